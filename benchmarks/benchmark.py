@@ -0,0 +1,835 @@
+"""
+Benchmarks for the Ladybug core kernels.
+
+Every kernel runs at several scales (number of points or sky density) against
+the reference inputs in fixtures.py. The results are checked against the golden
+outputs in golden.json and the timings are written to a json report so the
+throughput can be compared between releases.
+
+    python benchmarks/benchmark.py -o report.json
+    python benchmarks/benchmark.py -k comfPMV comfUTCI -s 1 1000
+    python benchmarks/benchmark.py --update-golden
+
+New kernels can be added with registerKernel. The function gets the fixtures
+and the scale, and returns the number of calculated items and a function that
+runs the kernel and returns a flat list of numbers to check:
+
+    @registerKernel('myKernel', POINTSCALES)
+    def myKernel(fixtures, scale):
+        conditions = pointConditions(scale)
+        return scale, lambda: [myFunction(*c) for c in conditions]
+
+The script exits with 1 if any of the results doesn't match the golden outputs.
+"""
+from __future__ import division, print_function
+import os
+import sys
+import json
+import math
+import shutil
+import csv
+import datetime
+import platform
+import re
+import subprocess
+import tempfile
+import timeit
+import zlib
+
+benchmarkFolder = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(benchmarkFolder, '..', 'src'))
+sys.path.insert(0, benchmarkFolder)
+
+import ladybug_core
+from ladybug_core.epw import EPW, WeatherCache
+from ladybug_core.batch import runBatch
+from ladybug_core.wea import hourToDate
+from ladybug_core.skymatrix import SkyMatrix, readGendaymtx
+from ladybug_core.comfort import ComfortModels
+from ladybug_core.photovoltaics import Photovoltaics
+from ladybug_core.colors import gradientRGB
+from ladybug_core.mesh import meshTestPoints
+from ladybug_core.isolines import meshIsolines, contourLevels
+from ladybug_core.texture import TextureAtlas, encodePng
+from ladybug_core.envimet import EnvimetDomain
+from ladybug_core.shadows import ShadowStudy
+from ladybug_core.solarfan import SolarFan
+from ladybug_core.terrain import DEMCache
+from ladybug_core.stations import StationCatalogue
+from ladybug_core.weatherstore import WeatherStore, fileDigest, urlKey
+from ladybug_core.geomag import WMM
+from ladybug_core.irradiance import IrradianceMatrix, hourlySkyMatrix
+from ladybug_core import psychrometrics
+from ladybug_core import comfortindices
+from ladybug_core import skycolor
+from ladybug_core import windrose
+from ladybug_core.wind import WindProfile
+
+from fixtures import writeEpw, writeGendaymtx, urbanMesh, pointConditions, writeHgt, writeStations, \
+    writeWeatherZips, serveFolder, Random
+
+
+GOLDENFILE = os.path.join(benchmarkFolder, 'golden.json')
+
+POINTSCALES = (1, 1000, 100000)
+
+# 1 for Tregenza and 2 for Reinhart
+SKYSCALES = (1, 2)
+
+# Ladybug's default legend colors
+LEGENDCOLORS = ((75, 107, 169), (115, 147, 202), (170, 200, 247), (193, 213, 208),
+                (245, 239, 103), (252, 230, 74), (239, 156, 21), (234, 123, 0),
+                (234, 74, 0), (234, 38, 0))
+
+# simplified PV module (PVFORM close roof mount, c-Si)
+PVMODULESETTINGS = ['close roof mount', 'c-Si', 1, 90, 15, -0.5, -2.98, -0.0471, 1]
+
+KERNELS = []
+
+
+def registerKernel(name, scales):
+    """Decorator to add a kernel to the benchmarks."""
+    def register(func):
+        KERNELS.append((name, tuple(scales), func))
+        return func
+    return register
+
+
+class Fixtures(object):
+    """Reference inputs that are written to a temporary folder on first use."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._epw = None
+        self._gendaymtx = {}
+        self._weatherServer = None
+
+    @property
+    def epwFile(self):
+        filePath = os.path.join(self.folder, 'synthetic.epw')
+        if not os.path.isfile(filePath): writeEpw(filePath)
+        return filePath
+
+    @property
+    def epw(self):
+        if self._epw is None: self._epw = EPW.fromFile(self.epwFile)
+        return self._epw
+
+    def epwFiles(self, count):
+        """Paths of count synthetic epw files with different seeds."""
+        folder = os.path.join(self.folder, 'epws')
+        if not os.path.isdir(folder): os.makedirs(folder)
+        filePaths = [os.path.join(folder, 'synthetic_%d.epw' % seed) for seed in range(1, count + 1)]
+        for seed, filePath in enumerate(filePaths, 1):
+            if not os.path.isfile(filePath): writeEpw(filePath, seed)
+        return filePaths
+
+    def gendaymtx(self, density):
+        if density not in self._gendaymtx:
+            self._gendaymtx[density] = writeGendaymtx(self.folder, density)
+        return self._gendaymtx[density]
+
+    def urbanMesh(self, faceCount):
+        return urbanMesh(faceCount)
+
+    @property
+    def stationFile(self):
+        filePath = os.path.join(self.folder, 'weatherStations.csv')
+        if not os.path.isfile(filePath): writeStations(self.folder)
+        return filePath
+
+    @property
+    def weatherServer(self):
+        """Urls of 50 zipped weather files on a local server with 50 ms latency."""
+        if self._weatherServer is None:
+            folder = os.path.join(self.folder, 'server')
+            os.makedirs(folder)
+            fileNames = writeWeatherZips(folder, self.epwFile, 50)
+            url, server = serveFolder(folder, 0.05)
+            self._weatherServer = [url + fileName for fileName in fileNames], server
+        return self._weatherServer[0]
+
+    @property
+    def weatherRequests(self):
+        """(file name, Range header) of each request to the weather server."""
+        self.weatherServer
+        return self._weatherServer[1].requests
+
+    def close(self):
+        if self._weatherServer is not None:
+            server = self._weatherServer[1]
+            server.shutdown()
+            server.server_close()
+
+    @property
+    def demFolder(self):
+        folder = os.path.join(self.folder, 'dem')
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+            writeHgt(folder)
+        return folder
+
+
+def flatten(results):
+    values = []
+    for result in results:
+        if isinstance(result, (list, tuple)): values.extend(result)
+        else: values.append(result)
+    return values
+
+
+@registerKernel('comfPMV', POINTSCALES)
+def comfPMVKernel(fixtures, scale):
+    comfort = ComfortModels()
+    conditions = pointConditions(scale)
+    return scale, lambda: flatten(comfort.comfPMV(ta, tr, vel, rh, 1.1, 0.7, 0)
+                                  for ta, tr, vel, rh in conditions)
+
+
+@registerKernel('comfUTCI', POINTSCALES)
+def comfUTCIKernel(fixtures, scale):
+    comfort = ComfortModels()
+    conditions = pointConditions(scale)
+    return scale, lambda: flatten(comfort.comfUTCI(ta, tr, vel, rh)
+                                  for ta, tr, vel, rh in conditions)
+
+
+@registerKernel('humidityRatio', POINTSCALES)
+def humidityRatioKernel(fixtures, scale):
+    conditions = pointConditions(scale)
+    airTemp = [ta for ta, tr, vel, rh in conditions]
+    relHumid = [rh for ta, tr, vel, rh in conditions]
+    barPress = [101325] * scale
+    return scale, lambda: flatten(psychrometrics.humidityRatio(airTemp, relHumid, barPress))
+
+
+@registerKernel('wetBulb', POINTSCALES)
+def wetBulbKernel(fixtures, scale):
+    conditions = pointConditions(scale)
+    airTemp = [ta for ta, tr, vel, rh in conditions]
+    relHumid = [rh for ta, tr, vel, rh in conditions]
+    barPress = [101325] * scale
+    return scale, lambda: psychrometrics.wetBulb(airTemp, relHumid, barPress)
+
+
+@registerKernel('PET', (1, 1000))
+def PETKernel(fixtures, scale):
+    conditions = pointConditions(scale)
+    Ta, MRT, ws, rh = [list(values) for values in zip(*conditions)]
+    met, clo = [80] * scale, [0.9] * scale
+    return scale, lambda: comfortindices.physiologicalEquivalentTemperature(
+        Ta, MRT, rh, ws, met, clo, 35, 'male', 1.75, 75, 'standing')[0]
+
+
+@registerKernel('predictedHeatStrain', (1, 1000))
+def predictedHeatStrainKernel(fixtures, scale):
+    conditions = pointConditions(scale)
+    Ta, MRT, ws, rh = [list(values) for values in zip(*conditions)]
+    vapourPressure = psychrometrics.vaporPressure(Ta, rh)
+    met, clo = [135] * scale, [0.5] * scale
+    # a work shift for each hour
+    return scale, lambda: flatten(comfortindices.predictedHeatStrain(
+        Ta, MRT, vapourPressure, ws, clo, met, 1.75, 75, 'standing', 'unacclimated', 480))
+
+
+@registerKernel('skyColor', (10, 64))
+def skyColorKernel(fixtures, resolution):
+    # colored skies of a summer design day
+    hours = list(range(5, 21))
+    run = lambda: skycolor.skySequence([172], 2026, hours, -5, 42.37, -71.03, 2.5, resolution)
+    return len(hours) * (resolution + 1) ** 2, lambda: [v for sky in run() for channel in sky for v in channel]
+
+
+@registerKernel('windRose', (16, 36))
+def windRoseKernel(fixtures, numOfDirections):
+    # monthly roses of the dry bulb temperature in the legend ranges
+    data = fixtures.epw.data
+    bounds = [-10 + 4 * i for i in range(11)]
+
+    def run():
+        roses = windrose.windRoses(data['windDirection'], data['windSpeed'],
+                                   windrose.monthlyHours(), numOfDirections)
+        counts, calmCounts, hourCounts = windrose.stackedHistograms(roses, bounds, data['dryBulbTemperature'])
+        averages = [rose.averageVelocities() + rose.frequencies() for rose in roses]
+        return flatten([c for rose in counts for c in rose] + calmCounts + averages)
+    return 8760, run
+
+
+@registerKernel('windProfile', (10, 100))
+def windProfileKernel(fixtures, heightCount):
+    # hourly wind speeds at a column of heights and their statistics
+    windSpeeds = fixtures.epw.data['windSpeed']
+    heights = [2 * (i + 1) for i in range(heightCount)]
+    profile = WindProfile.fromTerrainTypes('city')
+
+    def run():
+        speeds = profile.speeds(windSpeeds, heights)
+        averages, percentiles = profile.statistics(windSpeeds, heights)
+        return [sum(values) for values in speeds] + averages + flatten(percentiles)
+    return 8760 * heightCount, run
+
+
+@registerKernel('gradientColor', POINTSCALES)
+def gradientColorKernel(fixtures, scale):
+    rand = Random(5)
+    values = [rand.uniform(-10, 110) for i in range(scale)]
+    return scale, lambda: flatten(gradientRGB(values, 0, 100, LEGENDCOLORS))
+
+
+@registerKernel('NRELsunPosition', POINTSCALES)
+def NRELsunPositionKernel(fixtures, scale):
+    pv = Photovoltaics()
+    epw = fixtures.epw
+    dates = [hourToDate(i % 8760 + 1) for i in range(scale)]
+    return scale, lambda: flatten(pv.NRELsunPosition(epw.lat, epw.lngt, epw.timeZone, 2017,
+                                                     month, day, hour - 0.5)
+                                  for month, day, hour in dates)
+
+
+@registerKernel('pvwatts', POINTSCALES)
+def pvwattsKernel(fixtures, scale):
+    pv = Photovoltaics()
+    epw = fixtures.epw
+    data = epw.data
+    srfTiltD, srfAzimuthD = 30, 180
+    inputs = []
+    for i in range(scale):
+        hoy = i % 8760
+        month, day, hour = hourToDate(hoy + 1)
+        sunZenithD, sunAzimuthD, sunAltitudeD = pv.NRELsunPosition(
+            epw.lat, epw.lngt, epw.timeZone, 2017, month, day, hour - 0.5)
+        DNI = data['directNormalRadiation'][hoy]
+        DHI = data['diffuseHorizontalRadiation'][hoy]
+        Epoa, Eb, Ed_sky, Eground, AOI_R = pv.POAirradiance(sunZenithD, sunAzimuthD, srfTiltD,
+                                                             srfAzimuthD, DNI, DHI, 0.2)
+        inputs.append((sunZenithD, AOI_R, Epoa, Eb, Ed_sky, Eground,
+                       data['dryBulbTemperature'][hoy], data['windSpeed'][hoy], DNI, DHI))
+
+    def run():
+        return flatten(pv.pvwatts(4, 0.77, srfTiltD, sunZenithD, AOI_R, Epoa, Eb, Ed_sky,
+                                  Eground, Ta, ws10, DNI, DHI, PVMODULESETTINGS, epw.elev)
+                       for sunZenithD, AOI_R, Epoa, Eb, Ed_sky, Eground, Ta, ws10, DNI, DHI
+                       in inputs)
+
+    return scale, run
+
+
+@registerKernel('meshTestPoints', POINTSCALES)
+def meshTestPointsKernel(fixtures, scale):
+    vertices, faces = fixtures.urbanMesh(scale)
+
+    def run():
+        points, normals, areas = meshTestPoints(vertices, faces, 0.75)
+        return flatten(points) + flatten(normals) + areas
+
+    return scale, run
+
+
+@registerKernel('isolines', (1000, 100000))
+def isolinesKernel(fixtures, scale):
+    # 20 contour levels of the face heights with some noise
+    vertices, faces = fixtures.urbanMesh(scale)
+    rand = Random(6)
+    values = [vertices[face[0]][2] + vertices[face[2]][2] + rand.uniform(0, 5) for face in faces]
+    levels = contourLevels(5, 10, 19)
+
+    def run():
+        results = []
+        for lines in meshIsolines(vertices, faces, values, levels):
+            results.append(len(lines))
+            results.append(sum(len(line) for line in lines))
+            results.append(sum(pt[0] + pt[1] + pt[2] for line in lines for pt in line))
+        return results
+
+    return scale * 20, run
+
+
+@registerKernel('textureAtlas', POINTSCALES)
+def textureAtlasKernel(fixtures, scale):
+    # texture of a mesh with random vertex colors and the crc of the pixel rows
+    vertices, faces = fixtures.urbanMesh(scale)
+    rand = Random(7)
+    colors = [tuple(int(rand.uniform(0, 256)) for i in range(3)) for v in vertices]
+
+    def run():
+        atlas = TextureAtlas(faces, len(vertices))
+        width, height, rows = atlas.pixelRows(colors, 128)
+        png = encodePng(width, height, rows)
+        crc = 0
+        for row in rows: crc = zlib.crc32(bytes(row), crc)
+        return [width, height, int(png.startswith(b'\x89PNG')), crc & 0xffffffff] + \
+            flatten(atlas.textureCoordinates())
+
+    return scale, run
+
+
+@registerKernel('envimetDomain', (10, 300))
+def envimetDomainKernel(fixtures, buildingCount):
+    # closed box buildings on a 250 x 250 x 30 domain
+    rand = Random(8)
+    buildings = []
+    for b in range(buildingCount):
+        x0, y0 = (b % 17) * 29 + 3, (b // 17) * 27 + 3
+        x1, y1 = x0 + rand.uniform(8, 24), y0 + rand.uniform(8, 22)
+        height = rand.uniform(4, 80)
+        vertices = [(x0, y0, 0), (x1, y0, 0), (x1, y1, 0), (x0, y1, 0),
+                    (x0, y0, height), (x1, y0, height), (x1, y1, height), (x0, y1, height)]
+        faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+        buildings.append((vertices, faces))
+    walls = ['W%d' % b for b in range(buildingCount)]
+    roofs = ['R%d' % b for b in range(buildingCount)]
+
+    def run():
+        domain = EnvimetDomain(250, 250, 30, 2.0, 2.0, 3.0)
+        for vertices, faces in buildings: domain.addBuilding(vertices, faces)
+        flags = domain.buildingFlags()
+        records = domain.wallRecords(walls, roofs)
+        numbers = domain.buildingNumbers()
+        return [len(flags), len(records), sum(len(r) for r in records),
+                sum(int(n) for row in numbers for n in row.split(','))]
+
+    return 250 * 250 * 34, run
+
+
+@registerKernel('shadowStudy', (10, 70))
+def shadowStudyKernel(fixtures, buildingCount):
+    # box buildings on a 10 x 10 ground mesh for 12 sun vectors
+    rand = Random(9)
+    meshes = []
+    for b in range(buildingCount):
+        x0, y0 = (b % 9) * 22 + 3, (b // 9) * 20 + 3
+        x1, y1 = x0 + rand.uniform(6, 16), y0 + rand.uniform(6, 14)
+        height = rand.uniform(4, 60)
+        vertices = [(x0, y0, 0), (x1, y0, 0), (x1, y1, 0), (x0, y1, 0),
+                    (x0, y0, height), (x1, y0, height), (x1, y1, height), (x0, y1, height)]
+        faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+        meshes.append((vertices, faces))
+    ground = [(x * 20 - 10, y * 20 - 10, 0) for y in range(11) for x in range(11)]
+    meshes.append((ground, [(y * 11 + x, y * 11 + x + 1, y * 11 + x + 12, y * 11 + x + 11)
+                            for y in range(10) for x in range(10)]))
+    sunVectors = [(math.cos(math.radians(30 * k)), math.sin(math.radians(30 * k)), -0.4 - 0.05 * k)
+                  for k in range(12)]
+
+    def run():
+        study = ShadowStudy.fromMeshes(meshes)
+        return [sum(study.shadowAreas(sun)) for sun in sunVectors]
+
+    return buildingCount * 6 + 100, run
+
+
+@registerKernel('solarFan', (20, 400))
+def solarFanKernel(fixtures, pointCount):
+    # a star shaped parcel for the sun positions of six months from 8 AM to 4 PM
+    boundary = [((12 if i % 2 else 7) * math.cos(2 * math.pi * i / pointCount),
+                 (12 if i % 2 else 7) * math.sin(2 * math.pi * i / pointCount), 0)
+                for i in range(pointCount)]
+    sunVectors = []
+    for month in range(6):
+        altitude = math.radians(30 + 6 * month)
+        for hour in range(9):
+            azimuth = math.radians(120 + 15 * hour)
+            sunVectors.append((math.cos(altitude) * math.sin(azimuth),
+                               math.cos(altitude) * math.cos(azimuth), math.sin(altitude)))
+
+    def run():
+        meshes = SolarFan(boundary, sunVectors, 20).meshes()
+        return [len(meshes), sum(len(faces) for vertices, faces in meshes)] + \
+            [sum(v[2] for v in vertices) for vertices, faces in meshes]
+
+    return pointCount, run
+
+
+@registerKernel('demSample', (2500, 40000))
+def demSampleKernel(fixtures, pointCount):
+    # a square grid of points on a synthetic SRTM tile
+    folder = fixtures.demFolder
+    side = int(math.sqrt(pointCount))
+    latitudes = [40.1 + 0.8 * (i // side) / side for i in range(side * side)]
+    longitudes = [14.1 + 0.8 * (i % side) / side for i in range(side * side)]
+
+    def run():
+        cache = DEMCache(folder)
+        try:
+            return cache.sample(latitudes, longitudes)
+        finally:
+            cache.close()
+
+    return side * side, run
+
+
+@registerKernel('stationLookup', (100, 5000))
+def stationLookupKernel(fixtures, siteCount):
+    # nearest three stations and nearest station of the same climate zone for random sites
+    catalogue = StationCatalogue.fromCsv(fixtures.stationFile)
+    rand = Random(9)
+    sites = [(math.degrees(math.asin(rand.uniform(-1, 1))), rand.uniform(-180, 180)) for i in range(siteCount)]
+    latitudes, longitudes = [lat for lat, lon in sites], [lon for lat, lon in sites]
+
+    def run():
+        results = []
+        for found in catalogue.nearestMany(latitudes, longitudes, 3):
+            results.extend(index for distance, index in found)
+        for found in catalogue.nearestMany(latitudes, longitudes, 1, '4A'):
+            results.extend(found[0])
+        return results
+
+    return siteCount, run
+
+
+@registerKernel('weatherStore', (10, 50))
+def weatherStoreKernel(fixtures, stationCount):
+    # parallel download and extraction of zipped weather files into an empty store
+    urls = fixtures.weatherServer[:stationCount]
+
+    def run():
+        folder = tempfile.mkdtemp(dir=fixtures.folder)
+        try:
+            store = WeatherStore(folder, workers=8)
+            return [os.path.getsize(filePath) for files in store.fetchMany(urls) for filePath in files]
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return stationCount, run
+
+
+BATCHPIPELINE = [('analysisPeriod', {'period': ((6, 1, 1), (8, 31, 24))}),
+                 ('weatherStatistics', {}),
+                 ('degreeDays', {}),
+                 ('comfort', {'model': 'PMV', 'windSpeed': 0.1}),
+                 ('comfort', {'model': 'UTCI'}),
+                 ('pvwatts', {'perMonth': True})]
+
+
+def readTable(filePath):
+    with open(filePath, 'r') as inf:
+        return list(csv.reader(inf))[1:]
+
+
+def sameTable(table, rows):
+    """True if the rows of a csv file are the rows of a results table."""
+    if len(table) != len(rows): return False
+    for row, csvRow in zip(table, rows):
+        key = '' if row[4] is None else str(row[4])
+        if list(row[:4]) + [key] != csvRow[:5] or float(csvRow[5]) != row[5]: return False
+    return True
+
+
+@registerKernel('batchPipeline', (2, 4))
+def batchPipelineKernel(fixtures, epwCount):
+    # pipeline of epw files in two processes with a shared weather cache and csv tables
+    epwFiles = fixtures.epwFiles(epwCount)
+
+    def run():
+        folder = tempfile.mkdtemp(dir=fixtures.folder)
+        try:
+            cacheFolder, outputFolder = os.path.join(folder, 'cache'), os.path.join(folder, 'csv')
+            tables = runBatch(epwFiles, BATCHPIPELINE, 2, cacheFolder, outputFolder)
+            checks = [int(tables == runBatch(epwFiles, BATCHPIPELINE, 1))]
+            # one pickle per epw file named by its path, size and mtime
+            cacheFiles = [WeatherCache(cacheFolder).cacheFile(WeatherCache.fileKey(f)) for f in epwFiles]
+            checks.append(int(all(os.path.isfile(f) for f in cacheFiles)))
+            checks.append(len(os.listdir(cacheFolder)))
+            checks.append(int(all(sameTable(table, readTable(os.path.join(outputFolder, fileName)))
+                                  for table, fileName in
+                                  zip(tables, sorted(os.listdir(outputFolder))))))
+            # a second run reads the pickles and gives the same tables
+            checks.append(int(runBatch(epwFiles, BATCHPIPELINE, 2, cacheFolder) == tables))
+            checks.append(len(os.listdir(cacheFolder)))
+            # a changed mtime is a new cache key
+            changedFile = os.path.join(folder, 'changed.epw')
+            shutil.copyfile(epwFiles[0], changedFile)
+            os.utime(changedFile, (1500000000, 1500000000))
+            runBatch([changedFile], BATCHPIPELINE, 1, cacheFolder)
+            os.utime(changedFile, (1500000100, 1500000100))
+            changedTable = runBatch([changedFile], BATCHPIPELINE, 1, cacheFolder)[0]
+            checks.append(len(os.listdir(cacheFolder)))
+            checks.append(int([row[2:] for row in changedTable] == [row[2:] for row in tables[0]]))
+            return [row[5] for table in tables for row in table] + checks
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return epwCount, run
+
+
+@registerKernel('weatherStoreRecovery', (1,))
+def weatherStoreRecoveryKernel(fixtures, scale):
+    # resumed, restarted and rejected downloads and stale copies of the local server files
+    url = fixtures.weatherServer[0]
+    name = url.split('/')[-1]
+    with open(os.path.join(fixtures.folder, 'server', name), 'rb') as inf:
+        content = inf.read()
+    digest = fileDigest(os.path.join(fixtures.folder, 'server', name))
+    requests = fixtures.weatherRequests
+
+    def storeWithPartial(folder, partial):
+        store = WeatherStore(folder, retries=0)
+        if partial is not None:
+            with open(os.path.join(store._subfolder('partial'), urlKey(url) + '.part'), 'wb') as outf:
+                outf.write(partial)
+        return store
+
+    def storedContent(store):
+        with open(os.path.join(store.folder, 'objects', digest + '.zip'), 'rb') as inf:
+            return inf.read()
+
+    def run():
+        folder = tempfile.mkdtemp(dir=fixtures.folder)
+        try:
+            checks = []
+            # a truncated partial file continues with a range request
+            half = len(content) // 2
+            store = storeWithPartial(os.path.join(folder, 'resume'), content[:half])
+            del requests[:]
+            store.fetch(url)
+            checks.append(int(storedContent(store) == content))
+            checks.append(int(requests == [(name, 'bytes=%d-' % half)]))
+            checks.append(len(os.listdir(os.path.join(store.folder, 'partial'))))
+
+            # a partial file longer than the file on the server gets a 416 and starts over
+            store = storeWithPartial(os.path.join(folder, 'restart'), content + b'0' * 100)
+            del requests[:]
+            store.fetch(url)
+            checks.append(int(storedContent(store) == content))
+            checks.append(int(requests == [(name, 'bytes=%d-' % (len(content) + 100)), (name, None)]))
+
+            # a download that doesn't match its sha256 is rejected and nothing is stored
+            store = storeWithPartial(os.path.join(folder, 'mismatch'), None)
+            try:
+                store.fetch(url, sha256='0' * 64)
+                checks.append(0)
+            except ValueError:
+                checks.append(1)
+            checks.append(len(store.index()))
+            checks.extend(len(os.listdir(os.path.join(store.folder, subfolder)))
+                          if os.path.isdir(os.path.join(store.folder, subfolder)) else 0
+                          for subfolder in ('partial', 'objects', 'extracted'))
+
+            # a copy that was changed in place without changing its size is copied again
+            store = storeWithPartial(os.path.join(folder, 'copies'), None)
+            copyFolder = os.path.join(folder, 'working')
+            epwFile = store.fetch(url, copyFolder)[0]
+            with open(epwFile, 'r+b') as outf:
+                outf.write(b'X')
+            checks.append(int(fileDigest(store.fetch(url, copyFolder)[0]) ==
+                              fileDigest(store.stored(url)[0])))
+            return checks
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+    return scale, run
+
+
+COLDSTARTSCRIPT = '''
+import json, sys
+from timeit import default_timer
+startTime = default_timer()
+sys.path.insert(0, %(srcFolder)r)
+%(imports)s
+objects = [LazyObject(path) for path in %(paths)r]
+versionCache = VersionCache(%(versionsFile)r, 'http://127.0.0.1:9/versions.txt')
+versionCache.refreshInBackground()
+versions = versionCache.versions()
+seconds = default_timer() - startTime
+loaded = len([name for name, module in sys.modules.items() if name.startswith('ladybug_core.') and module])
+resolved = len([o.resolve() for o in objects])
+print(json.dumps([seconds, len(objects), loaded, resolved, len(versions), int(seconds <= STARTUPBUDGET)]))
+'''
+
+
+@registerKernel('coldStart', (1,))
+def coldStartKernel(fixtures, scale):
+    # the core part of letting Ladybug fly in a new interpreter with a fresh local versions.txt
+    srcFolder = os.path.join(benchmarkFolder, '..', 'src')
+    with open(os.path.join(srcFolder, 'ladybug_ladybug.py'), 'r') as inf:
+        source = inf.read()
+    imports = re.findall(r'^    (from ladybug_core\.\w+ import .+)$', source, re.M)
+    paths = re.findall(r"LazyObject\('([\w.:]+)'\)", source)
+    versionsFile = os.path.join(fixtures.folder, 'versions.txt')
+    shutil.copyfile(os.path.join(benchmarkFolder, '..', 'resources', 'versions.txt'), versionsFile)
+    script = COLDSTARTSCRIPT % {'srcFolder': os.path.abspath(srcFolder), 'imports': '\n'.join(imports),
+                                'paths': paths, 'versionsFile': versionsFile}
+
+    def run():
+        output = subprocess.check_output([sys.executable, '-c', script])
+        # the start time is checked with the budget flag and not with the golden sum
+        return json.loads(output.decode('ascii').strip().splitlines()[-1])[1:]
+
+    return scale, run
+
+
+@registerKernel('magneticDeclination', (10, 200))
+def magneticDeclinationKernel(fixtures, siteCount):
+    # field of random sites and elevations for the first day of each month of 2015-2019
+    rand = Random(13)
+    sites = [(math.degrees(math.asin(rand.uniform(-1, 1))), rand.uniform(-180, 180), rand.uniform(0, 3000))
+             for i in range(siteCount)]
+    dates = [datetime.date(year, month, 1) for year in range(2015, 2020) for month in range(1, 13)]
+    latitudes = [lat for lat, lon, elevation in sites for date in dates]
+    longitudes = [lon for lat, lon, elevation in sites for date in dates]
+    elevations = [elevation for lat, lon, elevation in sites for date in dates]
+
+    def run():
+        results = []
+        for values in WMM.default().field(latitudes, longitudes, elevations, dates * siteCount):
+            results.extend(values)
+        return results
+
+    return siteCount * len(dates), run
+
+
+@registerKernel('weightedIrradiance', (1, 1000))
+def weightedIrradianceKernel(fixtures, faceCount):
+    # random visibility of the Tregenza patches and the annual gendaymtx sky
+    rand = Random(6)
+    rows = []
+    for face in range(faceCount):
+        indices = [patch for patch in range(145) if rand.random() < 0.5]
+        rows.append((indices, [rand.random() for patch in indices]))
+    matrix = IrradianceMatrix(rows, 145)
+    areas = [rand.uniform(0.01, 0.1) for face in range(faceCount)]
+    skyMatrix = hourlySkyMatrix(readGendaymtx(*fixtures.gendaymtx(1)), range(1, 8761))
+    return faceCount * 8760, lambda: matrix.weightedIrradiance(areas, skyMatrix)
+
+
+@registerKernel('skyMatrix', SKYSCALES)
+def skyMatrixKernel(fixtures, density):
+    wea = fixtures.epw.toWea()
+    return 8760, lambda: flatten(SkyMatrix(wea, density).cumulativeValues())
+
+
+@registerKernel('readGendaymtx', SKYSCALES)
+def readGendaymtxKernel(fixtures, density):
+    difFile, dirFile = fixtures.gendaymtx(density)
+
+    def run():
+        radValuesDict = readGendaymtx(difFile, dirFile, density)
+        totals = []
+        for patch in sorted(radValuesDict):
+            hourlyValues = radValuesDict[patch].values()
+            totals.append(sum(values[0] for values in hourlyValues))
+            totals.append(sum(values[1] for values in hourlyValues))
+        return totals
+
+    return 8760, run
+
+
+def summarize(values):
+    """Golden output of a kernel run."""
+    return {'count': len(values), 'sum': sum(values), 'min': min(values),
+            'max': max(values), 'first': values[:5]}
+
+
+def compareSummaries(summary, golden, tolerance=1e-6):
+    """Largest relative difference between two summaries or None if they don't match."""
+    if summary['count'] != golden['count']: return None
+    maxDifference = 0
+    for key in ('sum', 'min', 'max'):
+        maxDifference = max(maxDifference, relativeDifference(summary[key], golden[key]))
+    for value, goldenValue in zip(summary['first'], golden['first']):
+        maxDifference = max(maxDifference, relativeDifference(value, goldenValue))
+    return maxDifference if maxDifference <= tolerance else None
+
+
+def relativeDifference(value, reference):
+    return abs(value - reference) / max(abs(reference), 1)
+
+
+def runKernel(fixtures, func, scale, repeat=3):
+    """Time a kernel and return the fastest run and the results of the last run."""
+    size, run = func(fixtures, scale)
+    bestTime = None
+    for i in range(repeat):
+        startTime = timeit.default_timer()
+        values = run()
+        seconds = timeit.default_timer() - startTime
+        if bestTime is None or seconds < bestTime: bestTime = seconds
+        # long runs are stable enough with a single run
+        if seconds > 1: break
+    return size, bestTime, values
+
+
+def runBenchmarks(kernels=None, scales=None, repeat=3, updateGolden=False, verbose=True):
+    """Run the benchmarks.
+
+    Args:
+        kernels: Optional list of kernel names. Default is all the kernels.
+        scales: Optional list of scales. Default is all the scales of each kernel.
+        repeat: Number of runs for each kernel. The fastest run is reported.
+        updateGolden: Set to True to write the results to golden.json instead
+            of checking them.
+    Returns:
+        A report dictionary.
+    """
+    golden = {}
+    if os.path.isfile(GOLDENFILE):
+        with open(GOLDENFILE, 'r') as inf:
+            golden = json.load(inf)
+
+    results = []
+    tempFolder = tempfile.mkdtemp(prefix='ladybug_benchmark_')
+    fixtures = Fixtures(tempFolder)
+    try:
+        for name, kernelScales, func in KERNELS:
+            if kernels and name not in kernels: continue
+            for scale in kernelScales:
+                if scales and scale not in scales: continue
+                size, seconds, values = runKernel(fixtures, func, scale, repeat)
+                summary = summarize(values)
+                key = '%s@%s' % (name, scale)
+                if updateGolden:
+                    golden[key] = summary
+                    status, difference = 'updated', 0
+                elif key not in golden:
+                    status, difference = 'missing', None
+                else:
+                    difference = compareSummaries(summary, golden[key])
+                    status = 'fail' if difference is None else 'pass'
+                result = {'kernel': name, 'scale': scale, 'size': size, 'seconds': seconds,
+                          'throughput': size / seconds if seconds else None,
+                          'golden': status, 'maxDifference': difference}
+                results.append(result)
+                if verbose:
+                    print('%-16s %8s %10.4f s %14.1f /s  %s' % (name, scale, seconds,
+                                                               result['throughput'] or 0, status))
+    finally:
+        fixtures.close()
+        shutil.rmtree(tempFolder, ignore_errors=True)
+
+    if updateGolden:
+        with open(GOLDENFILE, 'w') as outf:
+            json.dump(golden, outf, indent=1, sort_keys=True)
+
+    return {'version': ladybug_core.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'date': datetime.datetime.now().isoformat(),
+            'results': results}
+
+
+def main(args=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark the Ladybug core kernels.')
+    parser.add_argument('-k', '--kernels', nargs='+', default=None,
+                        help='kernels to run: %s.' % ', '.join(name for name, s, f in KERNELS))
+    parser.add_argument('-s', '--scales', nargs='+', type=int, default=None,
+                        help='scales to run (number of points or sky density).')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs for each kernel.')
+    parser.add_argument('-o', '--output', default=None, help='json file for the report.')
+    parser.add_argument('--update-golden', action='store_true',
+                        help='write the results to golden.json.')
+    args = parser.parse_args(args)
+
+    report = runBenchmarks(args.kernels, args.scales, args.repeat, args.update_golden)
+    if args.output:
+        with open(args.output, 'w') as outf:
+            json.dump(report, outf, indent=1)
+
+    failed = [r for r in report['results'] if r['golden'] == 'fail']
+    for result in failed:
+        print('%(kernel)s@%(scale)s does not match the golden output.' % result)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
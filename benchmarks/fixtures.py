@@ -0,0 +1,349 @@
+"""
+Reference inputs for the benchmarks.
+
+All the inputs are generated from fixed seeds so every run (and every Python
+version) sees the same numbers:
+
+    writeEpw: a synthetic 8760 hour epw file for Boston.
+    writeGendaymtx: synthetic gendaymtx -O1 output for a Tregenza or Reinhart sky.
+    urbanMesh: a procedural city of box buildings as vertex and face lists.
+    pointConditions: random air temperature, radiant temperature, wind speed
+        and relative humidity for comfort studies.
+    writeHgt: a synthetic SRTM tile of rolling hills.
+    writeStations: a weather station catalogue of random stations on the globe.
+    writeWeatherZips: zip archives of an epw and a stat file for a number of stations.
+    serveFolder: a local HTTP server with range requests that stands in for the
+        weather file websites.
+"""
+from __future__ import division
+import math
+import os
+import struct
+import threading
+import time
+import zipfile
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+
+LOCATION = ('Boston Logan Intl Arpt', 'MA', 'USA', 'TMY3', '725090', 42.37, -71.02, -5.0, 6.0)
+
+NUMOFDAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+class Random(object):
+    """Linear congruential generator.
+
+    Python's random module doesn't return the same sequence in Python 2 and 3
+    for all the methods so the fixtures use their own generator.
+    """
+
+    def __init__(self, seed=1):
+        self.state = seed
+
+    def random(self):
+        self.state = (self.state * 1103515245 + 12345) % 2147483648
+        return self.state / 2147483648
+
+    def uniform(self, low, high):
+        return low + (high - low) * self.random()
+
+
+def hours():
+    """(month, day, hour) for every hour of a non leap year. Hours are 1-24."""
+    for month, days in enumerate(NUMOFDAYS):
+        for day in range(1, days + 1):
+            for hour in range(1, 25):
+                yield month + 1, day, hour
+
+
+def sunAltitude(dayOfYear, hour, lat, lngt, timeZone):
+    """Approximate sun altitude in radians at the middle of an hour."""
+    declination = math.radians(23.45) * math.sin(2 * math.pi * (284 + dayOfYear) / 365)
+    solarTime = hour - 0.5 + (lngt / 15 - timeZone)
+    hourAngle = math.radians(15 * (solarTime - 12))
+    lat = math.radians(lat)
+    sinAltitude = math.sin(lat) * math.sin(declination) + \
+        math.cos(lat) * math.cos(declination) * math.cos(hourAngle)
+    return math.asin(max(-1, min(1, sinAltitude)))
+
+
+def dewPoint(temperature, relativeHumidity):
+    """Magnus dew point temperature (C)."""
+    gamma = math.log(max(relativeHumidity, 1) / 100) + 17.62 * temperature / (243.12 + temperature)
+    return 243.12 * gamma / (17.62 - gamma)
+
+
+def writeEpw(filePath, seed=1):
+    """Write a synthetic epw file and return the path.
+
+    Temperature and humidity follow annual and daily cycles, radiation follows
+    the sun altitude and a random clearness so clear, overcast and intermediate
+    hours are all part of the file.
+    """
+    rand = Random(seed)
+    city, state, country, source, wmo, lat, lngt, timeZone, elev = LOCATION
+    lines = ['LOCATION,%s,%s,%s,%s,%s,%.2f,%.2f,%.1f,%.1f' % (city, state, country, source,
+                                                           wmo, lat, lngt, timeZone, elev),
+             'DESIGN CONDITIONS,0',
+             'TYPICAL/EXTREME PERIODS,0',
+             'GROUND TEMPERATURES,0',
+             'HOLIDAYS/DAYLIGHT SAVINGS,No,0,0,0',
+             'COMMENTS 1,Synthetic weather file for Ladybug benchmarks',
+             'COMMENTS 2,',
+             'DATA PERIODS,1,1,Data,Sunday, 1/ 1,12/31']
+
+    for count, (month, day, hour) in enumerate(hours()):
+        dayOfYear = count // 24 + 1
+        annual = math.cos(2 * math.pi * (dayOfYear - 20) / 365)
+        daily = math.sin(2 * math.pi * (hour - 9) / 24)
+        temperature = 10 - 12 * annual + 5 * daily + rand.uniform(-1, 1)
+        relativeHumidity = min(100, max(10, 70 - 15 * daily + rand.uniform(-10, 10)))
+        pressure = 101325 + rand.uniform(-1500, 1500)
+
+        clearness = rand.random()
+        altitude = sunAltitude(dayOfYear, hour, lat, lngt, timeZone)
+        if altitude > 0:
+            sinAltitude = math.sin(altitude)
+            directRad = 950 * clearness * (1 - math.exp(-4 * sinAltitude)) if clearness > 0.3 else 0
+            diffuseRad = sinAltitude * (80 + 300 * (1 - clearness))
+            globalRad = diffuseRad + directRad * sinAltitude
+        else:
+            directRad = diffuseRad = globalRad = 0
+        infrared = 300 + 2 * temperature + 60 * (1 - clearness)
+        windDirection = rand.uniform(0, 360)
+        windSpeed = rand.uniform(0, 10)
+        cloudCover = int(10 * (1 - clearness))
+
+        values = (2017, month, day, hour, 60, '?9?9?9?9E0?9?9?9?9?9?9?9?9?9?9?9?9?9?9?9*9*9?9?9?9',
+                  '%.1f' % temperature, '%.1f' % dewPoint(temperature, relativeHumidity),
+                  int(relativeHumidity), int(pressure), 9999, 9999, int(infrared),
+                  int(globalRad), int(directRad), int(diffuseRad), int(globalRad * 110),
+                  int(directRad * 100), int(diffuseRad * 120), 9999, int(windDirection),
+                  '%.1f' % windSpeed, cloudCover, cloudCover, 16.1, 77777, 9, 999999999, 0,
+                  0.1, 0, 88, 0.2, 0, 0)
+        lines.append(','.join(str(v) for v in values))
+
+    with open(filePath, 'w') as outf:
+        outf.write('\n'.join(lines) + '\n')
+    return filePath
+
+
+def writeGendaymtx(folder, density=1, seed=2):
+    """Write synthetic gendaymtx -O1 results for the diffuse and the direct sky.
+
+    The files have the Radiance header, the ground patch and one block of 8760
+    RGB values for each sky patch. Night hours are zeros.
+
+    Returns:
+        Paths to the diffuse and the direct matrix files.
+    """
+    rand = Random(seed)
+    patchCount = 145 if density == 1 else 577
+    header = '#?RADIANCE\ngendaymtx -O1 -m %d synthetic.wea\nNROWS=%d\nNCOLS=8760\n' \
+             'NCOMP=3\nFORMAT=ascii\n\n' % (density, patchCount + 1)
+    daylight = [6 <= hour % 24 <= 18 for hour in range(8760)]
+
+    filePaths = []
+    for name, scale in (('dif', 40), ('dir', 200)):
+        filePath = os.path.join(folder, 'synthetic_%d_%s.mtx' % (density, name))
+        with open(filePath, 'w') as outf:
+            outf.write(header)
+            for patch in range(patchCount + 1):
+                lines = []
+                for isDay in daylight:
+                    if isDay and patch:
+                        value = scale * rand.random()
+                        lines.append('%.4g %.4g %.4g' % (value, value * 0.98, value * 0.95))
+                    else:
+                        lines.append('0 0 0')
+                outf.write('\n'.join(lines) + '\n\n')
+        filePaths.append(filePath)
+    return filePaths
+
+
+def urbanMesh(faceCount, gridSize=3, seed=3):
+    """Procedural city of box buildings.
+
+    Buildings are placed on a square grid of blocks with random footprints and
+    heights. Facades are subdivided into gridSize quads and roofs are split into
+    triangles so the mesh has quad and triangle faces. Buildings are added until
+    the mesh has faceCount faces.
+
+    Returns:
+        vertices: List of (x, y, z) tuples.
+        faces: List of vertex index tuples (3 or 4 indices, counter-clockwise
+            seen from outside).
+    """
+    rand = Random(seed)
+    vertices, faces = [], []
+    block = 60
+    blocksPerRow = max(1, int(math.sqrt(faceCount / 200)) + 1)
+    building = 0
+    while len(faces) < faceCount:
+        row, column = divmod(building, blocksPerRow)
+        building += 1
+        width = rand.uniform(10, 40)
+        depth = rand.uniform(10, 40)
+        height = rand.uniform(6, 120)
+        x0, y0 = column * block, row * block
+        corners = ((x0, y0), (x0 + width, y0), (x0 + width, y0 + depth), (x0, y0 + depth))
+
+        # facades
+        floors = max(1, int(math.ceil(height / gridSize)))
+        for (xa, ya), (xb, yb) in zip(corners, corners[1:] + corners[:1]):
+            length = math.hypot(xb - xa, yb - ya)
+            bays = max(1, int(math.ceil(length / gridSize)))
+            start = len(vertices)
+            for level in range(floors + 1):
+                z = height * level / floors
+                for bay in range(bays + 1):
+                    t = bay / bays
+                    vertices.append((xa + (xb - xa) * t, ya + (yb - ya) * t, z))
+            for level in range(floors):
+                for bay in range(bays):
+                    a = start + level * (bays + 1) + bay
+                    b = a + bays + 1
+                    faces.append((a, a + 1, b + 1, b))
+
+        # roof
+        start = len(vertices)
+        vertices.extend((x, y, height) for x, y in corners)
+        faces.append((start, start + 1, start + 2))
+        faces.append((start, start + 2, start + 3))
+
+    return vertices, faces[:faceCount]
+
+
+def writeHgt(folder, name='N40E014', size=1201, seed=5):
+    """Write a synthetic SRTM .hgt tile with a few voids.
+
+    Returns:
+        Path to the tile.
+    """
+    rand = Random(seed)
+    waves = [(rand.uniform(2, 12), rand.uniform(2, 12), rand.uniform(0, 6), rand.uniform(50, 300))
+             for i in range(4)]
+    filePath = os.path.join(folder, name + '.hgt')
+    with open(filePath, 'wb') as outf:
+        for row in range(size):
+            y = row / (size - 1)
+            values = []
+            for col in range(size):
+                x = col / (size - 1)
+                value = 500 + sum(a * math.sin(fx * x * math.pi + fy * y * math.pi + phase)
+                                  for fx, fy, phase, a in waves)
+                values.append(int(round(value)))
+            if row % 97 == 13: values[row % size] = -32768
+            outf.write(struct.pack('>%dh' % size, *values))
+    return filePath
+
+
+def writeStations(folder, count=10000, seed=8):
+    """Write a weatherStations.csv catalogue of stations spread evenly over the globe.
+
+    Returns:
+        Path to the catalogue.
+    """
+    rand = Random(seed)
+    zones = ('1A', '2A', '2B', '3A', '3B', '3C', '4A', '4B', '4C', '5A', '5B', '6A', '7', '8')
+    filePath = os.path.join(folder, 'weatherStations.csv')
+    with open(filePath, 'w') as outf:
+        outf.write('name,wmo,latitude,longitude,elevation,timeZone,climateZone,url\n')
+        for i in range(count):
+            latitude = math.degrees(math.asin(rand.uniform(-1, 1)))
+            longitude = rand.uniform(-180, 180)
+            name = 'Station %05d' % i
+            outf.write('%s,%06d,%.4f,%.4f,%d,%.1f,%s,stations/%05d.zip\n' % (
+                name, 100000 + i, latitude, longitude, int(rand.uniform(0, 2500)),
+                round(longitude / 15), zones[int(rand.uniform(0, len(zones)))], i))
+    return filePath
+
+
+def writeWeatherZips(folder, epwFile, count):
+    """Write a zip archive with an epw and a stat file for count stations.
+
+    Returns:
+        List of the archive file names.
+    """
+    with open(epwFile, 'rb') as inf:
+        content = inf.read()
+    fileNames = []
+    for i in range(count):
+        name = 'Station_%03d' % i
+        with zipfile.ZipFile(os.path.join(folder, name + '.zip'), 'w') as zf:
+            # a fixed date so the archives are the same in every run
+            for fileName, data in ((name + '.epw', content),
+                                   (name + '.stat', ('Statistics for %s\n' % name).encode('ascii'))):
+                info = zipfile.ZipInfo(fileName, (2018, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, data)
+        fileNames.append(name + '.zip')
+    return fileNames
+
+
+class _ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def serveFolder(folder, latency=0):
+    """Serve the files of a folder on localhost with support for range requests.
+
+    Args:
+        latency: Seconds to wait before each response.
+
+    Returns:
+        (base url, server). Call server.shutdown() to stop it. server.requests
+        is a list of the (file name, Range header) of each request.
+    """
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            self.server.requests.append((os.path.basename(self.path), self.headers.get('Range')))
+            filePath = os.path.join(folder, os.path.basename(self.path))
+            if not os.path.isfile(filePath): return self.send_error(404)
+            with open(filePath, 'rb') as inf:
+                content = inf.read()
+            time.sleep(latency)
+            start = 0
+            requested = self.headers.get('Range')
+            if requested and requested.startswith('bytes='):
+                start = int(requested[6:].split('-')[0])
+                if start >= len(content): return self.send_error(416)
+                self.send_response(206)
+                self.send_header('Content-Range', 'bytes %d-%d/%d' % (start, len(content) - 1, len(content)))
+            else:
+                self.send_response(200)
+            self.send_header('Content-Length', str(len(content) - start))
+            self.end_headers()
+            self.wfile.write(content[start:])
+
+        def log_message(self, *args):
+            pass
+
+    server = _ThreadingServer(('127.0.0.1', 0), Handler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return 'http://127.0.0.1:%d/' % server.server_address[1], server
+
+
+def pointConditions(count, seed=4):
+    """Air temperature, mean radiant temperature, wind speed and relative humidity.
+
+    Returns:
+        A list of (ta, tr, vel, rh) tuples.
+    """
+    rand = Random(seed)
+    conditions = []
+    for i in range(count):
+        ta = rand.uniform(-10, 40)
+        conditions.append((ta, ta + rand.uniform(-5, 20), rand.uniform(0.1, 5),
+                           rand.uniform(10, 95)))
+    return conditions
@@ -43,7 +43,7 @@ Provided by Ladybug 0.0.66
 """
 ghenv.Component.Name = "Ladybug_Clothing Function"
 ghenv.Component.NickName = 'CloFunction'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "1 | AnalyzeWeatherData"
@@ -140,7 +140,7 @@ def checkTheInputs(lb_preparation):
     
     # Check to see if the user has connected an analysis period along with outdoor air temperatures.
     if epwData == True and len(analysisPeriod_) > 0:
-        HOYS, months, days =  getHOYsBasedOnPeriod(analysisPeriod_, 1, lb_preparation)
+        HOYS, months, days =  lb_preparation.getHOYsBasedOnPeriod(analysisPeriod_, 1)
         finalAirTemps = []
         for hoy in HOYS:
             finalAirTemps.append(avgAirTemps[hoy-1])
@@ -154,66 +154,6 @@ def checkTheInputs(lb_preparation):
     return checkData, epwData, epwStr, calcLength, finalAirTemps, maxClo, maxCloTemp,  minClo, minCloTemp
 
 
-def getHOYs(hours, days, months, timeStep, lb_preparation, method = 0):
-    
-    if method == 1: stDay, endDay = days
-        
-    numberOfDaysEachMonth = lb_preparation.numOfDaysEachMonth
-    
-    if timeStep != 1: hours = rs.frange(hours[0], hours[-1] + 1 - 1/timeStep, 1/timeStep)
-    
-    HOYS = []
-    
-    for monthCount, m in enumerate(months):
-        # just a single day
-        if method == 1 and len(months) == 1 and stDay - endDay == 0:
-            days = [stDay]
-        # few days in a single month
-        
-        elif method == 1 and len(months) == 1:
-            days = range(stDay, endDay + 1)
-        
-        elif method == 1:
-            #based on analysis period
-            if monthCount == 0:
-                # first month
-                days = range(stDay, numberOfDaysEachMonth[monthCount] + 1)
-            elif monthCount == len(months) - 1:
-                # last month
-                days = range(1, lb_preparation.checkDay(endDay, m) + 1)
-            else:
-                #rest of the months
-                days = range(1, numberOfDaysEachMonth[monthCount] + 1)
-        
-        for d in days:
-            for h in hours:
-                h = lb_preparation.checkHour(float(h))
-                m  = lb_preparation.checkMonth(int(m))
-                d = lb_preparation.checkDay(int(d), m)
-                HOY = lb_preparation.date2Hour(m, d, h)
-                if HOY not in HOYS: HOYS.append(int(HOY))
-    
-    return HOYS
-
-def getHOYsBasedOnPeriod(analysisPeriod, timeStep, lb_preparation):
-    
-    stMonth, stDay, stHour, endMonth, endDay, endHour = lb_preparation.readRunPeriod(analysisPeriod, True, False)
-    
-    if stMonth > endMonth:
-        months = range(stMonth, 13) + range(1, endMonth + 1)
-    else:
-        months = range(stMonth, endMonth + 1)
-    
-    # end hour shouldn't be included
-    hours  = range(stHour, endHour + 1)
-    
-    days = stDay, endDay
-    
-    HOYS = getHOYs(hours, days, months, timeStep, lb_preparation, method = 1)
-    
-    return HOYS, months, days
-
-
 def schiavonClo(airTemp, maxClo, maxCloTemp,  minClo, minCloTemp, f1Slope, f1yInt, f2Slope, f2yInt):
     if airTemp < maxCloTemp:
         cloVal = maxClo
@@ -58,11 +58,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Colored Sky Visualizer"
 ghenv.Component.NickName = 'skyVizualizer'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nJAN_29_2017
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
 
@@ -362,30 +362,15 @@ def main(projection, doy, days, months, year, hours, timeZone, latitude, longitu
                 northRotation = rc.Geometry.Transform.Rotation(northAngle, rc.Geometry.Vector3d.ZAxis, basePoints[domeCount])
                 dome.Transform(northRotation)
         
-        #Create a function to split up lists into chunks based on the resolution.
-        def chunks(l, n):
-            if n < 1:
-                n = 1
-            return [l[i:i + n] for i in range(0, len(l), n)]
-        
         #Create the skies.
         for dayCount, day in enumerate(doy):
             for hourCount, hour in enumerate(hours):
-                #Get the color values for the sky and create the mesh.
+                #Get the color values for the sky in the order of the mesh vertices and color the mesh.
                 sky = lb_skyColor.createSky(day, year, hour, timeZone, latitude, longitude, turbidity)
-                fullSkyRGB, fullSkyXYZ = lb_skyColor.calcFullSky(int(resolution))
-                fullSkyXYZ = chunks(fullSkyXYZ, resolution+1)
-                fullSkyRGB = chunks(fullSkyRGB, resolution+1)
-                finalFullSkyRGB = []
-                finalFullSkyXYZ = []
-                for count, item in enumerate(fullSkyRGB[0]):
-                    for list in fullSkyRGB:
-                        finalFullSkyRGB.append(list[count])
-                    for list in fullSkyXYZ:
-                        finalFullSkyXYZ.append(list[count])
+                finalFullSkyRGB, finalFullSkyXYZ = lb_skyColor.calcFullSky(int(resolution))
                 skyColors.append(finalFullSkyRGB)
                 skyColorsXYZ.append(finalFullSkyXYZ)
-                skyMesh = uncoloredSkyMeshes[dayCount*hourCount+hourCount]
+                skyMesh = uncoloredSkyMeshes[dayCount*len(hours)+hourCount]
                 for vertxCount, color in enumerate(finalFullSkyRGB):
                     skyMesh.VertexColors[vertxCount] = color
                 skyMeshes.append(skyMesh)
@@ -60,13 +60,13 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Countour Mesh"
 ghenv.Component.NickName = 'contourMesh'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "5 | Extra"
 try: ghenv.Component.AdditionalHelpFromDocStrings = "5"
 except: pass
-#compatibleLBVersion = VER 0.0.59\nJAN_05_2017
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 
 import scriptcontext as sc
 import Rhino as rc
@@ -314,6 +314,10 @@ def main(analysisResult, inputMesh, contourType, heightDomain, legendPar, analys
                             failedIntersects.append(finalSplitMesh)
                     except: pass
     
+    # Contour lines of all the planes from one pass over the mesh faces.
+    if contourType != 1:
+        planeLines = lb_visualization.contourCurves(coloredChart, [plane.Origin.Z for plane in intPlanes])
+    
     # Generate Labeled Contours
     try:
         if contourType == 0 or contourType == 2 or contourType == None:
@@ -332,10 +336,9 @@ def main(analysisResult, inputMesh, contourType, heightDomain, legendPar, analys
                 labelSize = textSize/5
             else:
                 labelSize = _labelSize_
-            for count, plane in enumerate(intPlanes):
+            for count, theLines in enumerate(planeLines):
                 contourLines.append([])
                 contourLabels.append([])
-                theLines = rc.Geometry.Mesh.CreateContourCurves(coloredChart, plane)
                 for line in theLines:
                     contourLines[count].append(line)
                     try:
@@ -352,12 +355,12 @@ def main(analysisResult, inputMesh, contourType, heightDomain, legendPar, analys
         legendSrfs = None
     
     if contourType == 3:
-        for count, plane in enumerate(intPlanes):
+        for count, theLines in enumerate(planeLines):
             try:
                 contourColors.append([legendColors[count]])
             except:
                 pass
-            contourLines.append(rc.Geometry.Mesh.CreateContourCurves(coloredChart, plane))
+            contourLines.append(theLines)
     
     # Project the mesh back to the XYPlane.
     if heightDomain == None:
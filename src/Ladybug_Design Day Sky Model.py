@@ -37,23 +37,23 @@ Provided by Ladybug 0.0.66
         _tauBeam: Values representing the optical sky depth for beam (direct) solar radiation.  Optical depth is the natural logarithm of the ratio of incident to transmitted radiant power through the atmosphere.  It can vary from month to month as water vapor concentrations in the atmosphere change.  This input can be either a single value for the whole year, a list of 12 monthly values, or the output from the "Ladybug_Import stat" component.  Typical values range from 0.3 in cool dry months to 0.65 in warm humid months.
         _tauDiffuse: Values representing the optical sky depth for diffuse solar radiation.  Optical depth is the natural logarithm of the ratio of incident to transmitted radiant power through the atmosphere.  It can vary from month to month as water vapor concentrations in the atmosphere change. This input can be either a single value for the whole year, a list of 12 monthly values, or the output from the "Ladybug_Import stat" component. Typical values range from 1.75 in warm humid months to 2.5 in cool dry months.
         _skyDensity_: Set to 0 to generate a Tregenza sky, which will divide up the sky dome with a coarse density of 145 sky patches.  Set to 1 to generate a Reinhart sky, which will divide up the sky dome using a very fine density of 580 sky patches.  Note that, while the Reinhart sky is more accurate, it will result in considerably longer calculation times.  Accordingly, the default is set to 0 for a Tregenza sky.
-        workingDir_: An optional working directory in your system where the sky will be generated. Default is set to C:\Ladybug or C:\Users\yourUserName\AppData\Roaming\Ladybug.  The latter is used if you cannot write to the C:\ drive of your computer.  Any valid file path location can be connected.
-        useOldRes_: Set this to "True" if you have already run this component previously and you want to use the already-generated data for this weather file.
+        workingDir_: An optional working directory in your system where the results of previous gendaymtx runs are saved. Default is set to C:\Ladybug or C:\Users\yourUserName\AppData\Roaming\Ladybug.  The latter is used if you cannot write to the C:\ drive of your computer.  Any valid file path location can be connected.
+        useOldRes_: Set this to "True" if you have already run gendaymtx for this location with an older version of this component and you want to use the already-generated data.
         genCumSky_: Set to 'True' to have this component generate a cumulative sky matrix for the design day sky.  This can then be used in Ladybug solar radiation studies and visualized with the "Ladybug_Sky Dome" or "Ladybug_Radiation Rose."
     Returns:
         readMe!: ...
         directNormRad: The hourly Direct Normal Radiation in Wh/m2 for an ASHRAE Revised Clear Sky (Tau Model). Direct normal radiation is the amount of solar radiation in Wh/m2 received directly from the solar disk on a surface perpendicular to the sun's rays.
         diffuseHorizRad: The hourly Diffuse Horizontal Radiation in Wh/m2 for an ASHRAE Revised Clear Sky (Tau Model). Diffuse horizontal radiation is the amount of solar radiation in Wh/m2 received from the sky (excluding the solar disk) on a horizontal surface.
         globalHorizRad; The hourly Global Horizontal Radiation in Wh/m2 for an ASHRAE Revised Clear Sky (Tau Model). Diffuse horizontal radiation is the total amount of direct and diffuse solar radiation in Wh/m2 received on a horizontal surface.
-        cumulativeSkyMtx: The result of the gendaymtx function. Use the selectSkyMtx component to select a desired sky matrix from this output for use in a radiation study, radition rose, or sky dome visualization.
+        cumulativeSkyMtx: The hourly radiation of the sky patches for a Perez sky (the same method as Radiance's gendaymtx function). Use the selectSkyMtx component to select a desired sky matrix from this output for use in a radiation study, radition rose, or sky dome visualization.
 """
 
 ghenv.Component.Name = "Ladybug_Design Day Sky Model"
 ghenv.Component.NickName = 'DesignDaySky'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
 
@@ -62,131 +62,20 @@ import Grasshopper.Kernel as gh
 import Rhino as rc
 import math
 import os
-from itertools import izip
-import shutil
 
 w = gh.GH_RuntimeMessageLevel.Warning
 
 
-
-def weaHeader(locName, lat, long, timeZone, elev):
-    return  "place " + locName + "\n" + \
-            "latitude " + str(lat) + "\n" + \
-            "longitude " + `-float(long)` + "\n" + \
-            "time_zone " + `-float(timeZone) * 15` + "\n" + \
-            "site_elevation " + str(elev) + "\n" + \
-            "weather_data_file_units 1\n"
-
-def generateWea(workingDir, header, diffuseRad, directRad, lb_preparation):
-    outputFile = workingDir + "\Design_Day_ASHRAE_Clear_Sky" + ".wea"
-    weaFile = open(outputFile, 'w')
-    weaFile.write(header)
-    for hour in range(1,8761):
-        day, month, time = lb_preparation.hour2Date(hour, True)
-        weaFile.write(str(month+1) + " " + str(day) + " " + str(time) + " " + str(directRad[hour-1]) + " " + str(diffuseRad[hour-1]) + "\n")
-    weaFile.close()
-    return outputFile
-
-def readMTXFile(daylightMtxDif, daylightMtxDir, n, newLocName, lat, lngt, timeZone):
-    # All the patches on top high get the same values so maybe
-    # I should re-create the geometry 577 instead of 580
-    # and keep in mind that first patch is ground!
-    # I create the dictionary only for sky patches and don't collect the data
-    # for the first patch
-    # this line could have saved me 5 hours
-    skyPatchesDict = {1 : 145,
-                      2 : 580 - 3}
-
-    numOfPatchesInEachRow = {1: [30, 30, 24, 24, 18, 12, 6, 1],
-                             2: [60, 60, 60, 60, 48, 48, 48, 48, 36, 36, 24, 24, 12, 12, 1]}
-                             
-    # first row is horizon and last row is the one 
-    strConv = {1 : [0.0435449227, 0.0416418006, 0.0473984151, 0.0406730411, 0.0428934136, 0.0445221864, 0.0455168385, 0.0344199465],
-               2: [0.0113221971, 0.0111894547, 0.0109255262, 0.0105335058, 0.0125224872, 0.0117312774, 0.0108025291, 0.00974713106, 0.011436609, 0.00974295956, 0.0119026242, 0.00905126163, 0.0121875626, 0.00612971396, 0.00921483254]}
-    
-    numOfSkyPatches = skyPatchesDict[n]
-    
-    # create an empty dictionary
-    radValuesDict = {}
-    for skyPatch in range(numOfSkyPatches):
-        radValuesDict[skyPatch] = {}
-        
-    resFileDif = open(daylightMtxDif, "r") 
-    resFileDir = open(daylightMtxDir, "r") 
-    
-    def getValue(line, rowNumber):
-        R, G, B = line.split(' ')
-        value = (.265074126 * float(R) + .670114631 * float(G) + .064811243 * float(B)) * strConv[n][rowNumber]
-        return value
-        
-    lineCount = 0
-    extraHeadingLines = 0 # no heading
-    warnOff = False
-    failedHours = {}
-    for difLine, dirLine in izip(resFileDif, resFileDir):
-        # each line is the data for each hour for a single patch
-        
-        # new version of gendaymtx genrates a header
-        # this is a check to make sure the component will work for both versions
-        if lineCount == 0 and difLine.startswith("#?RADIANCE"):
-            # the file has a header
-            extraHeadingLines = -8
-            
-        if lineCount + extraHeadingLines < 0:
-            # pass heading line
-            lineCount += 1
-            continue
-        
-        # these lines is an empty line to separate patches do let's pass them
-        hour = (lineCount + 1 + extraHeadingLines)% 8761
-        
-        #print lineCount, hour
-        
-        if hour != 0:
-            patchNumber = int((lineCount + 1 + extraHeadingLines) /8761)
-            
-            # first patch is ground!
-            if patchNumber != 0: #and patchNumber < numOfSkyPatches:
-                for rowCount, patchCountInRow in enumerate(numOfPatchesInEachRow[n]):
-                    if patchNumber - 1 < sum(numOfPatchesInEachRow[n][:rowCount+1]):
-                        rowNumber = rowCount
-                        # print rowNumber
-                        break
-                try:
-                    difValue = getValue(difLine, rowNumber)
-                    dirValue = getValue(dirLine, rowNumber)
-                except Exception, e:
-                    value = 0
-                    if not warnOff:
-                        print "genDayMtx returns null Values for few hours. The study will run anyways." + \
-                              "\nMake sure that you are using an standard epw file." + \
-                              "\nThe failed hours are listed below in [Month/Day @Hour] format."
-                    warnOff = True
-                    day, month, time = hour2Date(hour - 1)
-                    if hour-1 not in failedHours.keys():
-                        failedHours[hour-1] = [day, month, time]
-                        print "Failed to read the results > " + month + "/" + day + " @" + time
-                    
-                try: radValuesDict[patchNumber-1][hour] = [difValue, dirValue]
-                except:print patchNumber-1, hour, value
-            
-        lineCount += 1
-    
-    resFileDif.close()
-    resFileDir.close()
+class SkyResultsCollection(object):
+    def __init__(self, valuesDict, locationName, lat, lngt, timeZone):
+        self.d = valuesDict
+        self.location = locationName
+        self.lat = lat
+        self.lngt = lngt
+        self.timeZone = timeZone
     
-    class SkyResultsCollection(object):
-        def __init__(self, valuesDict, locationName, lat, lngt, timeZone):
-            self.d = valuesDict
-            self.location = locationName
-            self.lat = lat
-            self.lngt = lngt
-            self.timeZone = timeZone
-        
-        def ToString(self):
-            return 'AnnualDaylightMatrix::%s' % self.location
-    
-    return SkyResultsCollection(radValuesDict, newLocName, lat, lngt, timeZone)
+    def ToString(self):
+        return 'AnnualDaylightMatrix::%s' % self.location
 
 def main(location, monthlyTauBeam, monthlyTauDiffuse, skyDensity, workingDir, useOldRes, genCumSky):
     # Call the necessary libraries.
@@ -297,87 +186,46 @@ def main(location, monthlyTauBeam, monthlyTauDiffuse, skyDensity, workingDir, us
         if skyDensity == None: n = 1 #Tregenza Sky
         else: n = skyDensity%2 + 1 # Custom Sky
         
-        # make working directory.
-        if workingDir:
-            workingDir = lb_preparation.removeBlankLight(workingDir)
-        workingDir = lb_preparation.makeWorkingDir(None)
-        # make sure the directory has been created.
-        if workingDir == -1:
-            warning = 'Failed to create working directory for genCumSky.'
+        if not sc.sticky.has_key('ladybug_SkyMatrix'):
+            warning = 'Failed to find Ladybug core modules.' + \
+                '\nUse updateLadybug component to update userObjects and let the Ladybug fly again!'
             print warning
             ghenv.Component.AddRuntimeMessage(w, warning)
             return -1
-        workingDrive = workingDir[0:1]
-        # GenCumulativeSky
-        gendaymtxFile = os.path.join(workingDir, 'gendaymtx.exe')
-        if not os.path.isfile(gendaymtxFile):
-            # let's see if we can grab it from radiance folder
-            if os.path.isfile("c:/radiance/bin/gendaymtx.exe"):
-                # just copy this file
-                shutil.copyfile("c:/radiance/bin/gendaymtx.exe", gendaymtxFile)
-                # in newer versions of radiance you also need msvcr120.dll
-                if os.path.isfile("c:/radiance/bin/msvcr120.dll"):
-                    shutil.copyfile("c:/radiance/bin/msvcr120.dll",
-                                    os.path.join(workingDir, 'msvcr120.dll'))
-            else:
-                # download the file
-                lb_preparation.downloadGendaymtx(workingDir)
-            #check if the file is there
-        if not os.path.isfile(gendaymtxFile) or os.path.getsize(gendaymtxFile)< 15000:
-            warning = 'Download failed!!! You need GenDayMtx.exe to use this component.' + \
-                '\nPlease check your internet connection, and try again!'
-            print warning
-            ghenv.Component.AddRuntimeMessage(w, warning)
-        if not os.access(gendaymtxFile, os.X_OK):
-            raise Exception("%s is blocked by system! Right click on the file,"%gendaymtxFile + \
-                " select properties and unblock it.")
-        
+        lb_skyMatrix = sc.sticky["ladybug_SkyMatrix"]
+        lb_wea = sc.sticky["ladybug_Wea"]
         newLocName = lb_preparation.removeBlank(locName)
-        # make new folder for each city
-        subWorkingDir = lb_preparation.makeWorkingDir(workingDir + "\\" + newLocName)
-        print 'Current working directory is set to: ', subWorkingDir
-        
-        # Generate a .wea file with the appropriate information.
-        header = weaHeader(locName, lat, lngt, timeZone, elev)
-        weaFile = generateWea(subWorkingDir, header, diffuseHorizRad[7:], directNormRad[7:], lb_preparation)
         
-        outputFile = weaFile.replace(".wea", ".mtx")
-        outputFileDif = weaFile.replace(".wea", "_dif_" + `n` + ".mtx")
-        outputFileDir = weaFile.replace(".wea", "_dir_" + `n` + ".mtx")
-        
-        # check if the study is already ran for this weather file
-        if useOldRes and os.path.isfile(outputFileDif) and os.path.isfile(outputFileDir):
-            # ask the user if he wants to re-run the study
-            print "Sky matrix files for this epw file are already existed on your system.\n" + \
-                  "The component won't recalculate the sky and imports the available result.\n" + \
-                  "In case you don't want to use these files, set useOldRes input to False and re-run the study.\n" + \
-                  "If you found the lines above confusing just ignore it! It's all fine. =)\n"
-        else:
-            batchFile = weaFile.replace(".wea", ".bat")
-            try:
-                username = ' %s' % os.getenv("USERNAME")
-            except:
-                username = ''
+        radValuesDict = None
+        if useOldRes:
+            # make working directory.
+            if workingDir:
+                workingDir = lb_preparation.removeBlankLight(workingDir)
+            workingDir = lb_preparation.makeWorkingDir(workingDir)
+            # make sure the directory has been created.
+            if workingDir == -1:
+                warning = 'Failed to create working directory for genCumSky.'
+                print warning
+                ghenv.Component.AddRuntimeMessage(w, warning)
+                return -1
             
-            command = '@echo off \necho.\n echo HELLO{0}!\n' \
-                      'echo DO NOT CLOSE THIS WINDOW. \necho.\necho IT WILL BE CLOSED AUTOMATICALLY WHEN THE CALCULATION IS OVER!\n' \
-                      'echo.\necho AND MAY TAKE FEW MINUTES...\n' \
-                      'echo.\n' \
-                      'echo CALCULATING DIFFUSE COMPONENT OF THE SKY...\n' \
-                      '"{1}\\gendaymtx" -m {2} -s -O1 "{3}"> "{4}"\n' \
-                      'echo.\necho CALCULATING DIRECT COMPONENT OF THE SKY...\n' \
-                      '"{1}\\gendaymtx" -m {2} -d -O1 "{3}"> "{5}"\n'
-                     
-            command = command.format(username, workingDir, n, weaFile,
-                                     outputFileDif, outputFileDir)
-            file = open(batchFile, 'w')
-            file.write(command.encode('utf-8'))
-            file.close()
+            subWorkingDir = os.path.join(workingDir, newLocName)
+            outputFileDif = os.path.join(subWorkingDir, "Design_Day_ASHRAE_Clear_Sky_dif_" + `n` + ".mtx")
+            outputFileDir = os.path.join(subWorkingDir, "Design_Day_ASHRAE_Clear_Sky_dir_" + `n` + ".mtx")
             
-            os.system('"%s"' % batchFile)
+            # check if the study is already ran for this location
+            if os.path.isfile(outputFileDif) and os.path.isfile(outputFileDir):
+                print "Sky matrix files for this location are already existed on your system.\n" + \
+                      "The component won't recalculate the sky and imports the available result.\n" + \
+                      "In case you don't want to use these files, set useOldRes input to False and re-run the study.\n"
+                radValuesDict = lb_skyMatrix.readGendaymtx(outputFileDif, outputFileDir, n)
+        
+        if radValuesDict == None:
+            # the last 8760 items are the hourly values (the header may be missing)
+            wea = lb_wea(locName, lat, lngt, timeZone, elev, directNormRad[-8760:], diffuseHorizRad[-8760:])
+            radValuesDict = lb_skyMatrix(wea, n).toDict()
         
-        # Read in the result matrix.
-        cumulativeSkyMtx = readMTXFile(outputFileDif, outputFileDir, n, newLocName, lat, lngt, timeZone)
+        cumulativeSkyMtx = SkyResultsCollection(radValuesDict, newLocName, lat, lngt, timeZone)
     else:
         cumulativeSkyMtx = None
     
@@ -65,11 +65,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_ENVI-Met Spaces"
 ghenv.Component.NickName = 'ENVI-MetSpaces'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "7 | WIP"
-#compatibleLBVersion = VER 0.0.62\nJUN_07_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
 
@@ -79,7 +79,6 @@ import datetime
 import collections
 import Rhino as rc
 import scriptcontext as sc
-from xml.dom import minidom
 import Grasshopper.Kernel as gh
 
 
@@ -110,129 +109,25 @@ def locationDataFunction(location):
     return locationName, '{:f}'.format(float(latitude)), '{:f}'.format(float(longitude)), timeZone
 
 
-def matrixConstruction(buildings, numX, numY, numZ, dimX, dimY, dimZ, matWall, matRoof, basePoint):
+def matrixConstruction(domain, buildings, matWall, matRoof):
     
-    buildingFlagAndNr = []
-    nestedLayers = []
+    # voxelize the building meshes with the ids 1, 2, ...
+    for building in buildings:
+        vertices, faces = lb_meshpreparation.meshArrays(building)
+        domain.addBuilding(vertices, faces)
     
-    for index, building in enumerate(buildings):
-        layers = []
-        for k in range(numZ+5):
-            columns = []
-            for j in range(numY+1):
-                rows = []
-                for i in range(numX+1):
-                    if k<5:
-                        point = rc.Geometry.Point3d(i*dimX+dimX/2 + basePoint.X, j*dimY+dimY/2 + basePoint.Y, k*dimZ/5+dimZ/10 + basePoint.Z)
-                    else:
-                        point = rc.Geometry.Point3d(i*dimX+dimX/2 + basePoint.X, j*dimY+dimY/2 + basePoint.Y, (k-4)*dimZ+dimZ/2 + basePoint.Z)
-                    if building.IsPointInside(point, sc.doc.ModelAbsoluteTolerance*10, False):
-                        bNr = ','.join([str(i),str(j),str(k),'1',str(index+1)])
-                        id = index+1
-                        
-                        buildingFlagAndNr.append(bNr)
-                        rows.append(id)
-                    else:
-                        rows.append(0)
-                  
-                columns.append(rows)
-            layers.append(columns)  
-        nestedLayers.append(layers)
-    
-    buildingFlagAndNrMatrix = '\n'.join(buildingFlagAndNr)
-    
-    # merge Matrix
-    oneMatrix = []
-    for k in zip(*nestedLayers):
-        columns = []
-        for y in zip(*k):
-            rows = []
-            for x in zip(*y):
-                total = sum(x)
-                # overlap issue ;)
-                if total > len(buildings):
-                    print 's'
-                    total = 0
-                rows.append(total)
-            columns.append(rows)
-        oneMatrix.append(columns)
-    
-    # spare matrix
-    WallDB = []
-    
-    for k, layer in enumerate(oneMatrix):
-        for j, column in enumerate(layer):
-            for i, row in enumerate(column):
-                
-                if row != 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],matWall[index],matRoof[index]]))
-                elif row != 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],'',matRoof[index]]))
-                elif row != 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'',matWall[index],matRoof[index]]))
-                
-                elif row != 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] != 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],matWall[index],'']))
-                elif row != 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] != 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],'','']))
-                elif row != 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] != 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'',matWall[index],'']))
-                elif row != 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(row)-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'','',matRoof[index]]))
-                
-                # empty cells
-                elif row == 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(oneMatrix[k][j][i-1])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],'','']))
-                elif row == 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(oneMatrix[k][j-1][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'',matWall[index],'']))
-                elif row == 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] != 0:
-                    index = int(oneMatrix[k-1][j][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'','',matRoof[index]]))
-                
-                elif row == 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] == 0:
-                    index = int(oneMatrix[k][j-1][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[index],matWall[index],'']))
-                elif row == 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] == 0 and oneMatrix[k-1][j][i] != 0:
-                    indexW = int(oneMatrix[k][j][i-1])-1
-                    indexR = int(oneMatrix[k-1][j][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[indexW],'',matRoof[indexR]]))
-                elif row == 0 and oneMatrix[k][j][i-1] == 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] != 0:
-                    indexW = int(oneMatrix[k][j-1][i])-1
-                    indexR = int(oneMatrix[k-1][j][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),'',matWall[indexW],matRoof[indexR]]))
-                elif row == 0 and oneMatrix[k][j][i-1] != 0 and oneMatrix[k][j-1][i] != 0 and oneMatrix[k-1][j][i] != 0:
-                    indexW = int(oneMatrix[k][j-1][i])-1
-                    indexR = int(oneMatrix[k-1][j][i])-1
-                    WallDB.append(','.join([str(i),str(j),str(k),matWall[indexW],matWall[indexW],matRoof[indexR]]))
-    
-    WallDBMatrix = '\n'.join(WallDB)
-    
-    return buildingFlagAndNrMatrix, WallDBMatrix, oneMatrix
-
-
-def twoDimensionalBuilding(oneMatrix):
-    buildingNr = []
-    
-    for k in zip(*oneMatrix):
-        columns = []
-        emptyColumns = []
-        for y in zip(*k):
-            index = sum(set(y))
-            columns.append(index)
-        
-        linebuildingNr = ','.join(map(str, columns))
-        buildingNr.append(linebuildingNr)
+    # the records are written by the INXWriter
+    buildingFlagAndNrMatrix = domain.buildingFlags
+    
+    # walls and roofs between building cells and empty cells
+    WallDBMatrix = lambda: domain.wallRecords(matWall, matRoof)
+    
+    return buildingFlagAndNrMatrix, WallDBMatrix
+
+
+def twoDimensionalBuilding(domain):
     
-    buildingNrMatrix = '\n'.join(reversed(buildingNr))
+    buildingNrMatrix = '\n'.join(domain.buildingNumbers())
     
     return buildingNrMatrix
 
@@ -277,27 +172,13 @@ def checkDistanceFromBorder(points, buildings, dimX, dimY, dimZ, numZ, maxHeight
     return True
 
 
-def digitalElevationModel3D(terrain, numX, numY, numZ, dimX, dimY, dimZ, basePoint):
-    
-    terrainflag = []
-    
-    for k in range(numZ+5):
-        columns = []
-        for j in range(numY+1):
-            rows = []
-            for i in range(numX+1):
-                if k<5:
-                    point = rc.Geometry.Point3d(i*dimX+dimX/2 + basePoint.X, j*dimY+dimY/2 + basePoint.Y, k*dimZ/5+dimZ/10 + basePoint.Z)
-                else:
-                    point = rc.Geometry.Point3d(i*dimX+dimX/2 + basePoint.X, j*dimY+dimY/2 + basePoint.Y, (k-4)*dimZ+dimZ/2 + basePoint.Z)
-                if terrain.IsPointInside(point, sc.doc.ModelAbsoluteTolerance*10, False):
-                    tN = ','.join([str(i),str(j),str(k),str('1.00000')])
-                    
-                    terrainflag.append(tN)
+def digitalElevationModel3D(terrain, domain):
     
-    terrainFlagMatrix = '\n'.join(terrainflag)
+    vertices, faces = lb_meshpreparation.meshArrays(terrain)
+    terrainFlagMatrix = lambda: domain.terrainFlags(vertices, faces)
+    terrainSignature = hash((tuple(vertices), tuple(faces), tuple(domain.xs), tuple(domain.ys), tuple(domain.zs)))
     
-    return terrainFlagMatrix
+    return terrainFlagMatrix, terrainSignature
 
 
 def separateData(data):
@@ -434,7 +315,9 @@ def grid(numX, numY, numZ, dimX, dimY, dimZ, basePoint):
     return points
 
 
-def writeINX(fullPath, Xcells, Ycells, Zcells, Xdim, Ydim, Zdim, numNesting, matNesting, location, north, defaultMat, buildingEmptyMatrix, buildingNrMatrix, terrainFlagMatrix, buildingFlagAndNrMatrix, WallDBMatrix, ID_plants1DMatrix, threeDplants, soils2DMatrix, ID_sourcesMatrix, emptySequence, demPattern, telescopingGrid = 0, verticalStretch = 0.0, startStretch = 0.0, has3DModel = 1, isFull3DDesign = 1):
+def writeINX(fullPath, Xcells, Ycells, Zcells, Xdim, Ydim, Zdim, numNesting, matNesting, location, north, defaultMat, buildingEmptyMatrix, buildingNrMatrix, terrainFlagMatrix, buildingFlagAndNrMatrix, WallDBMatrix, ID_plants1DMatrix, threeDplants, soils2DMatrix, ID_sourcesMatrix, emptySequence, demPattern, telescopingGrid = 0, verticalStretch = 0.0, startStretch = 0.0, has3DModel = 1, isFull3DDesign = 1, signatures = {}):
+    # matrices are texts or functions that return the lines of the matrix.
+    # signatures has a signature for sections that can be copied from the previous file (see INXWriter).
     
     # location data
     locationName, latitude, longitude, timeZone = locationDataFunction(location)
@@ -449,192 +332,94 @@ def writeINX(fullPath, Xcells, Ycells, Zcells, Xdim, Ydim, Zdim, numNesting, mat
         startStretch = 0 
         grids3DK = Zcells + 4
     
-    
-    def appendMultipleChild(childChild, childRoot):         
-        elements = []
-        for key, element in childChild.items():
-            xmlElement = root.createElement(key)
-            xmlElement.appendChild(root.createTextNode(element))
-            elements.append(xmlElement)        
-        for node in elements:
-            childRoot.childNodes.append(node)
-    
-    
-    def appendMultipleChildWithAttribute(childChild, childRoot, nameAttribute, dataAttribute): 
-        elements = []
-        for key, element in childChild.items():
-            xmlElement = root.createElement(key)
-            for name, attr in zip(nameAttribute, dataAttribute):
-                xmlElement.setAttribute(name, attr)
-            xmlElement.appendChild(root.createTextNode(element))
-            elements.append(xmlElement)        
-        for node in elements:
-            childRoot.childNodes.append(node)
-    
     # date
     timeTxt = datetime.datetime.now()
     timeTxt = str(timeTxt)[:-7]
     
-    root = minidom.Document()
-    
-    # create an xml document, ENVI-MET_Datafile
-    xml = root.createElement('ENVI-MET_Datafile')
-    root.appendChild(xml)
-    
-    
-    # child of root, Header
-    header = root.createElement('Header')
-    baseData = root.createElement('baseData')
-    modelGeometry = root.createElement('modelGeometry')
-    nestingArea = root.createElement('nestingArea')
-    locationData = root.createElement('locationData')
-    defaultSettings = root.createElement('defaultSettings')
-    buildings2D = root.createElement('buildings2D')
-    simpleplants2D = root.createElement('simpleplants2D')
-    soils2D = root.createElement('soils2D')
-    dem = root.createElement('dem')
-    sources2D = root.createElement('sources2D')
-    receptors2D = root.createElement('receptors2D')# empty
-    additionalData = root.createElement('additionalData')# empty
-    modelGeometry3D = root.createElement('modelGeometry3D')
-    buildings3D = root.createElement('buildings3D')
-    dem3D = root.createElement('dem3D')
-    WallDB = root.createElement('WallDB')
-    SingleWallDB = root.createElement('SingleWallDB')
-    
-    
-    xml.appendChild(header)
-    xml.appendChild(baseData)
-    xml.appendChild(modelGeometry)
-    xml.appendChild(nestingArea)
-    xml.appendChild(locationData)
-    xml.appendChild(defaultSettings)
-    xml.appendChild(buildings2D)
-    xml.appendChild(simpleplants2D)
-    xml.appendChild(soils2D)
-    xml.appendChild(dem)
-    xml.appendChild(sources2D)
-    xml.appendChild(receptors2D)
-    xml.appendChild(additionalData)
-    xml.appendChild(modelGeometry3D)
-    xml.appendChild(buildings3D)
-    xml.appendChild(dem3D)
-    xml.appendChild(WallDB)
-    xml.appendChild(SingleWallDB)
-    
-    # add child to header
-    headerDict = {'filetype':'INPX ENVI-met Area Input File',
-                  'version': '4',
-                  'revisiondate':timeTxt,
-                  'remark':'- Test version -',
-                  'encryptionlevel':'0'
-                  }
-    baseDataDict = {'modelDescription':'DragonFly Document',
-                  'modelAuthor': 'DragonFly'
-                  }
-    modelGeometryDict = {'grids-I': str(Xcells),
-                  'grids-J': str(Ycells),
-                  'grids-Z': str(Zcells),
-                  'dx': '{:f}'.format(Xdim),
-                  'dy': '{:f}'.format(Ydim),
-                  'dz-base': '{:f}'.format(Zdim),
-                  'useTelescoping_grid': str(telescopingGrid),
-                  'useSplitting': str(useSplitting),
-                  'verticalStretch': '{:f}'.format(verticalStretch),
-                  'startStretch': '{:f}'.format(startStretch),
-                  'has3DModel': str(has3DModel),
-                  'isFull3DDesign': str(isFull3DDesign)
-                  }
-    nestingAreaDict = {'numberNestinggrids': str(numNesting),
-                  'soilProfileA': matNesting[0],
-                  'soilProfileB': matNesting[1]
-                  }
-    locationDataDict = {'modelRotation':'{:f}'.format(north),
-                  'projectionSystem': '',
-                  'realworldLowerLeft_X':'0.00000',
-                  'realworldLowerLeft_Y':'0.00000',
-                  'locationName':locationName,
-                  'location_Longitude':longitude,
-                  'location_Latitude':latitude,
-                  'locationTimeZone_Name':timeZone,
-                  'locationTimeZone_Longitude':'15.00000'
-                  }
-    defaultSettingsDict = {'commonWallMaterial': defaultMat[0],
-                  'commonRoofMaterial': defaultMat[1]
-                  }
-    nameAttribute2D, dataAttribute2D = ['type', 'dataI', 'dataJ'], ['matrix-data', str(Xcells), str(Ycells)] #buildingNrMatrix
-    buildings2DDict = {'zTop':buildingNrMatrix,
-                  'zBottom':buildingEmptyMatrix,
-                  'buildingNr':buildingNrMatrix,
-                  'fixedheight':buildingEmptyMatrix
-                  }
-    simpleplants2DDict = {'ID_plants1D':ID_plants1DMatrix
-                  }
-    soils2DDict = {'ID_soilprofile':soils2DMatrix
-                  }
-    demDict = {'terrainheight':demPattern
-                  }
-    sources2DDict = {'ID_sources':ID_sourcesMatrix
-                  }
-    receptors2DDict = {'ID_receptors':emptySequence
-                  }# empty
-    additionalDataDict = {'db_link_point':emptySequence,
-                  'db_link_area':emptySequence
-                  }# empty
-    modelGeometry3DDict = {'grids3D-I': str(Xcells),
-                  'grids3D-J': str(Ycells),
-                  'grids3D-K': str(grids3DK)
-                  }
-    nameAttribute3Dbuilding, dataAttribute3Dbuilding = ['type', 'dataI', 'dataJ', 'zlayers', 'defaultValue'], ['sparematrix-3D', str(Xcells), str(Ycells), str(grids3DK), '0']
-    buildings3DDict = {'buildingFlagAndNr':buildingFlagAndNrMatrix
-                  }
-    nameAttribute3DTerrain, dataAttribute3DTerrain = ['type', 'dataI', 'dataJ', 'zlayers', 'defaultValue'], ['sparematrix-3D', str(Xcells), str(Ycells), str(grids3DK), '0.00000']
-    dem3DDict = {'terrainflag':terrainFlagMatrix
-                  }
-    nameAttributeWallDB, dataAttributeWallDB = ['type', 'dataI', 'dataJ', 'zlayers', 'defaultValue'], ['sparematrix-3D', str(Xcells), str(Ycells), str(grids3DK), '']
-    WallDBDict = {'ID_wallDB':WallDBMatrix
-                  }
-    nameAttributeSingleWallDB, dataAttributeSingleWallDB = ['type', 'dataI', 'dataJ', 'zlayers', 'defaultValue'], ['sparematrix-3D', str(Xcells), str(Ycells), str(grids3DK), '']
-    SingleWallDBDict = {'ID_singlewallDB':''
-                  }
-    
-    # appendChild!
-    appendMultipleChild(headerDict, header)
-    appendMultipleChild(baseDataDict, baseData)
-    appendMultipleChild(modelGeometryDict, modelGeometry)
-    appendMultipleChild(nestingAreaDict, nestingArea)
-    appendMultipleChild(locationDataDict, locationData)
-    appendMultipleChild(defaultSettingsDict, defaultSettings)
-    appendMultipleChildWithAttribute(buildings2DDict, buildings2D, nameAttribute2D, dataAttribute2D)
-    appendMultipleChildWithAttribute(simpleplants2DDict, simpleplants2D, nameAttribute2D, dataAttribute2D)
-    if threeDplants:
-        for plant in threeDplants:
-            plants3D = root.createElement('3Dplants')
-            xml.appendChild(plants3D)
-            plants3DDict = {'rootcell_i': str(plant[0]),
-                          'rootcell_j': str(plant[1]),
-                          'rootcell_k': str(plant[2]),
-                          'plantID': str(plant[3]),
-                          'name': str(plant[4]),
-                          'observe': str(plant[5])
-                          }
-            appendMultipleChild(plants3DDict, plants3D)
-    appendMultipleChildWithAttribute(soils2DDict, soils2D, nameAttribute2D, dataAttribute2D)
-    appendMultipleChildWithAttribute(demDict, dem, nameAttribute2D, dataAttribute2D)
-    appendMultipleChildWithAttribute(sources2DDict, sources2D, nameAttribute2D, dataAttribute2D)
-    appendMultipleChildWithAttribute(receptors2DDict, receptors2D, nameAttribute2D, dataAttribute2D)
-    appendMultipleChildWithAttribute(additionalDataDict, additionalData, nameAttribute2D, dataAttribute2D)
-    appendMultipleChild(modelGeometry3DDict, modelGeometry3D)
-    appendMultipleChildWithAttribute(buildings3DDict, buildings3D, nameAttribute3Dbuilding, dataAttribute3Dbuilding)
-    appendMultipleChildWithAttribute(dem3DDict, dem3D, nameAttribute3DTerrain, dataAttribute3DTerrain)
-    appendMultipleChildWithAttribute(WallDBDict, WallDB, nameAttributeWallDB, dataAttributeWallDB)
-    appendMultipleChildWithAttribute(SingleWallDBDict, SingleWallDB, nameAttributeSingleWallDB, dataAttributeSingleWallDB)
-    
-    # pass xml in xml string
-    xml_str = root.toprettyxml(indent="  ")
-    
-    with open(fullPath, "w") as f:
-        f.write(xml_str[23:])
+    def children(childList, attributes = []):
+        return [(key, attributes, element) for key, element in childList]
+    
+    attributes2D = lb_inxWriter.matrixAttributes(Xcells, Ycells)
+    
+    # sections of the ENVI-MET_Datafile in the order of the file
+    headerList = [('filetype', 'INPX ENVI-met Area Input File'),
+                  ('version', '4'),
+                  ('revisiondate', timeTxt),
+                  ('remark', '- Test version -'),
+                  ('encryptionlevel', '0')]
+    baseDataList = [('modelDescription', 'DragonFly Document'),
+                  ('modelAuthor', 'DragonFly')]
+    modelGeometryList = [('grids-I', str(Xcells)),
+                  ('grids-J', str(Ycells)),
+                  ('grids-Z', str(Zcells)),
+                  ('dx', '{:f}'.format(Xdim)),
+                  ('dy', '{:f}'.format(Ydim)),
+                  ('dz-base', '{:f}'.format(Zdim)),
+                  ('useTelescoping_grid', str(telescopingGrid)),
+                  ('useSplitting', str(useSplitting)),
+                  ('verticalStretch', '{:f}'.format(verticalStretch)),
+                  ('startStretch', '{:f}'.format(startStretch)),
+                  ('has3DModel', str(has3DModel)),
+                  ('isFull3DDesign', str(isFull3DDesign))]
+    nestingAreaList = [('numberNestinggrids', str(numNesting)),
+                  ('soilProfileA', matNesting[0]),
+                  ('soilProfileB', matNesting[1])]
+    locationDataList = [('modelRotation', '{:f}'.format(north)),
+                  ('projectionSystem', ''),
+                  ('realworldLowerLeft_X', '0.00000'),
+                  ('realworldLowerLeft_Y', '0.00000'),
+                  ('locationName', locationName),
+                  ('location_Longitude', longitude),
+                  ('location_Latitude', latitude),
+                  ('locationTimeZone_Name', timeZone),
+                  ('locationTimeZone_Longitude', '15.00000')]
+    defaultSettingsList = [('commonWallMaterial', defaultMat[0]),
+                  ('commonRoofMaterial', defaultMat[1])]
+    buildings2DList = [('zTop', buildingNrMatrix),
+                  ('zBottom', buildingEmptyMatrix),
+                  ('buildingNr', buildingNrMatrix),
+                  ('fixedheight', buildingEmptyMatrix)]
+    additionalDataList = [('db_link_point', emptySequence),
+                  ('db_link_area', emptySequence)]
+    modelGeometry3DList = [('grids3D-I', str(Xcells)),
+                  ('grids3D-J', str(Ycells)),
+                  ('grids3D-K', str(grids3DK))]
+    
+    sections = [('Header', children(headerList)),
+                ('baseData', children(baseDataList)),
+                ('modelGeometry', children(modelGeometryList)),
+                ('nestingArea', children(nestingAreaList)),
+                ('locationData', children(locationDataList)),
+                ('defaultSettings', children(defaultSettingsList)),
+                ('buildings2D', children(buildings2DList, attributes2D)),
+                ('simpleplants2D', children([('ID_plants1D', ID_plants1DMatrix)], attributes2D)),
+                ('soils2D', children([('ID_soilprofile', soils2DMatrix)], attributes2D)),
+                ('dem', children([('terrainheight', demPattern)], attributes2D)),
+                ('sources2D', children([('ID_sources', ID_sourcesMatrix)], attributes2D)),
+                ('receptors2D', children([('ID_receptors', emptySequence)], attributes2D)),
+                ('additionalData', children(additionalDataList, attributes2D)),
+                ('modelGeometry3D', children(modelGeometry3DList)),
+                ('buildings3D', children([('buildingFlagAndNr', buildingFlagAndNrMatrix)],
+                    lb_inxWriter.sparseMatrixAttributes(Xcells, Ycells, grids3DK, '0'))),
+                ('dem3D', children([('terrainflag', terrainFlagMatrix)],
+                    lb_inxWriter.sparseMatrixAttributes(Xcells, Ycells, grids3DK, '0.00000'))),
+                ('WallDB', children([('ID_wallDB', WallDBMatrix)],
+                    lb_inxWriter.sparseMatrixAttributes(Xcells, Ycells, grids3DK, ''))),
+                ('SingleWallDB', children([('ID_singlewallDB', '')],
+                    lb_inxWriter.sparseMatrixAttributes(Xcells, Ycells, grids3DK, '')))]
+    for plant in threeDplants:
+        plants3DList = [('rootcell_i', str(plant[0])),
+                      ('rootcell_j', str(plant[1])),
+                      ('rootcell_k', str(plant[2])),
+                      ('plantID', str(plant[3])),
+                      ('name', str(plant[4])),
+                      ('observe', str(plant[5]))]
+        sections.append(('3Dplants', children(plants3DList)))
+    
+    # stream the file and reuse the unchanged sections of the previous run
+    writers = sc.sticky["ladybug_INXWriters"]
+    if fullPath not in writers: writers[fullPath] = lb_inxWriter(fullPath)
+    writers[fullPath].write([(tag, signatures.get(tag), sectionChildren) for tag, sectionChildren in sections])
 
 
 def main():
@@ -718,15 +503,14 @@ def main():
         checkBorder = checkDistanceFromBorder(points, buildings, dimX, dimY, dimZ, numZ, maxHeight, basePoint)
         
         if checkBorder:
-            # move building up
-            copyBuildings = [b.Duplicate() for b in buildings]
-            #[b.Translate(rc.Geometry.Vector3d.ZAxis*(dimZ/10)) for b in copyBuildings]
+            # voxel grid of the model
+            domain = lb_envimetDomain(numX+1, numY+1, numZ+1, dimX, dimY, dimZ, (basePoint.X, basePoint.Y, basePoint.Z))
             
             # create building matrix
-            buildingFlagAndNrMatrix, WallDBMatrix, oneMatrix = matrixConstruction(copyBuildings, numX, numY, numZ, dimX, dimY, dimZ, wallMaterials, roofMaterials, basePoint)
+            buildingFlagAndNrMatrix, WallDBMatrix = matrixConstruction(domain, buildings, wallMaterials, roofMaterials)
             
             # 2D building stuff
-            buildingNrMatrix = twoDimensionalBuilding(oneMatrix)
+            buildingNrMatrix = twoDimensionalBuilding(domain)
             buildingEmptyMatrix = re.sub('\d+','0',buildingNrMatrix)
         else:
             return -1
@@ -734,10 +518,10 @@ def main():
         emptySequence = emptyMatrix(numX, numY)
         # dem
         if envimetTerrain_:
-            terrainFlagMatrix = digitalElevationModel3D(envimetTerrain_, numX, numY, numZ, dimX, dimY, dimZ, basePoint)
+            terrainFlagMatrix, terrainSignature = digitalElevationModel3D(envimetTerrain_, domain)
             demPattern = generateDem2D(numX, numY, dimX, dimY, envimetTerrain_, basePoint)
         else:
-            terrainFlagMatrix = ''
+            terrainFlagMatrix, terrainSignature = '', None
             demPattern = buildingEmptyMatrix
         # plants
         if envimetPlants_:
@@ -761,12 +545,16 @@ def main():
             ID_sourcesMatrix = matrix2DGen(source2D, numX, numY, dimX, dimY, idSource, '', basePoint)
         else: ID_sourcesMatrix = emptySequence
         
-        # write file
+        # write file. Sections that didn't change since the last run are copied from the old file.
+        domainSignature = domain.signature()
         writeINX(fileAddress, numX+1, numY+1, numZ+1, dimX, dimY, dimZ,
                 str(numNestingGrid), nestingGridSoil, _location,
                 north, defaultMaterials, buildingEmptyMatrix, buildingNrMatrix,
                 terrainFlagMatrix, buildingFlagAndNrMatrix, WallDBMatrix, ID_plants1DMatrix, 
-                threeDplants, soils2DMatrix, ID_sourcesMatrix, emptySequence, demPattern)
+                threeDplants, soils2DMatrix, ID_sourcesMatrix, emptySequence, demPattern,
+                signatures = {'buildings3D': domainSignature,
+                              'dem3D': terrainSignature,
+                              'WallDB': hash((domainSignature, tuple(wallMaterials), tuple(roofMaterials)))})
         
         if os.path.exists(fileAddress):
             print("INX file successfully created!")
@@ -796,6 +584,11 @@ if sc.sticky.has_key('ladybug_release'):
         "into canvas and try again."
         w = gh.GH_RuntimeMessageLevel.Warning
         ghenv.Component.AddRuntimeMessage(w, warning)
+    
+    lb_meshpreparation = sc.sticky["ladybug_Mesh"]()
+    lb_envimetDomain = sc.sticky["ladybug_EnvimetDomain"]
+    lb_inxWriter = sc.sticky["ladybug_INXWriter"]
+    if not sc.sticky.has_key("ladybug_INXWriters"): sc.sticky["ladybug_INXWriters"] = {}
 else:
     initCheck = False
     print "You should first let the Ladybug fly..."
@@ -39,19 +39,19 @@ Provided by Honeybee 0.0.59
 
 ghenv.Component.Name = "Ladybug_Generate Mesh"
 ghenv.Component.NickName = 'genMesh'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "5 | Extra"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "5"
 except: pass
 
 
 import Rhino as rc
+import scriptcontext as sc
 import Grasshopper.Kernel as gh
 from itertools import chain
-import System.Threading.Tasks as tasks
 
 def createMesh(brep, gridSize):
     ## mesh breps
@@ -78,64 +78,32 @@ def createMesh(brep, gridSize):
 
 def flattenList(l):return list(chain.from_iterable(l))
 
-def getTestPts(inputMesh, movingDis, moveTestMesh= False, parallel = True):
-        
-        # preparing bulk lists
-        testPoint = [[]] * len(inputMesh)
-        srfNormals = [[]] * len(inputMesh)
-        meshSrfCen = [[]] * len(inputMesh)
-        meshSrfArea = [[]] * len(inputMesh)
-        
-        srfCount = 0
-        for srf in inputMesh:
-            testPoint[srfCount] = range(srf.Faces.Count)
-            srfNormals[srfCount] = range(srf.Faces.Count)
-            meshSrfCen[srfCount] = range(srf.Faces.Count)
-            meshSrfArea[srfCount] = range(srf.Faces.Count)
-            srfCount += 1
+def checkLadybug():
+    if not sc.sticky.has_key('ladybug_release'):
+        print "You should first let the Ladybug fly..."
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, "You should first let the Ladybug fly...")
+        return False
+    try:
+        if not sc.sticky['ladybug_release'].isCompatible(ghenv.Component): return False
+    except:
+        warning = "You need a newer version of Ladybug to use this compoent." + \
+        "Use updateLadybug component to update userObjects.\n" + \
+        "If you have already updated userObjects drag Ladybug_Ladybug component " + \
+        "into canvas and try again."
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, warning)
+        return False
+    return True
 
-        try:
-            def srfPtCalculator(i):
-                # calculate face normals
-                inputMesh[i].FaceNormals.ComputeFaceNormals()
-                inputMesh[i].FaceNormals.UnitizeFaceNormals()
-                
-                for face in range(inputMesh[i].Faces.Count):
-                    srfNormals[i][face] = (inputMesh[i].FaceNormals)[face] # store face normals
-                    meshSrfCen[i][face] = inputMesh[i].Faces.GetFaceCenter(face) # store face centers
-                    # calculate test points
-                    if srfNormals[i][face]:
-                        movingVec = rc.Geometry.Vector3f.Multiply(movingDis,srfNormals[i][face])
-                        testPoint[i][face] = rc.Geometry.Point3d.Add(rc.Geometry.Point3d(meshSrfCen[i][face]), movingVec)
-                    # make mesh surface, calculate the area, dispose the mesh and mass area calculation
-                    tempMesh = rc.Geometry.Mesh()
-                    tempMesh.Vertices.Add(inputMesh[i].Vertices[inputMesh[i].Faces[face].A]) #0
-                    tempMesh.Vertices.Add(inputMesh[i].Vertices[inputMesh[i].Faces[face].B]) #1
-                    tempMesh.Vertices.Add(inputMesh[i].Vertices[inputMesh[i].Faces[face].C]) #2
-                    tempMesh.Vertices.Add(inputMesh[i].Vertices[inputMesh[i].Faces[face].D]) #3
-                    tempMesh.Faces.AddFace(0, 1, 3, 2)
-                    massData = rc.Geometry.AreaMassProperties.Compute(tempMesh)
-                    meshSrfArea[i][face] = massData.Area
-                    massData.Dispose()
-                    tempMesh.Dispose()
-                    
-                    
-        except:
-            print 'Error in Extracting Test Points'
-            pass
-        
-        # calling the function
-        if parallel:
-            tasks.Parallel.ForEach(range(len(inputMesh)),srfPtCalculator)
-        else:
-            for i in range(len(inputMesh)):
-                srfPtCalculator(i)
+def getTestPts(inputMesh, movingDis, moveTestMesh= False, parallel = True):
+        lb_mesh = sc.sticky["ladybug_Mesh"]()
+        testPoint, srfNormals, meshSrfArea = lb_mesh.parallel_testPointCalculator(inputMesh, movingDis, parallel)
         
         if moveTestMesh:
             # find surfaces based on first normal in srfNormals - It is a simplification we can write a better function for this later
             for meshCount, mesh in enumerate(inputMesh):
-                vector = srfNormals[meshCount][0]
-                vector.Unitize()
+                vector = rc.Geometry.Vector3d(srfNormals[meshCount][0])
                 vector = rc.Geometry.Vector3d.Multiply(movingDis, vector)
                 mesh.Translate(vector.X, vector.Y, vector.Z)
                 
@@ -144,7 +112,7 @@ def getTestPts(inputMesh, movingDis, moveTestMesh= False, parallel = True):
 ghenv.Component.Params.Input[1].Name = '_gridSize'
 ghenv.Component.Params.Input[1].NickName = '_gridSize'
 
-if _testGeometry!=None:
+if _testGeometry!=None and checkLadybug():
     inputMesh = []
     
     if type(_testGeometry) == rc.Geometry.Mesh and _distBaseSrf!=None:
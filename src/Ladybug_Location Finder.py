@@ -30,6 +30,8 @@ https://developers.google.com/maps/pricing-and-plans/#details
 -
 Special thanks goes to Google Maps.
 -
+If there is a list of weather stations saved as weatherStations.csv (with name, latitude, longitude and url columns) or weatherStations.geojson in the Ladybug default folder, the nearest stations to the location are printed in readMe!. Connect the location to Ladybug_Open EPW And STAT Weather Files to download the weather file of the nearest one.
+-
 Provided by Ladybug 0.0.66
     
     Args:
@@ -45,11 +47,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Location Finder"
 ghenv.Component.NickName = 'LocationFinder'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "7 | WIP"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
 
@@ -146,6 +148,15 @@ def createLocation(locationName, latitude, longitude, timeZone, elevation):
     return location
 
 
+def printNearestStations(latitude, longitude):
+    catalogue = sc.sticky["ladybug_StationCatalogue"].fromFolder(sc.sticky["Ladybug_DefaultFolder"])
+    if catalogue is None: return
+    print("nearest weather stations:")
+    for distance, index in catalogue.nearest(latitude, longitude, 3):
+        station = catalogue.station(index)
+        print("  {} ({:.1f} km) {}".format(station['name'], distance, station['url'] or ''))
+
+
 def checkInternetConnection():
     server = "www.google.com"
     try:
@@ -169,6 +180,7 @@ def main():
             elevation = location.elevationLocation(latitude, longitude)
             
             location = createLocation(locationName, latitude, longitude, timeZone, elevation)
+            printNearestStations(float(latitude), float(longitude))
         else:
             w = gh.GH_RuntimeMessageLevel.Warning
             ghenv.Component.AddRuntimeMessage(w, "location not found, please try to change the address.")
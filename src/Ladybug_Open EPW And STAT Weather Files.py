@@ -25,11 +25,13 @@
 Use this component to automatically download a .zip file from the Department of Energy's (DOE) database, unzip the file, and open both the .epw and .stat weather files into Grasshopper.
 The component requires the URL of the zipped file for the specific climate that you want to import from the DOE's website.  To open the DOE's website, use the Ladybug_download EPW Weather File component.
 Note that you can copy the zip file URL to your clipboard by right-clicking on the "ZIP" link for the climate that you want on the DOE's website and choosing "Copy Link Address."
+Instead of a URL you can also connect a location (e.g. from the Ladybug_Location Finder) or a "latitude, longitude" text to open the weather file of the nearest station. This needs a list of the stations saved as weatherStations.csv (with name, latitude, longitude and url columns) or weatherStations.geojson in the Ladybug default folder.
+Downloads are kept in the weatherStore folder of the Ladybug default folder, so a weather file is only downloaded once even if you change workingDir_, and an interrupted download continues where it stopped.
 -
 Provided by Ladybug 0.0.66
     
     Args:
-        _weatherFileURL: A text string representing the .zip file URL from the Department of Energy's (DOE's) website. To open the DOE's website, use the Ladybug_download EPW Weather File component. Note that you can copy the zip file URL to your clipboard by right-clicking on the "ZIP" link for the climate that you want on the DOE's website and choosing "Copy Link Address."
+        _weatherFileURL: A text string representing the .zip file URL from the Department of Energy's (DOE's) website. To open the DOE's website, use the Ladybug_download EPW Weather File component. Note that you can copy the zip file URL to your clipboard by right-clicking on the "ZIP" link for the climate that you want on the DOE's website and choosing "Copy Link Address." You can also connect a location or a "latitude, longitude" text to use the weather file of the nearest station in weatherStations.csv.
         workingDir_: An optional text string representing a file path to a working directory on your computer where you would like to download and unzip the file.  If nothing is set, the weather files will be downloaded to C:/ladybug/ and placed in a folder with the name of the weather file location.
     Returns:
         epwFile: The file path of the downloaded epw file.
@@ -37,11 +39,11 @@ Provided by Ladybug 0.0.66
 """
 ghenv.Component.Name = "Ladybug_Open EPW And STAT Weather Files"
 ghenv.Component.NickName = 'EPW+STAT'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "0 | Ladybug"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
 
@@ -49,7 +51,7 @@ except: pass
 import scriptcontext as sc
 import urllib
 import os
-import zipfile,os.path
+import os.path
 import Grasshopper.Kernel as gh
 import time
 import System
@@ -73,6 +75,10 @@ def checkTheInputs(_weatherFileURL):
         
         lb_defaultFolder = sc.sticky["Ladybug_DefaultFolder"]
         
+        if _weatherFileURL and not (_weatherFileURL.startswith('https://') or _weatherFileURL.startswith('http://')):
+            stationURL = nearestStationURL(_weatherFileURL, lb_defaultFolder)
+            if stationURL: _weatherFileURL = stationURL
+        
         if _weatherFileURL and (_weatherFileURL.startswith('https://') or _weatherFileURL.startswith('http://')):
             if _weatherFileURL.endswith('.zip') or _weatherFileURL.endswith('.ZIP') or _weatherFileURL.endswith('.Zip'):
                 folderName = _weatherFileURL.split('/')[-1][:-4]
@@ -105,35 +111,44 @@ def checkTheInputs(_weatherFileURL):
         ghenv.Component.AddRuntimeMessage(w, "You should first let the Ladybug fly...")
         return False, None, None
 
+def nearestStationURL(site, lb_defaultFolder):
+    # site is a location or a "latitude, longitude" text
+    try:
+        if site.startswith('Site:Location'):
+            lb_preparation = sc.sticky["ladybug_Preparation"]()
+            latitude, longitude = lb_preparation.decomposeLocation(site)[1:3]
+        else:
+            latitude, longitude = [float(value) for value in site.split(',')]
+    except:
+        return None
+    
+    catalogue = sc.sticky["ladybug_StationCatalogue"].fromFolder(lb_defaultFolder)
+    if catalogue is None:
+        warning = "To open the weather file of the nearest station, save a list of the stations as weatherStations.csv " + \
+        "(with name, latitude, longitude and url columns) in " + lb_defaultFolder
+        print warning
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+        return None
+    
+    for distance, index in catalogue.nearest(latitude, longitude, 10):
+        station = catalogue.station(index)
+        if station['url']:
+            print "Nearest weather station: " + station['name'] + " (%.1f km)" % distance
+            return station['url']
+    return None
+
 def download(url, workingDir):
+    # downloads are kept in a store in the Ladybug default folder so a url is only
+    # downloaded once. broken downloads are continued the next time.
+    lb_weatherStore = sc.sticky["ladybug_WeatherStore"](os.path.join(sc.sticky["Ladybug_DefaultFolder"], 'weatherStore'))
     try:
-        if not os.path.isdir(workingDir):
-            os.mkdir(workingDir)
-        client = System.Net.WebClient()
-        webFile = os.path.join(workingDir, url.split('/')[-2] + '.zip')
-        client.DownloadFile(url, webFile)
-        return webFile
-        
+        return lb_weatherStore.fetch(url, workingDir)
     except Exception, e:
         warning = 'You are not connected to the internet and you do not have the weather files already on your computer. You must be connected to the internet to download the files with this component.'
         warning += '\n' + `e`
         print warning
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
-        return None
-
-def unzip(source_filename, dest_dir):
-    with zipfile.ZipFile(source_filename) as zf:
-        for member in zf.infolist():
-            # Path traversal defense copied from
-            # http://hg.python.org/cpython/file/tip/Lib/http/server.py#l789
-            words = member.filename.split('\\')
-            path = dest_dir
-            for word in words[:-1]:
-                drive, word = os.path.splitdrive(word)
-                head, word = os.path.split(word)
-                if word in (os.curdir, os.pardir, ''): continue
-                path = os.path.join(path, word)
-            zf.extract(member, path)
+        return None, None
 
 def addresses(directory):
     epw, stat = None, None
@@ -176,13 +191,7 @@ if checkData == True:
     checkData2, epwFile, statFile = checkIfAlreadyDownloaded(workingDir, _weatherFileURL)
 else: checkData2 = True
 
-#Download the zip file to the directory.
+#Download and unzip the file to the directory and load it into Grasshopper!!!!
 if checkData == True and checkData2 == False:
-    zipFileAddress = download(_weatherFileURL, workingDir)
-else: pass
-
-#Unzip the file and load it into Grasshopper!!!!
-if checkData == True and checkData2 == False and zipFileAddress:
-    unzip(zipFileAddress, workingDir)
-    epwFile, statFile = addresses(workingDir)
+    epwFile, statFile = download(_weatherFileURL, workingDir)
 else: pass
\ No newline at end of file
@@ -76,11 +76,11 @@ Provided by Ladybug 0.0.66
 """
 ghenv.Component.Name = "Ladybug_Outdoor Solar Temperature Adjustor"
 ghenv.Component.NickName = 'SolarAdjustTemperature'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nJUN_07_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
 
@@ -918,16 +918,11 @@ def main(method, baseTempType, radTemp, infraredRad, mannequinMesh, groundMesh,
                 totalPersonArea = 1.775
             
             #Compute the sky view of each mesh face and an average sky view over the body.
+            irradianceMtx = sc.sticky["ladybug_IrradianceMatrix"].fromIntersectionMatrix(intersectionMtx)
             skyViews = []
             if baseTempType == True:
                 avgSkyTemp = sum(skyTemp)/len(skyTemp)
-                for ptCount in intersectionMtx.keys():
-                    skyView = 0
-                    numPatches = len(intersectionMtx[ptCount].keys())
-                    for patchCount in intersectionMtx[ptCount].keys():
-                        if intersectionMtx[ptCount][patchCount]['isIntersect']:
-                            skyView = skyView + 1/numPatches
-                    skyViews.append(skyView)
+                skyViews = irradianceMtx.skyViews()
                 skyViewFac = 0
                 for count, area in enumerate(personMeshAreas):
                     skyViewFac = skyViewFac + ((area/totalPersonArea) * skyViews[count])
@@ -966,8 +961,6 @@ def main(method, baseTempType, radTemp, infraredRad, mannequinMesh, groundMesh,
             for item in legendColored[1]:
                 legend.append(item)
             
-            intDict = intersectionMtx
-            
             #Add the headers to the computed lists.
             if periodMethod == 0:
                 analysisStart = analysisPeriodOrHOY[0]
@@ -1000,153 +993,25 @@ def main(method, baseTempType, radTemp, infraredRad, mannequinMesh, groundMesh,
             solarAdjustedMRT.append(analysisStart)
             solarAdjustedMRT.append(analysisEnd)
             
-            #Define functions for computing the radiation for each hour, which is in parallal and not in parallel.
-            def nonParallelRadCalc():
-                try:
-                    for count, hour in enumerate(HOYS):
-                        if gh.GH_Document.IsEscapeKeyDown(): assert False
-                        
-                        if count != len(HOYS)-1: lastVal = 1
-                        else: lastVal = 0
-                        if altitudes[count] > 0 or altitudes[count-1] > 0 or altitudes[count+lastVal] > 0:
-                            skyMtxLists, _analysisPeriodOrHOY_ = getHourlySky(cumSkyMtx.d, hour)
-                            selSkyMatrix = prepareLBList(skyMtxLists, _analysisPeriodOrHOY_, location, unit, False, False)
-                            
-                            indexList, listInfo = lb_preparation.separateList(selSkyMatrix, lb_preparation.strToBeFound)
-                            #separate total, diffuse and direct radiations
-                            separatedLists = []
-                            for i in range(len(indexList)-1):
-                                selList = []
-                                [selList.append(float(x)) for x in selSkyMatrix[indexList[i] + 7:indexList[i+1]]]
-                                separatedLists.append(selList)
-                            
-                            skyMatrix = separatedLists[0]
-                            
-                            radiationResult = []
-                            for ptCount in  intDict.keys():
-                                radValue = 0
-                                for patchCount in intDict[ptCount].keys():
-                                    if intDict[ptCount][patchCount]['isIntersect']:
-                                        radValue = radValue + (skyMatrix[patchCount] * math.cos(intDict[ptCount][patchCount]['vecAngle']))
-                                radiationResult.append(radValue)
-                            
-                            personRad = radiationResult[:-1]
-                            groundRad = radiationResult[-1]
-                            totalPersonBeamDiffRad = sum([a*b for a,b in zip(personRad,personMeshAreas)])
-                            
-                            #Account for the transmissivity of glass.
-                            if finalWinTransmiss[count] != 1:
-                                groundRad = groundRad*(finalWinTransmiss[count])
-                                totalPersonBeamDiffRad = totalPersonBeamDiffRad*(finalWinTransmiss[count])
-                            
-                            #Calculate the additional radiation reflected to the person by the ground.
-                            groundRefRad = 0.5 * groundRad * fracEff * groundR
-                            
-                            #Calculate the total person radiation and the ERF.
-                            totalPersonRad = totalPersonBeamDiffRad + groundRefRad
-                            radiantFlux = totalPersonRad/totalPersonArea
-                            hourERF = (radiantFlux * cloA)/0.95
-                            ERF.append(hourERF/1000)
-                            
-                            #Calculate the MRT delta, the solar adjusted MRT, and the solar adjusted operative temperature.
-                            mrtDelt = (hourERF/(fracEff*radTransCoeff))
-                            MRTDelta.append(mrtDelt)
-                            if baseTempType == False:
-                                hourMRT = mrtDelt + (radTemp[count])
-                            else:
-                                hourMRT = mrtDelt + (skyTemp[count]*(skyViewFac) + radTemp[count]*(1-(skyViewFac)))
-                            solarAdjustedMRT.append(hourMRT)
-                        else:
-                            ERF.append(0)
-                            MRTDelta.append(0)
-                            if baseTempType == False:
-                                hourMRT = radTemp[count]
-                            else:
-                                hourMRT = (skyTemp[count]*(skyViewFac) + radTemp[count]*(1-(skyViewFac)))
-                            solarAdjustedMRT.append(hourMRT)
-                    return True
-                except:
-                    print "The calculation has been terminated by the user!"
-                    e = gh.GH_RuntimeMessageLevel.Warning
-                    ghenv.Component.AddRuntimeMessage(e, "The calculation has been terminated by the user!")
-                    return False
+            #Compute the radiation on the person and the ground for the sun-up hours as a product of the visibility and the sky matrix.
+            lastCount = len(HOYS)-1
+            sunUpCounts = [count for count in range(len(HOYS)) if altitudes[count] > 0 or altitudes[count-1] > 0 or altitudes[min(count+1, lastCount)] > 0]
+            skyMatrix = irradianceMtx.hourlySkyMatrix(cumSkyMtx.d, [HOYS[count] for count in sunUpCounts])
+            personWeights = personMeshAreas + [0]
+            groundWeights = [0]*len(personMeshAreas) + [1]
+            personRad = [0]*len(HOYS)
+            groundRad = [0]*len(HOYS)
+            for count, pRad, gRad in zip(sunUpCounts, irradianceMtx.weightedIrradiance(personWeights, skyMatrix), irradianceMtx.weightedIrradiance(groundWeights, skyMatrix)):
+                personRad[count] = pRad
+                groundRad[count] = gRad
             
-            def parallelRadCalc():
-                def radCalc(count):
-                    if count != len(HOYS)-1: lastVal = 1
-                    else: lastVal = 0
-                    if altitudes[count] > 0 or altitudes[count-1] > 0 or altitudes[count+lastVal] > 0:
-                        skyMtxLists, _analysisPeriodOrHOY_ = getHourlySky(cumSkyMtx.d, HOYS[count])
-                        selSkyMatrix = prepareLBList(skyMtxLists, _analysisPeriodOrHOY_, location, unit, False, False)
-                        
-                        indexList, listInfo = lb_preparation.separateList(selSkyMatrix, lb_preparation.strToBeFound)
-                        #separate total, diffuse and direct radiations
-                        separatedLists = []
-                        for i in range(len(indexList)-1):
-                            selList = []
-                            [selList.append(float(x)) for x in selSkyMatrix[indexList[i] + 7:indexList[i+1]]]
-                            separatedLists.append(selList)
-                        
-                        skyMatrix = separatedLists[0]
-                        
-                        radiationResult = []
-                        for ptCount in  intDict.keys():
-                            radValue = 0
-                            for patchCount in intDict[ptCount].keys():
-                                if intDict[ptCount][patchCount]['isIntersect']:
-                                    radValue = radValue + (skyMatrix[patchCount] * math.cos(intDict[ptCount][patchCount]['vecAngle']))
-                            radiationResult.append(radValue)
-                        
-                        personRad = radiationResult[:-1]
-                        groundRad = radiationResult[-1]
-                        totalPersonBeamDiffRad = sum([a*b for a,b in zip(personRad,personMeshAreas)])
-                        
-                        #Account for the transmissivity of glass.
-                        if (finalWinTransmiss[count]) != 1:
-                            groundRad = groundRad*(finalWinTransmiss[count])
-                            totalPersonBeamDiffRad = totalPersonBeamDiffRad*(finalWinTransmiss[count])
-                        
-                        #Calculate the additional radiation reflected to the person by the ground.
-                        groundRefRad = 0.5 * groundRad * fracEff * groundR
-                        
-                        #Calculate the total person radiation and the ERF.
-                        totalPersonRad = totalPersonBeamDiffRad + groundRefRad
-                        radiantFlux = totalPersonRad/totalPersonArea
-                        hourERF = (radiantFlux * cloA)/0.95
-                        ERF[count+7] = hourERF/1000
-                        
-                        #Calculate the MRT delta, the solar adjusted MRT, and the solar adjusted operative temperature.
-                        mrtDelt = (hourERF/(fracEff*radTransCoeff))
-                        MRTDelta[count+7] = mrtDelt
-                        if baseTempType == False:
-                            hourMRT = mrtDelt + (radTemp[count])
-                        else:
-                            hourMRT = mrtDelt + (skyTemp[count]*(skyViewFac) + radTemp[count]*(1-(skyViewFac)))
-                        solarAdjustedMRT[count+7] = hourMRT
-                    else:
-                        ERF[count+7] = 0
-                        MRTDelta[count+7] = 0
-                        if baseTempType == False:
-                            hourMRT = radTemp[count]
-                        else:
-                            hourMRT = (skyTemp[count]*(skyViewFac) + radTemp[count]*(1-(skyViewFac)))
-                        solarAdjustedMRT[count+7] = hourMRT
-                
-                
-                tasks.Parallel.ForEach(range(len(HOYS)), radCalc)
-                
-                return True
-            
-            # Compute the radiation for each hour of the year.
-            runSuccess = False
-            if parallel == False:
-                runSuccess = nonParallelRadCalc()
-            else:
-                for count, hour in enumerate(HOYS):
-                    ERF.append(0)
-                    MRTDelta.append(0)
-                    solarAdjustedMRT.append(0)
-                runSuccess = parallelRadCalc()
+            #Calculate the ERF, the MRT delta and the solar adjusted MRT.
+            if baseTempType == True: hourlyERF, hourlyMRTDelta, hourlyMRT = lb_comfortModels.solarAdjustedMRT(personRad, groundRad, radTemp, totalPersonArea, fracEff, cloA, groundR, finalWinTransmiss, radTransCoeff, skyTemp, skyViewFac)
+            else: hourlyERF, hourlyMRTDelta, hourlyMRT = lb_comfortModels.solarAdjustedMRT(personRad, groundRad, radTemp, totalPersonArea, fracEff, cloA, groundR, finalWinTransmiss, radTransCoeff)
+            ERF.extend([hourERF/1000 for hourERF in hourlyERF])
+            MRTDelta.extend(hourlyMRTDelta)
+            solarAdjustedMRT.extend(hourlyMRT)
+            runSuccess = True
             
             if runSuccess == True:
                 #If the user has requested to bake the results, then bake them.
@@ -138,11 +138,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Pedestrian Wind Comfort"
 ghenv.Component.NickName = "PedestrianWindComfort"
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "7 | WIP"
-#compatibleLBVersion = VER 0.0.63\nJUN_09_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
 
@@ -190,28 +190,14 @@ def getEpwData(epwFile):
 
 def HOYs_from_analysisPeriod(analysisPeriod):
     
-    if (len(analysisPeriod) != 0) and (analysisPeriod[0] != None):
-        
-        startingDate = analysisPeriod[0]
-        endingDate = analysisPeriod[1]
-        timeStep = 1
-        HOYs, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisPeriod, timeStep)
-    
-    else:  # no "analysisPeriod_" inputted. Use the whole year period
-        HOYs = range(1,8761)
+    if (len(analysisPeriod) == 0) or (analysisPeriod[0] == None):
+        # no "analysisPeriod_" inputted. Use the whole year period
         analysisPeriod = [(1, 1, 1),(12, 31, 24)]
     
-    days = []
-    months = []
-    hours = []
-    for hoy in HOYs:
-        d, m, h = lb_preparation.hour2Date(hoy, True)
-        days.append(d)
-        months.append(m + 1)
-        hours.append(h)
-    
-    startingDate = lb_preparation.hour2Date(lb_preparation.date2Hour(months[0], days[0], hours[0]))
-    endingDate = lb_preparation.hour2Date(lb_preparation.date2Hour(months[-1], days[-1], hours[-1]))
+    HOYs = list(lb_preparation.getAnalysisPeriod(analysisPeriod).hoys)
+    
+    startingDate = lb_preparation.hour2Date(HOYs[0])
+    endingDate = lb_preparation.hour2Date(HOYs[-1])
     date = startingDate + " to " + endingDate
     
     return HOYs, analysisPeriod, date
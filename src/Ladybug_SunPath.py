@@ -84,11 +84,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_SunPath"
 ghenv.Component.NickName = 'sunPath'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nJAN_29_2017
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
 
@@ -203,72 +203,14 @@ def readLocation(location):
 
 
 
-def getHOYs(hours, days, months, timeStep, lb_preparation, method = 0):
-    
-    if method == 1: stDay, endDay = days
-        
-    numberOfDaysEachMonth = lb_preparation.numOfDaysEachMonth
-    
-    numOfHours = timeStep * len(hours) 
-    
-    if timeStep != 1:
-        step = 1/timeStep
-        hours = rs.frange(hours[0], hours[-1] + 1, step)
-        
-        # make sure hours are generated correctly
-        if len(hours) > numOfHours:
-            hours = hours[:numOfHours]
-        elif len(hours) < numOfHours:
-            newHour = hours[-1] + step
-    
-    HOYS = []
-    
-    for monthCount, m in enumerate(months):
-        # just a single day
-        if method == 1 and len(months) == 1 and stDay - endDay == 0:
-            days = [stDay]
-        # few days in a single month
-        
-        elif method == 1 and len(months) == 1:
-            days = range(stDay, endDay + 1)
-        
-        elif method == 1:
-            #based on analysis period
-            if monthCount == 0:
-                # first month
-                days = range(stDay, numberOfDaysEachMonth[m-1] + 1)
-            elif monthCount == len(months) - 1:
-                # last month
-                days = range(1, lb_preparation.checkDay(endDay, m) + 1)
-            else:
-                #rest of the months
-                days = range(1, numberOfDaysEachMonth[m-1] + 1)
-        
-        for d in days:
-            for h in hours:
-                h = lb_preparation.checkHour(float(h))
-                m  = lb_preparation.checkMonth(int(m))
-                d = lb_preparation.checkDay(int(d), m)
-                HOY = lb_preparation.date2Hour(m, d, h)
-                if HOY not in HOYS: HOYS.append(HOY)
-    
-    return HOYS
-
-
 def getHOYsBasedOnPeriod(analysisPeriod, timeStep, lb_preparation):
     stMonth, stDay, stHour, endMonth, endDay, endHour = lb_preparation.readRunPeriod(analysisPeriod, True, False)
     
-    if stMonth > endMonth:
-        months = range(stMonth, 13) + range(1, endMonth + 1)
-    else:
-        months = range(stMonth, endMonth + 1)
-    
     # end hour shouldn't be included
-    hours  = range(stHour, endHour)
+    period = lb_preparation.getAnalysisPeriod(((stMonth, stDay, stHour), (endMonth, endDay, endHour - 1)), timeStep)
     days = stDay, endDay
-    HOYS = getHOYs(hours, days, months, timeStep, lb_preparation, method = 1)
     
-    return HOYS, months, days
+    return list(period.hoys), period.months, days
 
 def colorSun(spheres, colors, lb_visualization):
     sunS = rc.Geometry.Mesh()
@@ -375,7 +317,7 @@ def main(latitude, longitude, timeZone, elevation, north, hour, day, month, time
             months = month
             hours = hour
             
-            HOYs = getHOYs(hours, days, months, timeStep, lb_preparation)
+            HOYs = lb_preparation.getHOYs(hours, days, months, timeStep)
         
         # check conditional statement for the whole year
         titleStatement = -1
@@ -42,21 +42,19 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Surface View Analysis"
 ghenv.Component.NickName = 'srfViewFactors'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "3 | EnvironmentalAnalysis"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 #compatibleHBVersion = VER 0.0.56\nFEB_01_2015
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
 
-import operator
 import Grasshopper.Kernel as gh
 import Rhino as rc
 import rhinoscriptsyntax as rs
 import scriptcontext as sc
 import math
-import System.Threading.Tasks as tasks
 from System import Object
 from Grasshopper import DataTree
 from Grasshopper.Kernel.Data import GH_Path
@@ -102,35 +100,22 @@ def checkInputs():
     
     return checkData, viewRes, viewMethod, viewPoints, viewPtNormals, parallel
 
-def checkViewResolution(viewResolution, centPt, lb_preparation):
+def checkViewResolution(viewResolution, centPt, lb_preparation, lb_viewAnalysis):
     #Set lists to be filled.
-    newVecs = []
     viewPatches = []
-    patchAreaFacs = []
-    patchAreas = []
     
     #Set up some transformations.
     skyPtachTranslation = rc.Geometry.Transform.Translation(centPt.X, centPt.Y, centPt.Z)
     patchReflectTrans = rc.Geometry.Transform.Mirror(rc.Geometry.Plane(centPt, rc.Geometry.Vector3d.XAxis, rc.Geometry.Vector3d.YAxis))
     patchRotateTrans = rc.Geometry.Transform.Rotation(math.pi, rc.Geometry.Vector3d.ZAxis, centPt)
     
-    #Generate sky patches.
-    skyPatches = lb_preparation.generateSkyGeo(rc.Geometry.Point3d.Origin, viewResolution, 1)
+    #Get the spherical view vectors and their patch areas from the cached sets.
+    vectors, patchAreas = lb_viewAnalysis.viewVectors(2, viewResolution)
+    newVecs = [rc.Geometry.Vector3d(*vec) for vec in vectors]
     
-    #Extract info from the patches.
+    #Generate sky patches for the viewPatches output.
+    skyPatches = lb_preparation.generateSkyGeo(rc.Geometry.Point3d.Origin, viewResolution, 1)
     for patch in skyPatches:
-        #Add to the area list.
-        patchAreaProps = rc.Geometry.AreaMassProperties.Compute(patch)
-        patchAreas.extend([patchAreaProps.Area, patchAreaProps.Area])
-        
-        #Add to the vector list.
-        patchPt = patchAreaProps.Centroid
-        Vec = rc.Geometry.Vector3d(patchPt.X, patchPt.Y, patchPt.Z)
-        revVec = rc.Geometry.Vector3d(-patchPt.X, -patchPt.Y, -patchPt.Z)
-        newVecs.append(Vec)
-        newVecs.append(revVec)
-        
-        #Add to the viewPatches list.
         patch.Transform(skyPtachTranslation)
         viewPatches.append(patch)
         newPatch = rc.Geometry.Brep.CreateTrimmedSurface(patch.Faces[0], patch.Faces[0])
@@ -140,71 +125,38 @@ def checkViewResolution(viewResolution, centPt, lb_preparation):
     
     #Convert patch areas to factors that will be multiplied by the 0/1 values.
     normPatArea = sum(patchAreas)/len(patchAreas)
-    for patArea in patchAreas:
-        patchAreaFacs.append(patArea/normPatArea)
+    patchAreaFacs = [patArea/normPatArea for patArea in patchAreas]
     
     return newVecs, viewPatches, patchAreaFacs
 
-def allZero(items):
-    return all(x == "N" for x in items)
-
-def main(zoneSrfsMesh, context, viewVectors, patchAreaFacs, testPts, viewPtNormals, viewMethod, parallel = False):
+def main(zoneSrfsMesh, context, viewVectors, patchAreaFacs, testPts, viewPtNormals, viewMethod, lb_viewAnalysis, parallel = False):
+    totalSrfsMesh = zoneSrfsMesh + context
+    divisor = len(viewVectors)
+    
+    #Find the closest surface that each view vector hits from each point in a single batched query.
+    hits = lb_viewAnalysis.nearestSurfaceHits(testPts, viewVectors, totalSrfsMesh, parallel)
+    
     #Make the list that will eventually hold the view factors of each surface.
     testPtViewFactor = []
     vecSrfIndices = []
-    for pointCount, point in enumerate(testPts):
-        testPtViewFactor.append([])
-        vecSrfIndices.append([])
-        divisor = len(viewVectors)
-    totalSrfsMesh = zoneSrfsMesh + context
-    
-    def intRays(i):
-        #Create the rays to be projected from each point.
-        pointRays = []
-        for vec in viewVectors: pointRays.append(rc.Geometry.Ray3d(testPts[i], vec))
-        
-        #Create a list that will hold the intersection hits of each surface
-        srfHits = []
-        for srf in totalSrfsMesh: srfHits.append([])
-        
-        #Perform the intersection of the rays with the mesh.
-        pointIntersectList = []
-        for rayCount, ray in enumerate(pointRays):
-            pointIntersectList.append([])
-            for srf in totalSrfsMesh:
-                intersect = rc.Geometry.Intersect.Intersection.MeshRay(srf, ray)
-                if intersect == -1: intersect = "N"
-                pointIntersectList[rayCount].append(intersect)
-        
-        #Find the intersection that was the closest for each ray (in case one ray intersects 2 surfaces)
-        for rayCount, intList in enumerate(pointIntersectList):
-            if allZero(intList) == False:
-                minIndex, minValue = min(enumerate(intList), key=operator.itemgetter(1))
-                if minIndex > len(zoneSrfsMesh)-1:
-                    vecSrfIndices[i].append(-1)
-                else:
-                    vecSrfIndices[i].append(minIndex)
-                    if viewMethod == 0: srfHits[minIndex].append(patchAreaFacs[rayCount])
-                    else:
-                        # calculate the angle between the surface and the vector to project the view into the plane.
-                        vecAngle = rc.Geometry.Vector3d.VectorAngle(viewVectors[rayCount], viewPtNormals[i])
-                        if math.degrees(vecAngle) > 90:
-                            srfHits[minIndex].append(0)
-                        else:
-                            srfHits[minIndex].append(patchAreaFacs[rayCount]* 4 * abs(math.cos(vecAngle)))
+    for i, ptHits in enumerate(hits):
+        srfHits = [0] * len(totalSrfsMesh)
+        srfIndices = []
+        for rayCount, srfIndex in enumerate(ptHits):
+            if srfIndex == -1 or srfIndex > len(zoneSrfsMesh)-1:
+                srfIndices.append(-1)
+                continue
+            srfIndices.append(srfIndex)
+            if viewMethod == 0: srfHits[srfIndex] += patchAreaFacs[rayCount]
             else:
-                vecSrfIndices[i].append(-1)
+                # calculate the angle between the surface and the vector to project the view into the plane.
+                vecAngle = rc.Geometry.Vector3d.VectorAngle(viewVectors[rayCount], viewPtNormals[i])
+                if math.degrees(vecAngle) <= 90:
+                    srfHits[srfIndex] += patchAreaFacs[rayCount]* 4 * abs(math.cos(vecAngle))
         
-        #Sum up the lists and divide by the total rays to get the view factor.
-        for hitList in srfHits:
-            testPtViewFactor[i].append(sum(hitList)/divisor)
-    
-    if parallel:
-        tasks.Parallel.ForEach(range(len(testPts)), intRays)
-    else:
-        for count in range(len(testPts)):
-            intRays(count)
-    
+        #Divide by the total rays to get the view factor.
+        testPtViewFactor.append([hit/divisor for hit in srfHits])
+        vecSrfIndices.append(srfIndices)
     
     return testPtViewFactor, vecSrfIndices
 
@@ -222,6 +174,7 @@ else:
         if not sc.sticky['ladybug_release'].isCompatible(ghenv.Component): initCheck = False
         if sc.sticky['ladybug_release'].isInputMissing(ghenv.Component): initCheck = False
         lb_preparation = sc.sticky["ladybug_Preparation"]()
+        lb_viewAnalysis = sc.sticky["ladybug_ViewAnalysis"]()
     except:
         initCheck = False
         warning = "You need a newer version of Ladybug to use this compoent." + \
@@ -237,8 +190,8 @@ if initCheck == True:
     checkData, viewRes, viewMethod, viewPoints, viewPtNormals, parallel = checkInputs()
     if checkData == True and _runIt == True:
         viewPatchBasePt = viewPoints[0]
-        viewVectors, viewPatches, patchAreaFacs = checkViewResolution(viewRes, viewPatchBasePt, lb_preparation)
-        srfViewFactorsInit, viewVecSrfIndexInit = main(_testSrfs, context_, viewVectors, patchAreaFacs, viewPoints, viewPtNormals, viewMethod, parallel)
+        viewVectors, viewPatches, patchAreaFacs = checkViewResolution(viewRes, viewPatchBasePt, lb_preparation, lb_viewAnalysis)
+        srfViewFactorsInit, viewVecSrfIndexInit = main(_testSrfs, context_, viewVectors, patchAreaFacs, viewPoints, viewPtNormals, viewMethod, lb_viewAnalysis, parallel)
         
         srfViewFactors = DataTree[Object]()
         viewVecSrfIndex = DataTree[Object]()
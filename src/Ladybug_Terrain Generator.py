@@ -24,7 +24,8 @@
 """
 This component uses Google Maps API to achieve elevation data and satellite images of the terrain generated.
 -
-This component requires an internet connection and it runs for free up to 2,500 requests per day. Once you go over this limit the component doesn't work.
+Elevations are read from local DEM tiles first. Put SRTM .hgt or GeoTIFF (.tif) tiles of 1x1 degree named after their south west corner (e.g. N40E014.hgt) in C:/USERNAME/AppData/Roaming/Ladybug/DEM and the terrain is built offline.
+Without local tiles this component requires an internet connection and it runs for free up to 2,500 requests per day. Once you go over this limit the component doesn't work.
 Note that each surface is a request, for example if you use a surface made by sub-surfaces 6x6, this will be 36 requests.
 For informations about the rules of use of Google Maps API, take a look at this link:
 https://developers.google.com/maps/pricing-and-plans/#details
@@ -83,11 +84,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Terrain Generator"
 ghenv.Component.NickName = 'TerrainGenerator'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "7 | WIP"
-#compatibleLBVersion = VER 0.0.62\nJUN_07_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
 
@@ -318,6 +319,15 @@ def mdPath(folder):
     return directory
 
 
+def demFolder():
+    # local DEM tiles
+    appdata = os.getenv("APPDATA")
+    try:
+        return os.path.join(appdata, "Ladybug", "DEM")
+    except:
+        return os.path.join(appdata[:3], "Ladybug", "DEM")
+
+
 def writeFile():
     # Make sure that the file exists
     appdata = os.getenv("APPDATA")
@@ -340,7 +350,7 @@ def writeFile():
     return name
 
 
-def main(name):
+def main(name, online):
     
     earth_radius = 6378137
     equator_circumference = 2 * pi * earth_radius
@@ -402,10 +412,28 @@ def main(name):
     
     if _runIt:
         pointsGeo, pointsZ, pointsXY, imagePath  = DataTree[System.Object](), DataTree[System.Object](), DataTree[System.Object](), DataTree[System.Object]()
+        
+        # sample the whole grid from the local DEM tiles at once
+        tilePoints = [divideSrf(tile, numDivision) for tile in tilesCalculation]
+        tileGeoPoints = [[xf * point for point in pts] for pts in tilePoints]
+        allGeoPoints = [pt for pts in tileGeoPoints for pt in pts]
+        demElevations = lb_demCache.sample([pt.Y for pt in allGeoPoints], [pt.X for pt in allGeoPoints])
+        offline = None not in demElevations
+        if not offline and not online:
+            warning = "Please enable your internet connection or add the DEM tiles of this location to {}.".format(lb_demCache.folder)
+            ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+            return -1
+        
+        start = 0
         for i in range(len(tilesCalculation)):
-            points_srf = divideSrf(tilesCalculation[i], numDivision)
+            points_srf = tilePoints[i]
             try:
-                points, elevations = terrainGen(points_srf, xf, _runIt, name)
+                if offline:
+                    points = tileGeoPoints[i]
+                    elevations = demElevations[start:start + len(points)]
+                    start += len(points)
+                else:
+                    points, elevations = terrainGen(points_srf, xf, _runIt, name)
                 ptCenter = centerPtsGeo(tilesCalculation[i])
                 pointGeo = xf * ptCenter
                 points_for_srf.extend(points_srf)
@@ -437,6 +465,7 @@ def main(name):
             origin = Rhino.Geometry.Intersect.Intersection.ProjectPointsToBreps([terrain.ToBrep()], [basePoint], Rhino.Geometry.Vector3d.ZAxis * factor, sc.doc.ModelAbsoluteTolerance)
         
         try:
+            if not online: raise IOError
             for i, u in enumerate(URLs):
                 path = GH_Path(0, i)
                 name = directory + str(i) + "elevation.png"
@@ -479,6 +508,7 @@ if sc.sticky.has_key('ladybug_release'):
         w = gh.GH_RuntimeMessageLevel.Warning
         ghenv.Component.AddRuntimeMessage(w, warning)
     lb_preparation = sc.sticky["ladybug_Preparation"]()
+    lb_demCache = sc.sticky["ladybug_DEMCache"](demFolder())
 else:
     initCheck = False
     print "You should first let the Ladybug fly..."
@@ -492,17 +522,15 @@ check = checkInputs(_location)
 name = writeFile()
 
 if check and initCheck:
-    if checkInternetConnection():
-        unitConversionFactor = lb_preparation.checkUnits()
-        if name != -1:
-            result = main(name)
-            if result != -1:
-                pointsGeo, pointsZ, pointsXY, imagePath, terrain, tiles, origin, elevation = result
-        else:
-            warning = "Something went wrong with IO permission."
-            ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+    # the internet connection is only needed for the tiles that are not in the DEM folder and for the images
+    online = checkInternetConnection()
+    unitConversionFactor = lb_preparation.checkUnits()
+    if name != -1:
+        result = main(name, online)
+        if result != -1:
+            pointsGeo, pointsZ, pointsXY, imagePath, terrain, tiles, origin, elevation = result
     else:
-        warning = "Please enable your internet connection."
+        warning = "Something went wrong with IO permission."
         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
 else:
     pass
@@ -58,11 +58,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Texture Maker"
 ghenv.Component.NickName = 'Texture Maker'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "5 | Extra"
-#compatibleLBVersion = VER 0.0.62\nJUN_07_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "5"
 except: pass
 
@@ -113,104 +113,43 @@ def mdPath(folder):
     
     return directory
 
-def makeTexture(size, colorTree):
-    sb = size * 2 - 1
-    bm = System.Drawing.Bitmap(size * 2, size * 2)
-    bmb = System.Drawing.Bitmap(size * 4, size * 4)
-    
-    count = -1
-    for x in xrange(size):
-        for y in xrange(size):
-            count += 1
-            if count < len(colorTree):
-                bm.SetPixel((x * 2) + 0, sb - ((y * 2) + 0), colorTree[count][0])
-                bm.SetPixel((x * 2) + 1, sb - ((y * 2) + 0), colorTree[count][1])
-                bm.SetPixel((x * 2) + 1, sb - ((y * 2) + 1), colorTree[count][2])
-                bm.SetPixel((x * 2) + 0, sb - ((y * 2) + 1), colorTree[count][3])
-    
-    g = System.Drawing.Graphics.FromImage(bmb)
-    g.InterpolationMode = System.Drawing.Drawing2D.InterpolationMode.NearestNeighbor
-    g.DrawImage(bm, 0, 0, size * 4 + 1, size * 4 + 1)
-    
-    return bmb
-
-def vincenteBakingMesh(m, u, a, v):
+def vincenteBakingMesh(m, u, a, lb_textureAtlas):
     """ The author of this function is Vincente Soler. The original function is made by two VB.Net components.
     changes:
     - from VB.Net to Python
     - one component
+    - the texture is written from a ladybug TextureAtlas with the opacity in its alpha channel
     """
     
     m.Unweld(0, False)
-    # set a tree
-    colorTree = []
-    c = m.Faces.Count
-    f = m.Faces
-    
-    for i in range(c):
-        colorTree.append([])
-        colorTree[i].append(System.Drawing.Color.FromArgb(a, m.VertexColors[f[i].A].R, m.VertexColors[f[i].A].G, m.VertexColors[f[i].A].B))
-        colorTree[i].append(System.Drawing.Color.FromArgb(a, m.VertexColors[f[i].B].R, m.VertexColors[f[i].B].G, m.VertexColors[f[i].B].B))
-        colorTree[i].append(System.Drawing.Color.FromArgb(a, m.VertexColors[f[i].C].R, m.VertexColors[f[i].C].G, m.VertexColors[f[i].C].B))
-        colorTree[i].append(System.Drawing.Color.FromArgb(a, m.VertexColors[f[i].D].R, m.VertexColors[f[i].D].G, m.VertexColors[f[i].D].B))
+    faces = [(face.A, face.B, face.C, face.D) for face in m.Faces]
+    vertexColors = [(color.R, color.G, color.B) for color in m.VertexColors]
+    atlas = lb_textureAtlas(faces, m.Vertices.Count)
     
     # mod mesh
     m.TextureCoordinates.Clear()
-    for i in range(0, m.Vertices.Count):
-        m.TextureCoordinates.Add(0, 0)
-    
-    size = math.ceil(math.sqrt(c))
-    count = -1
-    for x in xrange(size):
-        for y in xrange(size):
-            count += 1
-            sb = size * 2
-            if count < c:
-                f = m.Faces[count]
-                m.TextureCoordinates[f.A] = rc.Geometry.Point2f(((x * 2) + 0.5) / sb, ((y * 2) + 0.5) / sb)
-                m.TextureCoordinates[f.B] = rc.Geometry.Point2f(((x * 2) + 1.5) / sb, ((y * 2) + 0.5) / sb)
-                m.TextureCoordinates[f.C] = rc.Geometry.Point2f(((x * 2) + 1.5) / sb, ((y * 2) + 1.5) / sb)
-                m.TextureCoordinates[f.D] = rc.Geometry.Point2f(((x * 2) + 0.5) / sb, ((y * 2) + 1.5) / sb)
+    textureCoordinates = [rc.Geometry.Point2f(*uv) for uv in atlas.textureCoordinates()]
+    m.TextureCoordinates.AddRange(System.Array[rc.Geometry.Point2f](textureCoordinates))
     
     # make the texture
-    size = math.ceil(math.sqrt(len(colorTree)))
-    bmb = makeTexture(size, colorTree)
-    bmb.Save(u)
-    
-    # make the alpha channel.
-    if a != 255:
-        aColTree = []
-        aColor = System.Drawing.Color.FromArgb(a, a, a)
-        for count, colList in enumerate(colorTree):
-            aColTree.append([])
-            for val in colList:
-                aColTree[count].append(aColor)
-        abmb = makeTexture(size, aColTree)
-        abmb.Save(v)
+    atlas.save(u, vertexColors, a)
     
     return m
 
 
-def main(analysisMesh, folder, name, layerName, alpha, softBake, softBakeMeshes):
+def main(analysisMesh, folder, name, layerName, alpha, softBake, softBakeMeshes, lb_textureAtlas):
     # make a folder for the images
     directory = mdPath(folder)
     
     #Generate the image map textures.
     special_mesh = []
     imagePath = []
-    alphaPath = []
-    aPath = None
     for i, m in enumerate(analysisMesh):
         if name != []:
             completePath = directory + name_[i] + '.png'
         else: completePath = directory + 'mesh_n_' + str(i) + '.png'
-        if alpha != 255:
-            if name != []:
-                aPath = directory + name_[i] + '_alpha.png'
-            else: aPath = directory + 'mesh_alpha_n_' + str(i) + '.png'
-            alphaPath.append(aPath)
         
-        special_mesh.append(vincenteBakingMesh(m, completePath, alpha, aPath))
+        special_mesh.append(vincenteBakingMesh(m, completePath, alpha, lb_textureAtlas))
         imagePath.append(completePath)
     
     # Bake the mesh into the Rhino scene and set the image map material.
@@ -235,7 +174,8 @@ def main(analysisMesh, folder, name, layerName, alpha, softBake, softBakeMeshes)
         material = rc.DocObjects.Material()
         material.SetBitmapTexture(imagePath[count])
         if alpha != 255:
-            material.SetTransparencyTexture(alphaPath[count])
+            # the opacity is in the alpha channel of the same image
+            material.SetTransparencyTexture(imagePath[count])
         matIndex = materialT.Add(material)
         attr.MaterialSource = rc.DocObjects.ObjectMaterialSource.MaterialFromObject
         attr.MaterialIndex = matIndex
@@ -245,7 +185,7 @@ def main(analysisMesh, folder, name, layerName, alpha, softBake, softBakeMeshes)
         if softBake == True:
             softBakeMeshes.append([rhinoMesh,matIndex])
     
-    return imagePath, alphaPath, special_mesh
+    return imagePath, special_mesh
 
 
 # Delete any old objects in memory
@@ -258,9 +198,30 @@ except:
     sc.sticky["ladybug_SoftBakeMeshes"] = []
     softBakeMeshes = sc.sticky["ladybug_SoftBakeMeshes"]
 
+# import the classes
+initCheck = True
+if sc.sticky.has_key('ladybug_release'):
+    try:
+        if not sc.sticky['ladybug_release'].isCompatible(ghenv.Component): initCheck = False
+    except:
+        warning = "You need a newer version of Ladybug to use this compoent." + \
+                 "Use updateLadybug component to update userObjects.\n" + \
+                 "If you have already updated userObjects drag Ladybug_Ladybug component " + \
+                 "into canvas and try again."
+        w = gh.GH_RuntimeMessageLevel.Warning
+        ghenv.Component.AddRuntimeMessage(w, warning)
+        initCheck = False
+    
+    lb_textureAtlas = sc.sticky["ladybug_TextureAtlas"]
+else:
+    print "You should let the Ladybug fly first..."
+    w = gh.GH_RuntimeMessageLevel.Warning
+    ghenv.Component.AddRuntimeMessage(w, "You should let the Ladybug fly first...")
+    initCheck = False
+
 alpha = checkInputs(_analysisMesh, _bakeIt, transparency_)
-if alpha != -1:
-    result = main(_analysisMesh, folder_, name_, _layerName_, alpha, softBake_, softBakeMeshes)
+if initCheck and alpha != -1:
+    result = main(_analysisMesh, folder_, name_, _layerName_, alpha, softBake_, softBakeMeshes, lb_textureAtlas)
     if result != -1:
-        imagePath, alphaPath, mesh = result
+        imagePath, mesh = result
         print("Texture generated!")
\ No newline at end of file
@@ -151,11 +151,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Thermal Comfort Indices"
 ghenv.Component.NickName = "ThermalComfortIndices"
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "1 | AnalyzeWeatherData"
-#compatibleLBVersion = VER 0.0.64\nFEB_12_2017
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "3"
 except: pass
 
@@ -205,77 +205,77 @@ def getWeatherData(latitude, longitude, timeZone, Ta, mrt, Tdp, rh, ws, SR, N, b
     
     # define function and HotExtremeCategory, ColdExtremeCategory variables
     if _comfortIndex == 0:
-        function = heatIndex
+        function = hourlyIndex(heatIndex)
         HotExtremeCategory = 4
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 1:
-        function = Humidex
+        function = hourlyIndex(Humidex)
         HotExtremeCategory = 5
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 2:
-        function = discomfortIndex
+        function = hourlyIndex(discomfortIndex)
         HotExtremeCategory = 3
         ColdExtremeCategory = -6
         climate = "dummy"
     elif _comfortIndex == 3:
-        function = windChillIndex
+        function = hourlyIndex(windChillIndex)
         HotExtremeCategory = 3
         ColdExtremeCategory = -4
         climate = "dummy"
     elif _comfortIndex == 4:
-        function = windChillTemperature
+        function = hourlyIndex(windChillTemperature)
         HotExtremeCategory = "dummy"
         ColdExtremeCategory = -4
         climate = "dummy"
     elif _comfortIndex == 5:
-        function = wbgt_indoors
+        function = hourlyIndex(wbgt_indoors)
         HotExtremeCategory = 5
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 6:
-        function = wbgt_outdoors
+        function = hourlyIndex(wbgt_outdoors)
         HotExtremeCategory = 5
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 7:
-        function = effectiveTemperature
+        function = hourlyIndex(effectiveTemperature)
         HotExtremeCategory = 2
         ColdExtremeCategory = -4
         climate = "dummy"
     elif _comfortIndex == 8:
-        function = apparentTemperature
+        function = hourlyIndex(apparentTemperature)
         HotExtremeCategory = 4
         ColdExtremeCategory = -6
         climate = "dummy"
     elif _comfortIndex == 9:
-        function = thermalSensation
+        function = hourlyIndex(thermalSensation)
         HotExtremeCategory = 3
         ColdExtremeCategory = -3
         climate = "dummy"
     elif _comfortIndex == 10:
-        function = actualSensationModel
+        function = hourlyIndex(actualSensationModel)
         HotExtremeCategory = 2
         ColdExtremeCategory = -2
         climate = "dummy"
     elif _comfortIndex == 11:
-        function = meanRadiantTemperature
+        function = hourlyIndex(meanRadiantTemperature)
         HotExtremeCategory = "dummy"
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 12:
-        function = predictedInsulationIndexOfClothing
+        function = hourlyIndex(predictedInsulationIndexOfClothing)
         HotExtremeCategory = 2
         ColdExtremeCategory = -4
         climate = "dummy"
     elif _comfortIndex == 13:
-        function = heartRate
+        function = hourlyIndex(heartRate)
         HotExtremeCategory = 3
         ColdExtremeCategory = "dummy"
         climate = "dummy"
     elif _comfortIndex == 14:
-        function = dehydrationRisk
+        function = hourlyIndex(dehydrationRisk)
         HotExtremeCategory = 2
         ColdExtremeCategory = "dummy"
         climate = "dummy"
@@ -290,7 +290,7 @@ def getWeatherData(latitude, longitude, timeZone, Ta, mrt, Tdp, rh, ws, SR, N, b
         ColdExtremeCategory = -4
         climate = "humid"
     elif _comfortIndex == 17:
-        function = temperatureHumidityIndex
+        function = hourlyIndex(temperatureHumidityIndex)
         HotExtremeCategory = 2
         ColdExtremeCategory = -3
         climate = "dummy"
@@ -475,7 +475,7 @@ def getWeatherData(latitude, longitude, timeZone, Ta, mrt, Tdp, rh, ws, SR, N, b
         TdpL = [float(TdpL[0])  for i in range(inputsMaximalLength)]
     if (len(TdpL) == 1) and (TdpL[0] == "calculate_Tdp"):
         try:
-            TdpL = [dewPointTemperature(TaL[i],rhL[i])  for i in range(inputsMaximalLength)]  # calculate TdpL
+            TdpL = lb_comfortModels.calcDewPoint(TaL, rhL, (17.27, 237.7))  # calculate TdpL with MET4 and MET4A coefficients
         except:
             comfortIndexValue = comfortIndexCategory = comfortableOrNot = PETresults = HotExtremeCategory = ColdExtremeCategory = outputNickNames = outputDescriptions = createOutputHeaders = HOYs = date = None
             validWeatherData = False
@@ -516,29 +516,39 @@ def getWeatherData(latitude, longitude, timeZone, Ta, mrt, Tdp, rh, ws, SR, N, b
     dehydrationRiskRates = DehydrationRiskRates(acclimated)
     comfortIndexValue, comfortIndexCategory, comfortableOrNot, outputNickNames, outputDescriptions = createHeaders(createOutputHeaders, _comfortIndex, locationName, newAnalysisPeriod, _dryBulbTemperature, dewPointTemperature_, relativeHumidity_, windSpeed_, solarRadiationPerHour_, totalSkyCover_, HRrates, dehydrationRiskRates, activityDuration)
     
-    TgroundL = []; RprimL = []; vapourPressureL = []; EpotL = []; mrtL_calculated = []
+    vapourPressureL = lb_comfortModels.calcVaporPressure(TaL, rhL)  # in hPa
+    e_L = lb_comfortModels.calcVaporPressure(TaL, [5]*len(TaL))  # in hPa
+    
+    # hourly values of the analysis hours
+    if (inputsMaximalLength == 8760):
+        valueIndices = [hoy - 1 for hoy in HOYs]
+    else:
+        valueIndices = range(len(HOYs))
+    TaH = [TaL[i] for i in valueIndices]; TdpH = [TdpL[i] for i in valueIndices]; rhH = [rhL[i] for i in valueIndices]
+    wsH = [wsL[i] for i in valueIndices]; SRH = [SRL[i] for i in valueIndices]; NH = [NL[i] for i in valueIndices]
+    IclH = [IclL[i] for i in valueIndices]; MH = [ML[i] for i in valueIndices]; vapourPressureH = [vapourPressureL[i] for i in valueIndices]
+    TgroundH = []; RprimH = []; mrtH = []; EpotH = []
     for i,hoy in enumerate(HOYs):
         listIndex = hoy - 1
-        if (inputsMaximalLength == 8760):
-            valueIndex = listIndex
-        else:
-            valueIndex = i
+        valueIndex = valueIndices[i]
         Tground = groundTemperature(TaL[valueIndex], NL[valueIndex])  # in C
         solarZenithD, solarAzimuthD, solarAltitudeD = noaaSolarCalculator(latitude, longitude, timeZone, months[listIndex], days[listIndex], hours[listIndex])  # in degrees
         Rprim = solarRadiationNudeMan(SRL[valueIndex], solarAltitudeD, ac)  # in W/m2
-        vapourPressure = VapourPressure(TaL[valueIndex], rhL[valueIndex])  # in hPa
+        vapourPressure = vapourPressureL[valueIndex]  # in hPa
         if (mrtL[0] == "calculate_MRT"):
             MRT = meanRadiantTemperature2(TaL[valueIndex], Tground, Rprim, vapourPressure, NL[valueIndex])  # in C
         else:
             MRT = mrtL[valueIndex]  # in C
         Ts = meanSkinTemperature(TaL[valueIndex], wsL[valueIndex], rhL[valueIndex], MRT, IclL[valueIndex], ML[valueIndex])  # in C
-        e_ = VapourPressure(TaL[valueIndex], 5)  # in hPa
+        e_ = e_L[valueIndex]  # in hPa
         Epot = turbulentExchangeOfLatentHeat(TaL[valueIndex], wsL[valueIndex], Ts, IclL[valueIndex], e_, ML[valueIndex])  # in W/m2
-        
-        comfIndexValue, comfCategory, comfOrNot, PETresults = function(TaL[valueIndex], MRT, TdpL[valueIndex], rhL[valueIndex], wsL[valueIndex], SRL[valueIndex], NL[valueIndex], Tground, Rprim, vapourPressure, Epot, age, sex, heightCM, heightM, weight, bodyPosition, IclL[valueIndex], ac, acclimated, ML[valueIndex], activityDuration, HRrates, dehydrationRiskRates, climate)
-        comfortIndexValue.append(comfIndexValue)
-        comfortIndexCategory.append(comfCategory)
-        comfortableOrNot.append(comfOrNot)
+        TgroundH.append(Tground); RprimH.append(Rprim); mrtH.append(MRT); EpotH.append(Epot)
+    
+    # all the hours in one call of the index function
+    comfIndexValues, comfCategories, comfOrNots, PETresults = function(TaH, mrtH, TdpH, rhH, wsH, SRH, NH, TgroundH, RprimH, vapourPressureH, EpotH, age, sex, heightCM, heightM, weight, bodyPosition, IclH, ac, acclimated, MH, activityDuration, HRrates, dehydrationRiskRates, climate)
+    comfortIndexValue.extend(comfIndexValues)
+    comfortIndexCategory.extend(comfCategories)
+    comfortableOrNot.extend(comfOrNots)
     
     
     printMsg = "ok"
@@ -569,6 +579,19 @@ def celsiusToKelvin(Tc):
 
 
 # thermal comfort indices
+def hourlyIndex(function):
+    # index function for lists of hourly values from a function for the values of a single hour
+    def indexFunction(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPressure, Epot, age, sex, heightCM, heightM, weight, bodyPosition, Icl, ac, acclimated, M, activityDuration, HRrates, dehydrationRiskRates, climate):
+        comfIndexValues = []; comfCategories = []; comfOrNots = []; results = []
+        for i in range(len(Ta)):
+            comfIndexValue, comfCategory, comfOrNot, results = function(Ta[i], mrt[i], Tdp[i], rh[i], ws[i], SR[i], N[i], Tground[i], Rprim[i], vapourPressure[i], Epot[i], age, sex, heightCM, heightM, weight, bodyPosition, Icl[i], ac, acclimated, M[i], activityDuration, HRrates, dehydrationRiskRates, climate)
+            comfIndexValues.append(comfIndexValue)
+            comfCategories.append(comfCategory)
+            comfOrNots.append(comfOrNot)
+        return comfIndexValues, comfCategories, comfOrNots, results
+    return indexFunction
+
+
 def heatIndex(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPressure, Epot, age, sex, heightCM, heightM, weight, bodyPosition, Icl, ac, acclimated, M, activityDuration, HRrates, dehydrationRiskRates, climate):
     # inputs: (Ta, rh):
     # formula by (NWS) National Weather Service
@@ -610,20 +633,6 @@ def heatIndex(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPressure, Epot,
     return HI_c, effectHI, comfortable, []
 
 
-def dewPointTemperature(Ta, rh):
-    # MET4 and MET4A calculation of dew point temperature.
-    # limits:
-    # uncertainty in the calculated dew point temperature: +/- 0.4C
-    # for Tc in range:  0C < Tc < 60C  
-    # for Tdp in range:  0C < Tdp < 50C   
-    a = 17.27
-    b = 237.7
-    rh = rh/100  # 0.01 < rh < 1.00
-    Tdp = (b * ( ((a*Ta)/(b+Ta))+math.log(rh) ))/(a-( ((a*Ta)/(b+Ta))+math.log(rh) ))  # in Celius degrees
-    
-    return Tdp
-
-
 def Humidex(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPressure, Epot, age, sex, heightCM, heightM, weight, bodyPosition, Icl, ac, acclimated, M, activityDuration, HRrates, dehydrationRiskRates, climate):
     # inputs: (Ta, Tdp):
     # formula by Environment Canada
@@ -971,23 +980,6 @@ def groundTemperature(Ta, N):
     return Tground
 
 
-def VapourPressure(Ta, rh):
-    # formula by ITS-90 formulations for vapor pressure, frostpoint temperature, dewpoint temperature, and enhancement factors in the range 100 to +100 c, Thunder Scientific Corporation, Albuquerque, NM, Bob Hardy
-    TaK = Ta + 273.15   # convert to Kelvins
-    
-    TS90coefficients = [-2.8365744*(10**(3)), -6.028076559*(10**(3)), 1.954263612*(10**(1)), -2.737830188*(10**(-2)), 1.6261698*(10**(-5)), 7.0229056*(10**(-10)), -1.8680009*(10**(-13)), 2.7150305]
-    e_s = TS90coefficients[7]*math.log(TaK)
-    
-    for i in range(7):
-        e_s += TS90coefficients[i]*(TaK**(i-2))
-    
-    es = math.exp(e_s)  # in Pa
-    
-    es = (es*0.01*rh)/100  # convert to hPa
-    
-    return es
-
-
 def meanRadiantTemperature(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPressure, Epot, age, sex, heightCM, heightM, weight, bodyPosition, Icl, ac, acclimated, M, activityDuration, HRrates, dehydrationRiskRates, climate):
     # inputs: (Ta, Tground, Rprim, e, N):
     # formula by Man-ENvironment heat EXchange model (MENEX_2005)
@@ -1281,14 +1273,16 @@ def physiologicalEquivalentTemperature(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rpr
     # "Urban climatic map and standards for wind environment - Feasibility study, Technical Input Report No.1",
     # The Chinese University of Hong Kong, Planning Department, Nov 2008
     
-    petObj = lb_comfortModels.physiologicalEquivalentTemperature(Ta, mrt, rh, ws, age, sex, heightM, weight, bodyPosition, M, Icl)
-    respiration = petObj.inkoerp()
-    coreTemperature, radiationBalance, convection, waterVaporDiffusion = petObj.berech()
-    petObj.pet()
-    skinTemperature, totalHeatLoss, skinSweating, internalHeat, sweatEvaporation, PET = petObj.tsk, petObj.wsum, petObj.wetsk, petObj.h, petObj.esw, petObj.tx
-    effectPET, comfortablePET = petObj.thermalCategories(climate)
+    # all the hours are solved together. PETresults of each hour: [coreTemperature, skinTemperature, totalHeatLoss, skinSweating, internalHeat, radiationBalance, convection, waterVaporDiffusion, sweatEvaporation, respiration]
+    PET, PETresultsL = lb_comfortModels.calcPET(Ta, mrt, rh, ws, M, Icl, age, sex, heightM, weight, bodyPosition)
+    effectPET = []; comfortablePET = []
+    for value in PET:
+        effect, comfortable = lb_comfortModels.petCategory(value, climate)
+        effectPET.append(effect)
+        comfortablePET.append(comfortable)
     
-    PETresults = [coreTemperature, skinTemperature, totalHeatLoss, skinSweating, internalHeat, radiationBalance, convection, waterVaporDiffusion, sweatEvaporation, respiration]
+    # body parameters and heat fluxes are printed for a single hour
+    PETresults = PETresultsL[-1] if PETresultsL else []
     
     return PET, effectPET, comfortablePET, PETresults
 
@@ -1324,272 +1318,20 @@ def predictedHeatStrain(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPress
     # inputs: (Ta, mrt, ws, vapourPressure, heightM, weight, bodyPosition, Icl, acclimated, Met, activityDuration):
     # based on: Dr. Jacques Malchaire Quick Basic code from:
     # "Ergonomics of the thermal environment - Analytical determination and interpretation of heat stress using calculation of predicted heat strain", ISO 7933, 2004
+    # the minute by minute work sequences of all the hours advance together
+    TreL, SWtotgL, Dlimloss95L, DlimtreL = lb_comfortModels.calcPredictedHeatStrain(Ta, mrt, vapourPressure, ws, Icl, Met, heightM, weight, bodyPosition, acclimated, activityDuration)
     
-    drink = 1  # if drink = 1: water replacement is sufficient, and workers can drink freely; otherwise: drink = 0
-    if acclimated == "acclimated":  # 100 if acclimatised person, 0 if unacclimatised person
-        accl = 100
-    elif acclimated == "unacclimated":
-        accl = 0
-    
-    # Effective radiating area of the body (1 = sitting, 2 = standing, 3 = crouching)
-    if bodyPosition == "sitting":
-        Ardu = 0.7  # dimensionless
-    elif bodyPosition == "standing":
-        Ardu = 0.77  # dimensionless
-    elif bodyPosition == "crouching":
-        Ardu = 0.67  # dimensionless
-    
-    Pa = vapourPressure * 0.1  # partial water vapour pressure, converted from hectopascals to kilopascals
-    Work = 0  # effective mechanical power, in W/m2
-    imst = 0.38  # static moisture permeability index, dimensionless
-    Ap = 0.54  # fraction of the body surface covered by the reflective clothing, dimensionless
-    Fr = 0.97  # emissivity of the reflective clothing, dimensionless
-    # walking
-    defspeed = 1  # 1 if walking speed entered, 0 otherwise
-    Walksp = 0  # walking speed, in m/s
-    defdir = 1  # 1 if walking direction entered, 0 otherwise
-    THETA = 0  # angle between walking direction and wind direction degrees
-    
-    Adu = 0.202 * weight ** 0.425 * heightM ** 0.725  # body surface area in m2
-    spHeat = 57.83 * weight / Adu
-    
-    SWp = 0
-    SWtot = 0; Tre = 36.8; Tcr = 36.8; Tsk = 34.1; Tcreq = 36.8; TskTcrwg = 0.3
-    Dlimtre = 0; Dlimloss50 = 0; Dlimloss95 = 0
-    Dmax50 = 0.075 * weight * 1000
-    Dmax95 = 0.05 * weight * 1000
-    
-    # EXPONENTIAL AVERAGING CONSTANTS
-    # Core temperature as a function of the metabolic rate: time constant: 10 minutes
-    ConstTeq = math.exp(-1 / 10)
-    # Skin Temperature: time constant: 3 minutes
-    ConstTsk = math.exp(-1 / 3)
-    # Sweat rate: time constant: 10 minutes
-    ConstSW = math.exp(-1 / 10)
-    
-    for time in range(1, activityDuration+1):  # activityDuration - the duration of the work sequence in minutes
-        # INITIALISATION MIN PER MIN
-        Tsk0 = Tsk; Tre0 = Tre; Tcr0 = Tcr; Tcreq0 = Tcreq; TskTcrwg0 = TskTcrwg
-        
-        # EVALUATION OF THE MAXIMUM SWEAT RATE AS A FUNCTION OF THE METABOLIC RATE
-        SWmax = (Met - 32) * Adu
-        if SWmax > 400: SWmax = 400
-        if SWmax < 250: SWmax = 250
-        # For acclimatised subjects (accl=100), the maximum Sweat Rate is greater by 25%
-        if accl >= 50: SWmax = SWmax * 1.25
-        if accl < 50: Wmax = 0.85
-        else: Wmax = 1
-        
-        # EQUILIBRIUM CORE TEMPERATURE ASSOCIATED TO THE METABOLIC RATE
-        Tcreqm = 0.0036 * Met + 36.6
-        # Core temperature at this minute, by exponential averaging
-        Tcreq = Tcreq0 * ConstTeq + Tcreqm * (1 - ConstTeq)
-        # Heat storage associated with this core temperature increase during the last minute
-        dStoreq = spHeat * (Tcreq - Tcreq0) * (1 - TskTcrwg0)
-        
-        # SKIN TEMPERATURE PREDICTION
-        # Skin Temperature in equilibrium
-        # Clothed model
-        Tskeqcl = 12.165 + 0.02017 * Ta + 0.04361 * mrt + 0.19354 * Pa - 0.25315 * ws
-        Tskeqcl = Tskeqcl + 0.005346 * Met + 0.51274 * Tre
-        # Nude model
-        Tskeqnu = 7.191 + 0.064 * Ta + 0.061 * mrt + 0.198 * Pa - 0.348 * ws
-        Tskeqnu = Tskeqnu + 0.616 * Tre
-        # Value at this minute, as a function of the clothing insulation
-        if Icl >= 0.6: Tskeq = Tskeqcl
-        else: Tskeq = Tskeqnu + 2.5 * (Tskeqcl - Tskeqnu) * (Icl - 0.2)  # Interpolation between the values for clothed and nude subjects, if  0.2 < clo < 0.6
-        
-        if Icl <= 0.2: Tskeq = Tskeqnu
-        else: Tskeq = Tskeqnu + 2.5 * (Tskeqcl - Tskeqnu) * (Icl - 0.2)  # Interpolation between the values for clothed and nude subjects, if  0.2 < clo < 0.6
-        
-        # Skin Temperature at this minute, by exponential averaging
-        Tsk = Tsk0 * ConstTsk + Tskeq * (1 - ConstTsk)
-        # Saturated water vapour pressure at the surface of the skin
-        Psk = 0.6105 * math.exp(17.27 * Tsk / (Tsk + 237.3))
-        
-        # CLOTHING INFLUENCE ON EXCHANGE COEFFICIENTS
-        # Static clothing insulation
-        Iclst = Icl * 0.155
-        # Clothing area factor
-        fcl = 1 + 0.3 * Icl
-        # Static boundary layer thermal insulation in quiet air
-        Iast = 0.111
-        # Total static insulation
-        Itotst = Iclst + Iast / fcl
-        
-        # Relative velocities due to air velocity and movements
-        if defspeed > 0:
-            if defdir == 1:
-                # Unidirectional walking
-                Var = abs(ws - Walksp * math.cos(3.14159 * THETA / 180))
-            else:
-                # Omni-directional walking
-                if ws < Walksp:
-                    Var = Walksp
-                else: Var = ws
-        else:
-            # Stationary or undefined speed
-            Walksp = 0.0052 * (Met - 58)
-            if Walksp > 0.7:
-                Walksp = 0.7
-            Var = ws
-        
-        # Dynamic clothing insulation
-        # Clothing insulation correction for wind (Var) and walking (Walksp) 
-        Vaux = Var
-        if Var > 3:
-            Vaux = 3
-        Waux = Walksp
-        if Walksp > 1.5:
-            Waux = 1.5
-        CORcl = 1.044 * math.exp((.066 * Vaux - 0.398) * Vaux + (.094 * Waux - 0.378) * Waux)
-        if CORcl > 1:
-            CORcl = 1
-        CORia = math.exp((.047 * Var - 0.472) * Var + (.117 * Waux - 0.342) * Waux)
-        if CORia > 1:
-            CORia = 1
-         
-        CORtot = CORcl
-        if Icl <= 0.6:
-            CORtot = ((.6 - Icl) * CORia + Icl * CORcl) / .6
-        
-        Itotdyn = Itotst * CORtot
-        IAdyn = CORia * Iast
-        Icldyn = Itotdyn - IAdyn / fcl
-        
-        # Permeability index
-        # Correction for wind and walking
-        CORe = (2.6 * CORtot - 6.5) * CORtot + 4.9
-        imdyn = imst * CORe
-        if imdyn > 0.9:
-            imdyn = 0.9
-        # Dynamic evaporative resistance
-        Rtdyn = Itotdyn / imdyn / 16.7
-        
-        # HEAT EXCHANGES
-        # Heat exchanges through respiratory convection and evaporation
-        # temperature of the expired air
-        Texp = 28.56 + 0.115 * Ta + 0.641 * Pa
-        Cres = 0.001516 * Met * (Texp - Ta)
-        Eres = 0.00127 * Met * (59.34 + 0.53 * Ta - 11.63 * Pa)
-        
-        # Mean temperature of the clothing: Tcl
-        # Dynamic convection coefficient
-        Z = 3.5 + 5.2 * Var
-        if Var > 1:
-            Z = 8.7 * Var ** 0.6
-        Hcdyn = 2.38 * abs(Tsk - Ta) ** 0.25
-        if Z > Hcdyn:
-            Hcdyn = Z
-        
-        auxR = 5.67E-08 * Ardu
-        FclR = (1 - Ap) * 0.97 + Ap * Fr
-        Tcl = mrt + 0.1
-        
-        for k in range(100):
-            # Radiation coefficient
-            Hr = FclR * auxR * ((Tcl + 273) ** 4 - (mrt + 273) ** 4) / (Tcl - mrt)
-            Tcl1 = ((fcl * (Hcdyn * Ta + Hr * mrt) + Tsk / Icldyn)) / (fcl * (Hcdyn + Hr) + 1 / Icldyn)
-            
-            if abs(Tcl - Tcl1) > 0.001:
-                Tcl = (Tcl + Tcl1) / 2
-                continue
-            else:
-                break
-        
-        # Convection and Radiation heat exchanges
-        Conv = fcl * Hcdyn * (Tcl - Ta)
-        Rad = fcl * Hr * (Tcl - mrt)
-        # Maximum Evaporation Rate
-        Emax = (Psk - Pa) / Rtdyn
-        # Required Evaporation Rate
-        Ereq = Met - dStoreq - Work - Cres - Eres - Conv - Rad
-         
-        # INTERPRETATION
-        # Required wettedness
-        wreq = Ereq / Emax
-        
-        # Required Sweat Rate
-        #    If no evaporation required: no sweat rate
-        if Ereq <= 0:
-            Ereq = 0; SWreq = 0;
-        else:
-            #    If evaporation is not possible, sweat rate is maximum
-            if Emax <= 0:
-                Emax = 0; SWreq = SWmax;
-            else:
-                #    If required wettedness greater than 1.7: sweat rate is maximum
-                if wreq >= 1.7:
-                    wreq = 1.7; SWreq = SWmax;
-                else:
-                    #    Required evaporation efficiency
-                    Eveff = (1 - wreq ** 2 / 2)
-                    if wreq > 1:
-                        Eveff = (2 - wreq) ** 2 / 2
-                    SWreq = Ereq / Eveff
-                    if SWreq > SWmax:
-                        SWreq = SWmax
-        
-        # Predicted Sweat Rate, by exponential averaging
-        SWp = SWp * ConstSW + SWreq * (1 - ConstSW)
-        if SWp <= 0:
-            Ep = 0; SWp = 0;
-        else:
-            # Predicted Evaporation Rate
-            k = Emax / SWp
-            wp = 1
-            if k >= 0.5:
-                wp = -k + math.sqrt(k * k + 2)
-            if wp > Wmax:
-                wp = Wmax
-            Ep = wp * Emax
-        
-        # Heat Storage
-        dStorage = Ereq - Ep + dStoreq
-        
-        # PREDICTION OF THE CORE TEMPERATURE
-        Tcr1 = Tcr0
-        for g in range(50):
-            # Skin - Core weighting
-            TskTcrwg = 0.3 - 0.09 * (Tcr1 - 36.8)
-            if TskTcrwg > 0.3:
-                TskTcrwg = 0.3
-            if TskTcrwg < 0.1:
-                TskTcrwg = 0.1
-            
-            Tcr = dStorage / spHeat + Tsk0 * TskTcrwg0 / 2 - Tsk * TskTcrwg / 2
-            Tcr = (Tcr + Tcr0 * (1 - TskTcrwg0 / 2)) / (1 - TskTcrwg / 2)
-            if abs(Tcr - Tcr1) > 0.001:
-                Tcr1 = (Tcr1 + Tcr) / 2;
-                continue
-            else:
-                break
-        
-        # PREDICTION OF THE CENTRAL (RECTAL) TEMPERATURE
-        Tre = Tre0 + (2 * Tcr - 1.962 * Tre0 - 1.31) / 9  # in Celsius degrees
-        
-        if Dlimtre == 0 and Tre >= 38: Dlimtre = time
-        # Total water loss rate during the minute (in W/m2)
-        SWtot = SWtot + SWp + Eres
-        SWtotg = SWtot * 2.67 * Adu / 1.8 / 60
-        
-        if Dlimloss50 == 0 and SWtotg >= Dmax50: Dlimloss50 = time
-        if Dlimloss95 == 0 and SWtotg >= Dmax95: Dlimloss95 = time
-        if drink == 0:
-            Dlimloss95 = Dlimloss95 * 0.6;
-            Dlimloss50 = Dlimloss95
-        continue
-    
-    if Dlimloss50 == 0:
-        Dlimloss50 = activityDuration
-    if Dlimloss95 == 0:
-        Dlimloss95 = activityDuration
-    if Dlimtre == 0:
-        Dlimtre = activityDuration
-    
-    PHSresults = [SWtotg, Dlimloss95, Dlimtre]
-    
+    effectPHSL = []; comfortableL = []
+    for Dlimloss95, Dlimtre in zip(Dlimloss95L, DlimtreL):
+        effectPHS, comfortable = heatStrainCategory(Dlimloss95, Dlimtre, activityDuration)
+        effectPHSL.append(effectPHS)
+        comfortableL.append(comfortable)
     
+    return TreL, effectPHSL, comfortableL, []
+
+
+def heatStrainCategory(Dlimloss95, Dlimtre, activityDuration):
+    # PHS category from the duration limits of the water loss and the rectal temperature
     if (Dlimloss95 >= activityDuration) and (Dlimtre >= activityDuration):
         effectPHS = 0
         comfortable = 1
@@ -1606,7 +1348,7 @@ def predictedHeatStrain(Ta, mrt, Tdp, rh, ws, SR, N, Tground, Rprim, vapourPress
         effectPHS = 1
         comfortable = 0
     
-    return Tre, effectPHS, comfortable, []
+    return effectPHS, comfortable
 
 
 def HOYsDaysMonthsHoursFromHOY_analysisPeriod(HOY, analysisPeriod):
@@ -1617,27 +1359,26 @@ def HOYsDaysMonthsHoursFromHOY_analysisPeriod(HOY, analysisPeriod):
         endingDay, endingMonth, endingHour = lb_preparation.hour2Date(max(HOYs),True)
         
         newAnalysisPeriod = [(startingMonth+1, startingDay, startingHour),(endingMonth+1, endingDay, endingHour)]
-    
-    elif (len(HOY) == 0) and (len(analysisPeriod) != 0) and (analysisPeriod[0] != None):
-        startingDate = analysisPeriod[0]
-        endingDate = analysisPeriod[1]
-        timeStep = 1
-        HOYs, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisPeriod, timeStep)
         
-        newAnalysisPeriod = analysisPeriod
+        days = []
+        months = []
+        hours = []
+        for hoy in HOYs:
+            d, m, h = lb_preparation.hour2Date(hoy, True)
+            days.append(d)
+            months.append(m + 1)
+            hours.append(h)
     
-    else:  # no "HOY_" nor "analysisPeriod_" inputted. Use annual data.
-        HOYs = range(1,8761)
-        newAnalysisPeriod = [(1, 1, 1),(12, 31, 24)]
-    
-    days = []
-    months = []
-    hours = []
-    for hoy in HOYs:
-        d, m, h = lb_preparation.hour2Date(hoy, True)
-        days.append(d)
-        months.append(m + 1)
-        hours.append(h)
+    else:
+        if (len(analysisPeriod) != 0) and (analysisPeriod[0] != None):
+            newAnalysisPeriod = analysisPeriod
+        else:  # no "HOY_" nor "analysisPeriod_" inputted. Use annual data.
+            newAnalysisPeriod = [(1, 1, 1),(12, 31, 24)]
+        
+        # HOYs and dates of the period are calculated once and cached
+        period = lb_preparation.getAnalysisPeriod(newAnalysisPeriod)
+        HOYs = list(period.hoys)
+        months, days, hours = [list(dateItems) for dateItems in zip(*period.dates)]
     
     startingDate = lb_preparation.hour2Date(lb_preparation.date2Hour(months[0], days[0], hours[0]))
     endingDate = lb_preparation.hour2Date(lb_preparation.date2Hour(months[-1], days[-1], hours[-1]))
@@ -2178,7 +1919,7 @@ level = gh.GH_RuntimeMessageLevel.Warning
 if sc.sticky.has_key("ladybug_release"):
     if sc.sticky["ladybug_release"].isCompatible(ghenv.Component):
         lb_preparation = sc.sticky["ladybug_Preparation"]()
-        lb_comfortModels = sc.sticky["ladybug_ComfortModels"]
+        lb_comfortModels = sc.sticky["ladybug_ComfortModels"]()
         
         if (_comfortIndex != None) and _comfortIndex in range(19):
             locationName, latitude, longitude, timeZone, validLocationData, printMsgLocation = getLocationData(_location)
@@ -97,11 +97,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Tilt And Orientation Factor"
 ghenv.Component.NickName = "TOF"
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "4 | Renewables"
-#compatibleLBVersion = VER 0.0.64\nAPR_12_2017
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
 
@@ -329,7 +329,6 @@ def main(latitude, longitude, timeZone, locationName, years, months, days, hours
     
     isoCrvPlanes = []
     isoCrvPercents = []
-    projectedIsoCrvs = []
     tol = Rhino.RhinoDoc.ActiveDoc.ModelAbsoluteTolerance
     percents10 = [10,20,30,40,50,60,70,80,90,94,96,98,99]
     for p in percents10:
@@ -337,17 +336,14 @@ def main(latitude, longitude, timeZone, locationName, years, months, days, hours
             plane = Rhino.Geometry.Plane( Rhino.Geometry.Point3d(planesAxisCrv.PointAt(p)), Rhino.Geometry.Vector3d(0,0,1) )
             isoCrvPlanes.append(plane)
             isoCrvPercents.append(p)
-            isoPolylinesSublist = Rhino.Geometry.Intersect.Intersection.MeshPlane(meshLifted, plane)
-            isoCrvsSubList = [Rhino.Geometry.Polyline.ToNurbsCurve(polyline) for polyline in isoPolylinesSublist]
-            joinedIsoCrvsSubList = Rhino.Geometry.Curve.JoinCurves(isoCrvsSubList, tol)
-            projectedIsoCrvsSubList = [Rhino.Geometry.Curve.ProjectToPlane(crv, Rhino.Geometry.Plane(Rhino.Geometry.Point3d(originOffset), Rhino.Geometry.Vector3d(0,0,1))) for crv in joinedIsoCrvsSubList]
-            projectedIsoCrvs.append(projectedIsoCrvsSubList)
     # last (100%) isoCrv
     plane = Rhino.Geometry.Plane( Rhino.Geometry.Point3d(planesAxisCrv.PointAt(100-tol)), Rhino.Geometry.Vector3d(0,0,1) )
-    lastIsoPolylines = Rhino.Geometry.Intersect.Intersection.MeshPlane(meshLifted, plane)
-    lastIsoCrvs = [Rhino.Geometry.Polyline.ToNurbsCurve(polyline) for polyline in lastIsoPolylines]
-    joinedLastIsoCrvs = Rhino.Geometry.Curve.JoinCurves(lastIsoCrvs, tol)
-    projectedLastIsoCrvs = [Rhino.Geometry.Curve.ProjectToPlane(crv, Rhino.Geometry.Plane(Rhino.Geometry.Point3d(originOffset), Rhino.Geometry.Vector3d(0,0,1))) for crv in joinedLastIsoCrvs]
+    isoCrvPlanes.append(plane)
+    # joined isoCrvs of all the planes from one pass over the lifted mesh
+    joinedIsoCrvs = lb_visualization.contourCurves(meshLifted, [plane.Origin.Z for plane in isoCrvPlanes])
+    projectionPlane = Rhino.Geometry.Plane(Rhino.Geometry.Point3d(originOffset), Rhino.Geometry.Vector3d(0,0,1))
+    projectedIsoCrvs = [[Rhino.Geometry.Curve.ProjectToPlane(crv, projectionPlane) for crv in joinedIsoCrvsSubList] for joinedIsoCrvsSubList in joinedIsoCrvs[:-1]]
+    projectedLastIsoCrvs = [Rhino.Geometry.Curve.ProjectToPlane(crv, projectionPlane) for crv in joinedIsoCrvs[-1]]
     
     
     # optimal Tilt, Azimuth
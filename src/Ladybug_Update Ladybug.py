@@ -36,11 +36,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Update Ladybug"
 ghenv.Component.NickName = 'updateLadybug'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "6 | Developers"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "1"
 except: pass
 
@@ -102,6 +102,25 @@ def downloadSourceAndUnzip(lb_preparation):
     
     return userObjectsFolder
 
+def updateCoreModules(userObjectsFolder):
+    """
+    Copy the headless core modules next to the userObjects to Ladybug's lib folder
+    """
+    srcFolder = os.path.join(os.path.dirname(os.path.normpath(userObjectsFolder)), "src", "ladybug_core")
+    if not os.path.isdir(srcFolder):
+        warning = "Failed to find Ladybug core modules at %s.\n" % srcFolder + \
+                  "Components that use the core modules won't be updated."
+        print warning
+        ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
+        return
+    
+    dstFolder = os.path.join(sc.sticky["Ladybug_DefaultFolder"], "lib", "ladybug_core")
+    if not os.path.isdir(dstFolder): os.makedirs(dstFolder)
+    
+    for srcFileName in os.listdir(srcFolder):
+        if not srcFileName.endswith('.py'): continue
+        shutil.copy2(os.path.join(srcFolder, srcFileName), os.path.join(dstFolder, srcFileName))
+
 def getAllTheComponents(onlyGHPython = True):
     
     components = []
@@ -257,6 +276,9 @@ def main(sourceDirectory, updateThisFile, updateAllUObjects):
         if not os.path.isfile(dstFullPath):
             shutil.copy2(srcFullPath, dstFullPath)
         
+        print 'Updating core modules...'
+        updateCoreModules(userObjectsFolder)
+        
         
         return "Done!" , True
     
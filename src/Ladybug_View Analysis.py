@@ -73,11 +73,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_View Analysis"
 ghenv.Component.NickName = 'viewAnalysis'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "3 | EnvironmentalAnalysis"
-#compatibleLBVersion = VER 0.0.59\nFEB_14_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
 
@@ -140,7 +140,7 @@ def restoreComponentInputs():
         ghenv.Component.Params.Input[input].Name = inputsDict[input][0]
         ghenv.Component.Params.Input[input].Description = inputsDict[input][1]
 
-def checkViewType(lb_preparation):
+def checkViewType(lb_viewAnalysis):
     #Assign default values.
     viewVecs, viewType, patchAreas, geoBlockView = [], -1, [], False
     
@@ -162,7 +162,7 @@ def checkViewType(lb_preparation):
                 print warning
                 ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
                 return -1
-        viewVecs, patchAreas = checkViewResolution(viewRes, viewType, viewConeParameters_, lb_preparation)
+        viewVecs, patchAreas = checkViewResolution(viewRes, viewType, viewConeParameters_, lb_viewAnalysis)
     except:
         try:
             for val in _viewTypeOrPoints:
@@ -180,80 +180,13 @@ def checkViewType(lb_preparation):
     
     return viewVecs, viewType, patchAreas, geoBlockView
 
-def checkViewResolution(viewResolution, viewType, viewPar, lb_preparation):
-    newVecs = []
-    patchAreas = []
-    
-    #Creeate the view vectors.
-    if viewType != 0:
-        # View vectors should be generated from Tregenza sky patches.
-        skyPatches = lb_preparation.generateSkyGeo(rc.Geometry.Point3d.Origin, viewResolution, 1)
-        for patch in skyPatches:
-            patchAreaProp = rc.Geometry.AreaMassProperties.Compute(patch)
-            patchPt = patchAreaProp.Centroid
-            patchA = patchAreaProp.Area
-            Vec = None
-            if viewType >= 2: Vec = rc.Geometry.Vector3d(patchPt.X, patchPt.Y, patchPt.Z)
-            elif viewType == 1 and patchPt.Z < 0.5: Vec = rc.Geometry.Vector3d(patchPt.X, patchPt.Y, patchPt.Z)
-            
-            if Vec != None:
-                newVecs.append(Vec)
-                patchAreas.append(patchA)
-                if viewType == 1 or viewType == 2:
-                    revVec = rc.Geometry.Vector3d(-patchPt.X, -patchPt.Y, -patchPt.Z)
-                    newVecs.append(revVec)
-                    patchAreas.append(patchA)
-    else:
-        # View vectors should be generated by a rotation around a circle.
-        numberDivisions = (viewResolution+1) * 20
-        initAngle = 0
-        divisionAngleDeg = 360/numberDivisions
-        divisionAngle = math.radians(divisionAngleDeg)
-        for count in range(numberDivisions):
-            viewVecInit = rc.Geometry.Vector3d.YAxis
-            viewVecInit.Rotate(initAngle, rc.Geometry.Vector3d.ZAxis)
-            newVecs.append(viewVecInit)
-            initAngle += divisionAngle
-    
-    # If there are view parameters, then apply them to the view vectors.
-    if viewPar != []:
-        # Find the acceptable horizontal range of the view analysis.
-        maxHorizAng = viewPar[4] + viewPar[2]
-        minHorizAng = viewPar[4] - viewPar[2]
-        orOperator = False
-        print minHorizAng
-        if maxHorizAng > 360:
-            maxHorizAng = maxHorizAng - 360
-            orOperator = True
-        elif minHorizAng < 0:
-            minHorizAng = minHorizAng + 360
-            orOperator = True
-        
-        # Find the acceptable maximum/minimum Z values for the vector.
-        maxZVal = math.sin(math.radians(viewPar[0]))
-        minZVal = -math.sin(math.radians(viewPar[1]))
-        
-        # Test each vector to see if it is in the range.
-        finalVecs = []
-        finalPatchAreas = []
-        for count, vec in enumerate(newVecs):
-            vecHorizAng = math.degrees(rc.Geometry.Vector3d.VectorAngle(rc.Geometry.Vector3d(vec.X,vec.Y,0), rc.Geometry.Vector3d.YAxis))
-            if vec.X < 0:
-                vecHorizAng = 360 - vecHorizAng
-            if orOperator == False:
-                if vecHorizAng > minHorizAng and vecHorizAng < maxHorizAng:
-                    if vec.Z > minZVal and vec.Z < maxZVal:
-                        finalVecs.append(vec)
-                        finalPatchAreas.append(patchAreas[count])
-            elif orOperator == True:
-                if vecHorizAng > minHorizAng or vecHorizAng < maxHorizAng:
-                    if vec.Z > minZVal and vec.Z < maxZVal:
-                        finalVecs.append(vec)
-                        finalPatchAreas.append(patchAreas[count])
-        newVecs = finalVecs
-        patchAreas = finalPatchAreas
-    
-    return newVecs, patchAreas
+def checkViewResolution(viewResolution, viewType, viewPar, lb_viewAnalysis):
+    # View vectors are generated once for each type, resolution and cone of vision
+    # and are cached by the view analysis engine.
+    vectors, patchAreas = lb_viewAnalysis.viewVectors(viewType, viewResolution, viewPar)
+    newVecs = [rc.Geometry.Vector3d(*vec) for vec in vectors]
+    
+    return newVecs, list(patchAreas)
 
 
 def openLegend(legendRes):
@@ -341,12 +274,13 @@ def main(geometry, context, gridSize, disFromBase, orientationStudyP, viewPoints
     lb_mesh = sc.sticky["ladybug_Mesh"]()
     lb_runStudy_GH = sc.sticky["ladybug_RunAnalysis"]()
     lb_visualization = sc.sticky["ladybug_ResultVisualization"]()
+    lb_viewAnalysis = sc.sticky["ladybug_ViewAnalysis"]()
     
     conversionFac = lb_preparation.checkUnits()
     
     #Check the view type.
     viewType = -1
-    viewCheck = checkViewType(lb_preparation)
+    viewCheck = checkViewType(lb_viewAnalysis)
     if viewCheck != -1:
         viewPoints_viewStudy, viewType, patchAreas, geoBlockView = viewCheck
     else: return -1
@@ -44,19 +44,16 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_WetBulbTemp"
 ghenv.Component.NickName = 'WetBulbTemp & DewPointTemp'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "1 | AnalyzeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nFEB_01_2015
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "0"
 except: pass
 
 import scriptcontext as sc
 import Grasshopper.Kernel as gh
 
-import math
-
-
 
 
 def checkTheData():
@@ -192,56 +189,6 @@ def checkTheData():
     return checkData, airTemp, relHumid, barPress, epwStr
 
 
-#dbTemp [Celsius], RH [%], Psta [Pa]
-def WBFUNC(dbTemp, RH, Psta):
-    es = 6.112 * math.e**((17.67 * dbTemp) / (dbTemp + 243.5))
-    
-    e = (es * RH) / 100
-    
-    
-    Tw = 0
-    increse = 10
-    previoussign = 1
-    Ed = 1
-    
-    while math.fabs(Ed) > 0.005:
-        Ewg = 6.112 * math.e**((17.67 * Tw) / (Tw + 243.5))
-        eg = Ewg - (Psta/100) * (dbTemp - Tw) * 0.00066 * (1 + (0.00155 * Tw))
-        Ed = e - eg
-        if Ed ==0:
-            break
-        else:
-            if Ed <0:
-                cursign = -1
-                if cursign != previoussign:
-                    previoussign = cursign
-                    increse = increse/10
-                else:
-                    increse = increse
-            else:
-                cursign = 1
-                if cursign != previoussign:
-                    previoussign = cursign
-                    increse = increse/10
-                else:
-                    increse = increse
-        Tw = Tw + increse * previoussign
-    wbTemp = round(Tw,2)
-    return wbTemp
-
-
-
-def DPTFUNC(dbTemp, RH):
-    es = 6.112 * math.e**((17.67 * dbTemp) / (dbTemp + 243.5))
-    
-    e = (es * RH) / 100
-    
-    Td = (243.5 * math.log(e / 6.112)) / (17.67 - math.log(e / 6.112))
-    
-    dpTemp = round(Td,2)
-    return dpTemp
-
-
 def main(dryBulbTemperature, relativeHumidity, barometricPressure, epwStr):
     # declare the lists
     if epwStr == []:
@@ -253,11 +200,9 @@ def main(dryBulbTemperature, relativeHumidity, barometricPressure, epwStr):
         epwStr[2] = "Dew Point Temperature"
         dewPointTemp = epwStr[:]
     
-    for i in range(0, len(dryBulbTemperature)):
-        wbTemp = WBFUNC(dryBulbTemperature[i], relativeHumidity[i], barometricPressure[i])
-        wetBulbTemp.append(float(wbTemp))
-        dpTemp = DPTFUNC(dryBulbTemperature[i], relativeHumidity[i])
-        dewPointTemp.append(float(dpTemp))
+    # all the hours are solved together
+    wetBulbTemp.extend([round(wbTemp, 2) for wbTemp in lb_comfortModels.calcWetBulb(dryBulbTemperature, relativeHumidity, barometricPressure)])
+    dewPointTemp.extend([round(dpTemp, 2) for dpTemp in lb_comfortModels.calcDewPoint(dryBulbTemperature, relativeHumidity)])
     print "Congratulations! Now you have wet-bulb temperatures."
     
     # return the values
@@ -279,6 +224,7 @@ if sc.sticky.has_key('ladybug_release'):
         w = gh.GH_RuntimeMessageLevel.Warning
         ghenv.Component.AddRuntimeMessage(w, warning)
     lb_preparation = sc.sticky["ladybug_Preparation"]()
+    lb_comfortModels = sc.sticky["ladybug_ComfortModels"]()
 else:
     initCheck = False
     print "You should first let the Ladybug fly..."
@@ -83,11 +83,11 @@ Provided by Ladybug 0.0.66
 """
 ghenv.Component.Name = "Ladybug_Wind Boundary Profile"
 ghenv.Component.NickName = 'WindBoundaryProfile'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nAPR_12_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "4"
 except: pass
 
@@ -415,84 +415,21 @@ def checkConditionalStatement(annualHourlyData, conditionalStatement, analysisPe
         
         return titleStatement, patternList
 
-def createColoredArrowMesh(count, point, colors, windVec, heightsAboveGround, use1meterArrowHeadSize, scaleFactor):
-    meshArrowTip = rc.Geometry.Point3d.Add(point, windVec[count+1])
-    meshArrowBottom = point
-    meshArrowAxis = rc.Geometry.Line(meshArrowTip, meshArrowBottom)
-    meshArrowAxis = meshArrowAxis.ToNurbsCurve()
+def createColoredArrowMeshes(anchorPts, windVec, colors, arrowSize, windProfile):
+    #All the arrows are transforms of one template mesh.
+    template = windProfile.arrowTemplate(0.3*arrowSize, 0.05*arrowSize, 0.1*arrowSize)
+    transforms = windProfile.arrowTransforms([(pt.X, pt.Y, pt.Z) for pt in anchorPts], [(vec.X, vec.Y, vec.Z) for vec in windVec], arrowSize)
+    vertices, faces, arrowIndices = windProfile.instanceArrows(template, transforms)
     
-    if (meshArrowAxis.GetLength() > (windVectorScale/1.75)*scaleFactor) and use1meterArrowHeadSize:
-        t = meshArrowAxis.LengthParameter((windVectorScale/1.75)*scaleFactor)
-    else:
-        length = meshArrowAxis.GetLength()* 0.3
-        t = meshArrowAxis.LengthParameter(length)
-        use1meterArrowHeadSize = False
-    meshArrowBottomCentroid = meshArrowAxis.PointAt(t[1])
-    meshArrowBottomCircle = rc.Geometry.Circle(rc.Geometry.Plane(meshArrowBottomCentroid, meshArrowTip-meshArrowBottomCentroid), 0.3*(windVectorScale/1.75)*scaleFactor)  # arrow bottom circle radius is a function of the distance between vectors
-    meshArrowBottomCircle = meshArrowBottomCircle.ToNurbsCurve()
-    t1 = meshArrowBottomCircle.NormalizedLengthParameter(0.125)
-    meshArrowBottomPt1 = meshArrowBottomCircle.PointAt(t1[1])
-    t2 = meshArrowBottomCircle.NormalizedLengthParameter(0.375)
-    meshArrowBottomPt2 = meshArrowBottomCircle.PointAt(t2[1])
-    t3 = meshArrowBottomCircle.NormalizedLengthParameter(0.625)
-    meshArrowBottomPt3 = meshArrowBottomCircle.PointAt(t3[1])
-    t4 = meshArrowBottomCircle.NormalizedLengthParameter(0.875)
-    meshArrowBottomPt4 = meshArrowBottomCircle.PointAt(t4[1])
-    
-    #mesh body
-    # top 4 points
-    meshbodyTopCircle = rc.Geometry.Circle(rc.Geometry.Plane(meshArrowBottomCentroid, meshArrowTip-meshArrowBottomCentroid), 0.05*(windVectorScale/1.75)*scaleFactor)  # body top circle radius is a function of the distance between vectors
-    meshbodyTopCircle = meshbodyTopCircle.ToNurbsCurve()
-    t1 = meshbodyTopCircle.NormalizedLengthParameter(0.125)
-    meshBodyTopPt1 = meshbodyTopCircle.PointAt(t1[1])
-    t2 = meshbodyTopCircle.NormalizedLengthParameter(0.375)
-    meshBodyTopPt2 = meshbodyTopCircle.PointAt(t2[1])
-    t3 = meshbodyTopCircle.NormalizedLengthParameter(0.625)
-    meshBodyTopPt3 = meshbodyTopCircle.PointAt(t3[1])
-    t4 = meshbodyTopCircle.NormalizedLengthParameter(0.875)
-    meshBodyTopPt4 = meshbodyTopCircle.PointAt(t4[1])
-    # bottom 4 points
-    meshBodyBottomCircle = rc.Geometry.Circle(rc.Geometry.Plane(meshArrowBottom, meshArrowTip-meshArrowBottomCentroid), 0.1*(windVectorScale/1.75)*scaleFactor)  # body bottom circle radius: 0.2
-    meshBodyBottomCircle = meshBodyBottomCircle.ToNurbsCurve()
-    t1 = meshBodyBottomCircle.NormalizedLengthParameter(0.125)
-    meshBodyBottomPt1 = meshBodyBottomCircle.PointAt(t1[1])
-    t2 = meshBodyBottomCircle.NormalizedLengthParameter(0.375)
-    meshBodyBottomPt2 = meshBodyBottomCircle.PointAt(t2[1])
-    t3 = meshBodyBottomCircle.NormalizedLengthParameter(0.625)
-    meshBodyBottomPt3 = meshBodyBottomCircle.PointAt(t3[1])
-    t4 = meshBodyBottomCircle.NormalizedLengthParameter(0.875)
-    meshBodyBottomPt4 = meshBodyBottomCircle.PointAt(t4[1])
     # create mesh
     mesh = rc.Geometry.Mesh()
-    # mesh arrow vertices
-    mesh.Vertices.Add(meshArrowBottomPt1)
-    mesh.Vertices.Add(meshArrowBottomPt2)
-    mesh.Vertices.Add(meshArrowBottomPt3)
-    mesh.Vertices.Add(meshArrowBottomPt4)
-    mesh.Vertices.Add(meshArrowTip)
-    # mesh body vertices
-    mesh.Vertices.Add(meshBodyTopPt1)
-    mesh.Vertices.Add(meshBodyTopPt2)
-    mesh.Vertices.Add(meshBodyTopPt3)
-    mesh.Vertices.Add(meshBodyTopPt4)
-    mesh.Vertices.Add(meshBodyBottomPt1)
-    mesh.Vertices.Add(meshBodyBottomPt2)
-    mesh.Vertices.Add(meshBodyBottomPt3)
-    mesh.Vertices.Add(meshBodyBottomPt4)
-    
-    mesh.Faces.AddFace(0,1,2,3)
-    mesh.Faces.AddFace(0,1,4)
-    mesh.Faces.AddFace(1,2,4)
-    mesh.Faces.AddFace(2,3,4)
-    mesh.Faces.AddFace(3,0,4)
-    
-    mesh.Faces.AddFace(5,6,10,9)
-    mesh.Faces.AddFace(6,7,11,10)
-    mesh.Faces.AddFace(7,8,12,11)
-    mesh.Faces.AddFace(8,5,9,12)
-    mesh.Faces.AddFace(9,10,11,12)
-    
-    mesh.VertexColors.CreateMonotoneMesh(colors[count])
+    for x, y, z in vertices: mesh.Vertices.Add(x, y, z)
+    for face in faces:
+        if len(face) == 3: mesh.Faces.AddFace(face[0], face[1], face[2])
+        else: mesh.Faces.AddFace(face[0], face[1], face[2], face[3])
+    vertexCount = len(template[0])
+    for count in arrowIndices:
+        for i in range(vertexCount): mesh.VertexColors.Add(colors[count])
     
     return mesh
 
@@ -955,79 +892,14 @@ def main(heightsAboveGround, analysisPeriod, d, a, rl, terrainType, epwTerr, met
     noHrMeetsStatement = False
     #Find the prevailing wind direction and corresponding speed.
     if HOY_ == None and windDir != [] and hrWindSpd != [] and hrWindDir != []:
-        #Create lists to be filled
-        compassDirs = []
-        windDirections = []
-        windSpeeds = []
-        for i in range(16):
-            windDirections.append([])
-            windSpeeds.append([])
-            compassDirs.append(i*22.5)
-        
         #Organize all of the data based on 16 main cardinal directions.
-        for dirCount, winDir in enumerate(hrWindDir):
-            if hrWindSpd[dirCount] == 0.0: pass
-            elif winDir < 11 or winDir > 349:
-                windDirections[0].append(winDir)
-                windSpeeds[0].append(hrWindSpd[dirCount])
-            elif winDir < 34:
-                windDirections[1].append(winDir)
-                windSpeeds[1].append(hrWindSpd[dirCount])
-            elif winDir < 56:
-                windDirections[2].append(winDir)
-                windSpeeds[2].append(hrWindSpd[dirCount])
-            elif winDir < 79:
-                windDirections[3].append(winDir)
-                windSpeeds[3].append(hrWindSpd[dirCount])
-            elif winDir < 101:
-                windDirections[4].append(winDir)
-                windSpeeds[4].append(hrWindSpd[dirCount])
-            elif winDir < 124:
-                windDirections[5].append(winDir)
-                windSpeeds[5].append(hrWindSpd[dirCount])
-            elif winDir < 146:
-                windDirections[6].append(winDir)
-                windSpeeds[6].append(hrWindSpd[dirCount])
-            elif winDir < 169:
-                windDirections[7].append(winDir)
-                windSpeeds[7].append(hrWindSpd[dirCount])
-            elif winDir < 191:
-                windDirections[8].append(winDir)
-                windSpeeds[8].append(hrWindSpd[dirCount])
-            elif winDir < 214:
-                windDirections[9].append(winDir)
-                windSpeeds[9].append(hrWindSpd[dirCount])
-            elif winDir < 236:
-                windDirections[10].append(winDir)
-                windSpeeds[10].append(hrWindSpd[dirCount])
-            elif winDir < 259:
-                windDirections[11].append(winDir)
-                windSpeeds[11].append(hrWindSpd[dirCount])
-            elif winDir < 281:
-                windDirections[12].append(winDir)
-                windSpeeds[12].append(hrWindSpd[dirCount])
-            elif winDir < 304:
-                windDirections[13].append(winDir)
-                windSpeeds[13].append(hrWindSpd[dirCount])
-            elif winDir < 326:
-                windDirections[14].append(winDir)
-                windSpeeds[14].append(hrWindSpd[dirCount])
-            else:
-                windDirections[15].append(winDir)
-                windSpeeds[15].append(hrWindSpd[dirCount])
-        
-        # Create a list with the number of hours of each of the wind directions.
-        windDirectionsNumHrs = []
-        for directLis in windDirections:
-            windDirectionsNumHrs.append(len(directLis))
-        
-        #Zip and sort all of the lists together.
-        zipped = zip(windDirectionsNumHrs, windSpeeds, compassDirs)
-        zipped.sort()
+        windRose = sc.sticky["ladybug_WindRose"](hrWindDir, hrWindSpd, numOfDirections = 16)
+        windDirectionsNumHrs = [len(hours) for hours in windRose.sectorHours]
+        prevailingDir = windDirectionsNumHrs.index(max(windDirectionsNumHrs))
         
         #Get the final wind direction and wind speed.
-        avgHrWindDir = math.radians(-(zipped[-1][2]-180))
-        avgHrWindSpd = sum(zipped[-1][1])/len(zipped[-1][1])
+        avgHrWindDir = math.radians(-(windRose.angles[prevailingDir]-180))
+        avgHrWindSpd = windRose.averageVelocities()[prevailingDir]
     elif HOY_ == None and windDir == []:
         try:
             avgHrWindSpd = sum(hrWindSpd)/len(hrWindSpd)
@@ -1041,13 +913,10 @@ def main(heightsAboveGround, analysisPeriod, d, a, rl, terrainType, epwTerr, met
         return -1
     else:
         #Evaluate each height.
-        windSpdHeight = []
+        windProfile = sc.sticky["ladybug_WindProfile"](d, a, rl, metD, metA, metrl, 10, powerOrLog_ == True or powerOrLog_ == None)
+        windSpdHeight = [avgHrWindSpd*factor for factor in windProfile.factors([height/scaleFactor for height in heightsAboveGround])]
         anchorPts = []
         for count, height in enumerate(heightsAboveGround):
-            if powerOrLog_ == True or powerOrLog_ == None:
-                windSpdHeight.append(lb_wind.powerLawWind(avgHrWindSpd, height/scaleFactor, d, a, metD, metA))
-            else:
-                windSpdHeight.append(lb_wind.logLawWind(avgHrWindSpd, height/scaleFactor, rl, metrl))
             if windDir != []: anchorPts.append(rc.Geometry.Point3d(0, 0, height))
             else: anchorPts.append(rc.Geometry.Point3d(0, height, 0))
        
@@ -1086,9 +955,7 @@ def main(heightsAboveGround, analysisPeriod, d, a, rl, terrainType, epwTerr, met
                 ptList = [rc.Geometry.Point3d.Origin, profilePts[1]]
             else:
                 midPtHeight = (heightsAboveGround[1]-heightsAboveGround[0])/20
-                if powerOrLog_ == True or powerOrLog_ == None:
-                    midPtX = lb_wind.powerLawWind(avgHrWindSpd, midPtHeight, d, a, metD, metA)
-                else: midPtX = lb_wind.logLawWind(avgHrWindSpd, midPtHeight, rl, metrl)
+                midPtX = avgHrWindSpd*windProfile.factor(midPtHeight)
                 if windDir == []:
                     midPt = rc.Geometry.Point3d(midPtX*windVectorScale, midPtHeight, 0)
                     ptList = [rc.Geometry.Point3d.Origin, midPt, profilePts[1]]
@@ -1120,13 +987,7 @@ def main(heightsAboveGround, analysisPeriod, d, a, rl, terrainType, epwTerr, met
                 windVecMesh = []
                 #Create standard color 3D meshes.
                 if windArrowStyle == 1:
-                    arrowMesh = rc.Geometry.Mesh()
-                    use1meterArrowHeadSize = True
-                    for count, point in enumerate(anchorPts[1:]):
-                        try:
-                            mesh = createColoredArrowMesh(count, point, colors, windVec, heightsAboveGround, use1meterArrowHeadSize, scaleFactor)
-                            arrowMesh.Append(mesh)
-                        except: pass
+                    arrowMesh = createColoredArrowMeshes(anchorPts[1:], windVec[1:], colors, windVectorScale/1.75, windProfile)
                     windVecMesh.append(arrowMesh)
                 #Create high-res colored 3D meshes
                 elif windArrowStyle == 2:
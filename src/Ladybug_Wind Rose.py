@@ -68,11 +68,11 @@ Provided by Ladybug 0.0.66
 
 ghenv.Component.Name = "Ladybug_Wind Rose"
 ghenv.Component.NickName = 'windRose'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "2 | VisualizeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nJAN_24_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "4"
 except: pass
 
@@ -324,7 +324,7 @@ Hurricane = """At this wind speed, severe widespread damage to vegetaton and str
 # This dictionary is used when Ladybug_Beaufort Ranges is not connected and regular conditional statement is connected
 beaufortObservations = {0: Calm, 1: Light_Air, 2: Light_Breeze, 3: Gentle_Breeze, 4: Moderate_Breeze, 5: Fresh_Breeze, 6: Strong_Breeze, 7: Near_Gale, 8: Gale, 9: Strong_Gale, 10: Voilent_Storm, 11: Hurricane}  
 
-def beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsNoOffset, beaufortObservations,  velTextList):
+def beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsNoOffset, beaufortObservations,  velTextList, windRose):
     """
     This function generates summary to add at the bottom of wind rose diagram
     in case the user connects Ladybug_Beaufort Ranges in conditionalStatement_.
@@ -337,6 +337,7 @@ def beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsN
     input(beaufortObservationsNoOffset) : A list of strings containing observations in beaufort scale to be used when Ladybug_Beaufort Ranges is connected.
     input(beaufortObservations) : A list of strings containing observations in beaufort scale to be used when Ladybug_Beaufort Ranges is not connected.
     input(velTextList) : A list of strings representing average wind velocities coming from different directions
+    input(windRose) : The wind rose with the hours of each direction
     output(summary) : A string that will be added at the bottom of wind rose is beaufortRanges are used
     output(separator) : A string of dots to be added at the bottom of wind rose to separate summary from the rest of strings
     output(velTextList) : A list of strings representing average wind velocities coming from different directions. If regular conditional statement is
@@ -390,27 +391,8 @@ def beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsN
         if conditionalStatement not in mpsCheckRange and conditionalStatement not in mphCheckRange and showAverageVelocity_ == True:
             separator = '...                         ...                         ...'
             
-            # If wind velocities are in m/s
-            if dataType == "m/s":
-                dummyRange = [(0,3), (3, 16), (16, 34), (34, 55), (55, 80), (80, 108), (108, 139), (139, 172), (172, 208), (208, 245), (245, 285), (285, 327), (327, 1000)]
-    
-            # If wind velocities are in mph
-            if dataType == "mph":
-                dummyRange = [(0, 10), (10, 40), (40, 80), (80 , 130), (130, 190), (190, 250), (250, 320), (320, 390), (390, 470), (470, 550), (550, 640), (640, 730), (730, 1500)]
-                
             # Getting a list of all the beaufort numbers applicable to given criteria
-            beaufortObservationNumber = []
-            for vel in velTextList:
-                velocity = round(float(vel), 1)
-                for item in dummyRange:
-                    tempCatch = []
-                    start = item[0]
-                    end = item[1]
-                    if velocity in [round(x * 0.1, 1) for x in range(start, end)]:
-                        catch = str(dummyRange.index(item))
-                        beaufortObservationNumber.append(catch)
-                    else:
-                        pass
+            beaufortObservationNumber = [str(number) for number in windRose.beaufortNumbers(dataType)]
             
             # Adding beaufort numbers to average velocities
             velPlusBeaufort = []
@@ -454,26 +436,6 @@ def beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsN
     return summary , separator, velTextList
 
 
-def makeRanges(numDirections):
-    """This component takes numOfDirections and outputs a list of ranges to be used for
-    average velocity and frequency calculation.
-    input(numDirections) : Number of directions for windRose
-    output (compassAngles) : A list of compass angles based on numOfDirections to be used for rotation of vectors
-    output (angleRanges) : A list of angle ranges to be used for radial display of frequencies and average wind velocities
-    """
-    compassAngles = [(360/numDirections)*i for i in range(numDirections+1)]
-    angleRanges = []
-    angleRanges.append([0, (compassAngles[0] + compassAngles[1]) / 2])
-    i = 0
-    while i < len(compassAngles)-2:
-        catch = [(compassAngles[i] + compassAngles[i+1]) / 2, (compassAngles[i+1] + compassAngles[i+2]) / 2]
-        angleRanges.append(catch)
-        i += 1
-    angleRanges.append([(compassAngles[-1] + compassAngles[-2]) / 2, 361])
-    angleBins = [range(int(item[0]), int(item[1])) for item in angleRanges]
-    return compassAngles, angleBins
-
-
 def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                   analysisPeriod, conditionalStatement, numOfDirections, centerPoint,
                   scale, legendPar, bakeIt, maxFrequency):
@@ -499,6 +461,7 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
         lb_preparation = sc.sticky["ladybug_Preparation"]()
         lb_runStudy_GH = sc.sticky["ladybug_RunAnalysis"]()
         lb_visualization = sc.sticky["ladybug_ResultVisualization"]()
+        lb_windRose = sc.sticky["ladybug_WindRose"]
         
         conversionFac = lb_preparation.checkUnits()
         
@@ -589,10 +552,15 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                 try: numOfDirections = int(numOfDirections)
                 except: numOfDirections = 16
             
+            # separate the hours into calm hours and direction sectors
+            HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisPeriod, 1)
+            windRose = lb_windRose(windDir, windSpeed, [HOY - 1 for HOY in HOYS], numOfDirections, pattern = patternList)
+            # read analysis period
+            stMonth, stDay, stHour, endMonth, endDay, endHour = lb_preparation.readRunPeriod(analysisPeriod, False)
+            
             # define angles
-            segAngle = 360/numOfDirections
-            roseAngles = rs.frange(0,360,segAngle);
-            if round(roseAngles[-1]) == 360: roseAngles.remove(roseAngles[-1])
+            segAngle = 360 / float(numOfDirections)
+            roseAngles = windRose.angles
             
             movingVectors = []; sideVectors = []
             northAngle, northVector = lb_preparation.angle2north(north)
@@ -604,59 +572,14 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                 northVector2.Rotate(-float(math.radians(angle + (segAngle/2))), rc.Geometry.Vector3d.ZAxis)
                 sideVectors.append(northVector2)
             
-            HOYS, months, days = lb_preparation.getHOYsBasedOnPeriod(analysisPeriod, 1)
-            selectedWindDir = []
-            for count in HOYS:
-                selectedWindDir.append(windDir[count-1])
-            #selectedWindDir = lb_preparation.selectHourlyData(windDir, analysisPeriod)[7:]
-            # read analysis period
-            stMonth, stDay, stHour, endMonth, endDay, endHour = lb_preparation.readRunPeriod(analysisPeriod, False)
-
-            # find the study hours based on wind direction data
-            startHour = lb_preparation.date2Hour(stMonth, stDay, stHour)
-            endingHour =  lb_preparation.date2Hour(endMonth, endDay, endHour)
-            if startHour <= endingHour: studyHours = range(startHour-1, endingHour)
-            else: studyHours = range(startHour - 1, 8760) + range(0, endingHour)
-
-            calmHour = [] # count hours with no wind
-            separatedBasedOnAngle = []
-            [separatedBasedOnAngle.append([]) for i in range(len(roseAngles))]
-            #print len(studyHours)
-            #print len(selectedWindDir)
-
-            for hour, windDirection in enumerate(selectedWindDir):
-                h = studyHours[hour]
-                if patternList[h]: # if the hour pass the conditional statement
-                    # check if windSpeed is 0 so collect it in center
-                    if windSpeed[h] == 0: calmHour.append(h)
-                    
-                    else:
-                        for angleCount in range(len(roseAngles)-1):
-                            # print roseAngles[angleCount], roseAngles[angleCount + 1]
-                            #print windDirection
-                            if windDirection == 360.0: windDirection = 0
-                            
-                            if roseAngles[angleCount]-(segAngle/2)<= windDirection < roseAngles[angleCount + 1]-(segAngle/2):
-                                separatedBasedOnAngle[angleCount].append(h)
-                                break
-                            elif roseAngles[-1]-(segAngle/2)<= windDirection < roseAngles[-1]+(segAngle/2):
-                                separatedBasedOnAngle[-1].append(h)
-                                break
-                            elif 360-(segAngle/2)<= windDirection:
-                                separatedBasedOnAngle[0].append(h)
-                                break
-            
             # calculate the frequency
-            calmFreq = (100*len(calmHour)/len(studyHours))
-
-            comment1 = 'Calm for ' + '%.2f'%calmFreq + '% of the time = ' + `len(calmHour)` + ' hours.'
+            calmFreq = windRose.calmFrequency()
+            
+            comment1 = 'Calm for ' + '%.2f'%calmFreq + '% of the time = ' + `len(windRose.calmHours)` + ' hours.'
             print comment1
-            windFreq = []
-
-            for angle in separatedBasedOnAngle:
-                windFreq.append(100*len(angle)/len(studyHours))
+            windFreq = windRose.frequencies()
             
-            calmFreq = (100*len(calmHour)/len(studyHours))/numOfDirections
+            calmFreq = calmFreq/numOfDirections
 
             # draw the basic geometry for windRose
 
@@ -691,7 +614,7 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                 ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
                 return -1      
                 
-            comment2 = 'Each closed polyline shows frequency of ' + "%.1f"%step + '%. = ' + `int(step * len(studyHours)/100)` + ' hours.'
+            comment2 = 'Each closed polyline shows frequency of ' + "%.1f"%step + '%. = ' + `int(step * windRose.hourCount/100)` + ' hours.'
             print comment2
             for freq in rs.frange(minFreq, maxFreq + step, step):
                 freqCrvs.append(freqPolyline(cenPt, freq, sideVectors, scale))
@@ -737,18 +660,8 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                         ghenv.Component.AddRuntimeMessage(gh.GH_RuntimeMessageLevel.Warning, warning)
                         return -1
                     else:
-                        values= []; allValues = []
-                        [values.append([]) for v in range(len(separatedBasedOnAngle))]
-                        #find the values based on the hours separated before
-                        for segNum, eachSegment in enumerate(separatedBasedOnAngle):
-                            for h in eachSegment:
-                                values[segNum].append(selList[h])
-                                allValues.append(selList[h])
-                        
-                        calmValues = []
-                        for h in calmHour:
-                            calmValues.append(selList[h])
-                            allValues.append(selList[h])
+                        # values of the hours of the sectors and the calm hours
+                        allValues = [selList[h] for h in windRose.hours]
                         
                         # If the user has asked to see average velocities and frequencies both, then we shall push the legend to the right a bit
                         if showFrequency_ == True and showAverageVelocity_ == True:
@@ -774,87 +687,15 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                         # color legend surfaces
                         legendSrfs = lb_visualization.colorMesh(legendColors, legendSrfs)
                         
-                        def getDirectionData(patternList, analysisPeriod, _hourlyWindSpeed, _hourlyWindDirection, windFreq, numOfDirections):
-                            """The main role of this function is to produce lists of average velocities and frequencies to be displayed
-                            on wind rose and to be provided to the user as a list.
-                            
-                            input(patternList) : a list with True and False values based on conditional statement
-                            input (analysisPeriod) : Data from _analysisPeriod_ input of this component
-                            input (_hourlyWindSpeed) : Data from _hourlyWindSpeed input of this component
-                            input (_hourlyWindDirection) : Data from _hourlyWindDirection input of this component
-                            input (windFreq) : A list of wind frequencies for all directions. This is a variable defined in main.
-                            input (numOfDirections) : Number of directions set for the wind rose
-                            output(summary) = A string that will be added at the bottom of wind rose is beaufortRanges are used
-                            output(separator) = A string of dots to be added at the bottom of wind rose to separate summary from the rest of strings
-                            output(velTextList) = A list of strings containing average velocity values to be displayed on the wind rose.
-                            output(freqTextList) = A list of strings containing frequency values to be displayed on the wind rose and to be provided to the
-                                                    user as a list.
-                            output(averageVelForOutput ) = A list of strings containing average velocity values to be provided to the user as a list.
-                            """
-                               
-                            # Making a list of frequecies to display on wind rose and rounding them
-                            freqTextList = []
-                            for item in windFreq:
-                                freqTextList.append(str(round(item, 2)))
-                                
-                            # Making a list of angles to rotate vecotrs
-                            angleList, angleRanges = makeRanges(numOfDirections)
-                            angleList = angleList[1:]                               
-                            
-                            # Getting wind speeds and wind directions
-                            wind_Speeds, wind_Directions = unpackPatternList(patternList, analysisPeriod, _hourlyWindSpeed, _hourlyWindDirection)
-                            wind_Directions = [int(x) for x in windDirections[7:]]
-                            wind_Speeds = wind_Speeds[7:]
-                            
-                            # Preparing velocity bins for average calculation
-                            catchVelocity = [[] for item in angleRanges]
-                            j = 0
-                            while j < len(wind_Directions):
-                                for item in angleRanges:
-                                    if wind_Directions[j] in item:
-                                        i = angleRanges.index(item)
-                                        catchVelocity[i].append(wind_Speeds[j])
-                                j += 1
-                            firstBin = catchVelocity[0] + catchVelocity[-1]
-                            velocityBins = catchVelocity[:-1]
-                            velocityBins[0] = firstBin
-                            
-                            # Calculating averages velocities for all the directions
-                            velTextList = []
-                            for item in velocityBins:
-                                try:
-                                    average = str(round(sum(item) / len(item), 2))
-                                except Exception:
-                                    average = str(0)
-                                velTextList.append(average)
-                            
-                            averageVelForOutput = velTextList
-                            summary , separator, velTextList = beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsNoOffset, beaufortObservations,  velTextList)
-                            return summary , separator, velTextList, freqTextList, averageVelForOutput 
-                            
-                        # This is where we define summary to add to the bottom of the wind rose text, separator, and list of average wind velocities
-                        summary , separator, velTextList, freqTextList, averageVelocity  = getDirectionData(patternList, analysisPeriod, _hourlyWindSpeed, _hourlyWindDirection, windFreq, numOfDirections)
+                        # Making lists of frequecies and average velocities to display on wind rose and rounding them
+                        frequencyOutput = [round(freq, 2) for freq in windFreq]
+                        averageVelocityOutput = [round(vel, 2) for vel in windRose.averageVelocities()]
+                        freqTextList = [str(freq) for freq in frequencyOutput]
+                        velTextList = [str(vel) for vel in averageVelocityOutput]
                         
-                        # Preparing a list of frequencies for output
-                        frequencyOutput = []
-                        for item in freqTextList:
-                            if item == "0" or item == "0.00":
-                                item = 0.0
-                                frequencyOutput.append(item)
-                            else:
-                                item = float(item)
-                                frequencyOutput.append(item)
+                        # This is where we define summary to add to the bottom of the wind rose text, separator, and list of average wind velocities
+                        summary , separator, velTextList = beaufortScale(conditionalStatement_, _hourlyWindSpeed, beaufortObservationsNoOffset, beaufortObservations, velTextList, windRose)
                         
-                        # Preparing a list of averageVelocities for output
-                        averageVelocityOutput = []
-                        for item in averageVelocity:
-                            if item == "0" or item == "0.00":
-                                item = 0.0
-                                averageVelocityOutput.append(item)
-                            else:
-                                item = float(item)
-                                averageVelocityOutput.append(item)    
-                            
                         # Creating custom heading for the windrose
                         customHeading = customHeading + listInfo[i][1] + \
                                         '\n'+lb_preparation.hour2Date(lb_preparation.date2Hour(stMonth, stDay, stHour)) + ' - ' + \
@@ -904,28 +745,21 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                         if len(numRanges) == 1:
                             numRanges.insert(0, 0.0)
 
+                        # count the hours of each sector and of the calm period in the legend ranges
+                        histogram = windRose.histogram(numRanges, selList)
+                        
                         # do it for the calm period
                         # calculate the frequency for calm
-                        freqInCenter = []
-                        [freqInCenter.append([]) for v in range(len(numRanges))]
-                        for v in calmValues:
-                            for rangeCount in range(len(numRanges)):
-                                if numRanges[rangeCount]<= v <= numRanges[rangeCount + 1]:
-                                    freqInCenter[rangeCount].append(v)
-                                    break
-                                elif numRanges[-1]<= v:
-                                    freqInCenter[-1].append(v)
-                                    break
-                        
                         centerFrqPts = []
                         cumFreq = 0
                         freqList = []
                         avrValues = []
-                        for freq in freqInCenter:
-                            if len(freq)!=0:
-                                freqList.append(len(freq)/len(calmValues))
-                                avrValues.append(sum(freq)/len(freq))
-                                cumFreq = cumFreq + ((len(freq)/len(calmValues)) * calmFreq)
+                        calmCount = len(windRose.calmHours)
+                        for count, avr in zip(histogram.calmCounts, histogram.calmAverages()):
+                            if count!=0:
+                                freqList.append(count/calmCount)
+                                avrValues.append(avr)
+                                cumFreq = cumFreq + ((count/calmCount) * calmFreq)
                                 centerFrqPts.append(freqPolyline(cenPt, cumFreq , sideVectors, scale, True))
                                 
                         centerMesh = rc.Geometry.Mesh()
@@ -971,25 +805,15 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                         
                         segments = rc.Geometry.Mesh()
                         segmentsColors = []
-                        for direction, segmentValues in enumerate(values):
-                            freqInEachSeg = []
-                            [freqInEachSeg.append([]) for v in range(len(numRanges))]
-                            
-                            for v in segmentValues:
-                                for rangeCount in range(len(numRanges)-1):
-                                    if numRanges[rangeCount]<= v <= numRanges[rangeCount + 1]:
-                                        freqInEachSeg[rangeCount].append(v)
-                                        break
-                                    elif numRanges[-1]<= v:
-                                        freqInEachSeg[-1].append(v)
-                                        break
+                        for direction, (counts, averages) in enumerate(zip(histogram.counts, histogram.averages())):
+                            hourCount = len(windRose.sectorHours[direction])
                             totalFr = 0
                             
                             for rangeCount in range(len(numRanges)):
-                                if len(segmentValues)!=0:
-                                    fr = (len(freqInEachSeg[rangeCount])/len(segmentValues))
+                                if hourCount!=0:
+                                    fr = counts[rangeCount]/hourCount
                                     if fr!=0:
-                                        avr = [sum(freqInEachSeg[rangeCount])/len(freqInEachSeg[rangeCount])]
+                                        avr = [averages[rangeCount]]
                                         color = lb_visualization.gradientColor(avr, numRanges[0], numRanges[-1], customColors)
                                         pt1 = rc.Geometry.Point3d.Add(cenPt, (calmFreq + (windFreq[direction] * totalFr)) * scale * sideVectors[direction-1])
                                         pt2 = rc.Geometry.Point3d.Add(cenPt, (calmFreq + (windFreq[direction] * (totalFr + fr)))* scale * sideVectors[direction-1])
@@ -1013,8 +837,7 @@ def main(north, hourlyWindDirection, hourlyWindSpeed, annualHourlyData,
                     compassCrvs, compassTextPts, compassText = lb_visualization. compassCircle(cenPt, northVector, 1.11 *maxFreq * scale, roseAngles, 1.5*textSize)
 
                     # Making a list of angles to rotate vecotrs
-                    angleList, angleRanges = makeRanges(numOfDirections)
-                    angleList = angleList[1:]
+                    angleList = roseAngles[1:]
 
                     # Measuring the distance between the north point and the center of the wind rose.
                     # This radial distance is crucial for position of frequencies
@@ -52,11 +52,11 @@ Provided by Ladybug 0.0.66
 """
 ghenv.Component.Name = "Ladybug_Wind Speed Calculator"
 ghenv.Component.NickName = 'WindSpeedCalculator'
-ghenv.Component.Message = 'VER 0.0.66\nJAN_20_2018'
+ghenv.Component.Message = 'VER 0.0.66\nOCT_18_2026'
 ghenv.Component.IconDisplayMode = ghenv.Component.IconDisplayMode.application
 ghenv.Component.Category = "Ladybug"
 ghenv.Component.SubCategory = "1 | AnalyzeWeatherData"
-#compatibleLBVersion = VER 0.0.59\nAPR_12_2016
+#compatibleLBVersion = VER 0.0.66\nOCT_18_2026
 try: ghenv.Component.AdditionalHelpFromDocStrings = "2"
 except: pass
 
@@ -274,38 +274,24 @@ def main(heightAboveGround, analysisPeriod, d, a, rl, metD, metA, metrl, epwHeig
                 windDirectionAtHeight.Add(epwStr[6], GH_Path(count))
     
     #Evaluate each height.
-    windSpdHeight = []
-    for height in heightAboveGround:
-        initWindSpd = []
-        for speed in hrWindSpd:
-            if powerOrLog_ == True or powerOrLog_ == None:
-                initWindSpd.append(lb_wind.powerLawWind(speed, height, d, a, metD, metA, epwHeight))
-            else:
-                initWindSpd.append(lb_wind.logLawWind(speed, height, rl, metrl, epwHeight))
-        windSpdHeight.append(initWindSpd)
+    powerLaw = powerOrLog_ == True or powerOrLog_ == None
+    windProfile = lb_windProfile(d, a, rl, metD, metA, metrl, epwHeight, powerLaw)
+    windSpdHeight = windProfile.speeds(hrWindSpd, heightAboveGround)
     
     #Declare the wind direction.
     windDirHeight = []
     for height in heightAboveGround:
        windDirHeight.append(hrWindDir)
     
-    #Make the wind vectors.
-    windVec = []
-    for list in windSpdHeight:
-        initWindVec = []
-        for count, speed in enumerate(list):
-            vec = rc.Geometry.Vector3d(0, speed, 0)
-            vec.Rotate(hrWindDir[count]*0.0174532925, rc.Geometry.Vector3d.ZAxis)
-            initWindVec.append(vec)
-        windVec.append(initWindVec)
-    
     #If there is a north angle hooked up, rotate the vectors.
     if north_ != None:
         northAngle, northVector = lb_preparation.angle2north(north_)
-        for list in windVec:
-            for vec in list:
-                vec.Rotate(northAngle, rc.Geometry.Vector3d.ZAxis)
-    else: pass
+    else: northAngle = 0
+    
+    #Make the wind vectors.
+    windVec = []
+    for list in windSpdHeight:
+        windVec.append([rc.Geometry.Vector3d(x, y, 0) for x, y in windProfile.windVectors(list, hrWindDir, northAngle)])
     
     return windSpdHeight, windVec, windDirHeight
 
@@ -327,6 +313,7 @@ if sc.sticky.has_key('ladybug_release'):
     lb_preparation = sc.sticky["ladybug_Preparation"]()
     lb_visualization = sc.sticky["ladybug_ResultVisualization"]()
     lb_wind = sc.sticky["ladybug_WindSpeed"]()
+    lb_windProfile = sc.sticky["ladybug_WindProfile"]
 else:
     initCheck = False
     print "You should first let the Ladybug fly..."
@@ -0,0 +1,41 @@
+"""
+Ladybug core.
+
+Pure Python routines that do not depend on Rhino or Grasshopper. The modules in
+this package run inside IronPython (Ladybug_Ladybug adds the package folder to
+sys.path and copies the classes to Rhino's shared space) as well as in CPython
+for batch runs outside of Grasshopper.
+
+    epw: epw weather file reader and a shared cache of parsed weather files.
+    datacollection: typed headers and float buffers for Ladybug data lists.
+    analysisperiod: hours of the year of analysis periods.
+    wea: read epw weather files and write Radiance wea files.
+    skymatrix: native Perez all-weather sky matrix (Tregenza/Reinhart).
+    batch: run the same pipeline for many epw files in a process pool.
+    sunpath: sun position.
+    comfort: thermal comfort models (PMV, SET, adaptive, UTCI, PET).
+    psychrometrics: humidity ratio, enthalpy, dew point and wet bulb for lists of values.
+    comfortindices: PET and predicted heat strain (ISO 7933) for lists of hourly values.
+    wind: wind speed profiles for different terrains and wind vector arrows.
+    windrose: direction sector and value band histograms of wind roses.
+    photovoltaics: PV, solar water heating and magnetic declination (WMM).
+    geomag: World Magnetic Model for lists of sites and dates.
+    colors: legend color gradients.
+    mesh: face centers, normals, areas and test points of meshes.
+    isolines: contour polylines of all the levels of mesh values in one pass.
+    texture: texture atlases of colored meshes written as RGBA png files.
+    envimet: voxel grids of ENVI-met models and a streaming INX file writer.
+    shadows: shadows of mesh faces on each other with a sun-aligned grid of candidates.
+    solarfan: Quickhull solar fans of planar boundaries for a set of sun vectors.
+    terrain: elevations of points from local SRTM and GeoTIFF tiles with an optional tile fetcher.
+    stations: nearest weather stations of a site from a catalogue with a k-d tree.
+    weatherstore: content-addressed store of weather downloads with parallel, resumable downloads.
+    startup: lazily imported core objects, a cached version check and start timing.
+    irradiance: hourly irradiance of analysis faces from a visibility and a sky matrix.
+    skycolor: Preetham sky colors of sky domes and of sequences of hours.
+
+Submodules are not imported with the package so importing one model doesn't
+load the others.
+"""
+
+__version__ = '0.0.66'
@@ -0,0 +1,240 @@
+"""
+Analysis periods.
+
+Hours of the year (HOYs) of an analysis period are calculated from the day and
+hour ranges instead of checking every generated hour against the ones that are
+already in the list. Periods are cached so components that use the same period
+share the same lists.
+
+HOYs follow Ladybug's convention: 1 is the first hour of January 1st and 8760
+is the last hour of the year (8784 in leap years). For time steps larger than 1
+HOYs are floats (e.g. 1, 1.25, 1.5, 1.75 for a time step of 4).
+"""
+from __future__ import division
+
+
+NUMOFDAYSEACHMONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+NUMOFDAYSEACHMONTHLEAP = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+ANNUALPERIOD = ((1, 1, 1), (12, 31, 24))
+
+_periods = {}
+
+
+def numOfDaysEachMonth(isLeapYear=False):
+    return NUMOFDAYSEACHMONTHLEAP if isLeapYear else NUMOFDAYSEACHMONTH
+
+
+def firstDays(isLeapYear=False):
+    """Number of days before each month."""
+    days = [0]
+    for count in numOfDaysEachMonth(isLeapYear):
+        days.append(days[-1] + count)
+    return days
+
+
+def checkHour(hour):
+    if hour < 1: return 1
+    elif hour % 24 == 0: return 24
+    return hour % 24
+
+
+def checkMonth(month):
+    if month < 1: return 1
+    elif month % 12 == 0: return 12
+    return month % 12
+
+
+def checkDay(day, month, isLeapYear=False):
+    return min(max(day, 1), numOfDaysEachMonth(isLeapYear)[month - 1])
+
+
+def date2Hour(month, day, hour, isLeapYear=False):
+    """HOY of a date."""
+    return (firstDays(isLeapYear)[int(month) - 1] + int(day) - 1) * 24 + hour
+
+
+def hour2Date(hoy, isLeapYear=False):
+    """(month, day, hour) of a HOY. Hour is between 0 and 24 and 24 is the
+    last hour of the day."""
+    dayOfYear, hour = divmod(hoy, 24)
+    if hour == 0: dayOfYear, hour = dayOfYear - 1, 24
+    dayOfYear = int(dayOfYear) % (366 if isLeapYear else 365)
+    days = firstDays(isLeapYear)
+    month = 1
+    while dayOfYear >= days[month]: month += 1
+    return month, dayOfYear - days[month - 1] + 1, hour
+
+
+def dayHours(hours, timestep=1):
+    """Hours of a day for a list of hours and a time step.
+
+    Each hour is divided into time steps (e.g. 8, 8.25, 8.5, 8.75 for a time
+    step of 4). Hours that go over the end of the day wrap to its start.
+    """
+    if timestep == 1:
+        return sorted(set(int(checkHour(int(h))) for h in hours))
+    hourSet = set()
+    for hour in hours:
+        for step in range(timestep):
+            hourSet.add(checkHour(hour + step / timestep))
+    return sorted(hourSet)
+
+
+def hoysFromDates(months, days, hours, timestep=1, isLeapYear=False):
+    """HOYs for all the combinations of months, days and hours.
+
+    Days that are not in a month are moved to the last day of the month.
+    """
+    hours = dayHours(hours, timestep)
+    monthDays = []
+    for month in months:
+        month = checkMonth(int(month))
+        for day in days:
+            day = checkDay(int(day), month, isLeapYear)
+            if (month, day) not in monthDays: monthDays.append((month, day))
+
+    firstDayOfMonth = firstDays(isLeapYear)
+    hoys = []
+    for month, day in monthDays:
+        dayStart = (firstDayOfMonth[month - 1] + day - 1) * 24
+        hoys.extend(dayStart + h for h in hours)
+    return hoys
+
+
+class AnalysisPeriod(object):
+    """An analysis period.
+
+    Every day from the start date to the end date is included with the hours
+    from the start hour to the end hour. If the end date is before the start
+    date the period goes over the end of the year.
+
+    Args:
+        stMonth, stDay, stHour: Start date.
+        endMonth, endDay, endHour: End date.
+        timestep: Number of time steps in each hour.
+        isLeapYear: Set to True for 366 days.
+    """
+
+    def __init__(self, stMonth=1, stDay=1, stHour=1, endMonth=12, endDay=31, endHour=24,
+                 timestep=1, isLeapYear=False):
+        self.stMonth = checkMonth(int(stMonth))
+        self.endMonth = checkMonth(int(endMonth))
+        self.stDay = checkDay(int(stDay), self.stMonth, isLeapYear)
+        self.endDay = checkDay(int(endDay), self.endMonth, isLeapYear)
+        self.stHour = stHour
+        self.endHour = endHour
+        self.timestep = int(timestep)
+        self.isLeapYear = isLeapYear
+        self._hoys = None
+        self._hoySet = None
+        self._dates = None
+
+    @classmethod
+    def fromAnalysisPeriod(cls, analysisPeriod=None, timestep=1, isLeapYear=False):
+        """Cached period for ((stMonth, stDay, stHour), (endMonth, endDay, endHour)).
+
+        An empty analysis period is the whole year.
+        """
+        if not analysisPeriod or analysisPeriod[0] is None: analysisPeriod = ANNUALPERIOD
+        key = (tuple(analysisPeriod[0]), tuple(analysisPeriod[1]), int(timestep), bool(isLeapYear))
+        if key not in _periods:
+            (stMonth, stDay, stHour), (endMonth, endDay, endHour) = analysisPeriod
+            _periods[key] = cls(stMonth, stDay, stHour, endMonth, endDay, endHour, timestep,
+                                isLeapYear)
+        return _periods[key]
+
+    @property
+    def analysisPeriod(self):
+        return (self.stMonth, self.stDay, self.stHour), (self.endMonth, self.endDay, self.endHour)
+
+    @property
+    def months(self):
+        """Months of the period in the order of the period."""
+        if self.stMonth > self.endMonth or self.isOverYearEnd:
+            return list(range(self.stMonth, 13)) + list(range(1, self.endMonth + 1))
+        return list(range(self.stMonth, self.endMonth + 1))
+
+    @property
+    def isOverYearEnd(self):
+        return (self.stMonth, self.stDay) > (self.endMonth, self.endDay)
+
+    @property
+    def daysOfYear(self):
+        """0-based days of the year in the order of the period."""
+        days = firstDays(self.isLeapYear)
+        stDay = days[self.stMonth - 1] + self.stDay - 1
+        endDay = days[self.endMonth - 1] + self.endDay - 1
+        if stDay <= endDay:
+            return list(range(stDay, endDay + 1))
+        return list(range(stDay, days[-1])) + list(range(endDay + 1))
+
+    @property
+    def hoys(self):
+        """HOYs in the order of the period."""
+        if self._hoys is None:
+            numOfSteps = int(round((self.endHour - self.stHour + 1) * self.timestep))
+            hours = sorted(set(checkHour(self.stHour + step / self.timestep)
+                               for step in range(numOfSteps)))
+            if self.timestep == 1: hours = [int(h) for h in hours]
+            self._hoys = [day * 24 + h for day in self.daysOfYear for h in hours]
+        return self._hoys
+
+    @property
+    def hoySet(self):
+        """HOYs as a set for fast membership tests."""
+        if self._hoySet is None: self._hoySet = frozenset(self.hoys)
+        return self._hoySet
+
+    @property
+    def dates(self):
+        """(month, day, hour) for each HOY."""
+        if self._dates is None:
+            self._dates = [hour2Date(hoy, self.isLeapYear) for hoy in self.hoys]
+        return self._dates
+
+    @property
+    def dataIndices(self):
+        """0-based indices of the HOYs in an annual list of values with the same time step."""
+        return [int(round(hoy * self.timestep)) - 1 for hoy in self.hoys]
+
+    def isHoyIn(self, hoy):
+        return hoy in self.hoySet
+
+    def mask(self, hoys=None):
+        """True/False pattern of a list of HOYs. Default is every time step of the year."""
+        if hoys is None:
+            count = (8784 if self.isLeapYear else 8760) * self.timestep
+            hoys = [(i + 1) / self.timestep for i in range(count)] if self.timestep != 1 \
+                else range(1, count + 1)
+        hoySet = self.hoySet
+        return [hoy in hoySet for hoy in hoys]
+
+    def union(self, other):
+        """Sorted HOYs that are in this or the other period (or list of HOYs)."""
+        return sorted(self.hoySet.union(_hoys(other)))
+
+    def intersection(self, other):
+        """Sorted HOYs that are in this and the other period (or list of HOYs)."""
+        return sorted(self.hoySet.intersection(_hoys(other)))
+
+    def difference(self, other):
+        """Sorted HOYs that are in this period but not in the other."""
+        return sorted(self.hoySet.difference(_hoys(other)))
+
+    def __len__(self):
+        return len(self.hoys)
+
+    def __iter__(self):
+        return iter(self.hoys)
+
+    def __contains__(self, hoy):
+        return hoy in self.hoySet
+
+    def ToString(self):
+        return 'AnalysisPeriod::%s/%s %s to %s/%s %s' % (self.stMonth, self.stDay, self.stHour,
+                                                        self.endMonth, self.endDay, self.endHour)
+
+
+def _hoys(other):
+    return other.hoySet if isinstance(other, AnalysisPeriod) else other
@@ -0,0 +1,324 @@
+"""
+Batch runner for climate comparison studies.
+
+Run the same pipeline against a list of epw files in a process pool and collect
+one tidy results table (epw, location, step, metric, key, value) per epw file.
+
+A pipeline is a list of (stepName, options) pairs. Steps run in order and share
+a BatchRun that carries the weather data and the hours selected by the last
+analysisPeriod step. The built-in steps are analysisPeriod, weatherStatistics,
+degreeDays, skyMatrix, comfort (PMV or UTCI) and pvwatts. New steps can be
+added with registerStep:
+
+    @registerStep('myMetric')
+    def myMetric(run, threshold=26):
+        hours = [h for h in run.hours if run.epw.data['dryBulbTemperature'][h] > threshold]
+        return [('hoursAbove', threshold, len(hours))]
+
+Multiprocessing is only available in CPython. Inside IronPython the runs are
+executed one after the other.
+
+    python -m ladybug_core.batch pipeline.json epw1.epw epw2.epw -o results -j 8
+"""
+from __future__ import division
+import os
+import csv
+import json
+
+from .epw import WeatherCache
+from .analysisperiod import AnalysisPeriod
+from .skymatrix import SkyMatrix
+from .wea import hourToDate
+from .comfort import ComfortModels
+from .photovoltaics import Photovoltaics
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+
+COLUMNS = ('epw', 'location', 'step', 'metric', 'key', 'value')
+
+# Simplified Photovoltaics Module defaults: close roof mount c-Si module
+PVMODULESETTINGS = ['close roof mount', 'c-Si', 1, 90, 15, -0.5, -2.98, -0.0471, 1]
+
+STEPS = {}
+
+# weather caches of the current process by cache folder. worker processes get
+# their own copy.
+_weatherCaches = {}
+
+
+def registerStep(name):
+    """Decorator to add a step to the batch pipelines.
+
+    A step is called as step(run, **options) and returns a list of
+    (metric, key, value) tuples. Key can be None for single values.
+    """
+    def register(func):
+        STEPS[name] = func
+        return func
+    return register
+
+
+def periodHours(analysisPeriod):
+    """0-based hours of the year in an analysis period."""
+    return [hoy - 1 for hoy in AnalysisPeriod.fromAnalysisPeriod(analysisPeriod).hoys]
+
+
+class BatchRun(object):
+    """Weather data and state of a pipeline run for a single epw file."""
+
+    def __init__(self, epw):
+        self.epw = epw
+        self.hours = list(range(8760))
+        self.analysisPeriod = ((1, 1, 1), (12, 31, 24))
+        # step results that other steps can use (e.g. the sky matrix)
+        self.cache = {}
+
+    def values(self, key):
+        """Hourly values of a weather field for the selected hours."""
+        data = self.epw.data[key]
+        return [data[h] for h in self.hours]
+
+    def skyMatrix(self, density=1):
+        if ('skyMatrix', density) not in self.cache:
+            self.cache[('skyMatrix', density)] = SkyMatrix(self.epw.toWea(), density)
+        return self.cache[('skyMatrix', density)]
+
+    def hourlyInput(self, value, key):
+        """Values of the selected hours for a step input.
+
+        Value can be None to use the epw field key, a number for all the hours
+        or a list of 8760 hourly values.
+        """
+        if value is None: return self.values(key)
+        if isinstance(value, (list, tuple)): return [value[h] for h in self.hours]
+        return [float(value)] * len(self.hours)
+
+
+@registerStep('analysisPeriod')
+def analysisPeriodStep(run, period=((1, 1, 1), (12, 31, 24))):
+    run.analysisPeriod = period
+    run.hours = periodHours(period)
+    return [('hourCount', None, len(run.hours))]
+
+
+@registerStep('weatherStatistics')
+def weatherStatisticsStep(run, fields=('dryBulbTemperature', 'relativeHumidity', 'windSpeed',
+                                        'globalHorizontalRadiation')):
+    results = []
+    for key in fields:
+        values = run.values(key)
+        if not values: continue
+        results.append(('%s_mean' % key, None, sum(values) / len(values)))
+        results.append(('%s_min' % key, None, min(values)))
+        results.append(('%s_max' % key, None, max(values)))
+    return results
+
+
+@registerStep('degreeDays')
+def degreeDaysStep(run, heatingBase=18, coolingBase=23):
+    temperatures = run.values('dryBulbTemperature')
+    hdd = sum(heatingBase - t for t in temperatures if t < heatingBase) / 24
+    cdd = sum(t - coolingBase for t in temperatures if t > coolingBase) / 24
+    return [('heatingDegreeDays', heatingBase, hdd), ('coolingDegreeDays', coolingBase, cdd)]
+
+
+@registerStep('skyMatrix')
+def skyMatrixStep(run, density=1, perPatch=False):
+    """Cumulative radiation of the sky (kWh/m2) for the selected hours."""
+    cumulative = run.skyMatrix(density).cumulativeValues(run.hours)
+    results = [('skyDiffuseRadiation', None, sum(v[0] for v in cumulative) / 1000),
+               ('skyDirectRadiation', None, sum(v[1] for v in cumulative) / 1000)]
+    if perPatch:
+        for patch, (difValue, dirValue) in enumerate(cumulative):
+            results.append(('patchTotalRadiation', patch, (difValue + dirValue) / 1000))
+    return results
+
+
+@registerStep('comfort')
+def comfortStep(run, model='PMV', meanRadiantTemperature=None, windSpeed=None,
+                met=1.1, clo=0.5, wme=0):
+    """Outdoor PMV or UTCI of the selected hours.
+
+    Args:
+        model: 'PMV' or 'UTCI'.
+        meanRadiantTemperature: Number or 8760 hourly values. Default is the
+            dry bulb temperature.
+        windSpeed: Number or 8760 hourly values. Default is the epw wind speed.
+        met, clo, wme: Metabolic rate, clothing and external work of PMV.
+    """
+    temperatures = run.values('dryBulbTemperature')
+    if not temperatures: return []
+    humidities = run.values('relativeHumidity')
+    radiantTemperatures = run.hourlyInput(meanRadiantTemperature, 'dryBulbTemperature')
+    windSpeeds = run.hourlyInput(windSpeed, 'windSpeed')
+    inputs = zip(temperatures, radiantTemperatures, windSpeeds, humidities)
+    comfortModels = ComfortModels()
+
+    if model.upper() == 'PMV':
+        pmvs, ppds = [], []
+        for ta, tr, vel, rh in inputs:
+            result = comfortModels.comfPMV(ta, tr, vel, rh, met, clo, wme)
+            # comfPMV returns 1 if the clothing temperature doesn't converge
+            if result == 1: continue
+            pmvs.append(result[0])
+            ppds.append(result[1])
+        comfortable = len([pmv for pmv in pmvs if -0.5 <= pmv <= 0.5])
+        return [('pmv_mean', None, sum(pmvs) / len(pmvs) if pmvs else None),
+                ('ppd_mean', None, sum(ppds) / len(ppds) if ppds else None),
+                ('comfortablePercent', None, 100 * comfortable / len(temperatures)),
+                ('unsolvedHours', None, len(temperatures) - len(pmvs))]
+
+    if model.upper() == 'UTCI':
+        utcis, comfortable, stress = [], 0, {-1: 0, 1: 0}
+        for ta, tr, vel, rh in inputs:
+            utci, isComfortable, stressRange, stressVal = comfortModels.comfUTCI(ta, tr, vel, rh)
+            utcis.append(utci)
+            comfortable += isComfortable
+            if stressVal: stress[stressVal] += 1
+        return [('utci_mean', None, sum(utcis) / len(utcis)),
+                ('utci_min', None, min(utcis)),
+                ('utci_max', None, max(utcis)),
+                ('comfortablePercent', None, 100 * comfortable / len(utcis)),
+                ('coldStressHours', None, stress[-1]),
+                ('heatStressHours', None, stress[1])]
+
+    raise ValueError('Unknown comfort model: %s. Use PMV or UTCI.' % model)
+
+
+@registerStep('pvwatts')
+def pvwattsStep(run, nameplateDCpowerRating=1, DCtoACderateFactor=0.85, srfTiltD=None,
+                srfAzimuthD=None, albedo=None, PVmoduleSettings=None, perMonth=False):
+    """PVWatts energy of a PV array for the selected hours.
+
+    Args:
+        nameplateDCpowerRating: DC rating of the array in kW.
+        srfTiltD, srfAzimuthD: Tilt and azimuth of the array in degrees. Default
+            is a tilt of abs(latitude) facing the equator.
+        albedo: Number or 8760 hourly values. Default is 0.2 corrected for snow.
+        PVmoduleSettings: Default is the Simplified Photovoltaics Module one.
+        perMonth: Add the AC energy of each month of the selected hours.
+    """
+    epw = run.epw
+    data = epw.data
+    pv = Photovoltaics()
+    if srfTiltD is None: srfTiltD = abs(epw.lat)
+    if srfAzimuthD is None: srfAzimuthD = 180 if epw.lat >= 0 else 0
+    if albedo is None:
+        if 'albedo' not in run.cache:
+            run.cache['albedo'] = pv.calculateAlbedo(data['dryBulbTemperature'])
+        albedo = run.cache['albedo']
+    albedos = run.hourlyInput(albedo, None)
+    moduleSettings = PVmoduleSettings or PVMODULESETTINGS
+
+    acEnergy = dcEnergy = irradiation = 0
+    monthlyEnergy = {}
+    for h, albedoValue in zip(run.hours, albedos):
+        month, day, time = hourToDate(h)
+        sunZenithD, sunAzimuthD, sunAltitudeD = pv.NRELsunPosition(
+            epw.lat, epw.lngt, epw.timeZone, int(data['year'][h]), month, day, time - 0.5)
+        DNI = data['directNormalRadiation'][h]
+        DHI = data['diffuseHorizontalRadiation'][h]
+        Epoa, Eb, Ed_sky, Eground, AOI_R = pv.POAirradiance(
+            sunZenithD, sunAzimuthD, srfTiltD, srfAzimuthD, DNI, DHI, albedoValue)
+        Tcell, Pdc_, Pac = pv.pvwatts(
+            nameplateDCpowerRating, DCtoACderateFactor, srfTiltD, sunZenithD, AOI_R, Epoa, Eb,
+            Ed_sky, Eground, data['dryBulbTemperature'][h], data['windSpeed'][h], DNI, DHI,
+            moduleSettings, epw.elev)
+        acEnergy += Pac
+        dcEnergy += Pdc_
+        irradiation += Epoa / 1000
+        monthlyEnergy[month] = monthlyEnergy.get(month, 0) + Pac
+
+    results = [('acEnergy', None, acEnergy), ('dcEnergy', None, dcEnergy),
+               ('poaIrradiation', None, irradiation)]
+    if perMonth:
+        results.extend(('acEnergy', month, monthlyEnergy[month]) for month in sorted(monthlyEnergy))
+    return results
+
+
+def runPipeline(epwFile, pipeline, cacheFolder=None):
+    """Run a pipeline for a single epw file and return the results table."""
+    if cacheFolder not in _weatherCaches: _weatherCaches[cacheFolder] = WeatherCache(cacheFolder)
+    epw = _weatherCaches[cacheFolder].get(epwFile)
+    run = BatchRun(epw)
+    table = []
+    for stepName, options in pipeline:
+        if stepName not in STEPS:
+            raise ValueError('Unknown batch step: %s. Available steps are: %s' \
+                             % (stepName, ', '.join(sorted(STEPS))))
+        for metric, key, value in STEPS[stepName](run, **(options or {})):
+            table.append((os.path.basename(epwFile), epw.locName, stepName, metric, key, value))
+    return table
+
+
+def _runPipeline(args):
+    return runPipeline(*args)
+
+
+def runBatch(epwFiles, pipeline, processes=None, cacheFolder=None, outputFolder=None):
+    """Run a pipeline for a list of epw files.
+
+    Args:
+        epwFiles: List of epw file paths.
+        pipeline: List of (stepName, options) pairs.
+        processes: Number of worker processes. Default is the number of cpus.
+            Use 1 to run in the current process.
+        cacheFolder: Optional folder to share parsed weather files between
+            processes and runs.
+        outputFolder: Optional folder to write one csv table per epw file.
+    Returns:
+        A list of result tables in the same order as epwFiles.
+    """
+    pipeline = [(stepName, dict(options or {})) for stepName, options in pipeline]
+    args = [(epwFile, pipeline, cacheFolder) for epwFile in epwFiles]
+
+    if multiprocessing is None or processes == 1 or len(epwFiles) < 2:
+        tables = [_runPipeline(arg) for arg in args]
+    else:
+        pool = multiprocessing.Pool(processes)
+        try:
+            tables = pool.map(_runPipeline, args, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+    if outputFolder:
+        if not os.path.isdir(outputFolder): os.makedirs(outputFolder)
+        for epwFile, table in zip(epwFiles, tables):
+            fileName = os.path.splitext(os.path.basename(epwFile))[0] + '.csv'
+            writeTable(table, os.path.join(outputFolder, fileName))
+
+    return tables
+
+
+def writeTable(table, filePath):
+    """Write a results table to a csv file."""
+    with open(filePath, 'w') as outf:
+        writer = csv.writer(outf, lineterminator='\n')
+        writer.writerow(COLUMNS)
+        for row in table:
+            writer.writerow(['' if v is None else v for v in row])
+    return filePath
+
+
+def main(args=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Run a Ladybug pipeline for a list of epw files.')
+    parser.add_argument('pipeline', help='json file with a list of [stepName, options] pairs.')
+    parser.add_argument('epwFiles', nargs='+', help='epw files.')
+    parser.add_argument('-o', '--output', default='.', help='folder for the csv tables.')
+    parser.add_argument('-j', '--processes', type=int, default=None, help='number of processes.')
+    parser.add_argument('-c', '--cache', default=None, help='folder for parsed weather files.')
+    args = parser.parse_args(args)
+
+    with open(args.pipeline, 'r') as inf:
+        pipeline = json.load(inf)
+    runBatch(args.epwFiles, pipeline, args.processes, args.cache, args.output)
+
+
+if __name__ == '__main__':
+    main()
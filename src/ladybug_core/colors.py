@@ -0,0 +1,70 @@
+"""
+Color gradients.
+
+Colors are (R, G, B) tuples so the gradient can be calculated outside of Rhino.
+ResultVisualization.gradientColor converts the results to System.Drawing colors.
+"""
+from __future__ import division
+from bisect import bisect_right
+
+
+def colorBounds(numOfColors):
+    """Normalized value of each color in a gradient with numOfColors colors."""
+    if numOfColors < 2: return [0]
+    return [round(i / (numOfColors - 1), 3) for i in range(numOfColors)]
+
+
+def gradientRGB(values, lowB, highB, colors, lowBoundColor=None, highBoundColor=None):
+    """Gradient color for each value.
+
+    Args:
+        values: List of numbers.
+        lowB, highB: Bounds of the legend. Use 'min' and 'max' for the bounds of values.
+        colors: List of (R, G, B) tuples.
+        lowBoundColor, highBoundColor: Optional colors for the values at or
+            outside the bounds. They are returned as they are.
+    Returns:
+        A list of (R, G, B) tuples (or the bound colors) with the same length as values.
+    """
+    if highB == 'max': highB = max(values)
+    if lowB == 'min': lowB = min(values)
+
+    if len(colors) == 1: return [tuple(colors[0])] * len(values)
+
+    bounds = colorBounds(len(colors))
+    lastSegment = len(bounds) - 2
+    rangeB = highB - lowB
+
+    # interpolation factors of each segment so every value only needs a bisect
+    segments = []
+    for i in range(lastSegment + 1):
+        rangeP = bounds[i + 1] - bounds[i]
+        minColor, maxColor = colors[i], colors[i + 1]
+        segments.append((bounds[i], rangeP, minColor[0], minColor[1], minColor[2],
+                         maxColor[0] - minColor[0], maxColor[1] - minColor[1],
+                         maxColor[2] - minColor[2]))
+
+    gradient = []
+    for num in values:
+        # normalize the value
+        if num > highB: numP = 1
+        elif num < lowB: numP = 0
+        elif rangeB == 0: numP = 0
+        else: numP = (num - lowB) / rangeB
+
+        if numP == 1 and highBoundColor is not None:
+            gradient.append(highBoundColor)
+            continue
+        if numP == 0 and lowBoundColor is not None:
+            gradient.append(lowBoundColor)
+            continue
+
+        # the first segment that includes the value
+        i = min(max(bisect_right(bounds, numP) - 1, 0), lastSegment)
+        if i > 0 and numP == bounds[i]: i -= 1
+        minP, rangeP, R, G, B, dR, dG, dB = segments[i]
+        factor = (numP - minP) / rangeP if rangeP else 0
+        gradient.append((int(round(factor * dR + R)), int(round(factor * dG + G)),
+                         int(round(factor * dB + B))))
+
+    return gradient
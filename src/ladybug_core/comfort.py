@@ -0,0 +1,1240 @@
+"""
+Thermal comfort models.
+
+PMV and SET (after the CBE comfort tool), adaptive comfort (ASHRAE-55 and
+EN-15251), UTCI, PET, SolarCal projected area factors and the psychrometric
+functions that the models use. Most methods take the values for a single
+condition and return single values. The psychrometric methods that take lists
+of hourly values use the psychrometrics module and the hourly PET and PHS
+methods use the comfortindices module.
+"""
+from __future__ import division, print_function
+import math
+
+from . import psychrometrics
+from . import comfortindices
+
+
+class ComfortModels(object):
+
+    def comfPMVElevatedAirspeed(self, ta, tr, vel, rh, met, clo, wme):
+        #This function accepts any input conditions (including low air speeds) but will return accurate values if the airspeed is above (>0.15m/s).
+        #The function will return the following:
+        #pmv : Predicted mean vote
+        #ppd : Percent predicted dissatisfied [%]
+        #ta_adj: Air temperature adjusted for air speed [C]
+        #cooling_effect : The difference between the air temperature and adjusted air temperature [C]
+        #set: The Standard Effective Temperature [C] (see below)
+        
+        r = []
+        set = self.comfPierceSET(ta, tr, vel, rh, met , clo, wme)
+        stillAirThreshold = 0.1
+        
+        #This function is taken from the util.js script of the CBE comfort tool page and has been modified to include the fn inside the utilSecant function 
+        def utilSecant(a, b, epsilon):
+            # root-finding only
+            res = []
+            def fn(t):
+                if t > 200: t = 200
+                if t < -200: t = 200
+                return (set - self.comfPierceSET(ta-t, tr-t, stillAirThreshold, rh, met, clo, wme));
+            f1 = fn(a)
+            if abs(f1) <= epsilon: res.append(a)
+            else:
+                f2 = fn(b)
+                if abs(f2) <= epsilon: res.append(b)
+                else:
+                    count = range(100)
+                    for i in count:
+                        if (b - a) != 0 and (f2 - f1) != 0:
+                            slope = (f2 - f1) / (b - a)
+                            c = b - f2/slope
+                            f3 = fn(c)
+                            if abs(f3) < epsilon:
+                                res.append(c)
+                            a = b
+                            b = c
+                            f1 = f2
+                            f2 = f3
+                res.append('NaN')
+            
+            return res[0]
+        
+        #This function is taken from the util.js script of the CBE comfort tool page and has been modified to include the fn inside the utilSecant function definition.
+        def utilBisect(a, b, epsilon, target):
+            def fn(t):
+                return (set - self.comfPierceSET(ta-t, tr-t, stillAirThreshold, rh, met, clo, wme))
+            while abs(b - a) > (2 * epsilon):
+                midpoint = (b + a) / 2
+                a_T = fn(a)
+                b_T = fn(b)
+                midpoint_T = fn(midpoint)
+                if (a_T - target) * (midpoint_T - target) < 0: b = midpoint
+                elif (b_T - target) * (midpoint_T - target) < 0: a = midpoint
+                else: return -999
+            return midpoint
+        
+        
+        if vel <= stillAirThreshold:
+            pmv, ppd = self.comfPMV(ta, tr, vel, rh, met, clo, wme)
+            ta_adj = ta
+            ce = 0
+        else:
+            ce_l = 0
+            ce_r = 40
+            eps = 0.001  # precision of ce
+            
+            ce = utilSecant(ce_l, ce_r, eps)
+            if ce == 'NaN':
+                ce = utilBisect(ce_l, ce_r, eps, 0)
+            
+            pmv, ppd = self.comfPMV(ta - ce, tr - ce, stillAirThreshold, rh, met, clo, wme)
+            ta_adj = ta - ce
+            tr_adj = tr - ce
+        
+        r.append(pmv)
+        r.append(ppd)
+        r.append(set)
+        r.append(ta_adj)
+        r.append(ce)
+        
+        return r
+
+
+    def comfPMV(self, ta, tr, vel, rh, met, clo, wme):
+        #returns [pmv, ppd]
+        #ta, air temperature (C)
+        #tr, mean radiant temperature (C)
+        #vel, relative air velocity (m/s)
+        #rh, relative humidity (%) Used only this way to input humidity level
+        #met, metabolic rate (met)
+        #clo, clothing (clo)
+        #wme, external work, normally around 0 (met)
+        
+        pa = rh * 10 * math.exp(16.6536 - 4030.183 / (ta + 235))
+        
+        icl = 0.155 * clo #thermal insulation of the clothing in M2K/W
+        m = met * 58.15 #metabolic rate in W/M2
+        w = wme * 58.15 #external work in W/M2
+        mw = m - w #internal heat production in the human body
+        if (icl <= 0.078): fcl = 1 + (1.29 * icl)
+        else: fcl = 1.05 + (0.645 * icl)
+        
+        #heat transf. coeff. by forced convection
+        hcf = 12.1 * math.sqrt(vel)
+        taa = ta + 273
+        tra = tr + 273
+        tcla = taa + (35.5 - ta) / (3.5 * icl + 0.1)
+    
+        p1 = icl * fcl
+        p2 = p1 * 3.96
+        p3 = p1 * 100
+        p4 = p1 * taa
+        p5 = (308.7 - 0.028 * mw) + (p2 * math.pow(tra / 100, 4))
+        xn = tcla / 100
+        xf = tcla / 50
+        eps = 0.00015
+        
+        n = 0
+        while abs(xn - xf) > eps:
+            xf = (xf + xn) / 2
+            hcn = 2.38 * math.pow(abs(100.0 * xf - taa), 0.25)
+            if (hcf > hcn):
+                hc = hcf
+            else:
+                hc = hcn
+            xn = (p5 + p4 * hc - p2 * math.pow(xf, 4)) / (100 + p3 * hc)
+            n += 1
+            if (n > 150):
+                print('Max iterations exceeded')
+                return 1
+            
+        
+        tcl = 100 * xn - 273
+        
+        #heat loss diff. through skin 
+        hl1 = 3.05 * 0.001 * (5733 - (6.99 * mw) - pa)
+        #heat loss by sweating
+        if mw > 58.15:
+            hl2 = 0.42 * (mw - 58.15)
+        else:
+            hl2 = 0
+        #latent respiration heat loss 
+        hl3 = 1.7 * 0.00001 * m * (5867 - pa)
+        #dry respiration heat loss
+        hl4 = 0.0014 * m * (34 - ta)
+        #heat loss by radiation  
+        hl5 = 3.96 * fcl * (math.pow(xn, 4) - math.pow(tra / 100, 4))
+        #heat loss by convection
+        hl6 = fcl * hc * (tcl - ta)
+        
+        ts = 0.303 * math.exp(-0.036 * m) + 0.028
+        pmv = ts * (mw - hl1 - hl2 - hl3 - hl4 - hl5 - hl6)
+        ppd = 100.0 - 95.0 * math.exp(-0.03353 * pow(pmv, 4.0) - 0.2179 * pow(pmv, 2.0))
+        
+        r = []
+        r.append(pmv)
+        r.append(ppd)
+        
+        return r
+
+
+    def comfPierceSET(self, ta, tr, vel, rh, met, clo, wme):
+        #Function to find the saturation vapor pressure, used frequently throughtout the comfPierceSET function.
+        def findSaturatedVaporPressureTorr(T):
+            #calculates Saturated Vapor Pressure (Torr) at Temperature T  (C)
+            return math.exp(18.6686 - 4030.183 / (T + 235.0))
+        
+        #Key initial variables.
+        VaporPressure = (rh * findSaturatedVaporPressureTorr(ta)) / 100
+        AirVelocity = max(vel, 0.1)
+        KCLO = 0.25
+        BODYWEIGHT = 69.9
+        BODYSURFACEAREA = 1.8258
+        METFACTOR = 58.2
+        SBC = 0.000000056697 # Stefan-Boltzmann constant (W/m2K4)
+        CSW = 170
+        CDIL = 120
+        CSTR = 0.5
+        
+        TempSkinNeutral = 33.7 #setpoint (neutral) value for Tsk
+        TempCoreNeutral = 36.8 #setpoint value for Tcr
+        TempBodyNeutral = 36.49 #setpoint for Tb (.1*TempSkinNeutral + .9*TempCoreNeutral)
+        SkinBloodFlowNeutral = 6.3 #neutral value for SkinBloodFlow
+    
+        #INITIAL VALUES - start of 1st experiment
+        TempSkin = TempSkinNeutral
+        TempCore = TempCoreNeutral
+        SkinBloodFlow = SkinBloodFlowNeutral
+        MSHIV = 0.0
+        ALFA = 0.1
+        ESK = 0.1 * met
+        
+        #Start new experiment here (for graded experiments)
+        #UNIT CONVERSIONS (from input variables)
+        
+        p = 101325.0 / 1000 # This variable is the pressure of the atmosphere in kPa and was taken from the psychrometrics.js file of the CBE comfort tool.
+        
+        PressureInAtmospheres = p * 0.009869
+        LTIME = 60
+        TIMEH = LTIME / 60.0
+        RCL = 0.155 * clo
+        #AdjustICL(RCL, Conditions);  TH: I don't think this is used in the software
+        
+        FACL = 1.0 + 0.15 * clo #% INCREASE IN BODY SURFACE AREA DUE TO CLOTHING
+        LR = 2.2 / PressureInAtmospheres #Lewis Relation is 2.2 at sea level
+        RM = met * METFACTOR
+        M = met * METFACTOR
+        
+        if clo <= 0:
+            WCRIT = 0.38 * pow(AirVelocity, -0.29)
+            ICL = 1.0
+        else:
+            WCRIT = 0.59 * pow(AirVelocity, -0.08)
+            ICL = 0.45
+        
+        CHC = 3.0 * pow(PressureInAtmospheres, 0.53)
+        CHCV = 8.600001 * pow((AirVelocity * PressureInAtmospheres), 0.53)
+        CHC = max(CHC, CHCV)
+        
+        #initial estimate of Tcl
+        CHR = 4.7
+        CTC = CHR + CHC
+        RA = 1.0 / (FACL * CTC) #resistance of air layer to dry heat transfer
+        TOP = (CHR * tr + CHC * ta) / CTC
+        TCL = TOP + (TempSkin - TOP) / (CTC * (RA + RCL))
+    
+        # ========================  BEGIN ITERATION
+        #
+        # Tcl and CHR are solved iteratively using: H(Tsk - To) = CTC(Tcl - To),
+        # where H = 1/(Ra + Rcl) and Ra = 1/Facl*CTC
+        
+        TCL_OLD = TCL
+        TIME = range(LTIME)
+        flag = True
+        for TIM in TIME:
+            if flag == True:
+                while abs(TCL - TCL_OLD) > 0.01:
+                    TCL_OLD = TCL
+                    CHR = 4.0 * SBC * pow(((TCL + tr) / 2.0 + 273.15), 3.0) * 0.72
+                    CTC = CHR + CHC
+                    RA = 1.0 / (FACL * CTC) #resistance of air layer to dry heat transfer
+                    TOP = (CHR * tr + CHC * ta) / CTC
+                    TCL = (RA * TempSkin + RCL * TOP) / (RA + RCL)
+            flag = False
+            DRY = (TempSkin - TOP) / (RA + RCL)
+            HFCS = (TempCore - TempSkin) * (5.28 + 1.163 * SkinBloodFlow)
+            ERES = 0.0023 * M * (44.0 - VaporPressure)
+            CRES = 0.0014 * M * (34.0 - ta)
+            SCR = M - HFCS - ERES - CRES - wme
+            SSK = HFCS - DRY - ESK
+            TCSK = 0.97 * ALFA * BODYWEIGHT
+            TCCR = 0.97 * (1 - ALFA) * BODYWEIGHT
+            DTSK = (SSK * BODYSURFACEAREA) / (TCSK * 60.0)# //deg C per minute
+            DTCR = SCR * BODYSURFACEAREA / (TCCR * 60.0)# //deg C per minute
+            TempSkin = TempSkin + DTSK
+            TempCore = TempCore + DTCR
+            TB = ALFA * TempSkin + (1 - ALFA) * TempCore
+            SKSIG = TempSkin - TempSkinNeutral
+            WARMS = (SKSIG > 0) * SKSIG
+            COLDS = ((-1.0 * SKSIG) > 0) * (-1.0 * SKSIG)
+            CRSIG = (TempCore - TempCoreNeutral)
+            WARMC = (CRSIG > 0) * CRSIG
+            COLDC = ((-1.0 * CRSIG) > 0) * (-1.0 * CRSIG)
+            BDSIG = TB - TempBodyNeutral
+            WARMB = (BDSIG > 0) * BDSIG
+            COLDB = ((-1.0 * BDSIG) > 0) * (-1.0 * BDSIG)
+            SkinBloodFlow = (SkinBloodFlowNeutral + CDIL * WARMC) / (1 + CSTR * COLDS)
+            if SkinBloodFlow > 90.0: SkinBloodFlow = 90.0
+            if SkinBloodFlow < 0.5: SkinBloodFlow = 0.5
+            REGSW = CSW * WARMB * math.exp(WARMS / 10.7)
+            if REGSW > 500.0: REGSW = 500.0
+            ERSW = 0.68 * REGSW
+            REA = 1.0 / (LR * FACL * CHC) #evaporative resistance of air layer
+            RECL = RCL / (LR * ICL) #evaporative resistance of clothing (icl=.45)
+            EMAX = (findSaturatedVaporPressureTorr(TempSkin) - VaporPressure) / (REA + RECL)
+            PRSW = ERSW / EMAX
+            PWET = 0.06 + 0.94 * PRSW
+            EDIF = PWET * EMAX - ERSW
+            ESK = ERSW + EDIF
+            if PWET > WCRIT:
+                PWET = WCRIT
+                PRSW = WCRIT / 0.94
+                ERSW = PRSW * EMAX
+                EDIF = 0.06 * (1.0 - PRSW) * EMAX
+                ESK = ERSW + EDIF
+            if EMAX < 0:
+                EDIF = 0
+                ERSW = 0
+                PWET = WCRIT
+                PRSW = WCRIT
+                ESK = EMAX
+            ESK = ERSW + EDIF
+            MSHIV = 19.4 * COLDS * COLDC
+            M = RM + MSHIV
+            ALFA = 0.0417737 + 0.7451833 / (SkinBloodFlow + .585417)
+        
+        
+        #Define new heat flow terms, coeffs, and abbreviations
+        STORE = M - wme - CRES - ERES - DRY - ESK #rate of body heat storage
+        HSK = DRY + ESK #total heat loss from skin
+        RN = M - wme #net metabolic heat production
+        ECOMF = 0.42 * (RN - (1 * METFACTOR))
+        if ECOMF < 0.0: ECOMF = 0.0 #from Fanger
+        EREQ = RN - ERES - CRES - DRY
+        EMAX = EMAX * WCRIT
+        HD = 1.0 / (RA + RCL)
+        HE = 1.0 / (REA + RECL)
+        W = PWET
+        PSSK = findSaturatedVaporPressureTorr(TempSkin)
+        #Definition of ASHRAE standard environment... denoted "S"
+        CHRS = CHR
+        if met < 0.85:
+            CHCS = 3.0
+        else:
+            CHCS = 5.66 * pow((met - 0.85), 0.39)
+            if CHCS < 3.0: CHCS = 3.0
+        
+        CTCS = CHCS + CHRS
+        RCLOS = 1.52 / ((met - wme / METFACTOR) + 0.6944) - 0.1835
+        RCLS = 0.155 * RCLOS
+        FACLS = 1.0 + KCLO * RCLOS
+        FCLS = 1.0 / (1.0 + 0.155 * FACLS * CTCS * RCLOS)
+        IMS = 0.45
+        ICLS = IMS * CHCS / CTCS * (1 - FCLS) / (CHCS / CTCS - FCLS * IMS)
+        RAS = 1.0 / (FACLS * CTCS)
+        REAS = 1.0 / (LR * FACLS * CHCS)
+        RECLS = RCLS / (LR * ICLS)
+        HD_S = 1.0 / (RAS + RCLS)
+        HE_S = 1.0 / (REAS + RECLS)
+        
+        #SET* (standardized humidity, clo, Pb, and CHC)
+        #determined using Newton's iterative solution
+        #FNERRS is defined in the GENERAL SETUP section above
+        
+        DELTA = .0001
+        dx = 100.0
+        X_OLD = TempSkin - HSK / HD_S #lower bound for SET
+        while abs(dx) > .01:
+            ERR1 = (HSK - HD_S * (TempSkin - X_OLD) - W * HE_S * (PSSK - 0.5 * findSaturatedVaporPressureTorr(X_OLD)))
+            ERR2 = (HSK - HD_S * (TempSkin - (X_OLD + DELTA)) - W * HE_S * (PSSK - 0.5 * findSaturatedVaporPressureTorr((X_OLD + DELTA))))
+            X = X_OLD - DELTA * ERR1 / (ERR2 - ERR1)
+            dx = X - X_OLD
+            X_OLD = X
+        
+        return X
+
+
+    def calcBalTemp(self, initialGuess, windSpeed, relHumid, metRate, cloLevel, exWork):
+        balTemper = initialGuess
+        delta = 3
+        while abs(delta) > 0.01:
+            delta, ppd, set, taAdj, coolingEffect = self.comfPMVElevatedAirspeed(balTemper, balTemper, windSpeed, relHumid, metRate, cloLevel, exWork)
+            balTemper = balTemper - delta
+        return balTemper
+
+
+    def comfAdaptiveComfortASH55(self, ta, tr, runningMean, vel, eightyOrNinety, levelOfConditioning = 0):
+        # Define the variables that will be used throughout the calculation.
+        r = []
+        coolingEffect = 0
+        if eightyOrNinety == True: offset = 3.5
+        else: offset = 2.5
+        to = (ta + tr) / 2
+        # See if the running mean temperature is between 10 C and 33.5 C (the range where the adaptive model is supposed to be used).
+        if runningMean >= 10.0 and runningMean <= 33.5:
+            
+            if (vel >= 0.6 and to >= 25):
+                # calculate cooling effect of elevated air speed
+                # when top > 25 degC.
+                if vel < 0.9: coolingEffect = 1.2
+                elif  vel < 1.2: coolingEffect = 1.8
+                elif vel >= 1.2: coolingEffect = 2.2
+                else: pass
+            
+            #Figure out the relation between comfort and outdoor temperature depending on the level of conditioning.
+            if levelOfConditioning == 0: tComf = 0.31 * runningMean + 17.8
+            elif levelOfConditioning == 1: tComf = 0.09 * runningMean + 22.6
+            else: tComf = ((0.09*levelOfConditioning)+(0.31*(1-levelOfConditioning))) * runningMean + ((22.6*levelOfConditioning)+(17.8*(1-levelOfConditioning)))
+            
+            tComfLower = tComf - offset
+            tComfUpper = tComf + offset + coolingEffect
+            r.append(tComf)
+            r.append(to - tComf)
+            r.append(tComfLower)
+            r.append(tComfUpper)
+            
+            # See if the conditions are comfortable.
+            if to > tComfLower and to < tComfUpper:
+                # compliance
+                acceptability = True
+            else:
+                # nonCompliance
+                acceptability = False
+            r.append(acceptability)
+            
+            # Append a number to the result list to show whether the values are too hot, too cold, or comfortable.
+            if acceptability == True: r.append(0)
+            elif to > tComfUpper: r.append(1)
+            else: r.append(-1)
+            
+        elif runningMean < 10.0:
+            # The prevailing temperature is too cold for the adaptive standard but we will use some correlations from adaptive-style surveys of conditioned buildings to give a good guess.
+            if levelOfConditioning == 0: tComf = 24.024 + (0.295*(runningMean - 22.0)) * math.exp((-1)*(((runningMean-22)/(33.941125))*((runningMean-22)/(33.941125))))
+            else:
+                conditOffset = 2.6*levelOfConditioning
+                tComf = conditOffset+ 24.024 + (0.295*(runningMean - 22.0)) * math.exp((-1)*(((runningMean-22)/(33.941125))*((runningMean-22)/(33.941125))))
+            
+            tempDiff = to - tComf
+            tComfLower = tComf - offset
+            tComfUpper = tComf + offset
+            if to > tComfLower and to < tComfUpper: acceptability = True
+            else: acceptability = False
+            if acceptability == True: condit = 0
+            elif to > tComfUpper: condit = 1
+            else: condit = -1 
+            outputs = [tComf, tempDiff, tComfLower, tComfUpper, acceptability, condit]
+            r.extend(outputs)
+        else:
+            # The prevailing temperature is too hot for the adaptive method.  This should usually not happen for climates on today's earth but it might be possible in the future with global warming. For this case, we will just use the adaptive model at its hottest limit.
+            if (vel >= 0.6 and to >= 25):
+                if vel < 0.9: coolingEffect = 1.2
+                elif  vel < 1.2: coolingEffect = 1.8
+                elif vel >= 1.2: coolingEffect = 2.2
+                else: pass
+            if levelOfConditioning == 0: tComf = 0.31 * 33.5 + 17.8
+            else: tComf = ((0.09*levelOfConditioning)+(0.31*(1-levelOfConditioning))) * 33.5 + ((22.6*levelOfConditioning)+(17.8*(1-levelOfConditioning)))
+            tempDiff = to - tComf
+            tComfLower = tComf - offset
+            tComfUpper = tComf + offset + coolingEffect
+            if to > tComfLower and to < tComfUpper: acceptability = True
+            else: acceptability = False
+            if acceptability == True: condit = 0
+            elif to > tComfUpper: condit = 1
+            else: condit = -1 
+            outputs = [tComf, tempDiff, tComfLower, tComfUpper, acceptability, condit]
+            r.extend(outputs)
+        
+        return r
+
+
+    def comfAdaptiveComfortEN15251(self, ta, tr, runningMean, vel, comfortClass, levelOfConditioning = 0):
+        # Define the variables that will be used throughout the calculation.
+        r = []
+        coolingEffect = 0
+        if comfortClass == 1: offset = 2
+        elif comfortClass == 2: offset = 3
+        else: offset = 4
+        to = (ta + tr) / 2
+        
+        # See if the running mean temperature is between 10 C and 30.0 C (the range where the adaptive model is supposed to be used).
+        if runningMean >= 10.0 and runningMean <= 30.0:
+            if (vel >= 0.2 and to >= 25):
+                # calculate cooling effect of elevated air speed
+                # when top > 25 degC.
+                coolingEffect = 1.7856 * math.log(vel) + 2.9835
+            
+            if levelOfConditioning == 0: tComf = 0.33 * runningMean + 18.8
+            elif levelOfConditioning == 1: tComf = 0.09 * runningMean + 22.6
+            else: tComf = ((0.09*levelOfConditioning)+(0.33*(1-levelOfConditioning))) * runningMean + ((22.6*levelOfConditioning)+(18.8*(1-levelOfConditioning)))
+            
+            if runningMean > 15:
+                tComfLower = tComf - offset
+                tComfUpper = tComf + offset + coolingEffect
+            elif runningMean > 12.73 and runningMean < 15 and levelOfConditioning == 0:
+                tComfLow = 23.75
+                tComfLower = tComfLow - offset
+                tComfUpper = tComf + offset + coolingEffect
+            elif levelOfConditioning != 0:
+                tComfLower = tComf - offset
+                tComfUpper = tComf + offset + coolingEffect
+                #tComfLow = 23.75 - (0.25*levelOfConditioning)
+            else:
+                tComfLow = 23.75
+                tComfLower = tComfLow - offset
+                if comfortClass == 1: tComfUpper = tComf + offset
+                else: tComfUpper = tComf + offset + coolingEffect
+            
+            r.append(tComf)
+            r.append(to - tComf)
+            r.append(tComfLower)
+            r.append(tComfUpper)
+            
+            # See if the conditions are comfortable.
+            if to > tComfLower and to < tComfUpper:
+                # compliance
+                acceptability = True
+            else:
+                # nonCompliance
+                acceptability = False
+            r.append(acceptability)
+            
+            # Append a number to the result list to show whether the values are too hot, too cold, or comfortable.
+            if acceptability == True: r.append(0)
+            elif to > tComfUpper: r.append(1)
+            else: r.append(-1)
+            
+        elif runningMean < 10.0:
+            # The prevailing temperature is too cold for the adaptive standard but we will use some correlations from adaptive-style surveys of conditioned buildings to give a good guess.
+            if levelOfConditioning == 0: tComf = 25.224 + (0.295*(runningMean - 22.0)) * math.exp((-1)*(((runningMean-22)/(33.941125))*((runningMean-22)/(33.941125))))
+            else:
+                conditOffset = 1.4*levelOfConditioning
+                tComf = conditOffset + 25.224 + (0.295*(runningMean - 22.0)) * math.exp((-1)*(((runningMean-22)/(33.941125))*((runningMean-22)/(33.941125))))
+            
+            tempDiff = to - tComf
+            tComfLower = tComf - offset
+            tComfUpper = tComf + offset
+            if to > tComfLower and to < tComfUpper: acceptability = True
+            else: acceptability = False
+            if acceptability == True: condit = 0
+            elif to > tComfUpper: condit = 1
+            else: condit = -1 
+            outputs = [tComf, tempDiff, tComfLower, tComfUpper, acceptability, condit]
+            r.extend(outputs)
+        else:
+            # The prevailing temperature is too hot for the adaptive method.  This should usually not happen for climates on today's earth but it might be possible in the future with global warming. For this case, we will just use the adaptive model at its hottest limit.
+            if (vel >= 0.2 and to >= 25):
+                # calculate cooling effect of elevated air speed
+                # when top > 25 degC.
+                coolingEffect = 1.7856 * math.log(vel) + 2.9835
+            if levelOfConditioning == 0: tComf = 0.33 * 30.0 + 18.8
+            else: tComf = ((0.09*levelOfConditioning)+(0.33*(1-levelOfConditioning))) * 30.0 + ((22.6*levelOfConditioning)+(18.8*(1-levelOfConditioning)))
+            tempDiff = to - tComf
+            tComfLower = tComf - offset
+            tComfUpper = tComf + offset + coolingEffect
+            if to > tComfLower and to < tComfUpper: acceptability = True
+            else: acceptability = False
+            if acceptability == True: condit = 0
+            elif to > tComfUpper: condit = 1
+            else: condit = -1 
+            outputs = [tComf, tempDiff, tComfLower, tComfUpper, acceptability, condit]
+            r.extend(outputs)
+        
+        return r
+
+
+    def comfUTCI(self, Ta, Tmrt, va, RH):
+        # Define a function to change the RH to water saturation vapor pressure in hPa
+        def es(ta):
+            g = [-2836.5744, -6028.076559, 19.54263612, -0.02737830188, 0.000016261698, (7.0229056*(10**(-10))), (-1.8680009*(10**(-13)))]      
+            tk = ta + 273.15 # air temp in K
+            es = 2.7150305 * math.log(tk)
+            for count, i in enumerate(g):
+                es = es + (i * (tk**(count-2)))
+            es = math.exp(es)*0.01  # convert Pa to hPa
+            return es
+        
+        #Do a series of checks to be sure that the input values are within the bounds accepted by the model.
+        check = True
+        #if Ta < -50.0 or Ta > 50.0: check = False
+        #else: pass
+        #if Tmrt-Ta < -30.0 or Tmrt-Ta > 70.0: check = False
+        #else: pass
+        if va < 0.5: va = 0.5
+        elif va > 17: va = 17
+        else: pass
+        
+        #If everything is good, run the data through the model below to get the UTCI.
+        #This is a python version of the UTCI_approx function, Version a 0.002, October 2009
+        #Ta: air temperature, degree Celsius
+        #ehPa: water vapour presure, hPa=hecto Pascal
+        #Tmrt: mean radiant temperature, degree Celsius
+        #va10m: wind speed 10 m above ground level in m/s
+        
+        if check == True:
+            ehPa = es(Ta) * (RH/100.0)
+            D_Tmrt = Tmrt - Ta
+            Pa = ehPa/10.0  # convert vapour pressure to kPa
+            
+            
+            UTCI_approx = Ta + \
+            (0.607562052) + \
+            (-0.0227712343) * Ta + \
+            (8.06470249*(10**(-4))) * Ta * Ta + \
+            (-1.54271372*(10**(-4))) * Ta * Ta * Ta + \
+            (-3.24651735*(10**(-6))) * Ta * Ta * Ta * Ta + \
+            (7.32602852*(10**(-8))) * Ta * Ta * Ta * Ta * Ta + \
+            (1.35959073*(10**(-9))) * Ta * Ta * Ta * Ta * Ta * Ta + \
+            (-2.25836520) * va + \
+            (0.0880326035) * Ta * va + \
+            (0.00216844454) * Ta * Ta * va + \
+            (-1.53347087*(10**(-5))) * Ta * Ta * Ta * va + \
+            (-5.72983704*(10**(-7))) * Ta * Ta * Ta * Ta * va + \
+            (-2.55090145*(10**(-9))) * Ta * Ta * Ta * Ta * Ta * va + \
+            (-0.751269505) * va * va + \
+            (-0.00408350271) * Ta * va * va + \
+            (-5.21670675*(10**(-5))) * Ta * Ta * va * va + \
+            (1.94544667*(10**(-6))) * Ta * Ta * Ta * va * va + \
+            (1.14099531*(10**(-8))) * Ta * Ta * Ta * Ta * va * va + \
+            (0.158137256) * va * va * va + \
+            (-6.57263143*(10**(-5))) * Ta * va * va * va + \
+            (2.22697524*(10**(-7))) * Ta * Ta * va * va * va + \
+            (-4.16117031*(10**(-8))) * Ta * Ta * Ta * va * va * va + \
+            (-0.0127762753) * va * va * va * va + \
+            (9.66891875*(10**(-6))) * Ta * va * va * va * va + \
+            (2.52785852*(10**(-9))) * Ta * Ta * va * va * va * va + \
+            (4.56306672*(10**(-4))) * va * va * va * va * va + \
+            (-1.74202546*(10**(-7))) * Ta * va * va * va * va * va + \
+            (-5.91491269*(10**(-6))) * va * va * va * va * va * va + \
+            (0.398374029) * D_Tmrt + \
+            (1.83945314*(10**(-4))) * Ta * D_Tmrt + \
+            (-1.73754510*(10**(-4))) * Ta * Ta * D_Tmrt + \
+            (-7.60781159*(10**(-7))) * Ta * Ta * Ta * D_Tmrt + \
+            (3.77830287*(10**(-8))) * Ta * Ta * Ta * Ta * D_Tmrt + \
+            (5.43079673*(10**(-10))) * Ta * Ta * Ta * Ta * Ta * D_Tmrt + \
+            (-0.0200518269) * va * D_Tmrt + \
+            (8.92859837*(10**(-4))) * Ta * va * D_Tmrt + \
+            (3.45433048*(10**(-6))) * Ta * Ta * va * D_Tmrt + \
+            (-3.77925774*(10**(-7))) * Ta * Ta * Ta * va * D_Tmrt + \
+            (-1.69699377*(10**(-9))) * Ta * Ta * Ta * Ta * va * D_Tmrt + \
+            (1.69992415*(10**(-4))) * va*va*D_Tmrt + \
+            ( -4.99204314*(10**(-5)) ) * Ta*va*va*D_Tmrt + \
+            ( 2.47417178*(10**(-7)) ) * Ta*Ta*va*va*D_Tmrt + \
+            ( 1.07596466*(10**(-8)) ) * Ta*Ta*Ta*va*va*D_Tmrt + \
+            ( 8.49242932*(10**(-5)) ) * va*va*va*D_Tmrt + \
+            ( 1.35191328*(10**(-6)) ) * Ta*va*va*va*D_Tmrt + \
+            ( -6.21531254*(10**(-9)) ) * Ta*Ta*va*va*va*D_Tmrt + \
+            ( -4.99410301*(10**(-6)) ) * va*va*va*va*D_Tmrt + \
+            ( -1.89489258*(10**(-8)) ) * Ta*va*va*va*va*D_Tmrt + \
+            ( 8.15300114*(10**(-8)) ) * va*va*va*va*va*D_Tmrt + \
+            ( 7.55043090*(10**(-4)) ) * D_Tmrt*D_Tmrt + \
+            ( -5.65095215*(10**(-5)) ) * Ta*D_Tmrt*D_Tmrt + \
+            ( -4.52166564*(10**(-7)) ) * Ta*Ta*D_Tmrt*D_Tmrt + \
+            ( 2.46688878*(10**(-8)) ) * Ta*Ta*Ta*D_Tmrt*D_Tmrt + \
+            ( 2.42674348*(10**(-10)) ) * Ta*Ta*Ta*Ta*D_Tmrt*D_Tmrt + \
+            ( 1.54547250*(10**(-4)) ) * va*D_Tmrt*D_Tmrt + \
+            ( 5.24110970*(10**(-6)) ) * Ta*va*D_Tmrt*D_Tmrt + \
+            ( -8.75874982*(10**(-8)) ) * Ta*Ta*va*D_Tmrt*D_Tmrt + \
+            ( -1.50743064*(10**(-9)) ) * Ta*Ta*Ta*va*D_Tmrt*D_Tmrt + \
+            ( -1.56236307*(10**(-5)) ) * va*va*D_Tmrt*D_Tmrt + \
+            ( -1.33895614*(10**(-7)) ) * Ta*va*va*D_Tmrt*D_Tmrt + \
+            ( 2.49709824*(10**(-9)) ) * Ta*Ta*va*va*D_Tmrt*D_Tmrt + \
+            ( 6.51711721*(10**(-7)) ) * va*va*va*D_Tmrt*D_Tmrt + \
+            ( 1.94960053*(10**(-9)) ) * Ta*va*va*va*D_Tmrt*D_Tmrt + \
+            ( -1.00361113*(10**(-8)) ) * va*va*va*va*D_Tmrt*D_Tmrt + \
+            ( -1.21206673*(10**(-5)) ) * D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -2.18203660*(10**(-7)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 7.51269482*(10**(-9)) ) * Ta*Ta*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 9.79063848*(10**(-11)) ) * Ta*Ta*Ta*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 1.25006734*(10**(-6)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -1.81584736*(10**(-9)) ) * Ta*va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -3.52197671*(10**(-10)) ) * Ta*Ta*va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -3.36514630*(10**(-8)) ) * va*va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 1.35908359*(10**(-10)) ) * Ta*va*va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 4.17032620*(10**(-10)) ) * va*va*va*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -1.30369025*(10**(-9)) ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 4.13908461*(10**(-10)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 9.22652254*(10**(-12)) ) * Ta*Ta*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -5.08220384*(10**(-9)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -2.24730961*(10**(-11)) ) * Ta*va*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 1.17139133*(10**(-10)) ) * va*va*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 6.62154879*(10**(-10)) ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 4.03863260*(10**(-13)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 1.95087203*(10**(-12)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( -4.73602469*(10**(-12))) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt + \
+            ( 5.12733497) * Pa + \
+            ( -0.312788561) * Ta*Pa + \
+            ( -0.0196701861 ) * Ta*Ta*Pa + \
+            ( 9.99690870*(10**(-4)) ) * Ta*Ta*Ta*Pa + \
+            ( 9.51738512*(10**(-6)) ) * Ta*Ta*Ta*Ta*Pa + \
+            ( -4.66426341*(10**(-7)) ) * Ta*Ta*Ta*Ta*Ta*Pa + \
+            ( 0.548050612 ) * va*Pa + \
+            ( -0.00330552823) * Ta*va*Pa + \
+            ( -0.00164119440 ) * Ta*Ta*va*Pa + \
+            ( -5.16670694*(10**(-6)) ) * Ta*Ta*Ta*va*Pa + \
+            ( 9.52692432*(10**(-7)) ) * Ta*Ta*Ta*Ta*va*Pa + \
+            ( -0.0429223622 ) * va*va*Pa + \
+            ( 0.00500845667 ) * Ta*va*va*Pa + \
+            ( 1.00601257*(10**(-6)) ) * Ta*Ta*va*va*Pa + \
+            ( -1.81748644*(10**(-6)) ) * Ta*Ta*Ta*va*va*Pa + \
+            ( -1.25813502*(10**(-3)) ) * va*va*va*Pa + \
+            ( -1.79330391*(10**(-4)) ) * Ta*va*va*va*Pa + \
+            ( 2.34994441*(10**(-6)) ) * Ta*Ta*va*va*va*Pa + \
+            ( 1.29735808*(10**(-4)) ) * va*va*va*va*Pa + \
+            ( 1.29064870*(10**(-6)) ) * Ta*va*va*va*va*Pa + \
+            ( -2.28558686*(10**(-6)) ) * va*va*va*va*va*Pa + \
+            ( -0.0369476348 ) * D_Tmrt*Pa + \
+            ( 0.00162325322 ) * Ta*D_Tmrt*Pa + \
+            ( -3.14279680*(10**(-5)) ) * Ta*Ta*D_Tmrt*Pa + \
+            ( 2.59835559*(10**(-6)) ) * Ta*Ta*Ta*D_Tmrt*Pa + \
+            ( -4.77136523*(10**(-8)) ) * Ta*Ta*Ta*Ta*D_Tmrt*Pa + \
+            ( 8.64203390*(10**(-3)) ) * va*D_Tmrt*Pa + \
+            ( -6.87405181*(10**(-4)) ) * Ta*va*D_Tmrt*Pa + \
+            ( -9.13863872*(10**(-6)) ) * Ta*Ta*va*D_Tmrt*Pa + \
+            ( 5.15916806*(10**(-7)) ) * Ta*Ta*Ta*va*D_Tmrt*Pa + \
+            ( -3.59217476*(10**(-5)) ) * va*va*D_Tmrt*Pa + \
+            ( 3.28696511*(10**(-5)) ) * Ta*va*va*D_Tmrt*Pa + \
+            ( -7.10542454*(10**(-7)) ) * Ta*Ta*va*va*D_Tmrt*Pa + \
+            ( -1.24382300*(10**(-5)) ) * va*va*va*D_Tmrt*Pa + \
+            ( -7.38584400*(10**(-9)) ) * Ta*va*va*va*D_Tmrt*Pa + \
+            ( 2.20609296*(10**(-7)) ) * va*va*va*va*D_Tmrt*Pa + \
+            ( -7.32469180*(10**(-4)) ) * D_Tmrt*D_Tmrt*Pa + \
+            ( -1.87381964*(10**(-5)) ) * Ta*D_Tmrt*D_Tmrt*Pa + \
+            ( 4.80925239*(10**(-6)) ) * Ta*Ta*D_Tmrt*D_Tmrt*Pa + \
+            ( -8.75492040*(10**(-8)) ) * Ta*Ta*Ta*D_Tmrt*D_Tmrt*Pa + \
+            ( 2.77862930*(10**(-5)) ) * va*D_Tmrt*D_Tmrt*Pa + \
+            ( -5.06004592*(10**(-6)) ) * Ta*va*D_Tmrt*D_Tmrt*Pa + \
+            ( 1.14325367*(10**(-7)) ) * Ta*Ta*va*D_Tmrt*D_Tmrt*Pa + \
+            ( 2.53016723*(10**(-6)) ) * va*va*D_Tmrt*D_Tmrt*Pa + \
+            ( -1.72857035*(10**(-8)) ) * Ta*va*va*D_Tmrt*D_Tmrt*Pa + \
+            ( -3.95079398*(10**(-8)) ) * va*va*va*D_Tmrt*D_Tmrt*Pa + \
+            ( -3.59413173*(10**(-7)) ) * D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( 7.04388046*(10**(-7)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( -1.89309167*(10**(-8)) ) * Ta*Ta*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( -4.79768731*(10**(-7)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( 7.96079978*(10**(-9)) ) * Ta*va*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( 1.62897058*(10**(-9)) ) * va*va*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( 3.94367674*(10**(-8)) ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( -1.18566247*(10**(-9)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( 3.34678041*(10**(-10)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( -1.15606447*(10**(-10)) ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*Pa + \
+            ( -2.80626406 ) * Pa*Pa + \
+            ( 0.548712484 ) * Ta*Pa*Pa + \
+            ( -0.00399428410 ) * Ta*Ta*Pa*Pa + \
+            ( -9.54009191*(10**(-4)) ) * Ta*Ta*Ta*Pa*Pa + \
+            ( 1.93090978*(10**(-5)) ) * Ta*Ta*Ta*Ta*Pa*Pa + \
+            ( -0.308806365 ) * va*Pa*Pa + \
+            ( 0.0116952364 ) * Ta*va*Pa*Pa + \
+            ( 4.95271903*(10**(-4)) ) * Ta*Ta*va*Pa*Pa + \
+            ( -1.90710882*(10**(-5)) ) * Ta*Ta*Ta*va*Pa*Pa + \
+            ( 0.00210787756 ) * va*va*Pa*Pa + \
+            ( -6.98445738*(10**(-4)) ) * Ta*va*va*Pa*Pa + \
+            ( 2.30109073*(10**(-5)) ) * Ta*Ta*va*va*Pa*Pa + \
+            ( 4.17856590*(10**(-4)) ) * va*va*va*Pa*Pa + \
+            ( -1.27043871*(10**(-5)) ) * Ta*va*va*va*Pa*Pa + \
+            ( -3.04620472*(10**(-6)) ) * va*va*va*va*Pa*Pa + \
+            ( 0.0514507424 ) * D_Tmrt*Pa*Pa + \
+            ( -0.00432510997 ) * Ta*D_Tmrt*Pa*Pa + \
+            ( 8.99281156*(10**(-5)) ) * Ta*Ta*D_Tmrt*Pa*Pa + \
+            ( -7.14663943*(10**(-7)) ) * Ta*Ta*Ta*D_Tmrt*Pa*Pa + \
+            ( -2.66016305*(10**(-4)) ) * va*D_Tmrt*Pa*Pa + \
+            ( 2.63789586*(10**(-4)) ) * Ta*va*D_Tmrt*Pa*Pa + \
+            ( -7.01199003*(10**(-6)) ) * Ta*Ta*va*D_Tmrt*Pa*Pa + \
+            ( -1.06823306*(10**(-4)) ) * va*va*D_Tmrt*Pa*Pa + \
+            ( 3.61341136*(10**(-6)) ) * Ta*va*va*D_Tmrt*Pa*Pa + \
+            ( 2.29748967*(10**(-7)) ) * va*va*va*D_Tmrt*Pa*Pa + \
+            ( 3.04788893*(10**(-4)) ) * D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( -6.42070836*(10**(-5)) ) * Ta*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( 1.16257971*(10**(-6)) ) * Ta*Ta*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( 7.68023384*(10**(-6)) ) * va*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( -5.47446896*(10**(-7)) ) * Ta*va*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( -3.59937910*(10**(-8)) ) * va*va*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( -4.36497725*(10**(-6)) ) * D_Tmrt*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( 1.68737969*(10**(-7)) ) * Ta*D_Tmrt*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( 2.67489271*(10**(-8)) ) * va*D_Tmrt*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( 3.23926897*(10**(-9)) ) * D_Tmrt*D_Tmrt*D_Tmrt*D_Tmrt*Pa*Pa + \
+            ( -0.0353874123 ) * Pa*Pa*Pa + \
+            ( -0.221201190 ) * Ta*Pa*Pa*Pa + \
+            ( 0.0155126038 ) * Ta*Ta*Pa*Pa*Pa + \
+            ( -2.63917279*(10**(-4)) ) * Ta*Ta*Ta*Pa*Pa*Pa + \
+            ( 0.0453433455 ) * va*Pa*Pa*Pa + \
+            ( -0.00432943862 ) * Ta*va*Pa*Pa*Pa + \
+            ( 1.45389826*(10**(-4)) ) * Ta*Ta*va*Pa*Pa*Pa + \
+            ( 2.17508610*(10**(-4)) ) * va*va*Pa*Pa*Pa + \
+            ( -6.66724702*(10**(-5)) ) * Ta*va*va*Pa*Pa*Pa + \
+            ( 3.33217140*(10**(-5)) ) * va*va*va*Pa*Pa*Pa + \
+            ( -0.00226921615 ) * D_Tmrt*Pa*Pa*Pa + \
+            ( 3.80261982*(10**(-4)) ) * Ta*D_Tmrt*Pa*Pa*Pa + \
+            ( -5.45314314*(10**(-9)) ) * Ta*Ta*D_Tmrt*Pa*Pa*Pa + \
+            ( -7.96355448*(10**(-4)) ) * va*D_Tmrt*Pa*Pa*Pa + \
+            ( 2.53458034*(10**(-5)) ) * Ta*va*D_Tmrt*Pa*Pa*Pa + \
+            ( -6.31223658*(10**(-6)) ) * va*va*D_Tmrt*Pa*Pa*Pa + \
+            ( 3.02122035*(10**(-4)) ) * D_Tmrt*D_Tmrt*Pa*Pa*Pa + \
+            ( -4.77403547*(10**(-6)) ) * Ta*D_Tmrt*D_Tmrt*Pa*Pa*Pa + \
+            ( 1.73825715*(10**(-6)) ) * va*D_Tmrt*D_Tmrt*Pa*Pa*Pa + \
+            ( -4.09087898*(10**(-7)) ) * D_Tmrt*D_Tmrt*D_Tmrt*Pa*Pa*Pa + \
+            ( 0.614155345 ) * Pa*Pa*Pa*Pa + \
+            ( -0.0616755931 ) * Ta*Pa*Pa*Pa*Pa + \
+            ( 0.00133374846 ) * Ta*Ta*Pa*Pa*Pa*Pa + \
+            ( 0.00355375387 ) * va*Pa*Pa*Pa*Pa + \
+            ( -5.13027851*(10**(-4)) ) * Ta*va*Pa*Pa*Pa*Pa + \
+            ( 1.02449757*(10**(-4)) ) * va*va*Pa*Pa*Pa*Pa + \
+            ( -0.00148526421 ) * D_Tmrt*Pa*Pa*Pa*Pa + \
+            ( -4.11469183*(10**(-5)) ) * Ta*D_Tmrt*Pa*Pa*Pa*Pa + \
+            ( -6.80434415*(10**(-6)) ) * va*D_Tmrt*Pa*Pa*Pa*Pa + \
+            ( -9.77675906*(10**(-6)) ) * D_Tmrt*D_Tmrt*Pa*Pa*Pa*Pa + \
+            ( 0.0882773108 ) * Pa*Pa*Pa*Pa*Pa + \
+            ( -0.00301859306 ) * Ta*Pa*Pa*Pa*Pa*Pa + \
+            ( 0.00104452989 ) * va*Pa*Pa*Pa*Pa*Pa + \
+            ( 2.47090539*(10**(-4)) ) * D_Tmrt*Pa*Pa*Pa*Pa*Pa + \
+            ( 0.00148348065 ) * Pa*Pa*Pa*Pa*Pa*Pa
+            
+            if UTCI_approx > 9 and UTCI_approx < 26: comfortable = 1
+            else: comfortable = 0
+            
+            if UTCI_approx <= -13.0:
+                stressRange = -3
+                stressVal = -1
+            elif UTCI_approx > -13.0 and UTCI_approx <= 0.0:
+                stressRange = -2
+                stressVal = -1
+            elif UTCI_approx > 0.0 and UTCI_approx <= 9.0:
+                stressRange = -1
+                stressVal = -1
+            elif UTCI_approx > 9.0 and UTCI_approx <= 26.0:
+                stressRange = 0
+                stressVal = 0
+            elif UTCI_approx > 26.0 and UTCI_approx <= 28.0:
+                stressRange = 1
+                stressVal = 1
+            elif UTCI_approx > 28.0 and UTCI_approx <= 32.0:
+                stressRange = 2
+                stressVal = 1
+            else:
+                stressRange = 3
+                stressVal = 1
+            
+        else:
+            UTCI_approx = None
+            comfortable = None
+            stressVal = None
+            stressRange = None
+        
+        return UTCI_approx, comfortable, stressRange, stressVal
+
+
+    def calcVapPressHighAccuracy(self, TKelvin):
+        #Calculate saturation vapor pressure above and below freezing
+        return psychrometrics.saturationPressure(TKelvin)
+
+
+    def calcHumidRatio(self, airTemp, relHumid, barPress):
+        #Calculate hourly humidity ratio, enthalpy, water vapor pressure and saturation pressure in a single pass
+        return psychrometrics.humidityRatio(airTemp, relHumid, barPress)
+
+
+    def findWetBulb(self, dbTemp, RH, Psta=101325):
+        """
+        Calculates Wet Bulb Temperature (C) at Temperature dbTemp (C),
+        Relative Humidity RH (%), and Barometric Pressure Psta (Pa).
+        """
+        return psychrometrics.wetBulb([dbTemp], [RH], [Psta])[0]
+
+
+    def calcWetBulb(self, airTemp, relHumid, barPress):
+        #Calculate hourly wet bulb temperatures with a Newton solver that runs all the hours together
+        return psychrometrics.wetBulb(airTemp, relHumid, barPress)
+
+
+    def calcDewPoint(self, airTemp, relHumid, coefficients=psychrometrics.MAGNUSBOLTON):
+        #Calculate hourly dew point temperatures with the Magnus formula
+        return psychrometrics.dewPoint(airTemp, relHumid, coefficients)
+
+
+    def calcVaporPressure(self, airTemp, relHumid):
+        #Calculate hourly water vapor pressure [hPa] with the ITS-90 formulation (Hardy 1998)
+        return psychrometrics.vaporPressure(airTemp, relHumid)
+
+
+    def calcPET(self, Ta, MRT, rh, ws, M, Icl, age, sex, heightM, weight, bodyPosition):
+        #Calculate hourly PET and the body parameters and heat fluxes of each hour with all the hours solved together
+        return comfortindices.physiologicalEquivalentTemperature(Ta, MRT, rh, ws, M, Icl, age, sex, heightM, weight, bodyPosition)
+
+
+    # thermal perception category of a PET value
+    petCategory = staticmethod(comfortindices.petCategory)
+
+
+    def calcPredictedHeatStrain(self, Ta, MRT, vapourPressure, ws, Icl, M, heightM, weight, bodyPosition, acclimated, activityDuration):
+        #Calculate ISO 7933 PHS rectal temperatures, water loss and duration limits with the work sequences of all the hours advancing minute by minute together
+        return comfortindices.predictedHeatStrain(Ta, MRT, vapourPressure, ws, Icl, M, heightM, weight, bodyPosition, acclimated, activityDuration)
+
+
+    def calcRelHumidFromHumidRatio(self, absHumid, barPress, temperature):
+        return psychrometrics.relHumidFromHumidRatio([absHumid], [barPress], [temperature])[0]
+
+
+    def calcRelHumidFromDryBulbDewPt(self, temperature, dewPt):
+        return psychrometrics.relHumidFromDewPoint([temperature], [dewPt])[0]
+
+
+    def calcTempFromEnthalpy(self, enthalpy, absHumid):
+        airTemp =(enthalpy - 2.5*(absHumid*1000))/(1.01 + (0.00189*absHumid*1000))
+        return airTemp
+
+
+    def calcTempFromWetBulb(self, wetBulb, relHumid, avgBarPress):
+        humidityRatio, enthalpy, partialPressure, saturationPressure = self.calcHumidRatio([wetBulb], [relHumid], [avgBarPress])
+        absHumid, enthalpy, partialPressure, saturationPressure = self.calcHumidRatio([wetBulb], [100], [avgBarPress])
+        airTemp = wetBulb + (((absHumid[0]-humidityRatio[0])*2260000)/(1005)) 
+        return airTemp, humidityRatio[0]
+
+
+    def splineSit(self, az, alt):
+        from .solarcaltables import SPLINESIT
+        return SPLINESIT[az][alt]
+
+
+    def splineStand(self, az, alt):
+        from .solarcaltables import SPLINESTAND
+        return SPLINESTAND[az][alt]
+    
+    def solarAdjustedMRT(self, personRad, groundRad, radTemps, personArea, fracEff, cloA, groundR, transmittances=None, radTransCoeff=6.012, skyTemps=None, skyViewFac=0):
+        #Hourly effective radiant field, MRT delta and solar-adjusted MRT of a person from the radiation on the person and on the ground.
+        #personRad: the sum of the radiation on each face of the person multiplied by the face area for each hour [Wh]
+        #groundRad: the radiation on the ground for each hour [Wh/m2]
+        #radTemps: the long wave mean radiant temperature of each hour [C]
+        #skyTemps and skyViewFac: optional sky temperatures and the sky view of the person to mix with radTemps.
+        #The function will return three lists:
+        #ERF: Effective radiant field [W/m2]
+        #MRTDelta: The increase of MRT by the short wave radiation [C]
+        #MRT: The solar-adjusted mean radiant temperature [C]
+        if transmittances is None: transmittances = [1] * len(radTemps)
+        if skyTemps is None:
+            baseTemps = radTemps
+        else:
+            baseTemps = [skyTemp*skyViewFac + radTemp*(1-skyViewFac) for skyTemp, radTemp in zip(skyTemps, radTemps)]
+        
+        ERF, MRTDelta, MRT = [], [], []
+        for pRad, gRad, trans, baseTemp in zip(personRad, groundRad, transmittances, baseTemps):
+            #Add the radiation reflected to the person by the ground.
+            totalPersonRad = pRad*trans + 0.5*gRad*trans*fracEff*groundR
+            hourERF = ((totalPersonRad/personArea) * cloA)/0.95
+            mrtDelt = hourERF/(fracEff*radTransCoeff)
+            ERF.append(hourERF)
+            MRTDelta.append(mrtDelt)
+            MRT.append(mrtDelt + baseTemp)
+        
+        return ERF, MRTDelta, MRT
+
+
+    class physiologicalEquivalentTemperature():
+        # based on: Peter Hoeppe PET fortran code, from:
+        # "Urban climatic map and standards for wind environment - Feasibility study, Technical Input Report No.1",
+        # The Chinese University of Hong Kong, Planning Department, Nov 2008
+        
+        def __init__(self, Ta, MRT, rh, ws, age, sex, heightM, weight, bodyPosition, M, Icl):
+            # personal inputs
+            self.ta = Ta  # in Celsius degrees
+            self.tmrt = MRT  # in Celsius degrees
+            self.rh = rh  # in %
+            self.v = ws  # in m/s
+            self.vpa = self.rh / 100.0 * 6.105 * math.exp(17.27 * self.ta / (237.7 + self.ta))
+            self.age = age  # in years
+            if sex == "male": sex = 1
+            elif sex == "female": sex = 2
+            elif sex == "average sex": sex = 3
+            self.sex = sex
+            self.ht = heightM  # in meters
+            self.mbody = weight  # in kg
+            self.work = M  # in W/m2
+            if ((Icl-0.02) < 0.01):
+                Icl = 0.02
+            self.icl = Icl
+            self.eta = 0.0
+            self.fcl = 1 + (0.31*self.icl)
+            if bodyPosition == "sitting":
+                self.feff = 0.696
+            elif bodyPosition == "standing":
+                self.feff = 0.725
+            elif bodyPosition == "crouching":
+                self.feff = 0.67
+            # constants
+            self.po = 1013.25
+            self.p = 1013.25
+            self.rob = 1.06
+            self.cb = 3640.0
+            self.food = 0.0
+            self.emsk = 0.99
+            self.emcl = 0.95
+            self.evap = 2.42 * math.pow(10.0, 6.0)
+            self.sigm = 5.67 * math.pow(10.0, -8.0)
+        
+        def inkoerp(self):
+            # inner body energy
+            eswdif = 3.19 * math.pow(self.mbody, 0.75) * (1.0 + 0.004 * (30.0 - self.age) + 0.018 * (self.ht * 100.0 / math.pow(self.mbody, 1.0 / 3.0) - 42.1))
+            eswphy = 3.45 * math.pow(self.mbody, 0.75) * (1.0 + 0.004 * (30.0 - self.age) + 0.01 * (self.ht * 100.0 / math.pow(self.mbody, 1.0 / 3.0) - 43.4))
+            eswpot = self.work + eswphy
+            fec = self.work + eswdif
+            he = 0.0
+            if self.sex == 1:
+                he = eswpot
+            elif self.sex == 2:
+                he = fec
+            elif self.sex == 3:
+                he = (eswpot + fec)/2
+            self.h = he * (1.0 - self.eta)
+            # sensible respiratory energy
+            self.cair = 1010.0
+            self.tex = 0.47 * self.ta + 21.0
+            self.rtv = 1.44 * math.pow(10.0, -6.0) * he
+            self.eres = self.cair * (self.ta - self.tex) * self.rtv
+            # deferred respiration energy
+            self.vpex = 6.11 * math.pow(10.0, 7.45 * self.tex / (235.0 + self.tex))
+            self.erel = 0.623 * self.evap / self.p * (self.vpa - self.vpex) * self.rtv
+            self.ere = self.eres + self.erel
+            
+            return self.ere
+        
+        def berech(self):
+            self.wetsk = 0.0
+            c = [None for i in range(11)]
+            tcore = [None for i in range(7)]
+            self.adu = 0.203 * math.pow(self.mbody, 0.425) * math.pow(self.ht, 0.725)
+            self.hc = 2.67 + 6.5 * math.pow(self.v, 0.67)
+            self.hc = self.hc * math.pow(self.p / self.po, 0.55)
+            self.facl = (173.51 * self.icl - 2.36 - 100.76 * self.icl * self.icl + 19.28 * math.pow(self.icl, 3.0)) / 100.0
+            if self.facl > 1.0:
+                self.facl = 1.0
+            rcl = self.icl / 6.45 / self.facl
+            if self.icl >= 2.0:
+                y = 1.0
+            if self.icl > 0.6 and self.icl < 2.0:
+                y = (self.ht - 0.2) / self.ht
+            if self.icl <= 0.6 and self.icl > 0.3:
+                y = 0.5
+            if self.icl <= 0.3 and self.icl > 0.0:
+                y = 0.1
+            r2 = self.adu * (self.fcl - 1.0 + self.facl) / (6.28 * self.ht * y)
+            r1 = self.facl * self.adu / (6.28 * self.ht * y)
+            di = r2 - r1
+            # skin temperatures
+            for j in range(1,7):
+                self.tsk = 34.0
+                self.count1 = 0
+                self.tcl = (self.ta + self.tmrt + self.tsk) / 3.0
+                self.enbal2 = 0.0
+                while True:
+                    for count2 in range(1,100):
+                        self.acl = self.adu * self.facl + self.adu * (self.fcl - 1.0)
+                        rclo2 = self.emcl * self.sigm * (math.pow(self.tcl + 273.2, 4.0) - math.pow(self.tmrt + 273.2, 4.0)) * self.feff
+                        htcl = 6.28 * self.ht * y * di / (rcl * math.log(r2 / r1) * self.acl)
+                        self.tsk = 1.0 / htcl * (self.hc * (self.tcl - self.ta) + rclo2) + self.tcl
+                        # radiation balance
+                        self.aeff = self.adu * self.feff
+                        self.rbare = self.aeff * (1.0 - self.facl) * self.emsk * self.sigm * (math.pow(self.tmrt + 273.2, 4.0) - math.pow(self.tsk + 273.2, 4.0))
+                        self.rclo = self.feff * self.acl * self.emcl * self.sigm * (math.pow(self.tmrt + 273.2, 4.0) - math.pow(self.tcl + 273.2, 4.0))
+                        self.rsum = self.rbare + self.rclo
+                        # convection
+                        self.cbare = self.hc * (self.ta - self.tsk) * self.adu * (1.0 - self.facl)
+                        self.cclo = self.hc * (self.ta - self.tcl) * self.acl
+                        self.csum = self.cbare + self.cclo
+                        # core temperature
+                        c[0] = self.h + self.ere
+                        c[1] = self.adu * self.rob * self.cb
+                        c[2] = 18.0 - 0.5 * self.tsk
+                        c[3] = 5.28 * self.adu * c[2]
+                        c[4] = 13.0 / 625.0 * c[1]
+                        c[5] = 0.76075 * c[1]
+                        c[6] = c[3] - c[5] - self.tsk * c[4]
+                        c[7] = -c[0] * c[2] - self.tsk * c[3] + self.tsk * c[5]
+                        c[8] = c[6] * c[6] - 4.0 * c[4] * c[7]
+                        c[9] = 5.28 * self.adu - c[5] - c[4] * self.tsk
+                        c[10] = c[9] * c[9] - 4.0 * c[4] * (c[5] * self.tsk - c[0] - 5.28 * self.adu * self.tsk)
+                        if self.tsk == 36.0:
+                            self.tsk = 36.01
+                        tcore[6] = c[0] / (5.28 * self.adu + c[1] * 6.3 / 3600.0) + self.tsk
+                        tcore[2] = c[0] / (5.28 * self.adu + c[1] * 6.3 / 3600.0 / (1.0 + 0.5 * (34.0 - self.tsk))) + self.tsk
+                        if c[10] >= 0.0:
+                            tcore[5] = (-c[9] - math.pow(c[10], 0.5)) / (2.0 * c[4])
+                            tcore[0] = (-c[9] + math.pow(c[10], 0.5)) / (2.0 * c[4])
+                        if c[8] >= 0.0:
+                            tcore[1] = (-c[6] + math.pow(abs(c[8]), 0.5)) / (2.0 * c[4])
+                            tcore[4] = (-c[6] - math.pow(abs(c[8]), 0.5)) / (2.0 * c[4])
+                        tcore[3] = c[0] / (5.28 * self.adu + c[1] * 1.0 / 40.0) + self.tsk
+                        # transpiration
+                        tbody = 0.1 * self.tsk + 0.9 * tcore[j - 1]
+                        swm = 304.94 * (tbody - 36.6) * self.adu / 3600000.0
+                        self.vpts = 6.11 * math.pow(10.0, 7.45 * self.tsk / (235.0 + self.tsk))
+                        if tbody <= 36.6:
+                            swm = 0.0
+                        swf = 0.7 * swm
+                        if self.sex == 1:
+                            sw = swm
+                        if self.sex == 2:
+                            sw = swf
+                        if self.sex == 3:
+                            sw = (swm + swf)/2
+                        eswphy = -sw * self.evap
+                        he = 0.633 * self.hc / (self.p * self.cair)
+                        fec = 1.0 / (1.0 + 0.92 * self.hc * rcl)
+                        eswpot = he * (self.vpa - self.vpts) * self.adu * self.evap * fec
+                        self.wetsk = eswphy / eswpot
+                        if self.wetsk > 1.0:
+                            self.wetsk = 1.0
+                        eswdif = eswphy - eswpot
+                        if eswdif <= 0.0:
+                            self.esw = eswpot
+                        if eswdif > 0.0:
+                            self.esw = eswphy
+                        if self.esw > 0.0:
+                            self.esw = 0.0
+                        # diffusion
+                        self.rdsk = 0.79 * math.pow(10.0, 7.0)
+                        self.rdcl = 0.0
+                        self.ed = self.evap / (self.rdsk + self.rdcl) * self.adu * (1.0 - self.wetsk) * (self.vpa - self.vpts)
+                        # max vb
+                        vb1 = 34.0 - self.tsk
+                        vb2 = tcore[j - 1] - 36.6
+                        if vb2 < 0.0:
+                            vb2 = 0.0
+                        if vb1 < 0.0:
+                            vb1 = 0.0
+                        vb = (6.3 + 75.0 * vb2) / (1.0 + 0.5 * vb1)
+                        # energy balance
+                        self.enbal = self.h + self.ed + self.ere + self.esw + self.csum + self.rsum + self.food
+                        # clothing temperature
+                        if self.count1 == 0:
+                            self.xx = 1.0
+                        if self.count1 == 1:
+                            self.xx = 0.1
+                        if self.count1 == 2:
+                            self.xx = 0.01
+                        if self.count1 == 3:
+                            self.xx = 0.001
+                        if self.enbal > 0.0:
+                            self.tcl = self.tcl + self.xx
+                        if self.enbal < 0.0:
+                            self.tcl = self.tcl - self.xx
+                        if (self.enbal > 0.0 or self.enbal2 <= 0.0) and (self.enbal < 0.0 or self.enbal2 >= 0.0):
+                            self.enbal2 = self.enbal
+                            count2 += 1
+                        else:
+                            break
+                    if self.count1 == 0.0 or self.count1 == 1.0 or self.count1 == 2.0:
+                        self.count1 = self.count1 + 1
+                        self.enbal2 = 0.0
+                    else:
+                        break
+                for k in range(20):
+                    if self.count1 == 3.0 and (j != 2 and j != 5):
+                        if j != 6 and j != 1:
+                            if j != 3:
+                                if j != 7:
+                                    if j == 4:
+                                        g100 = True
+                                        break
+                                else:
+                                    if tcore[j - 1] >= 36.6 or self.tsk <= 34.0:
+                                        g100 = False
+                                        break
+                                    g100 = True
+                                    break
+                            else:
+                                if tcore[j - 1] >= 36.6 or self.tsk > 34.0:
+                                    g100 = False
+                                    break
+                                g100 = True
+                                break
+                        else:
+                            if c[10] < 0.0 or (tcore[j - 1] < 36.6 or self.tsk <= 33.85):
+                                g100 = False
+                                break
+                            g100 = True
+                            break
+                    if c[8] < 0.0 or (tcore[j - 1] < 36.6 or self.tsk > 34.05):
+                        g100 = False
+                        break
+                if g100 == False:
+                    continue
+                else:
+                    if (j == 4 or vb < 91.0) and (j != 4 or vb >= 89.0):
+                        if vb > 90.0:
+                            vb = 90.0
+                        # water loss
+                        ws = sw * 3600.0 * 1000.0
+                        if ws > 2000.0:
+                            ws = 2000.0
+                        wd = self.ed / self.evap * 3600.0 * (-1000.0)
+                        wr = self.erel / self.evap * 3600.0 * (-1000.0)
+                        self.wsum = ws + wr + wd
+                        return tcore[j-1], self.rsum, self.csum, self.ed
+                # water loss
+                ws = sw * 3600.0 * 1000.0
+                wd = self.ed / self.evap * 3600.0 * (-1000.0)
+                wr = self.erel / self.evap * 3600.0 * (-1000.0)
+                self.wsum = ws + wr + wd
+                if j-3 < 0:
+                    index = 3
+                else:
+                    index = j-3
+                
+                return tcore[index], self.rsum, self.csum, self.ed
+        
+        def pet(self):
+            self.tx = self.ta
+            self.enbal2 = 0.0
+            self.count1 = 0
+            while self.count1 != 4:
+                self.hc = 2.67 + 6.5 * math.pow(0.1, 0.67)
+                self.hc = self.hc * math.pow(self.p / self.po, 0.55)
+                # radiation saldo
+                self.aeff = self.adu * self.feff
+                self.rbare = self.aeff * (1.0 - self.facl) * self.emsk * self.sigm * (math.pow(self.tx + 273.2, 4.0) - math.pow(self.tsk + 273.2, 4.0))
+                self.rclo = self.feff * self.acl * self.emcl * self.sigm * (math.pow(self.tx + 273.2, 4.0) - math.pow(self.tcl + 273.2, 4.0))
+                self.rsum = self.rbare + self.rclo
+                # convection
+                self.cbare = self.hc * (self.tx - self.tsk) * self.adu * (1.0 - self.facl)
+                self.cclo = self.hc * (self.tx - self.tcl) * self.acl
+                self.csum = self.cbare + self.cclo
+                # diffusion
+                self.ed = self.evap / (self.rdsk + self.rdcl) * self.adu * (1.0 - self.wetsk) * (12.0 - self.vpts)
+                # breathing
+                self.tex = 0.47 * self.tx + 21.0
+                self.eres = self.cair * (self.tx - self.tex) * self.rtv
+                self.vpex = 6.11 * math.pow(10.0, 7.45 * self.tex / (235.0 + self.tex))
+                self.erel = 0.623 * self.evap / self.p * (12.0 - self.vpex) * self.rtv
+                self.ere = self.eres + self.erel
+                # energy balance
+                self.enbal = self.h + self.ed + self.ere + self.esw + self.csum + self.rsum
+                if self.count1 == 0:
+                    self.xx = 1.0
+                if self.count1 == 1:
+                    self.xx = 0.1
+                if self.count1 == 2:
+                    self.xx = 0.01
+                if self.count1 == 3:
+                    self.xx = 0.001
+                if self.enbal > 0.0:
+                    self.tx = self.tx - self.xx
+                if self.enbal < 0.0:
+                    self.tx = self.tx + self.xx
+                if (self.enbal > 0.0 or self.enbal2 <= 0.0) and (self.enbal < 0.0 or self.enbal2 >= 0.0):
+                    self.enbal2 = self.enbal
+                else:
+                    self.count1 = self.count1 + 1
+            
+            return
+        
+        def thermalCategories(self, climate):
+            return comfortindices.petCategory(self.tx, climate)
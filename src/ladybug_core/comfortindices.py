@@ -0,0 +1,537 @@
+"""
+Heat balance comfort indices for lists of hourly values.
+
+Predicted Heat Strain (ISO 7933) and Physiological Equivalent Temperature solve
+a heat balance for every hour. Instead of running the solver to the end for one
+hour at a time, all the hours advance together: PHS takes one minute of the work
+sequence for every hour at each step and PET takes one step of the clothing and
+air temperature searches for every hour that has not converged yet. Values that
+only depend on the hourly inputs are calculated once per hour instead of once per
+step.
+
+Temperatures are in C, vapour pressure in hPa, wind speed in m/s and metabolic
+rate in W/m2.
+"""
+from __future__ import division
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+# effective radiating area of the body (PHS)
+PHSRADIATINGAREA = {"sitting": 0.7, "standing": 0.77, "crouching": 0.67}
+# effective radiating area of the body (PET)
+PETRADIATINGAREA = {"sitting": 0.696, "standing": 0.725, "crouching": 0.67}
+PETSEX = {"male": 1, "female": 2, "average sex": 3}
+
+
+def predictedHeatStrain(Ta, mrt, vapourPressure, ws, Icl, Met, heightM, weight, bodyPosition,
+                        acclimated, activityDuration):
+    """Predicted Heat Strain for lists of hourly values.
+
+    Based on Dr. Jacques Malchaire Quick Basic code from: "Ergonomics of the
+    thermal environment - Analytical determination and interpretation of heat
+    stress using calculation of predicted heat strain", ISO 7933, 2004.
+
+    Each hour is a work sequence of activityDuration minutes in the conditions
+    of the hour. Workers can drink freely. The clothing temperature search of a
+    minute starts from the result of the previous minute instead of the mean
+    radiant temperature so it usually takes two iterations. Results are within
+    the 0.001 C tolerance of the search.
+
+    Returns:
+        Tre: Rectal temperature at the end of the work sequence.
+        SWtotg: Total water loss (g).
+        Dlimloss95: Minutes until the water loss limit for 95% of the workers.
+        Dlimtre: Minutes until the rectal temperature limit.
+    """
+    count = len(Ta)
+    hours = range(count)
+    accl = 100 if acclimated == "acclimated" else 0
+    Ardu = PHSRADIATINGAREA[bodyPosition]
+
+    Work = 0  # effective mechanical power, in W/m2
+    imst = 0.38  # static moisture permeability index, dimensionless
+    Ap = 0.54  # fraction of the body surface covered by the reflective clothing, dimensionless
+    Fr = 0.97  # emissivity of the reflective clothing, dimensionless
+    Walksp = 0  # walking speed, in m/s
+    THETA = 0  # angle between walking direction and wind direction degrees
+
+    Adu = 0.202 * weight ** 0.425 * heightM ** 0.725  # body surface area in m2
+    spHeat = 57.83 * weight / Adu
+    Dmax50 = 0.075 * weight * 1000
+    Dmax95 = 0.05 * weight * 1000
+    Wmax = 0.85 if accl < 50 else 1
+    Iast = 0.111
+    auxR = 5.67E-08 * Ardu
+    FclR = (1 - Ap) * 0.97 + Ap * Fr
+
+    # exponential averaging constants of the core temperature (10 minutes),
+    # the skin temperature (3 minutes) and the sweat rate (10 minutes)
+    ConstTeq = math.exp(-1 / 10)
+    ConstTsk = math.exp(-1 / 3)
+    ConstSW = math.exp(-1 / 10)
+
+    # values that do not change during the work sequence
+    Pa = [e * 0.1 for e in vapourPressure]  # in kPa
+    SWmaxL, TcreqmL, TskeqclL, TskeqnuL, fclL, IcldynL, RtdynL = [], [], [], [], [], [], []
+    CresL, EresL, ZL = [], [], []
+    for ta, tr, pa, v, icl, met in zip(Ta, mrt, Pa, ws, Icl, Met):
+        SWmax = (met - 32) * Adu
+        if SWmax > 400: SWmax = 400
+        if SWmax < 250: SWmax = 250
+        if accl >= 50: SWmax = SWmax * 1.25
+        SWmaxL.append(SWmax)
+        TcreqmL.append(0.0036 * met + 36.6)
+        # skin temperature in equilibrium without the rectal temperature term
+        TskeqclL.append(12.165 + 0.02017 * ta + 0.04361 * tr + 0.19354 * pa - 0.25315 * v +
+                        0.005346 * met)
+        TskeqnuL.append(7.191 + 0.064 * ta + 0.061 * tr + 0.198 * pa - 0.348 * v)
+
+        # clothing influence on exchange coefficients
+        Iclst = icl * 0.155
+        fcl = 1 + 0.3 * icl
+        Itotst = Iclst + Iast / fcl
+        # unidirectional walking
+        Var = abs(v - Walksp * math.cos(3.14159 * THETA / 180))
+        Vaux = Var
+        if Var > 3: Vaux = 3
+        Waux = Walksp
+        if Walksp > 1.5: Waux = 1.5
+        CORcl = 1.044 * math.exp((.066 * Vaux - 0.398) * Vaux + (.094 * Waux - 0.378) * Waux)
+        if CORcl > 1: CORcl = 1
+        CORia = math.exp((.047 * Var - 0.472) * Var + (.117 * Waux - 0.342) * Waux)
+        if CORia > 1: CORia = 1
+        CORtot = CORcl
+        if icl <= 0.6: CORtot = ((.6 - icl) * CORia + icl * CORcl) / .6
+        Itotdyn = Itotst * CORtot
+        IAdyn = CORia * Iast
+        fclL.append(fcl)
+        IcldynL.append(Itotdyn - IAdyn / fcl)
+        CORe = (2.6 * CORtot - 6.5) * CORtot + 4.9
+        imdyn = imst * CORe
+        if imdyn > 0.9: imdyn = 0.9
+        RtdynL.append(Itotdyn / imdyn / 16.7)
+
+        # respiratory convection and evaporation
+        Texp = 28.56 + 0.115 * ta + 0.641 * pa
+        CresL.append(0.001516 * met * (Texp - ta))
+        EresL.append(0.00127 * met * (59.34 + 0.53 * ta - 11.63 * pa))
+        Z = 3.5 + 5.2 * Var
+        if Var > 1: Z = 8.7 * Var ** 0.6
+        ZL.append(Z)
+
+    Tre = [36.8] * count; Tcr = [36.8] * count; Tsk = [34.1] * count; Tcreq = [36.8] * count
+    TskTcrwg = [0.3] * count; SWp = [0] * count; SWtot = [0] * count; SWtotg = [0] * count
+    Dlimtre = [0] * count; Dlimloss50 = [0] * count; Dlimloss95 = [0] * count
+    Tsk0L = [0] * count; TskTcrwg0L = [0] * count
+    Hcdyn = [0] * count; Hr = [0] * count; dStorage = [0] * count
+    # the clothing temperature search starts from the value of the previous minute
+    Tcl = [tr + 0.1 for tr in mrt]
+
+    for time in range(1, activityDuration + 1):
+        for i in hours:
+            Tsk0 = Tsk0L[i] = Tsk[i]
+            TskTcrwg0 = TskTcrwg0L[i] = TskTcrwg[i]
+            tre = Tre[i]
+            # equilibrium core temperature associated to the metabolic rate
+            Tcreq0 = Tcreq[i]
+            Tcreq[i] = Tcreq0 * ConstTeq + TcreqmL[i] * (1 - ConstTeq)
+            # heat storage associated with the core temperature increase during the last minute
+            dStoreq = spHeat * (Tcreq[i] - Tcreq0) * (1 - TskTcrwg0)
+            # skin temperature as a function of the clothing insulation
+            Tskeqcl = TskeqclL[i] + 0.51274 * tre
+            Tskeqnu = TskeqnuL[i] + 0.616 * tre
+            icl = Icl[i]
+            if icl <= 0.2: Tskeq = Tskeqnu
+            else: Tskeq = Tskeqnu + 2.5 * (Tskeqcl - Tskeqnu) * (icl - 0.2)
+            tsk = Tsk[i] = Tsk0 * ConstTsk + Tskeq * (1 - ConstTsk)
+            # dynamic convection coefficient
+            hcdyn = 2.38 * abs(tsk - Ta[i]) ** 0.25
+            if ZL[i] > hcdyn: hcdyn = ZL[i]
+            Hcdyn[i] = hcdyn
+            # heat storage without the convection and radiation exchanges
+            dStorage[i] = dStoreq
+
+        # mean temperature of the clothing
+        active = hours
+        for k in range(100):
+            if not active: break
+            stillActive = []
+            for i in active:
+                tcl, tr, fcl, icldyn, hcdyn = Tcl[i], mrt[i], fclL[i], IcldynL[i], Hcdyn[i]
+                hr = Hr[i] = FclR * auxR * ((tcl + 273) ** 4 - (tr + 273) ** 4) / (tcl - tr)
+                Tcl1 = ((fcl * (hcdyn * Ta[i] + hr * tr) + Tsk[i] / icldyn)) / \
+                    (fcl * (hcdyn + hr) + 1 / icldyn)
+                if abs(tcl - Tcl1) > 0.001:
+                    Tcl[i] = (tcl + Tcl1) / 2
+                    stillActive.append(i)
+            active = stillActive
+
+        for i in hours:
+            ta, tsk, met, fcl = Ta[i], Tsk[i], Met[i], fclL[i]
+            dStoreq = dStorage[i]
+            # convection and radiation heat exchanges
+            Conv = fcl * Hcdyn[i] * (Tcl[i] - ta)
+            Rad = fcl * Hr[i] * (Tcl[i] - mrt[i])
+            # saturated water vapour pressure at the surface of the skin
+            Psk = 0.6105 * math.exp(17.27 * tsk / (tsk + 237.3))
+            Emax = (Psk - Pa[i]) / RtdynL[i]
+            Ereq = met - dStoreq - Work - CresL[i] - EresL[i] - Conv - Rad
+            wreq = Ereq / Emax
+
+            # required sweat rate
+            SWmax = SWmaxL[i]
+            if Ereq <= 0:
+                Ereq = 0; SWreq = 0
+            elif Emax <= 0:
+                Emax = 0; SWreq = SWmax
+            elif wreq >= 1.7:
+                wreq = 1.7; SWreq = SWmax
+            else:
+                Eveff = (1 - wreq ** 2 / 2)
+                if wreq > 1:
+                    Eveff = (2 - wreq) ** 2 / 2
+                SWreq = Ereq / Eveff
+                if SWreq > SWmax:
+                    SWreq = SWmax
+
+            # predicted sweat rate and evaporation rate
+            swp = SWp[i] * ConstSW + SWreq * (1 - ConstSW)
+            if swp <= 0:
+                Ep = 0; swp = 0
+            else:
+                ratio = Emax / swp
+                wp = 1
+                if ratio >= 0.5:
+                    wp = -ratio + math.sqrt(ratio * ratio + 2)
+                if wp > Wmax:
+                    wp = Wmax
+                Ep = wp * Emax
+            SWp[i] = swp
+            dStorage[i] = Ereq - Ep + dStoreq
+
+        # core temperature
+        Tcr0L = Tcr[:]
+        Tcr1L = Tcr[:]
+        active = hours
+        for g in range(50):
+            if not active: break
+            stillActive = []
+            for i in active:
+                Tcr1 = Tcr1L[i]
+                Tcr0 = Tcr0L[i]
+                TskTcrwg0 = TskTcrwg0L[i]
+                tsktcrwg = 0.3 - 0.09 * (Tcr1 - 36.8)
+                if tsktcrwg > 0.3: tsktcrwg = 0.3
+                if tsktcrwg < 0.1: tsktcrwg = 0.1
+                TskTcrwg[i] = tsktcrwg
+                tcr = dStorage[i] / spHeat + Tsk0L[i] * TskTcrwg0 / 2 - Tsk[i] * tsktcrwg / 2
+                tcr = Tcr[i] = (tcr + Tcr0 * (1 - TskTcrwg0 / 2)) / (1 - tsktcrwg / 2)
+                if abs(tcr - Tcr1) > 0.001:
+                    Tcr1L[i] = (Tcr1 + tcr) / 2
+                    stillActive.append(i)
+            active = stillActive
+
+        for i in hours:
+            # rectal temperature
+            Tre0 = Tre[i]
+            tre = Tre[i] = Tre0 + (2 * Tcr[i] - 1.962 * Tre0 - 1.31) / 9
+            if Dlimtre[i] == 0 and tre >= 38: Dlimtre[i] = time
+            # total water loss
+            swtot = SWtot[i] = SWtot[i] + SWp[i] + EresL[i]
+            swtotg = SWtotg[i] = swtot * 2.67 * Adu / 1.8 / 60
+            if Dlimloss50[i] == 0 and swtotg >= Dmax50: Dlimloss50[i] = time
+            if Dlimloss95[i] == 0 and swtotg >= Dmax95: Dlimloss95[i] = time
+
+    Dlimloss95 = [d or activityDuration for d in Dlimloss95]
+    Dlimtre = [d or activityDuration for d in Dlimtre]
+
+    return Tre, SWtotg, Dlimloss95, Dlimtre
+
+
+def petCategory(PET, climate):
+    """Thermal perception category and comfort (1 or 0) of a PET value.
+
+    Args:
+        climate: "humid" for the categories of Lin and Matzarakis (2008) for
+            tropical and subtropical humid climates and "temperate" for the
+            categories of Matzarakis and Mayer (1996).
+    """
+    if climate == "humid":
+        limits = (14, 18, 22, 26, 30, 34, 38, 42)
+    elif climate == "temperate":
+        limits = (4, 8, 13, 18, 23, 29, 35, 41)
+    # the lower limits are in the colder category and the upper limits in the
+    # warmer category except the comfortable range that includes both limits
+    if PET < limits[0]: return -4, 0
+    elif PET < limits[1]: return -3, 0
+    elif PET < limits[2]: return -2, 0
+    elif PET < limits[3]: return -1, 0
+    elif PET <= limits[4]: return 0, 1
+    elif PET <= limits[5]: return 1, 0
+    elif PET <= limits[6]: return 2, 0
+    elif PET <= limits[7]: return 3, 0
+    return 4, 0
+
+
+def physiologicalEquivalentTemperature(Ta, MRT, rh, ws, M, Icl, age, sex, heightM, weight,
+                                       bodyPosition):
+    """Physiological Equivalent Temperature for lists of hourly values.
+
+    Based on Peter Hoeppe PET fortran code, from: "Urban climatic map and standards
+    for wind environment - Feasibility study, Technical Input Report No.1", The
+    Chinese University of Hong Kong, Planning Department, Nov 2008. Results are the
+    same as ComfortModels.physiologicalEquivalentTemperature.
+
+    Returns:
+        PET: List of PET values.
+        PETresults: A list for each hour with the core temperature, mean skin
+            temperature, total heat loss (g/h), skin wettedness, internal heat,
+            radiation balance, convection, water vapor diffusion, sweat
+            evaporation and respiration (W).
+    """
+    count = len(Ta)
+    sex = PETSEX[sex]
+    feff = PETRADIATINGAREA[bodyPosition]
+    ht, mbody = heightM, weight
+    po = p = 1013.25
+    rob = 1.06
+    cb = 3640.0
+    food = 0.0
+    emsk = 0.99
+    emcl = 0.95
+    evap = 2.42 * math.pow(10.0, 6.0)
+    sigm = 5.67 * math.pow(10.0, -8.0)
+    cair = 1010.0
+    rdsk = 0.79 * math.pow(10.0, 7.0)
+    rdcl = 0.0
+
+    # inner body energy
+    eswdifBody = 3.19 * math.pow(mbody, 0.75) * (1.0 + 0.004 * (30.0 - age) + 0.018 * (ht * 100.0 / math.pow(mbody, 1.0 / 3.0) - 42.1))
+    eswphyBody = 3.45 * math.pow(mbody, 0.75) * (1.0 + 0.004 * (30.0 - age) + 0.01 * (ht * 100.0 / math.pow(mbody, 1.0 / 3.0) - 43.4))
+    adu = 0.203 * math.pow(mbody, 0.425) * math.pow(ht, 0.725)
+    aeff = adu * feff
+    c1 = adu * rob * cb
+    c4 = 13.0 / 625.0 * c1
+    c5 = 0.76075 * c1
+
+    vpa, h, rtv, erel, ere, hc, fcl, facl, rcl, acl, htcl, tmrt4 = [], [], [], [], [], [], [], [], [], [], [], []
+    for ta, tmrt, r, v, work, icl in zip(Ta, MRT, rh, ws, M, Icl):
+        vpa.append(r / 100.0 * 6.105 * math.exp(17.27 * ta / (237.7 + ta)))
+        if ((icl - 0.02) < 0.01):
+            icl = 0.02
+        if sex == 1: he = work + eswphyBody
+        elif sex == 2: he = work + eswdifBody
+        else: he = ((work + eswphyBody) + (work + eswdifBody)) / 2
+        h.append(he)
+        # sensible and deferred respiration energy
+        tex = 0.47 * ta + 21.0
+        rtv.append(1.44 * math.pow(10.0, -6.0) * he)
+        eres = cair * (ta - tex) * rtv[-1]
+        vpex = 6.11 * math.pow(10.0, 7.45 * tex / (235.0 + tex))
+        erel.append(0.623 * evap / p * (vpa[-1] - vpex) * rtv[-1])
+        ere.append(eres + erel[-1])
+
+        hc.append(2.67 + 6.5 * math.pow(v, 0.67))
+        hc[-1] = hc[-1] * math.pow(p / po, 0.55)
+        fcl.append(1 + (0.31 * icl))
+        f = (173.51 * icl - 2.36 - 100.76 * icl * icl + 19.28 * math.pow(icl, 3.0)) / 100.0
+        if f > 1.0: f = 1.0
+        facl.append(f)
+        rcl.append(icl / 6.45 / f)
+        if icl >= 2.0: y = 1.0
+        if icl > 0.6 and icl < 2.0: y = (ht - 0.2) / ht
+        if icl <= 0.6 and icl > 0.3: y = 0.5
+        if icl <= 0.3 and icl > 0.0: y = 0.1
+        r2 = adu * (fcl[-1] - 1.0 + f) / (6.28 * ht * y)
+        r1 = f * adu / (6.28 * ht * y)
+        di = r2 - r1
+        acl.append(adu * f + adu * (fcl[-1] - 1.0))
+        htcl.append(6.28 * ht * y * di / (rcl[-1] * math.log(r2 / r1) * acl[-1]))
+        tmrt4.append(math.pow(tmrt + 273.2, 4.0))
+
+    # state of the clothing temperature search of each hour
+    tcl = [0] * count; tsk = [0] * count; enbal2 = [0] * count
+    tcore = [[None] * 7 for i in range(count)]
+    c8 = [0] * count; c10 = [0] * count; vb = [0] * count; sw = [0] * count
+    rsum = [0] * count; csum = [0] * count; ed = [0] * count; esw = [0] * count
+    wetsk = [0] * count; vpts = [0] * count
+    g100 = [None] * count
+    # results
+    coreTemperature = [0] * count; wsum = [0] * count
+    radiation = [0] * count; convection = [0] * count; diffusion = [0] * count
+
+    active = list(range(count))
+    for j in range(1, 7):
+        if not active: break
+        for i in active:
+            tcl[i] = (Ta[i] + MRT[i] + 34.0) / 3.0
+
+        # skin temperatures. Step the clothing temperature by xx until the
+        # energy balance changes its sign for all the hours, then do the same
+        # with a smaller step.
+        for xx in (1.0, 0.1, 0.01, 0.001):
+            searching = active
+            for i in searching: enbal2[i] = 0.0
+            for count2 in range(1, 100):
+                if not searching: break
+                stillSearching = []
+                for i in searching:
+                    ta, tmrt, t = Ta[i], MRT[i], tcl[i]
+                    hci, facli, acli, tc = hc[i], facl[i], acl[i], tcore[i]
+                    rclo2 = emcl * sigm * (math.pow(t + 273.2, 4.0) - tmrt4[i]) * feff
+                    s = 1.0 / htcl[i] * (hci * (t - ta) + rclo2) + t
+                    # radiation balance
+                    rbare = aeff * (1.0 - facli) * emsk * sigm * (tmrt4[i] - math.pow(s + 273.2, 4.0))
+                    rclo = feff * acli * emcl * sigm * (tmrt4[i] - math.pow(t + 273.2, 4.0))
+                    rs = rsum[i] = rbare + rclo
+                    # convection
+                    cbare = hci * (ta - s) * adu * (1.0 - facli)
+                    cclo = hci * (ta - t) * acli
+                    cs = csum[i] = cbare + cclo
+                    # core temperature
+                    c0 = h[i] + ere[i]
+                    c2 = 18.0 - 0.5 * s
+                    c3 = 5.28 * adu * c2
+                    c6 = c3 - c5 - s * c4
+                    c7 = -c0 * c2 - s * c3 + s * c5
+                    c8i = c8[i] = c6 * c6 - 4.0 * c4 * c7
+                    c9 = 5.28 * adu - c5 - c4 * s
+                    c10i = c10[i] = c9 * c9 - 4.0 * c4 * (c5 * s - c0 - 5.28 * adu * s)
+                    if s == 36.0:
+                        s = 36.01
+                    tsk[i] = s
+                    tc[6] = c0 / (5.28 * adu + c1 * 6.3 / 3600.0) + s
+                    tc[2] = c0 / (5.28 * adu + c1 * 6.3 / 3600.0 / (1.0 + 0.5 * (34.0 - s))) + s
+                    if c10i >= 0.0:
+                        tc[5] = (-c9 - math.pow(c10i, 0.5)) / (2.0 * c4)
+                        tc[0] = (-c9 + math.pow(c10i, 0.5)) / (2.0 * c4)
+                    if c8i >= 0.0:
+                        tc[1] = (-c6 + math.pow(abs(c8i), 0.5)) / (2.0 * c4)
+                        tc[4] = (-c6 - math.pow(abs(c8i), 0.5)) / (2.0 * c4)
+                    tc[3] = c0 / (5.28 * adu + c1 * 1.0 / 40.0) + s
+                    # transpiration
+                    tbody = 0.1 * s + 0.9 * tc[j - 1]
+                    swm = 304.94 * (tbody - 36.6) * adu / 3600000.0
+                    vp = vpts[i] = 6.11 * math.pow(10.0, 7.45 * s / (235.0 + s))
+                    if tbody <= 36.6:
+                        swm = 0.0
+                    swf = 0.7 * swm
+                    if sex == 1: swi = swm
+                    elif sex == 2: swi = swf
+                    else: swi = (swm + swf) / 2
+                    sw[i] = swi
+                    eswphy = -swi * evap
+                    he = 0.633 * hci / (p * cair)
+                    fec = 1.0 / (1.0 + 0.92 * hci * rcl[i])
+                    eswpot = he * (vpa[i] - vp) * adu * evap * fec
+                    w = eswphy / eswpot
+                    if w > 1.0:
+                        w = 1.0
+                    wetsk[i] = w
+                    if eswphy - eswpot <= 0.0: e = eswpot
+                    else: e = eswphy
+                    if e > 0.0:
+                        e = 0.0
+                    esw[i] = e
+                    # diffusion
+                    d = ed[i] = evap / (rdsk + rdcl) * adu * (1.0 - w) * (vpa[i] - vp)
+                    # max vb
+                    vb1 = 34.0 - s
+                    vb2 = tc[j - 1] - 36.6
+                    if vb2 < 0.0:
+                        vb2 = 0.0
+                    if vb1 < 0.0:
+                        vb1 = 0.0
+                    vb[i] = (6.3 + 75.0 * vb2) / (1.0 + 0.5 * vb1)
+                    # energy balance
+                    enbal = h[i] + d + ere[i] + e + cs + rs + food
+                    if enbal > 0.0:
+                        tcl[i] = t + xx
+                    if enbal < 0.0:
+                        tcl[i] = t - xx
+                    if (enbal > 0.0 or enbal2[i] <= 0.0) and (enbal < 0.0 or enbal2[i] >= 0.0):
+                        enbal2[i] = enbal
+                        stillSearching.append(i)
+                searching = stillSearching
+
+        # hours with a valid core temperature for this j are finished
+        stillActive = []
+        for i in active:
+            tc, s = tcore[i][j - 1], tsk[i]
+            if j == 1 or j == 6:
+                g100[i] = not (c10[i] < 0.0 or (tc < 36.6 or s <= 33.85))
+            elif j == 3:
+                g100[i] = not (tc >= 36.6 or s > 34.0)
+            elif j == 4:
+                g100[i] = True
+            elif c8[i] < 0.0 or (tc < 36.6 or s > 34.05):
+                g100[i] = False
+            if not g100[i]:
+                stillActive.append(i)
+                continue
+
+            # water loss
+            ws_ = sw[i] * 3600.0 * 1000.0
+            wd = ed[i] / evap * 3600.0 * (-1000.0)
+            wr = erel[i] / evap * 3600.0 * (-1000.0)
+            if (j == 4 or vb[i] < 91.0) and (j != 4 or vb[i] >= 89.0):
+                if ws_ > 2000.0:
+                    ws_ = 2000.0
+                coreTemperature[i] = tc
+            else:
+                coreTemperature[i] = tcore[i][3 if j - 3 < 0 else j - 3]
+            wsum[i] = ws_ + wr + wd
+            radiation[i], convection[i], diffusion[i] = rsum[i], csum[i], ed[i]
+        active = stillActive
+
+    # air temperature of the reference environment. The search uses smaller
+    # steps after each change of the sign of the energy balance.
+    hcRef = 2.67 + 6.5 * math.pow(0.1, 0.67)
+    hcRef = hcRef * math.pow(p / po, 0.55)
+    tx = list(Ta)
+    level = [0] * count
+    enbal2 = [0.0] * count
+    steps = (1.0, 0.1, 0.01, 0.001)
+    active = list(range(count))
+    while active:
+        stillActive = []
+        for i in active:
+            t, s, facli, acli = tx[i], tsk[i], facl[i], acl[i]
+            # radiation saldo
+            rbare = aeff * (1.0 - facli) * emsk * sigm * (math.pow(t + 273.2, 4.0) - math.pow(s + 273.2, 4.0))
+            rclo = feff * acli * emcl * sigm * (math.pow(t + 273.2, 4.0) - math.pow(tcl[i] + 273.2, 4.0))
+            rs = rbare + rclo
+            # convection
+            cbare = hcRef * (t - s) * adu * (1.0 - facli)
+            cclo = hcRef * (t - tcl[i]) * acli
+            cs = cbare + cclo
+            # diffusion
+            d = evap / (rdsk + rdcl) * adu * (1.0 - wetsk[i]) * (12.0 - vpts[i])
+            # breathing
+            tex = 0.47 * t + 21.0
+            eres = cair * (t - tex) * rtv[i]
+            vpex = 6.11 * math.pow(10.0, 7.45 * tex / (235.0 + tex))
+            erl = 0.623 * evap / p * (12.0 - vpex) * rtv[i]
+            # energy balance
+            enbal = h[i] + d + (eres + erl) + esw[i] + cs + rs
+            xx = steps[level[i]]
+            if enbal > 0.0:
+                tx[i] = t - xx
+            if enbal < 0.0:
+                tx[i] = t + xx
+            if (enbal > 0.0 or enbal2[i] <= 0.0) and (enbal < 0.0 or enbal2[i] >= 0.0):
+                enbal2[i] = enbal
+            else:
+                level[i] += 1
+            if level[i] != 4:
+                stillActive.append(i)
+        active = stillActive
+
+    PETresults = [[coreTemperature[i], tsk[i], wsum[i], wetsk[i], h[i], radiation[i],
+                   convection[i], diffusion[i], esw[i], ere[i]] for i in range(count)]
+    return tx, PETresults
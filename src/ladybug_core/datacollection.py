@@ -0,0 +1,268 @@
+"""
+Typed data collections.
+
+Ladybug components pass data as lists that start with a seven item header:
+
+    ['key:location/dataType/units/frequency/startsAt/endsAt', location,
+     dataType, units, frequency, (stMonth, stDay, stHour), (endMonth, endDay, endHour),
+     value1, value2, ...]
+
+A DataCollection keeps the header as a Header object and the values as floats
+in an array buffer. Selections by analysis period, hours of the year, mask or
+month return new collections that share the buffer and only keep the indices
+of the selected values. Values are read from the buffer when they are used and
+the legacy list is only created when toList is called (e.g. to set a component
+output).
+"""
+from __future__ import division
+from array import array
+
+from .analysisperiod import AnalysisPeriod
+
+
+HEADERKEY = 'key:location/dataType/units/frequency/startsAt/endsAt'
+
+ANNUALPERIOD = ((1, 1, 1), (12, 31, 24))
+
+NUMOFDAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365)
+
+
+def date2Hour(month, day, hour):
+    """1-based hour of the year."""
+    return (NUMOFDAYS[int(month) - 1] + int(day) - 1) * 24 + hour
+
+
+def analysisPeriodIndices(analysisPeriod, length=8760):
+    """0-based indices of the values in an analysis period.
+
+    Follows Preparation.selectHourlyData: the values from the start to the end
+    date and on each day the hours between the start and the end hour. If the
+    end is before the start the period goes over the end of the year.
+    """
+    if not analysisPeriod or analysisPeriod[0] is None: analysisPeriod = ANNUALPERIOD
+    (stMonth, stDay, stHour), (endMonth, endDay, endHour) = analysisPeriod
+    stAnnualHour = date2Hour(stMonth, stDay, stHour)
+    endAnnualHour = date2Hour(endMonth, endDay, endHour)
+    stHour, endHour = stHour - 1, endHour - 1
+
+    if stAnnualHour < endAnnualHour:
+        ranges = ((stAnnualHour - 1, min(endAnnualHour, length)),)
+    else:
+        ranges = ((stAnnualHour - 1, length), (0, min(endAnnualHour, length)))
+
+    indices = []
+    for start, end in ranges:
+        # whole days between the first and the last day
+        for dayStart in range(start - start % 24, end, 24):
+            first = max(start, dayStart + stHour)
+            last = min(end, dayStart + endHour + 1)
+            if first < last: indices.extend(range(first, last))
+    return indices
+
+
+def splitLegacyList(hourlyData, key=HEADERKEY):
+    """Find the headers in a list of one or more Ladybug lists.
+
+    Returns the same index list and header list as Preparation.separateList.
+    """
+    indexList = []
+    start = 0
+    try:
+        while True:
+            index = hourlyData.index(key, start)
+            indexList.append(index)
+            start = index + 1
+    except ValueError:
+        pass
+
+    if not indexList:
+        # numbers with no header
+        return [-7, len(hourlyData)], \
+            [[key, 'somewhere', 'someData', 'someUnits', 'someTimeStep', (1, 1, 1), (12, 31, 24)]]
+
+    listInfo = [list(hourlyData[index:index + 7]) for index in indexList]
+    indexList.append(len(hourlyData))
+    return indexList, listInfo
+
+
+def toFloats(values):
+    """Values as an array of floats."""
+    try:
+        return array('d', values)
+    except TypeError:
+        # values are strings
+        return array('d', (float(v) for v in values))
+
+
+class Header(object):
+    """Header of a data collection.
+
+    Args:
+        location: Location name.
+        dataType: Data type (e.g. Dry Bulb Temperature).
+        unit: Units (e.g. C).
+        frequency: Hourly, Daily, Monthly, Annual or a custom text.
+        analysisPeriod: ((stMonth, stDay, stHour), (endMonth, endDay, endHour)).
+    """
+
+    def __init__(self, location='somewhere', dataType='someData', unit='someUnits',
+                 frequency='Hourly', analysisPeriod=ANNUALPERIOD):
+        self.location = location
+        self.dataType = dataType
+        self.unit = unit
+        self.frequency = frequency
+        self.analysisPeriod = analysisPeriod
+
+    @classmethod
+    def fromList(cls, headerList):
+        """Create a header from the seven first items of a Ladybug list."""
+        return cls(headerList[1], headerList[2], headerList[3], headerList[4],
+                   (headerList[5], headerList[6]))
+
+    def duplicate(self, analysisPeriod=None, frequency=None):
+        return Header(self.location, self.dataType, self.unit, frequency or self.frequency,
+                      analysisPeriod or self.analysisPeriod)
+
+    def toList(self):
+        return [HEADERKEY, self.location, self.dataType, self.unit, self.frequency,
+                self.analysisPeriod[0], self.analysisPeriod[1]]
+
+    def ToString(self):
+        return 'Header::%s [%s]' % (self.dataType, self.unit)
+
+
+class DataCollection(object):
+    """Header and float values of a data stream.
+
+    Args:
+        header: A Header.
+        values: Numbers or an array('d') buffer. Other collections that are
+            selected from this one share the same buffer.
+        indices: Optional indices of the values of this collection in the
+            buffer. Default is all the values.
+        hoys: Optional 1-based hours of the year of the values in the buffer.
+            Default is the hours of the header analysis period for hourly data.
+    """
+
+    def __init__(self, header, values, indices=None, hoys=None):
+        self.header = header
+        self._buffer = values if isinstance(values, array) else toFloats(values)
+        self._indices = indices
+        self._bufferHoys = hoys
+        # header of the collection that created the buffer
+        self._bufferHeader = header
+        self._list = None
+
+    @classmethod
+    def fromList(cls, ladybugList):
+        """Create a collection from a Ladybug list with or without a header."""
+        if len(ladybugList) > 7 and ladybugList[0] == HEADERKEY:
+            return cls(Header.fromList(ladybugList), ladybugList[7:])
+        return cls(Header(), ladybugList)
+
+    @classmethod
+    def fromLists(cls, hourlyData):
+        """Create a collection for each Ladybug list in a list of lists."""
+        indexList, listInfo = splitLegacyList(hourlyData)
+        return [cls(Header.fromList(info), hourlyData[indexList[i] + 7:indexList[i + 1]])
+                for i, info in enumerate(listInfo)]
+
+    @property
+    def values(self):
+        """Values as a list of floats."""
+        if self._indices is None: return self._buffer.tolist()
+        buffer = self._buffer
+        return [buffer[i] for i in self._indices]
+
+    @property
+    def bufferHoys(self):
+        """1-based hours of the year of the values in the buffer."""
+        if self._bufferHoys is None:
+            length = len(self._buffer)
+            if length == 8760:
+                self._bufferHoys = range(1, 8761)
+            elif self._bufferHeader.frequency == 'Hourly':
+                header = self._bufferHeader
+                hoys = [i + 1 for i in analysisPeriodIndices(header.analysisPeriod)]
+                if len(hoys) != length:
+                    raise ValueError('%s has %d values but its analysis period has %d hours.'
+                                     % (header.dataType, length, len(hoys)))
+                self._bufferHoys = hoys
+            else:
+                raise ValueError('Hours of the year are only available for hourly data.')
+        return self._bufferHoys
+
+    @property
+    def hoys(self):
+        """1-based hours of the year of the values."""
+        hoys = self.bufferHoys
+        if self._indices is None: return list(hoys)
+        return [hoys[i] for i in self._indices]
+
+    def _select(self, indices, analysisPeriod=None, frequency=None):
+        # indices into this collection to indices into the buffer
+        if self._indices is not None:
+            indices = [self._indices[i] for i in indices]
+        collection = DataCollection(self.header.duplicate(analysisPeriod, frequency),
+                                    self._buffer, indices, self._bufferHoys)
+        collection._bufferHeader = self._bufferHeader
+        return collection
+
+    def filterByAnalysisPeriod(self, analysisPeriod):
+        """Select the values in an analysis period.
+
+        Indices follow the position of the values in this collection in the same
+        way as Preparation.selectHourlyData.
+        """
+        if not analysisPeriod or analysisPeriod[0] is None: analysisPeriod = ANNUALPERIOD
+        indices = analysisPeriodIndices(analysisPeriod, len(self))
+        return self._select(indices, (tuple(analysisPeriod[0]), tuple(analysisPeriod[1])),
+                            'Hourly')
+
+    def filterByHoys(self, hoys):
+        """Select the values for a list of 1-based hours of the year."""
+        if isinstance(hoys, AnalysisPeriod): hoys = hoys.hoys
+        if self._indices is None and len(self._buffer) == 8760:
+            # annual data. HOYs are the indices.
+            return self._select([int(hoy) - 1 for hoy in hoys if 1 <= hoy <= 8760],
+                                frequency='Custom')
+        positions = dict((hoy, i) for i, hoy in enumerate(self.hoys))
+        indices = [positions[int(hoy)] for hoy in hoys if int(hoy) in positions]
+        return self._select(indices, frequency='Custom')
+
+    def filterByMask(self, mask):
+        """Select the values where mask is True."""
+        return self._select([i for i, m in enumerate(mask) if m], frequency='Custom')
+
+    def filterByMonths(self, months):
+        """Select the values in a list of months (1-12)."""
+        months = set(int(m) for m in months)
+        hourRanges = [(NUMOFDAYS[m - 1] * 24, NUMOFDAYS[m] * 24) for m in months]
+        indices = [i for i, hoy in enumerate(self.hoys)
+                   if any(st < hoy <= end for st, end in hourRanges)]
+        return self._select(indices, frequency='Custom')
+
+    def toList(self):
+        """Ladybug list with the header. The list is created once."""
+        if self._list is None:
+            self._list = self.header.toList() + self.values
+        return self._list
+
+    def duplicate(self):
+        return DataCollection(self.header.duplicate(), self.values)
+
+    def __len__(self):
+        if self._indices is None: return len(self._buffer)
+        return len(self._indices)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, index):
+        if self._indices is None: return self._buffer[index]
+        if isinstance(index, slice):
+            return [self._buffer[i] for i in self._indices[index]]
+        return self._buffer[self._indices[index]]
+
+    def ToString(self):
+        return 'DataCollection::%s (%d values)' % (self.header.dataType, len(self))
@@ -0,0 +1,324 @@
+"""
+ENVI-met model domains.
+
+Closed meshes (buildings and terrain) are voxelized into an integer grid of
+cells with a vertical ray through the center of every column of cells. The
+crossings of the ray with the mesh are sorted and the cells between each pair
+of crossings are inside. Wall and roof faces of the buildings are the
+differences between each cell and its neighbors in -X, -Y and -Z.
+
+Cells are indexed [k][j][i] and cells outside of the domain count as empty.
+ENVI-met splits the lowest cell in five, so a domain with numZ cells has
+numZ + 4 layers.
+
+INXWriter streams the sections of INX model files from these records to disk.
+
+    vertices: List of (x, y, z) tuples.
+    faces: List of vertex index tuples. Faces have 3 or 4 indices. Rhino
+        triangles have 4 indices with the same third and fourth index.
+"""
+from __future__ import division
+import os
+from bisect import bisect_left, bisect_right
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+def cellCenters(count, size, origin=0):
+    """Coordinates of the centers of count cells of the same size."""
+    return [origin + i * size + size / 2 for i in range(count)]
+
+
+def layerCenters(numZ, dimZ, origin=0):
+    """Heights of the centers of the layers with the lowest cell split in five."""
+    lowest = [origin + k * dimZ / 5 + dimZ / 10 for k in range(5)]
+    return lowest + [origin + k * dimZ + dimZ / 2 for k in range(1, numZ)]
+
+
+def _edge(a, b, x, y):
+    # side of (x, y) from the edge a -> b in XY. The value is calculated from
+    # the lower end point of the edge so both faces of an edge get exactly the
+    # opposite value.
+    if (a[0], a[1]) > (b[0], b[1]):
+        return -((a[0] - b[0]) * (y - b[1]) - (a[1] - b[1]) * (x - b[0]))
+    return (b[0] - a[0]) * (y - a[1]) - (b[1] - a[1]) * (x - a[0])
+
+
+def _ownsEdge(a, b):
+    # top-left rule for counterclockwise triangles so a ray through an edge or
+    # a vertex crosses only one of the faces around it
+    return b[1] < a[1] or (b[1] == a[1] and b[0] < a[0])
+
+
+def columnCrossings(vertices, faces, xs, ys):
+    """Heights where vertical rays through (xs[i], ys[j]) cross the faces.
+
+    Returns:
+        A dictionary of sorted heights for each (i, j) that the mesh covers.
+    """
+    crossings = {}
+    for face in faces:
+        triangles = [(face[0], face[1], face[2])]
+        if len(face) == 4 and face[2] != face[3]: triangles.append((face[0], face[2], face[3]))
+        for ia, ib, ic in triangles:
+            a, b, c = vertices[ia], vertices[ib], vertices[ic]
+            area = (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+            # vertical faces don't cross vertical rays
+            if area == 0: continue
+            if area < 0: b, c, area = c, b, -area
+            ownBC, ownCA, ownAB = _ownsEdge(b, c), _ownsEdge(c, a), _ownsEdge(a, b)
+            i0 = bisect_left(xs, min(a[0], b[0], c[0]))
+            i1 = bisect_right(xs, max(a[0], b[0], c[0]))
+            j0 = bisect_left(ys, min(a[1], b[1], c[1]))
+            j1 = bisect_right(ys, max(a[1], b[1], c[1]))
+            for j in range(j0, j1):
+                y = ys[j]
+                for i in range(i0, i1):
+                    x = xs[i]
+                    wa = _edge(b, c, x, y)
+                    if wa < 0 or (wa == 0 and not ownBC): continue
+                    wb = _edge(c, a, x, y)
+                    if wb < 0 or (wb == 0 and not ownCA): continue
+                    wc = _edge(a, b, x, y)
+                    if wc < 0 or (wc == 0 and not ownAB): continue
+                    z = (wa * a[2] + wb * b[2] + wc * c[2]) / area
+                    crossings.setdefault((i, j), []).append(z)
+    for heights in crossings.values(): heights.sort()
+    return crossings
+
+
+class EnvimetDomain(object):
+    """Grid of an ENVI-met model with the id of the building in each cell.
+
+    Args:
+        numX, numY, numZ: Number of cells in X, Y and Z.
+        dimX, dimY, dimZ: Size of the cells.
+        basePoint: (x, y, z) of the corner of the domain.
+    """
+
+    def __init__(self, numX, numY, numZ, dimX, dimY, dimZ, basePoint=(0, 0, 0)):
+        self.xs = cellCenters(numX, dimX, basePoint[0])
+        self.ys = cellCenters(numY, dimY, basePoint[1])
+        self.zs = layerCenters(numZ, dimZ, basePoint[2])
+        self.grid = self.emptyGrid()
+        self.buildingCount = 0
+
+    def emptyGrid(self):
+        return [[[0] * len(self.xs) for y in self.ys] for z in self.zs]
+
+    def voxelize(self, vertices, faces, value=1, grid=None):
+        """Set the empty cells inside a closed mesh to value.
+
+        Returns:
+            The grid. A new empty grid is used if grid is None.
+        """
+        if grid is None: grid = self.emptyGrid()
+        zs = self.zs
+        for (i, j), heights in columnCrossings(vertices, faces, self.xs, self.ys).items():
+            for bottom, top in zip(heights[0::2], heights[1::2]):
+                for k in range(bisect_left(zs, bottom), bisect_left(zs, top)):
+                    if not grid[k][j][i]: grid[k][j][i] = value
+        return grid
+
+    def addBuilding(self, vertices, faces):
+        """Voxelize a building. Cells that are already in a building are kept.
+
+        Returns:
+            Id of the building (1 for the first building).
+        """
+        self.buildingCount += 1
+        self.voxelize(vertices, faces, self.buildingCount, self.grid)
+        return self.buildingCount
+
+    def cells(self, grid=None):
+        """(i, j, k, value) of every cell that isn't empty."""
+        if grid is None: grid = self.grid
+        return [(i, j, k, value) for k, layer in enumerate(grid) for j, row in enumerate(layer)
+                if any(row) for i, value in enumerate(row) if value]
+
+    def buildingFlags(self):
+        """'i,j,k,1,id' records of the building cells."""
+        return ['%d,%d,%d,1,%d' % cell for cell in self.cells()]
+
+    def terrainFlags(self, vertices, faces):
+        """'i,j,k,1.00000' records of the cells inside a closed terrain mesh."""
+        return ['%d,%d,%d,1.00000' % cell[:3] for cell in self.cells(self.voxelize(vertices, faces))]
+
+    def wallRecords(self, matWall, matRoof):
+        """'i,j,k,wallX,wallY,roof' records of the faces between buildings and empty cells.
+
+        Each cell holds the faces on its -X and -Y sides and its bottom. A face
+        gets the material of the building cell next to it.
+
+        Args:
+            matWall: Wall material of each building.
+            matRoof: Roof material of each building.
+        """
+        records = []
+        grid = self.grid
+        emptyRow = [0] * len(self.xs)
+        for k, layer in enumerate(grid):
+            below = grid[k - 1] if k else None
+            for j, row in enumerate(layer):
+                back = layer[j - 1] if j else emptyRow
+                under = below[j] if below else emptyRow
+                if not (any(row) or any(back) or any(under)): continue
+                left = [0] + row[:-1]
+                for i, (c, x, y, z) in enumerate(zip(row, left, back, under)):
+                    if c:
+                        if x and y and z: continue
+                        wallX = '' if x else matWall[c - 1]
+                        wallY = '' if y else matWall[c - 1]
+                        roof = '' if z else matRoof[c - 1]
+                    else:
+                        if not (x or y or z): continue
+                        wallX = matWall[x - 1] if x else ''
+                        wallY = matWall[y - 1] if y else ''
+                        roof = matRoof[z - 1] if z else ''
+                    records.append(','.join((str(i), str(j), str(k), wallX, wallY, roof)))
+        return records
+
+    def signature(self):
+        """Hash of the ids in the grid to find out if a model has changed."""
+        return hash(tuple(hash(tuple(row)) for layer in self.grid for row in layer))
+
+    def buildingNumbers(self):
+        """Rows of the 2D building number matrix from the last row to the first.
+
+        Each column gets the sum of the different ids in it.
+        """
+        grid = self.grid
+        rows = []
+        for j in range(len(self.ys)):
+            rows.append(','.join(str(sum(set(layer[j][i] for layer in grid)))
+                                 for i in range(len(self.xs))))
+        rows.reverse()
+        return rows
+
+    def ToString(self):
+        return 'EnvimetDomain::%d x %d x %d cells, %d buildings' % (
+            len(self.xs), len(self.ys), len(self.zs), self.buildingCount)
+
+
+def _escape(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+
+
+def matrixAttributes(numX, numY):
+    """Attributes of a 2D matrix of an INX file."""
+    return [('type', 'matrix-data'), ('dataI', str(numX)), ('dataJ', str(numY))]
+
+
+def sparseMatrixAttributes(numX, numY, layerCount, defaultValue):
+    """Attributes of a sparse 3D matrix of an INX file."""
+    return [('type', 'sparematrix-3D'), ('dataI', str(numX)), ('dataJ', str(numY)),
+            ('zlayers', str(layerCount)), ('defaultValue', defaultValue)]
+
+
+class INXWriter(object):
+    """Write ENVI-met INX files section by section.
+
+    The text of each element is streamed to a buffered file so the file is
+    never held in memory as a whole. The layout is the same as the pretty xml
+    of xml.dom.minidom without the xml declaration.
+
+    Sections are (tag, signature, children) tuples and children are (tag,
+    attributes, data) tuples. attributes is a list of (name, value) and data
+    is a text or a function that returns the lines of the text (e.g. the
+    records of an EnvimetDomain). The writer remembers where each section is in
+    the last file it wrote. A section with the same signature as in that file
+    (e.g. a hash of the grid and the wall materials) is copied from it without
+    calling its functions. Use None for sections that are always written.
+
+    Args:
+        filePath: Path of the INX file.
+        newline: Line separator of the file.
+    """
+    BUFFERSIZE = 1 << 16
+
+    def __init__(self, filePath, newline=os.linesep, root='ENVI-MET_Datafile'):
+        self.filePath = filePath
+        self.newline = newline
+        self.root = root
+        self._spans = {}
+        self._stamp = None
+
+    def _fileStamp(self):
+        if not os.path.isfile(self.filePath): return None
+        return os.path.getsize(self.filePath), os.path.getmtime(self.filePath)
+
+    def _encode(self, text):
+        if self.newline != '\n': text = text.replace('\n', self.newline)
+        return text.encode('utf-8')
+
+    def _writeLines(self, outf, lines):
+        # lines are joined with new lines and written in blocks
+        block = []
+        for i, line in enumerate(lines):
+            if i: block.append('\n')
+            block.append(_escape(line))
+            if len(block) >= 2048:
+                outf.write(self._encode(''.join(block)))
+                block = []
+        if block: outf.write(self._encode(''.join(block)))
+
+    def _writeSection(self, outf, tag, children):
+        if not children:
+            outf.write(self._encode('  <%s/>\n' % tag))
+            return
+        outf.write(self._encode('  <%s>\n' % tag))
+        for childTag, attributes, data in children:
+            attributeText = ''.join(' %s="%s"' % (name, _escape(value))
+                                    for name, value in sorted(attributes))
+            outf.write(self._encode('    <%s%s>' % (childTag, attributeText)))
+            if callable(data): self._writeLines(outf, data())
+            else: outf.write(self._encode(_escape(data)))
+            outf.write(self._encode('</%s>\n' % childTag))
+        outf.write(self._encode('  </%s>\n' % tag))
+
+    # attributes of the matrices
+    matrixAttributes = staticmethod(matrixAttributes)
+    sparseMatrixAttributes = staticmethod(sparseMatrixAttributes)
+
+    @staticmethod
+    def _copy(inf, outf, start, end):
+        inf.seek(start)
+        left = end - start
+        while left > 0:
+            data = inf.read(min(left, INXWriter.BUFFERSIZE))
+            if not data: break
+            outf.write(data)
+            left -= len(data)
+
+    def write(self, sections):
+        """Write the sections and return the path of the file."""
+        previous = self._spans if self._stamp and self._stamp == self._fileStamp() else {}
+        spans = {}
+        tempPath = self.filePath + '.tmp'
+        inf = open(self.filePath, 'rb') if previous else None
+        try:
+            with open(tempPath, 'wb', self.BUFFERSIZE) as outf:
+                outf.write(self._encode('<%s>\n' % self.root))
+                for index, (tag, signature, children) in enumerate(sections):
+                    key = index, tag
+                    start = outf.tell()
+                    if signature is not None and previous.get(key, (None,))[0] == signature:
+                        self._copy(inf, outf, previous[key][1], previous[key][2])
+                    else:
+                        self._writeSection(outf, tag, children)
+                    spans[key] = signature, start, outf.tell()
+                outf.write(self._encode('</%s>\n' % self.root))
+        finally:
+            if inf: inf.close()
+
+        if os.path.isfile(self.filePath): os.remove(self.filePath)
+        os.rename(tempPath, self.filePath)
+        self._spans = spans
+        self._stamp = self._fileStamp()
+        return self.filePath
+
+    def ToString(self):
+        return 'INXWriter::%s' % self.filePath
@@ -0,0 +1,173 @@
+"""
+Epw weather file reader.
+
+The hourly fields are the ones that Preparation.epwDataReader returns. Values are
+parsed to floats once and kept in lists of 8760 values without Ladybug headers.
+"""
+from __future__ import division
+import os
+
+from .wea import Wea
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+
+# key, epw column, Ladybug data type, unit
+FIELDS = (
+    ('year', 0, 'Year', 'Year'),
+    ('dryBulbTemperature', 6, 'Dry Bulb Temperature', 'C'),
+    ('dewPointTemperature', 7, 'Dew Point Temperature', 'C'),
+    ('relativeHumidity', 8, 'Relative Humidity', '%'),
+    ('barometricPressure', 9, 'Barometric Pressure', 'Pa'),
+    ('horizontalInfraredRadiation', 12, 'Horizontal Infrared Radiation Intensity', 'Wh/m2'),
+    ('globalHorizontalRadiation', 13, 'Global Horizontal Radiation', 'Wh/m2'),
+    ('directNormalRadiation', 14, 'Direct Normal Radiation', 'Wh/m2'),
+    ('diffuseHorizontalRadiation', 15, 'Diffuse Horizontal Radiation', 'Wh/m2'),
+    ('globalHorizontalIlluminance', 16, 'Global Horizontal Illuminance', 'lux'),
+    ('directNormalIlluminance', 17, 'Direct Normal Illuminance', 'lux'),
+    ('diffuseHorizontalIlluminance', 18, 'Diffuse Horizontal Illuminance', 'lux'),
+    ('windDirection', 20, 'Wind Direction', 'degrees'),
+    ('windSpeed', 21, 'Wind Speed', 'm/s'),
+    ('totalCloudCover', 22, 'Total Cloud Cover', 'tenth')
+    )
+
+FIELDNAMES = dict((key, (name, unit)) for key, column, name, unit in FIELDS)
+
+
+class EPW(object):
+    """Location and hourly data of an epw file.
+
+    Args:
+        locName: Location name.
+        lat, lngt: Latitude and longitude in degrees (north and east are positive).
+        timeZone: Time zone in hours.
+        elev: Elevation in meters.
+        data: A dictionary of 8760 hourly values for each field key in FIELDS.
+        filePath: Optional path to the original file.
+    """
+
+    def __init__(self, locName, lat, lngt, timeZone, elev, data, filePath=None):
+        self.locName = locName
+        self.lat = float(lat)
+        self.lngt = float(lngt)
+        self.timeZone = float(timeZone)
+        self.elev = float(elev)
+        self.data = data
+        self.filePath = filePath
+
+    @classmethod
+    def fromFile(cls, epwFile):
+        """Read an epw file."""
+        columns = [(key, column) for key, column, name, unit in FIELDS]
+        data = dict((key, []) for key, column in columns)
+        with open(epwFile, 'r') as epw:
+            headline = epw.readline().strip().split(',')
+            # remove empty cells from the end of the list if any
+            while headline:
+                try: float(headline[-1]); break
+                except ValueError: headline.pop()
+            if len(headline) < 5:
+                raise ValueError('%s is not a valid epw file.' % epwFile)
+            locName = '_'.join(h for h in headline[1:4] if h != '-')
+            lat, lngt, timeZone, elev = headline[-4:]
+            for lineCount, line in enumerate(epw):
+                # the first line is already read
+                if lineCount < 7: continue
+                values = line.split(',')
+                if len(values) < 23: continue
+                for key, column in columns:
+                    data[key].append(float(values[column]))
+
+        return cls(locName, lat, lngt, timeZone, elev, data, epwFile)
+
+    @property
+    def name(self):
+        """Location name and year without blank characters."""
+        year = self.data['year'][-1] if self.data['year'] else None
+        return self.toWea(year).name
+
+    def header(self, key, analysisPeriod=((1, 1, 1), (12, 31, 24))):
+        """Ladybug header for a field."""
+        name, unit = FIELDNAMES[key]
+        return ['key:location/dataType/units/frequency/startsAt/endsAt', self.locName,
+                name, unit, 'Hourly', analysisPeriod[0], analysisPeriod[1]]
+
+    def toWea(self, year=None):
+        """Create a Wea from the radiation values."""
+        if year is not None: year = int(year)
+        return Wea(self.locName, self.lat, self.lngt, self.timeZone, self.elev,
+                   self.data['directNormalRadiation'], self.data['diffuseHorizontalRadiation'],
+                   year)
+
+    def ToString(self):
+        return 'EPW::%s' % self.locName
+
+
+class WeatherCache(object):
+    """Cache of parsed epw files.
+
+    Parsed files are kept in memory and, if a cache folder is set, pickled to
+    the folder so other processes (and later runs) don't parse the same file
+    again. A cached file is used only if the epw file hasn't changed since.
+
+    Args:
+        cacheFolder: Optional folder for the pickled weather data.
+    """
+
+    def __init__(self, cacheFolder=None):
+        self.cacheFolder = cacheFolder
+        self._epws = {}
+
+    @staticmethod
+    def fileKey(epwFile):
+        stat = os.stat(epwFile)
+        return os.path.abspath(epwFile), stat.st_size, int(stat.st_mtime)
+
+    def cacheFile(self, key):
+        fileName = '%s_%d_%d.pkl' % (os.path.splitext(os.path.basename(key[0]))[0],
+                                     key[1], key[2])
+        return os.path.join(self.cacheFolder, fileName)
+
+    def get(self, epwFile):
+        """Return the EPW for a file path."""
+        key = self.fileKey(epwFile)
+        if key in self._epws: return self._epws[key]
+
+        epw = None
+        if self.cacheFolder:
+            cacheFile = self.cacheFile(key)
+            if os.path.isfile(cacheFile):
+                try:
+                    with open(cacheFile, 'rb') as inf:
+                        cachedKey, epw = pickle.load(inf)
+                    if cachedKey != key: epw = None
+                except Exception:
+                    epw = None
+
+        if epw is None:
+            epw = EPW.fromFile(epwFile)
+            if self.cacheFolder:
+                if not os.path.isdir(self.cacheFolder):
+                    try: os.makedirs(self.cacheFolder)
+                    except OSError:
+                        # another process made it first
+                        if not os.path.isdir(self.cacheFolder): raise
+                # write to a temporary file first so parallel readers never
+                # see a half written cache
+                tempFile = '%s.%d.tmp' % (cacheFile, os.getpid())
+                with open(tempFile, 'wb') as outf:
+                    pickle.dump((key, epw), outf, 2)
+                try:
+                    os.rename(tempFile, cacheFile)
+                except OSError:
+                    # another process was faster
+                    os.remove(tempFile)
+
+        self._epws[key] = epw
+        return epw
+
+    def clear(self):
+        self._epws = {}
@@ -0,0 +1,341 @@
+"""
+World Magnetic Model (WMM) for magnetic declination and the true north.
+
+The Gauss coefficients of a model are read and Schmidt normalized once and a
+model is evaluated for lists of sites and dates in one call. The associated
+Legendre functions only depend on the latitude and the elevation of a site and
+the sines and cosines of the longitude terms only on the longitude, so both are
+computed once per call for each distinct value. The field is linear in the
+coefficients and they change linearly with time, so the field of a site is
+evaluated once for the main and once for the secular variation coefficients and
+each date of a time series only costs a multiplication.
+
+    model = WMM.default()
+    declinations = model.declination(latitudes, longitudes, elevations, dates)
+
+    latitude, longitude: WGS84 geodetic coordinates in degrees.
+    elevation: meters above the WGS84 ellipsoid.
+    date: datetime.date, datetime.datetime or decimal year (e.g. 2016.5).
+    bx, by, bz: north, east and down components of the field in nT.
+
+Based on the geomag package of Christopher Weiss (cmweiss@gmail.com):
+https://pypi.python.org/pypi/geomag
+"""
+from __future__ import division
+import datetime
+import math
+import os
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+# WGS84 ellipsoid and the radius of the geomagnetic reference sphere in km
+A = 6378.137
+B = 6356.7523142
+RE = 6371.2
+
+# WMM2015 (2015-2020) in the format of the WMM.COF files of the NOAA
+WMM2015COF = """\
+    2015.0            WMM-2015        12/15/2014
+  1  0   -29438.5       0.0      10.7       0.0
+  1  1    -1501.1    4796.2      17.9     -26.8
+  2  0    -2445.3       0.0      -8.6       0.0
+  2  1     3012.5   -2845.6      -3.3     -27.1
+  2  2     1676.6    -642.0       2.4     -13.3
+  3  0     1351.1       0.0       3.1       0.0
+  3  1    -2352.3    -115.3      -6.2       8.4
+  3  2     1225.6     245.0      -0.4      -0.4
+  3  3      581.9    -538.3     -10.4       2.3
+  4  0      907.2       0.0      -0.4       0.0
+  4  1      813.7     283.4       0.8      -0.6
+  4  2      120.3    -188.6      -9.2       5.3
+  4  3     -335.0     180.9       4.0       3.0
+  4  4       70.3    -329.5      -4.2      -5.3
+  5  0     -232.6       0.0      -0.2       0.0
+  5  1      360.1      47.4       0.1       0.4
+  5  2      192.4     196.9      -1.4       1.6
+  5  3     -141.0    -119.4       0.0      -1.1
+  5  4     -157.4      16.1       1.3       3.3
+  5  5        4.3     100.1       3.8       0.1
+  6  0       69.5       0.0      -0.5       0.0
+  6  1       67.4     -20.7      -0.2       0.0
+  6  2       72.8      33.2      -0.6      -2.2
+  6  3     -129.8      58.8       2.4      -0.7
+  6  4      -29.0     -66.5      -1.1       0.1
+  6  5       13.2       7.3       0.3       1.0
+  6  6      -70.9      62.5       1.5       1.3
+  7  0       81.6       0.0       0.2       0.0
+  7  1      -76.1     -54.1      -0.2       0.7
+  7  2       -6.8     -19.4      -0.4       0.5
+  7  3       51.9       5.6       1.3      -0.2
+  7  4       15.0      24.4       0.2      -0.1
+  7  5        9.3       3.3      -0.4      -0.7
+  7  6       -2.8     -27.5      -0.9       0.1
+  7  7        6.7      -2.3       0.3       0.1
+  8  0       24.0       0.0       0.0       0.0
+  8  1        8.6      10.2       0.1      -0.3
+  8  2      -16.9     -18.1      -0.5       0.3
+  8  3       -3.2      13.2       0.5       0.3
+  8  4      -20.6     -14.6      -0.2       0.6
+  8  5       13.3      16.2       0.4      -0.1
+  8  6       11.7       5.7       0.2      -0.2
+  8  7      -16.0      -9.1      -0.4       0.3
+  8  8       -2.0       2.2       0.3       0.0
+  9  0        5.4       0.0       0.0       0.0
+  9  1        8.8     -21.6      -0.1      -0.2
+  9  2        3.1      10.8      -0.1      -0.1
+  9  3       -3.1      11.7       0.4      -0.2
+  9  4        0.6      -6.8      -0.5       0.1
+  9  5      -13.3      -6.9      -0.2       0.1
+  9  6       -0.1       7.8       0.1       0.0
+  9  7        8.7       1.0       0.0      -0.2
+  9  8       -9.1      -3.9      -0.2       0.4
+  9  9      -10.5       8.5      -0.1       0.3
+ 10  0       -1.9       0.0       0.0       0.0
+ 10  1       -6.5       3.3       0.0       0.1
+ 10  2        0.2      -0.3      -0.1      -0.1
+ 10  3        0.6       4.6       0.3       0.0
+ 10  4       -0.6       4.4      -0.1       0.0
+ 10  5        1.7      -7.9      -0.1      -0.2
+ 10  6       -0.7      -0.6      -0.1       0.1
+ 10  7        2.1      -4.1       0.0      -0.1
+ 10  8        2.3      -2.8      -0.2      -0.2
+ 10  9       -1.8      -1.1      -0.1       0.1
+ 10 10       -3.6      -8.7      -0.2      -0.1
+ 11  0        3.1       0.0       0.0       0.0
+ 11  1       -1.5      -0.1       0.0       0.0
+ 11  2       -2.3       2.1      -0.1       0.1
+ 11  3        2.1      -0.7       0.1       0.0
+ 11  4       -0.9      -1.1       0.0       0.1
+ 11  5        0.6       0.7       0.0       0.0
+ 11  6       -0.7      -0.2       0.0       0.0
+ 11  7        0.2      -2.1       0.0       0.1
+ 11  8        1.7      -1.5       0.0       0.0
+ 11  9       -0.2      -2.5       0.0      -0.1
+ 11 10        0.4      -2.0      -0.1       0.0
+ 11 11        3.5      -2.3      -0.1      -0.1
+ 12  0       -2.0       0.0       0.1       0.0
+ 12  1       -0.3      -1.0       0.0       0.0
+ 12  2        0.4       0.5       0.0       0.0
+ 12  3        1.3       1.8       0.1      -0.1
+ 12  4       -0.9      -2.2      -0.1       0.0
+ 12  5        0.9       0.3       0.0       0.0
+ 12  6        0.1       0.7       0.1       0.0
+ 12  7        0.5      -0.1       0.0       0.0
+ 12  8       -0.4       0.3       0.0       0.0
+ 12  9       -0.4       0.2       0.0       0.0
+ 12 10        0.2      -0.9       0.0       0.0
+ 12 11       -0.9      -0.2       0.0       0.0
+ 12 12        0.0       0.7       0.0       0.0
+"""
+
+
+def decimalYear(date):
+    """Decimal year of a datetime.date, a datetime.datetime or a number."""
+    if isinstance(date, datetime.datetime):
+        seconds = (date - datetime.datetime(date.year, 1, 1)).total_seconds()
+        return date.year + seconds / 86400 / 365.0
+    if isinstance(date, datetime.date):
+        return date.year + (date - datetime.date(date.year, 1, 1)).days / 365.0
+    return float(date)
+
+
+def parseCof(lines):
+    """(epoch, name, [(n, m, gnm, hnm, dgnm, dhnm), ...]) of the lines of a WMM.COF file."""
+    epoch = name = None
+    terms = []
+    for line in lines:
+        values = line.strip().split()
+        if len(values) == 3 and epoch is None:
+            epoch, name = float(values[0]), values[1]
+        elif len(values) == 6:
+            terms.append((int(float(values[0])), int(float(values[1]))) +
+                         tuple(float(v) for v in values[2:]))
+    if epoch is None or not terms: raise ValueError('Not a WMM.COF file.')
+    return epoch, name, terms
+
+
+def _broadcast(*values):
+    """Lists of the same length of numbers and lists. Numbers and lists of one item are repeated."""
+    lists = [list(v) if isinstance(v, (list, tuple)) else [v] for v in values]
+    count = max(len(v) for v in lists)
+    if any(len(v) not in (1, count) for v in lists):
+        raise ValueError('Input lists have different lengths.')
+    return [v * count if len(v) == 1 else v for v in lists]
+
+
+class WMM(object):
+    """Spherical harmonic model of the main geomagnetic field.
+
+    Args:
+        epoch: Decimal year of the coefficients.
+        terms: List of (n, m, gnm, hnm, dgnm, dhnm) Gauss coefficients in nT
+            and their secular variation in nT/year.
+        name: Name of the model.
+    """
+
+    _loaded = {}
+
+    def __init__(self, epoch, terms, name='WMM'):
+        self.epoch = epoch
+        self.name = name
+        self.maxOrder = max(term[0] for term in terms)
+        size = self.maxOrder + 1
+        # Schmidt normalization factors and recursion constants, indexed [n][m]
+        snorm = [[0.0] * size for n in range(size)]
+        self.k = k = [[0.0] * size for n in range(size)]
+        snorm[0][0] = 1.0
+        for n in range(1, size):
+            snorm[n][0] = snorm[n - 1][0] * (2.0 * n - 1) / n
+            j = 2.0
+            for m in range(n + 1):
+                k[n][m] = ((n - 1) * (n - 1) - m * m) / ((2.0 * n - 1) * (2.0 * n - 3.0))
+                if m > 0:
+                    snorm[n][m] = snorm[n][m - 1] * math.sqrt((n - m + 1.0) * j / (n + m))
+                    j = 1.0
+        # normalized coefficients and their secular variation
+        self.g, self.h, self.dg, self.dh = [[[0.0] * size for n in range(size)] for i in range(4)]
+        for n, m, gnm, hnm, dgnm, dhnm in terms:
+            if m > n: continue
+            self.g[n][m] = snorm[n][m] * gnm
+            self.dg[n][m] = snorm[n][m] * dgnm
+            if m != 0:
+                self.h[n][m] = snorm[n][m] * hnm
+                self.dh[n][m] = snorm[n][m] * dhnm
+
+    @classmethod
+    def fromCof(cls, filePath):
+        """Model of a WMM.COF file. Files are read once until they change."""
+        stat = os.stat(filePath)
+        key = os.path.abspath(filePath), stat.st_size, int(stat.st_mtime)
+        model = cls._loaded.get(key)
+        if model is None:
+            with open(filePath, 'r') as inf:
+                epoch, name, terms = parseCof(inf)
+            model = cls._loaded[key] = cls(epoch, terms, name)
+        return model
+
+    @classmethod
+    def default(cls):
+        """WMM2015 model (2015-2020)."""
+        model = cls._loaded.get('WMM2015')
+        if model is None:
+            epoch, name, terms = parseCof(WMM2015COF.splitlines())
+            model = cls._loaded['WMM2015'] = cls(epoch, terms, name)
+        return model
+
+    def _legendre(self, latitude, elevation):
+        """Spherical position and Legendre functions of a geodetic latitude and elevation."""
+        alt = elevation / 1000
+        rlat = math.radians(latitude)
+        srlat, crlat = math.sin(rlat), math.cos(rlat)
+        srlat2, crlat2 = srlat * srlat, crlat * crlat
+        a2, b2 = A * A, B * B
+        c2, c4 = a2 - b2, a2 * a2 - b2 * b2
+        # geodetic to spherical coordinates
+        q = math.sqrt(a2 - c2 * srlat2)
+        q1 = alt * q
+        q2 = ((q1 + a2) / (q1 + b2)) * ((q1 + a2) / (q1 + b2))
+        ct = srlat / math.sqrt(q2 * crlat2 + srlat2)
+        st = math.sqrt(1.0 - ct * ct)
+        r = math.sqrt(alt * alt + 2.0 * q1 + (a2 * a2 - c4 * srlat2) / (q * q))
+        d = math.sqrt(a2 * crlat2 + b2 * srlat2)
+        ca = (alt + d) / r
+        sa = c2 * crlat * srlat / (r * d)
+
+        # unnormalized associated Legendre functions and their derivatives, indexed [n][m]
+        k = self.k
+        size = self.maxOrder + 1
+        p = [[0.0] * size for n in range(size)]
+        dp = [[0.0] * size for n in range(size)]
+        p[0][0] = 1.0
+        for n in range(1, size):
+            pn, dpn, pn1, dpn1 = p[n], dp[n], p[n - 1], dp[n - 1]
+            # p[n - 2][n - 1] is zero and so is the row before n = 1
+            pn2, dpn2 = (p[n - 2], dp[n - 2]) if n > 1 else (pn, dpn)
+            for m in range(n):
+                pn[m] = ct * pn1[m] - k[n][m] * pn2[m]
+                dpn[m] = ct * dpn1[m] - st * pn1[m] - k[n][m] * dpn2[m]
+            pn[n] = st * pn1[n - 1]
+            dpn[n] = st * dpn1[n - 1] + ct * pn1[n - 1]
+        # at the geographic poles the east component is the limit of the m = 1 terms
+        pp = None
+        if st == 0.0:
+            pp = [1.0] * size
+            for n in range(2, size):
+                pp[n] = ct * pp[n - 1] - k[n][1] * pp[n - 2]
+        return RE / r, p, dp, pp, st, ca, sa
+
+    def _longitude(self, longitude):
+        """sin(m * lon) and cos(m * lon) of each order m."""
+        rlon = math.radians(longitude)
+        orders = range(self.maxOrder + 1)
+        return [math.sin(m * rlon) for m in orders], [math.cos(m * rlon) for m in orders]
+
+    def _siteField(self, legendre, trig):
+        """(bx, by, bz) of the main coefficients and of their secular variation."""
+        aor, p, dp, pp, st, ca, sa = legendre
+        sp, cp = trig
+        field = []
+        for g, h in ((self.g, self.h), (self.dg, self.dh)):
+            ar = aor * aor
+            br = bt = bp = bpp = 0.0
+            for n in range(1, self.maxOrder + 1):
+                ar *= aor
+                gn, hn, pn, dpn = g[n], h[n], p[n], dp[n]
+                for m in range(n + 1):
+                    temp1 = gn[m] * cp[m] + hn[m] * sp[m]
+                    temp2 = gn[m] * sp[m] - hn[m] * cp[m]
+                    par = ar * pn[m]
+                    bt -= ar * temp1 * dpn[m]
+                    bp += m * temp2 * par
+                    br += (n + 1) * temp1 * par
+                if pp is not None:
+                    bpp += (gn[1] * sp[1] - hn[1] * cp[1]) * ar * pp[n]
+            bp = bpp if pp is not None else bp / st
+            # spherical to geodetic components
+            field.append((-bt * ca - br * sa, bp, bt * sa - br * ca))
+        return field
+
+    def field(self, latitudes, longitudes, elevations=0, dates=None):
+        """Magnetic field of lists of sites and dates.
+
+        Args:
+            latitudes, longitudes, elevations, dates: Numbers or lists of the
+                same length. Numbers and lists of one item are used for all
+                the items of the other lists. Default date is today.
+
+        Returns:
+            A (declination, inclination, totalIntensity, bx, by, bz) tuple for
+            each item. Angles in degrees and the field in nT.
+        """
+        if dates is None: dates = datetime.date.today()
+        if isinstance(dates, (list, tuple)): dates = [decimalYear(date) for date in dates]
+        else: dates = decimalYear(dates)
+        latitudes, longitudes, elevations, dates = _broadcast(latitudes, longitudes, elevations, dates)
+
+        legendres, trigs, sites = {}, {}, {}
+        results = []
+        for lat, lon, elevation, time in zip(latitudes, longitudes, elevations, dates):
+            site = lat, lon, elevation
+            if site not in sites:
+                if (lat, elevation) not in legendres: legendres[lat, elevation] = self._legendre(lat, elevation)
+                if lon not in trigs: trigs[lon] = self._longitude(lon)
+                sites[site] = self._siteField(legendres[lat, elevation], trigs[lon])
+            (x0, y0, z0), (x1, y1, z1) = sites[site]
+            dt = time - self.epoch
+            bx, by, bz = x0 + dt * x1, y0 + dt * y1, z0 + dt * z1
+            bh = math.sqrt(bx * bx + by * by)
+            results.append((math.degrees(math.atan2(by, bx)), math.degrees(math.atan2(bz, bh)),
+                            math.sqrt(bh * bh + bz * bz), bx, by, bz))
+        return results
+
+    def declination(self, latitudes, longitudes, elevations=0, dates=None):
+        """Magnetic declination in degrees of lists of sites and dates. Positive east of true north."""
+        return [values[0] for values in self.field(latitudes, longitudes, elevations, dates)]
+
+    def ToString(self):
+        return 'WMM::%s %s' % (self.name, self.epoch)
@@ -0,0 +1,115 @@
+"""
+Hourly irradiance of analysis faces.
+
+The visibility of the sky patches from each analysis face is calculated once
+(e.g. the intersection matrix of RunAnalysisInsideGH.parallel_radCalculator).
+Hourly irradiance for a whole period is then the product of the visibility-cosine
+matrix (faces x patches) and an hourly sky matrix (patches x hours) instead of
+walking the sky and the intersection dictionaries for every hour.
+
+When only a weighted sum of the faces is needed (e.g. the radiation that falls on
+a mannequin) the faces are reduced to a single row of patch weights first so
+every hour is one dot product with the patch values.
+"""
+from __future__ import division
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+def hourlySkyMatrix(daylightMtxDict, hoys):
+    """Total radiation (diffuse + direct) of each sky patch for a list of HOYs.
+
+    Args:
+        daylightMtxDict: {patch: {HOY: [diffuse, direct]}} as in SkyMatrix.toDict
+            and the cumulative sky matrix components.
+        hoys: List of 1-based hours of the year.
+    Returns:
+        A list of hourly values for each patch (patches x hours).
+    """
+    matrix = []
+    for patch in sorted(daylightMtxDict):
+        patchValues = daylightMtxDict[patch]
+        matrix.append([v[0] + v[1] for v in (patchValues[hoy] for hoy in hoys)])
+    return matrix
+
+
+class IrradianceMatrix(object):
+    """Visibility-cosine matrix of analysis faces and sky patches.
+
+    Only the visible patches of each face are stored.
+
+    Args:
+        rows: A (patchIndices, factors) tuple for each face where factors are
+            the cosines of the angles between the face normal and the patches.
+        patchCount: Number of sky patches.
+    """
+
+    def __init__(self, rows, patchCount):
+        self.rows = rows
+        self.patchCount = patchCount
+
+    @classmethod
+    def fromIntersectionMatrix(cls, intersectionMtx):
+        """Create the matrix from {face: {patch: {'isIntersect', 'vecAngle'}}}.
+
+        A patch is visible if isIntersect is not 0.
+        """
+        rows = []
+        patchCount = 0
+        for face in sorted(intersectionMtx):
+            patches = intersectionMtx[face]
+            patchCount = max(patchCount, len(patches))
+            indices = [patch for patch in sorted(patches) if patches[patch]['isIntersect']]
+            rows.append((indices, [math.cos(patches[patch]['vecAngle']) for patch in indices]))
+        return cls(rows, patchCount)
+
+    @property
+    def faceCount(self):
+        return len(self.rows)
+
+    def skyViews(self):
+        """Fraction of the sky patches that each face sees."""
+        return [len(indices) / self.patchCount for indices, factors in self.rows]
+
+    def patchWeights(self, weights):
+        """Reduce the faces to one row of patch factors (weights x matrix)."""
+        patchWeights = [0] * self.patchCount
+        for weight, (indices, factors) in zip(weights, self.rows):
+            if not weight: continue
+            for patch, factor in zip(indices, factors):
+                patchWeights[patch] += weight * factor
+        return patchWeights
+
+    def irradiance(self, skyMatrix):
+        """Hourly irradiance of each face (faces x hours).
+
+        Args:
+            skyMatrix: Hourly values of each patch (patches x hours).
+        """
+        hourCount = len(skyMatrix[0]) if skyMatrix else 0
+        results = []
+        for indices, factors in self.rows:
+            values = [0] * hourCount
+            for patch, factor in zip(indices, factors):
+                values = [v + factor * s for v, s in zip(values, skyMatrix[patch])]
+            results.append(values)
+        return results
+
+    def weightedIrradiance(self, weights, skyMatrix):
+        """Hourly sum of the irradiance of the faces multiplied by weights (e.g. face areas)."""
+        hourCount = len(skyMatrix[0]) if skyMatrix else 0
+        values = [0] * hourCount
+        for weight, patchValues in zip(self.patchWeights(weights), skyMatrix):
+            if weight:
+                values = [v + weight * s for v, s in zip(values, patchValues)]
+        return values
+
+    # sky matrix for the hours of a study
+    hourlySkyMatrix = staticmethod(hourlySkyMatrix)
+
+    def ToString(self):
+        return 'IrradianceMatrix::%d faces x %d patches' % (self.faceCount, self.patchCount)
@@ -0,0 +1,134 @@
+"""
+Isolines of scalar values on meshes.
+
+All the contour levels are extracted with marching triangles in one pass over
+the faces. Each triangle only visits the levels between its lowest and highest
+value, the crossing points are interpolated on the triangle edges and the
+segments are stitched into polylines through the edges they share.
+
+    vertices: List of (x, y, z) tuples.
+    faces: List of vertex index tuples. Faces have 3 or 4 indices. Rhino
+        triangles have 4 indices with the same third and fourth index.
+    values: One value for each vertex (e.g. the Z coordinate of a lifted mesh).
+"""
+from __future__ import division
+from bisect import bisect_right
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+def triangles(faces):
+    """Vertex indices of the triangles of the faces. Quads are split along the first diagonal."""
+    tris = []
+    for face in faces:
+        if len(face) == 3 or face[2] == face[3]:
+            tris.append((face[0], face[1], face[2]))
+        else:
+            tris.append((face[0], face[1], face[2]))
+            tris.append((face[0], face[2], face[3]))
+    return tris
+
+
+def vertexValues(faceValues, faces, vertexCount):
+    """Value of each vertex as the average of the values of the faces around it."""
+    sums = [0] * vertexCount
+    counts = [0] * vertexCount
+    for value, face in zip(faceValues, faces):
+        for i in set(face):
+            sums[i] += value
+            counts[i] += 1
+    return [s / c if c else 0 for s, c in zip(sums, counts)]
+
+
+def contourLevels(start, interval, count):
+    """count + 1 levels from start that are interval apart."""
+    return [start + i * interval for i in range(count + 1)]
+
+
+def _stitch(adjacency, keys):
+    # walk the segments from the open ends first and then around the loops
+    lines = []
+
+    def walk(start):
+        line = [start]
+        current = start
+        while adjacency[current]:
+            following = adjacency[current].pop()
+            adjacency[following].remove(current)
+            line.append(following)
+            current = following
+            if current == start: break
+        return line
+
+    for key in keys:
+        if len(adjacency[key]) % 2: lines.append(walk(key))
+    for key in keys:
+        while adjacency[key]: lines.append(walk(key))
+    return lines
+
+
+def isolines(vertices, faces, values, levels):
+    """Polylines of each level.
+
+    A vertex that is exactly on a level counts as above it so lines that go
+    through vertices stay connected.
+
+    Returns:
+        A list of polylines for each level. Polylines are lists of (x, y, z)
+        tuples and closed polylines end with their first point.
+    """
+    order = sorted(range(len(levels)), key=lambda i: levels[i])
+    sortedLevels = [levels[i] for i in order]
+    points = [{} for level in levels]
+    adjacency = [{} for level in levels]
+    keys = [[] for level in levels]
+
+    def crossing(k, level, below, above):
+        # key of the crossing point on the edge from a vertex below the level to
+        # a vertex above it
+        va, vb = values[below], values[above]
+        if vb == level: key = above
+        else: key = (below, above) if below < above else (above, below)
+        levelPoints = points[k]
+        if key not in levelPoints:
+            pa, pb = vertices[below], vertices[above]
+            t = (level - va) / (vb - va)
+            levelPoints[key] = (pa[0] + t * (pb[0] - pa[0]), pa[1] + t * (pb[1] - pa[1]),
+                                pa[2] + t * (pb[2] - pa[2]))
+            adjacency[k][key] = []
+            keys[k].append(key)
+        return key
+
+    for a, b, c in triangles(faces):
+        # sort the corners so va <= vb <= vc
+        va, vb, vc = values[a], values[b], values[c]
+        if va > vb: a, b, va, vb = b, a, vb, va
+        if vb > vc: b, c, vb, vc = c, b, vc, vb
+        if va > vb: a, b, va, vb = b, a, vb, va
+        # levels with va < level <= vc cross the triangle
+        for s in range(bisect_right(sortedLevels, va), bisect_right(sortedLevels, vc)):
+            level = sortedLevels[s]
+            k = order[s]
+            if level <= vb:
+                start = crossing(k, level, a, b)
+                end = crossing(k, level, a, c)
+            else:
+                start = crossing(k, level, a, c)
+                end = crossing(k, level, b, c)
+            if start == end or end in adjacency[k][start]: continue
+            adjacency[k][start].append(end)
+            adjacency[k][end].append(start)
+
+    return [[[points[k][key] for key in line] for line in _stitch(adjacency[k], keys[k])]
+            for k in range(len(levels))]
+
+
+def meshIsolines(vertices, faces, faceValues, levels):
+    """Polylines of each level for a mesh with one value per face.
+
+    The vertices get the average value of the faces around them.
+    """
+    return isolines(vertices, faces, vertexValues(faceValues, faces, len(vertices)), levels)
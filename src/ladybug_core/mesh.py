@@ -0,0 +1,102 @@
+"""
+Mesh analysis.
+
+Face centers, normals, areas and test points are calculated from a list of
+vertices and a list of faces so analysis grids can be prepared outside of Rhino.
+
+    vertices: List of (x, y, z) tuples.
+    faces: List of vertex index tuples. Faces have 3 or 4 indices. Rhino
+        triangles have 4 indices with the same third and fourth index.
+
+MeshPreparation.meshArrays converts a Rhino mesh to these lists.
+"""
+from __future__ import division
+import math
+
+
+def vertexTuples(coordinates):
+    """(x, y, z) tuples from a flat list of coordinates (e.g. Mesh.Vertices.ToFloatArray())."""
+    coordinates = list(coordinates)
+    return list(zip(coordinates[0::3], coordinates[1::3], coordinates[2::3]))
+
+
+def _triangleArea(a, b, c):
+    abx, aby, abz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+    acx, acy, acz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+    x = aby * acz - abz * acy
+    y = abz * acx - abx * acz
+    z = abx * acy - aby * acx
+    return math.sqrt(x * x + y * y + z * z) / 2
+
+
+def faceProperties(vertices, faces):
+    """Center, unit normal and area of each face.
+
+    Centers are the average of the face vertices and normals follow Rhino's
+    face normals (the cross product of the diagonals for quads). Quads are
+    split into two triangles along the shorter diagonal to calculate the area
+    so non-planar faces get the same area as Rhino's mesh faces.
+
+    Returns:
+        centers: List of (x, y, z) tuples.
+        normals: List of (x, y, z) unit vectors. Degenerated faces get (0, 0, 0).
+        areas: List of face areas.
+    """
+    centers, normals, areas = [], [], []
+    for face in faces:
+        a, b, c = vertices[face[0]], vertices[face[1]], vertices[face[2]]
+        if len(face) == 3 or face[2] == face[3]:
+            centers.append(((a[0] + b[0] + c[0]) / 3, (a[1] + b[1] + c[1]) / 3,
+                            (a[2] + b[2] + c[2]) / 3))
+            ux, uy, uz = b[0] - a[0], b[1] - a[1], b[2] - a[2]
+            vx, vy, vz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+            x, y, z = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+            length = math.sqrt(x * x + y * y + z * z)
+            areas.append(length / 2)
+        else:
+            d = vertices[face[3]]
+            centers.append(((a[0] + b[0] + c[0] + d[0]) / 4, (a[1] + b[1] + c[1] + d[1]) / 4,
+                            (a[2] + b[2] + c[2] + d[2]) / 4))
+            # diagonals
+            ux, uy, uz = c[0] - a[0], c[1] - a[1], c[2] - a[2]
+            vx, vy, vz = d[0] - b[0], d[1] - b[1], d[2] - b[2]
+            x, y, z = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+            length = math.sqrt(x * x + y * y + z * z)
+            if ux * ux + uy * uy + uz * uz > vx * vx + vy * vy + vz * vz:
+                areas.append(_triangleArea(d, a, b) + _triangleArea(d, b, c))
+            else:
+                areas.append(_triangleArea(a, b, c) + _triangleArea(a, c, d))
+
+        if length: normals.append((x / length, y / length, z / length))
+        else: normals.append((0, 0, 0))
+
+    return centers, normals, areas
+
+
+def faceAreas(vertices, faces):
+    """Area of each face."""
+    return faceProperties(vertices, faces)[2]
+
+
+def offsetPoints(points, normals, distance):
+    """Move each point along its normal."""
+    if not distance: return list(points)
+    return [(p[0] + distance * n[0], p[1] + distance * n[1], p[2] + distance * n[2])
+            for p, n in zip(points, normals)]
+
+
+def meshTestPoints(vertices, faces, distance=0):
+    """Test points for each face of a mesh.
+
+    Args:
+        vertices: List of (x, y, z) tuples.
+        faces: List of vertex index tuples.
+        distance: Distance of the test points from the face centers along the
+            face normals.
+    Returns:
+        points: List of (x, y, z) test points.
+        normals: List of (x, y, z) unit normals.
+        areas: List of face areas.
+    """
+    centers, normals, areas = faceProperties(vertices, faces)
+    return offsetPoints(centers, normals, distance), normals, areas
@@ -0,0 +1,1029 @@
+"""
+Photovoltaics and solar water heating.
+
+NREL sun position, plane of array irradiance, PVWatts, solar water heating and
+the World Magnetic Model (WMM, see geomag) used to find the true north.
+"""
+from __future__ import division, print_function
+import math
+
+
+def celsiusToFahrenheit(C):
+    return (C*9/5)+32
+
+def fahrenheitToCelsius(F):
+    return (5/9)*(F-32)
+
+def monthOfHour(hoy):
+    # 0-based month for an hour of the year (1-8760)
+    numOfHours = [744, 1416, 2160, 2880, 3624, 4344, 5088, 5832, 6552, 7296, 8016, 8760]
+    for month, lastHour in enumerate(numOfHours):
+        if hoy <= lastHour: return month
+    return 11
+
+
+class Photovoltaics(object):
+    """ Set of methods for Photovoltaics and Solar Water Heating analysis """
+    def deconstruct_PVmoduleSettings(self, PVmoduleSettings):
+        # deconstruct "PVmoduleSettings" input
+        
+        if (len(PVmoduleSettings) == 36):
+            # "PVmoduleSettings" generated by "Import Sandia Photovoltaics Module" component
+            moduleModelName = "Sandia"
+            moduleName = PVmoduleSettings[0]
+            material = PVmoduleSettings[1]
+            moduleMountType = PVmoduleSettings[2]
+            moduleAreaM = PVmoduleSettings[3]
+            moduleActiveAreaPercent = PVmoduleSettings[4]
+            nameplateDCpowerRating_m = PVmoduleSettings[5]
+            moduleEfficiency = PVmoduleSettings[6]
+            Vmp_ref = PVmoduleSettings[7]
+            Imp_ref = PVmoduleSettings[8]
+            Voc_ref = PVmoduleSettings[9]
+            Isc_ref = PVmoduleSettings[10]
+            alpha_sc_ref = PVmoduleSettings[11]
+            beta_oc_ref = PVmoduleSettings[12]
+            beta_mp_ref = PVmoduleSettings[13]
+            mu_betamp = PVmoduleSettings[14]
+            s = PVmoduleSettings[15]
+            n = PVmoduleSettings[16]
+            Fd = PVmoduleSettings[17]
+            a0 = PVmoduleSettings[18]
+            a1 = PVmoduleSettings[19]
+            a2 = PVmoduleSettings[20]
+            a3 = PVmoduleSettings[21]
+            a4 = PVmoduleSettings[22]
+            b0 = PVmoduleSettings[23]
+            b1 = PVmoduleSettings[24]
+            b2 = PVmoduleSettings[25]
+            b3 = PVmoduleSettings[26]
+            b4 = PVmoduleSettings[27]
+            b5 = PVmoduleSettings[28]
+            C0 = PVmoduleSettings[29]
+            C1 = PVmoduleSettings[30]
+            C2 = PVmoduleSettings[31]
+            C3 = PVmoduleSettings[32]
+            a = PVmoduleSettings[33]
+            b = PVmoduleSettings[34]
+            deltaT = PVmoduleSettings[35]
+            
+            return moduleModelName, moduleName, material, moduleMountType, moduleAreaM, moduleActiveAreaPercent, nameplateDCpowerRating_m, moduleEfficiency, Vmp_ref, Imp_ref, Voc_ref, Isc_ref, alpha_sc_ref, beta_oc_ref, beta_mp_ref, mu_betamp, s, n, Fd, a0, a1, a2, a3, a4, b0, b1, b2, b3, b4, b5, C0, C1, C2, C3, a, b, deltaT
+        
+        elif (len(PVmoduleSettings) == 23):
+            # "PVmoduleSettings" generated by "Import CEC Photovoltaics Module" component
+            moduleModelName = "CEC"
+            moduleName = PVmoduleSettings[0]
+            material = PVmoduleSettings[1]
+            moduleMountType = PVmoduleSettings[2]
+            moduleAreaM = PVmoduleSettings[3]
+            moduleActiveAreaPercent = PVmoduleSettings[4]
+            nameplateDCpowerRating_m = PVmoduleSettings[5]
+            moduleEfficiency = PVmoduleSettings[6]
+            Vmp_ref = PVmoduleSettings[7]
+            Imp_ref = PVmoduleSettings[8]
+            Voc_ref = PVmoduleSettings[9]
+            Isc_ref = PVmoduleSettings[10]
+            alpha_sc_ref = PVmoduleSettings[11]
+            beta_oc_ref = PVmoduleSettings[12]
+            IL_ref = PVmoduleSettings[13]
+            Io_ref = PVmoduleSettings[14]
+            Rs_ref = PVmoduleSettings[15]
+            Rsh_ref = PVmoduleSettings[16]
+            A_ref = PVmoduleSettings[17]
+            n_s = PVmoduleSettings[18]
+            adjust = PVmoduleSettings[19]
+            gamma_r_ref = PVmoduleSettings[20]
+            ws_adjusted_factor = PVmoduleSettings[21]
+            Tnoct_adj = PVmoduleSettings[22]
+            
+            return moduleModelName, moduleName, material, moduleMountType, moduleAreaM, moduleActiveAreaPercent, nameplateDCpowerRating_m, moduleEfficiency, Vmp_ref, Imp_ref, Voc_ref, Isc_ref, alpha_sc_ref, beta_oc_ref, IL_ref, Io_ref, Rs_ref, Rsh_ref, A_ref, n_s, adjust, gamma_r_ref, ws_adjusted_factor, Tnoct_adj
+        
+        elif (len(PVmoduleSettings) == 9):
+            # "PVmoduleSettings" generated by "Simplified Photovoltaics Module" component
+            moduleModelName = "PVFORM"
+            mountTypeName = PVmoduleSettings[0]
+            moduleMaterial = PVmoduleSettings[1]
+            mountType = PVmoduleSettings[2]
+            moduleActiveAreaPercent = PVmoduleSettings[3]  # in percent
+            moduleEfficiency = PVmoduleSettings[4]  # in percent
+            temperatureCoefficientPercent = PVmoduleSettings[5]  # in percent
+            temperatureCoefficientFraction = temperatureCoefficientPercent/100  # unitless
+            a = PVmoduleSettings[6]
+            b = PVmoduleSettings[7]
+            deltaT = PVmoduleSettings[8]
+            
+            return moduleModelName, mountTypeName, moduleMaterial, mountType, moduleActiveAreaPercent, moduleEfficiency, temperatureCoefficientFraction, a, b, deltaT
+        
+        elif (len(PVmoduleSettings) == 0):
+            # "PVmoduleSettings_" input in any component is empty
+            # use the following default values:
+            moduleModelName = "PVFORM"
+            mountTypeName = "close roof mount"  # Glass/cell/glass (moduleType_ = 1)
+            moduleMaterial = "c-Si"  # mono and poly crystalline silicon
+            mountType = 1
+            moduleActiveAreaPercent = 90  # default value in %
+            moduleEfficiency = 15  # for crystalline silicon
+            temperatureCoefficientPercent = -0.5  # in %, for crystalline silicon
+            temperatureCoefficientFraction = temperatureCoefficientPercent/100  # unitless
+            # temperature and wind coefficients for moduleType_ = 1:
+            a = -2.98
+            b = -0.0471
+            deltaT = 1
+            
+            return moduleModelName, mountTypeName, moduleMaterial, mountType, moduleActiveAreaPercent, moduleEfficiency, temperatureCoefficientFraction, a, b, deltaT
+
+
+    def w0(self, z):
+        # Lambert W function using Newton's method
+        w = z
+        while True:
+            ew = math.exp(w)
+            wNew = w - (w * math.exp(w) - z) / (ew + (w * ew))
+            if abs(w - wNew) <= 0.00000001: break
+            w = wNew
+        return w
+
+
+    def noLeavesPeriod(self, criteria, latitude, sunWindowQuadrantIndex, leaflessStartHOY=None, leaflessEndHOY=None):
+        if criteria == "perQuadrant":
+            if latitude > 0:  # northern hemisphere
+                if sunWindowQuadrantIndex < 72:
+                    seasonIndex = 0  # winter/autumn
+                elif sunWindowQuadrantIndex >= 72:
+                    seasonIndex = 1  # spring/summer
+            elif latitude < 0:  # southern hemisphere
+                if sunWindowQuadrantIndex < 72:
+                    seasonIndex = 1  # spring/summer
+                elif sunWindowQuadrantIndex >= 72:
+                    seasonIndex = 0  # winter/autumn
+        elif criteria == "perHoy":
+            if leaflessStartHOY < leaflessEndHOY:
+                if (sunWindowQuadrantIndex >= leaflessStartHOY) and (sunWindowQuadrantIndex <= leaflessEndHOY):
+                    seasonIndex = 0  # leafless period
+                else:
+                    seasonIndex = 1  # inleaf period
+            elif leaflessStartHOY > leaflessEndHOY:
+                if (sunWindowQuadrantIndex >= leaflessStartHOY) or (sunWindowQuadrantIndex <= leaflessEndHOY):
+                    seasonIndex = 0  # leafless period
+                else:
+                    seasonIndex = 1  # inleaf period
+        
+        return seasonIndex
+
+
+    def NRELsunPosition(self, latitude, longitude, timeZone, year, month, day, hour):
+        # sunZenith, sunAzimuth, sunAltitude angles
+        # based on Michalsky (1988), modified to calculate sun azimuth angles for locations south of the equator using the approach described in (Iqbal, 1983)
+        min = 30
+        
+        # leap year
+        if year%4 == 0:
+            k = 1
+        else:
+            k = 0
+        
+        numOfDays = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+        jdoy = int(numOfDays[int(month)-1] + int(day))
+        
+        # julian day of year
+        if month > 2:
+            jdoy = jdoy + k
+        
+        # current decimal time of day in UTC
+        tutc = hour + min/60.0 - timeZone
+        
+        if tutc < 0:
+            tutc = tutc + 24
+            jdoy = jdoy - 1
+        elif tutc > 24:
+            tutc = tutc - 24
+            jdoy = jdoy + 1
+        
+        julian = 32916.5 + 365*(year-1949) + int((year-1949)/4) + jdoy + (tutc/24) - 51545
+        
+        mnlong = 280.46 + 0.9856474*julian  # in degrees
+        mnlong = mnlong - 360*int(mnlong/360)
+        
+        if (mnlong < 0):
+            mnlong = (mnlong+360)
+        
+        mnanom = (357.528 + 0.9856003*julian)
+        mnanom = mnanom - 360*int(mnanom/360)
+        
+        if (mnanom < 0):
+            mnanom = (mnanom+360)
+        mnanom = mnanom*(math.pi/180)  # in radians
+        
+        eclong = (mnlong + 1.915*math.sin(mnanom) + 0.02 * math.sin(2*mnanom))
+        eclong = eclong - 360*int(eclong/360)
+        
+        if (eclong < 0):
+            eclong = (eclong+360)
+        eclong = eclong*(math.pi/180)
+        
+        obleq = (math.pi/180)*(23.439 - 0.0000004*julian)
+        
+        if (math.cos(eclong) < 0):
+            ra = math.atan(((math.cos(obleq)*math.sin(eclong))/math.cos(eclong))) + math.pi
+        elif (math.cos(obleq)*math.sin(eclong) < 0):
+            ra = math.atan(((math.cos(obleq)*math.sin(eclong))/math.cos(eclong))) + 2*math.pi
+        else:
+            ra = math.atan(((math.cos(obleq)*math.sin(eclong))/math.cos(eclong)))
+        
+        beta = math.asin(math.sin(obleq)*math.sin(eclong))   # in radians
+        
+        
+        # perform check and adjustment for sunrise or sunset
+        sunrise_a = -math.tan((math.pi/180)*latitude)*math.tan(beta)
+        if sunrise_a >= 1:
+            sunrise_HAR = 0
+        elif sunrise_a <=-1:
+            sunrise_HAR = math.pi
+        else:
+            sunrise_HAR = math.acos(sunrise_a)
+        
+        sunrise_a = (1/15.0)*(mnlong - (180/math.pi)*ra)
+        if sunrise_a < -0.33:
+            sunrise_EOT = sunrise_a+24
+        elif sunrise_a > 0.33:
+            sunrise_EOT = sunrise_a-24
+        else:
+            sunrise_EOT = sunrise_a
+        
+        t_sunrise = 12 - (1/15.0)*(180/math.pi)*sunrise_HAR - (longitude/15 - timeZone) - sunrise_EOT
+        t_sunset = 12 + (1/15.0)*(180/math.pi)*sunrise_HAR - (longitude/15 - timeZone) - sunrise_EOT
+        
+        if int(t_sunrise) == hour:
+            min=(((t_sunrise - int(t_sunrise))*60)+60)/2
+            tutc = hour + min/60.0 - timeZone
+        elif int(t_sunset) == hour:
+            min=((t_sunset - int(t_sunset))*60)/2
+            tutc = hour + min/60.0 - timeZone
+        
+        
+        gmst = 6.697375 + 0.0657098242*julian + tutc
+        gmst = gmst - 24*int(gmst/24)
+        
+        if (gmst < 0):
+            gmst = gmst + 24
+        
+        lmst = gmst + longitude/15
+        lmst = lmst - 24*int(lmst/24)
+        
+        if (lmst < 0):
+            lmst = lmst + 24
+       
+        b = 15*(math.pi/180) * lmst - ra
+        
+        if (b < -math.pi):
+            HA = b + 2*math.pi  # in radians
+        elif (b > math.pi):
+            HA = b - 2*math.pi  # in radians
+        else:
+            HA = b
+        
+        # sun altitude, not corrected for radiation (in radians):
+        a = math.sin(beta) * math.sin((math.pi/180)*latitude ) + math.cos(beta) * math.cos((math.pi/180)*latitude ) * math.cos(HA)
+        
+        if (a >= -1) and (a <= 1):
+            alpha0 = math.asin(a)
+        elif (a > 1):
+            alpha0 = math.pi/2
+        elif (a < -1):
+            alpha0 = -math.pi/2
+        
+        # sun altitude, corrected for refraction (in radians):
+        alpha0d = 180/math.pi * alpha0
+        
+        if (alpha0d > -0.56):
+            r = 3.51561*((0.1594+0.0196*alpha0d+0.00002*(alpha0d**2))/(1+0.505*alpha0d+0.0845*(alpha0d**2)))
+        elif (alpha0d <= -0.56):
+            r = 0.56
+        
+        if (alpha0d+r > 90):
+            sunAltitudeR = math.pi/2
+        elif (alpha0d+r <= 90):
+            sunAltitudeR = (math.pi/180) * (alpha0d+r)
+        
+        # sun azimuth angle (in radians):
+        a = (math.sin(alpha0)*math.sin(math.pi/180*latitude ) - math.sin(beta))/(math.cos(alpha0)*math.cos(math.pi/180*latitude ))
+        
+        if (a >= -1) and (a <= 1):
+            b = math.acos(a)
+        elif (math.cos(alpha0) == 0) or (a < -1):
+            b = math.pi
+        elif (a > 1):
+            b = 0
+        
+        if (HA < -math.pi):
+            sunAzimuthR = b
+        elif ((HA >= -math.pi) and (HA <= 0)) or (HA >= math.pi):
+            sunAzimuthR = math.pi - b
+        elif (HA > 0) and (HA < math.pi):
+            sunAzimuthR = math.pi + b
+        
+        # sun zenith angle (in radians)
+        sunZenithR = (math.pi/2) - sunAltitudeR
+        
+        sunZenithD = math.degrees(sunZenithR)
+        sunAzimuthD = math.degrees(sunAzimuthR)
+        sunAltitudeD = math.degrees(sunAltitudeR)
+        
+        return sunZenithD, sunAzimuthD, sunAltitudeD
+
+
+    def calculateAlbedo(self, dryBulbTemperature):
+        # correcting albedo values for the presence of snow
+        # based on: Metenorm 6 Handbook part II: Theory, Meteotest
+        
+        startingDayHOY = 0
+        endingDayHOY = 24
+        dailyTaAverage = []
+        for i in range(365):
+            HOYsPerDay = dryBulbTemperature[startingDayHOY:endingDayHOY]
+            dailyTaAverage.append(sum(HOYsPerDay)/24)
+            startingDayHOY += 24
+            endingDayHOY += 24
+        
+        dailyTaAverageShifted = dailyTaAverage[-14:] + dailyTaAverage[:]
+        
+        startingWeekHOY = 0
+        endingWeekHOY = 14
+        albedoL = []
+        lastTwoWeeksTaAverageL = []
+        for i in range(365):
+            lastTwoWeeksTaAverage = sum(dailyTaAverageShifted[startingWeekHOY+i:endingWeekHOY+i])/14
+            lastTwoWeeksTaAverageL.append(lastTwoWeeksTaAverage)
+            if lastTwoWeeksTaAverage > 10:
+                albedo = 0.2
+            elif lastTwoWeeksTaAverage < -10:
+                albedo = 0.8
+            else:
+                albedo = 0.423 - 0.042*lastTwoWeeksTaAverage
+                if albedo < 0.2:
+                    albedo = 0.2
+                elif albedo > 0.8:
+                    albedo = 0.8
+            for i in range(24):
+                albedoL.append(albedo)
+        
+        return albedoL
+
+
+    def POAirradiance(self, sunZenithD, sunAzimuthD, srfTiltD, srfAzimuthD, DNI, DHI, albedo, beamTransIndex=1, SVF=1):
+        
+        if sunZenithD > 90:
+            sunZenithD = 90
+            sunAzimuthD = 0
+        
+        DNIshaded = DNI * beamTransIndex
+        GHI = DHI + DNIshaded * math.cos(math.radians(sunZenithD))
+        
+        # convert degree angles to radians:
+        srfTiltR = math.radians(srfTiltD)
+        srfAzimuthR = math.radians(srfAzimuthD)
+        
+        sunAzimuthR = math.radians(sunAzimuthD)
+        sunZenithR = math.radians(sunZenithD)
+        
+        # Tracking
+        #alphaFixed (angle of incidence in radians):
+        AOI_R = math.acos( math.cos(sunZenithR)*(math.cos(srfTiltR)) + math.sin(srfTiltR) * (math.sin(sunZenithR)) * (math.cos(srfAzimuthR - sunAzimuthR)) )  # in radians
+        
+        if (AOI_R > math.pi):
+            AOI_R = math.pi
+        elif AOI_R < 0:
+            AOI_R = 0
+        AOI_D = math.degrees(AOI_R)  # in degrees
+        
+        # Eb beam irradiance
+        Eb = DNIshaded * math.cos(AOI_R)
+        if Eb < 0:
+            Eb = 0
+        
+        # Ed_sky (Perez 1990 modified model diffuse sky irradiance)
+        a = max(0, math.cos(AOI_R))
+        b = max(math.cos(math.radians(85)), math.cos(sunZenithR))
+        
+        k = 5.534*(10**(-6))  # for angles in degrees
+        # sky clearness
+        if DHI == 0:
+            divison = 0
+        elif DHI > 0:
+            divison = ((DHI+DNIshaded)/DHI)
+        epsilon = ( divison + k*(sunZenithD**3)) / (1 + k*(sunZenithD**3))
+        
+        # Perez model coefficients for irradiance based on epsilon bins
+        if epsilon <= 1.065:
+            f11 = -0.0083117
+            f12 = 0.5877285
+            f13 = -0.0620636
+            f21 = -0.0596012
+            f22 = 0.0721249
+            f23 = -0.0220216
+        elif epsilon > 1.065 and epsilon <= 1.23:
+            f11 = 0.1299457
+            f12 = 0.6825954
+            f13 = -0.1513752
+            f21 = -0.0189325
+            f22 = 0.065965
+            f23 = -0.0288748
+        elif epsilon > 1.23 and epsilon <= 1.5:
+            f11 = 0.3296958
+            f12 = 0.4868735
+            f13 = -0.2210958
+            f21 = 0.055414
+            f22 = -0.0639588
+            f23 = -0.0260542
+        elif epsilon > 1.5 and epsilon <= 1.95:
+            f11 = 0.5682053
+            f12 = 0.1874525
+            f13 = -0.295129
+            f21 = 0.1088631
+            f22 = -0.1519229
+            f23 = -0.0139754
+        elif epsilon > 1.95 and epsilon <= 2.8:
+            f11 = 0.873028
+            f12 = -0.3920403
+            f13 = -0.3616149
+            f21 = 0.2255647
+            f22 = -0.4620442
+            f23 = 0.0012448
+        elif epsilon > 2.8 and epsilon <= 4.5:
+            f11 = 1.1326077
+            f12 = -1.2367284
+            f13 = -0.4118494
+            f21 = 0.2877813
+            f22 = -0.8230357
+            f23 = 0.0558651
+        elif epsilon > 4.5 and epsilon <= 6.2:
+            f11 = 1.0601591
+            f12 = -1.5999137
+            f13 = -0.3589221
+            f21 = 0.2642124
+            f22 = -1.127234
+            f23 = 0.1310694
+        elif epsilon > 6.2:
+            f11 = 0.677747
+            f12 = -0.3272588
+            f13 = -0.2504286
+            f21 = 0.1561313
+            f22 = -1.3765031
+            f23 = 0.2506212
+        
+        # absolute optical air mass
+        AM0 = 1/(b + 0.15*(1/((93.9 - sunZenithD)**(1.253))))
+        
+        # sky brightness
+        delta = DHI*(AM0/1367)
+        
+        F1 = max(0, (f11 + delta*f12 + sunZenithR*f13))
+        F2 = f21 + delta*f22 + sunZenithR*f23
+        
+        # isotropic, circumsolar, and horizon brightening components of the sky diffuse irradiance:
+        if (sunZenithD <= 87.5):
+            Di = (DHI*(1-F1)*((1+math.cos(srfTiltR))/2)) * SVF
+            Dc = (DHI*F1*(a/b)) * beamTransIndex  # based on assumption that all circumsolar component brightening is concentrated at the position of the sun, and therefor completely blocked in case of shading
+            if SVF >= 0.05:  # based on area of the sky dome intersected with sunZenithD when: 87.5 < sunZenithD <= 90
+                Dh = 0
+            else:
+                Dh = DHI*F2*math.sin(srfTiltR)
+        # only isotropic brightening component of the sky diffuse irradiance:
+        elif (sunZenithD > 87.5):
+            Di = ((1+math.cos(srfTiltR))/2) * SVF
+            Dc = 0
+            Dh = 0
+        
+        Ed_sky = Di + Dc + Dh
+        
+        # Eg ground reflected irradiance by Liu, Jordan, (1963).
+        Eground = ((DNIshaded * math.cos(sunZenithR)) + DHI) * albedo * ((1-math.cos(srfTiltR))/2)
+        
+        Epoa = Eb + Eground + Ed_sky  # in Wh/m2
+        if Epoa < 0:
+           Epoa = 0
+        
+        if ((DNI<=0) and (DHI<=0))  or  (sunZenithD > 90):
+            Epoa = 0; Eb = 0; Ed_sky = 0; Eground = 0
+        
+        return Epoa, Eb, Ed_sky, Eground, AOI_R
+
+
+    def pvwatts(self, nameplateDCpowerRating, DCtoACderateFactor, srfTiltD, sunZenithD, AOI_R, Epoa, Eb, Ed_sky, Eground, Ta, ws10, DNI, DHI, PVmoduleSettings, elevationM):
+        # PVWatts v1 Thermal, Module Temperature, Cell Temperature Module and Inverter models
+        
+        # deconstruct PVmoduleSettings
+        if (len(PVmoduleSettings) == 36):
+            moduleModelName, moduleName, material, moduleMountType, moduleAreaM, moduleActiveAreaPercent, nameplateDCpowerRating_m, moduleEfficiency, Vmp_ref, Imp_ref, Voc_ref, Isc_ref, alpha_sc_ref, beta_oc_ref, beta_mp_ref, mu_betamp, s, n, Fd, a0, a1, a2, a3, a4, b0, b1, b2, b3, b4, b5, C0, C1, C2, C3, a, b, deltaT = self.deconstruct_PVmoduleSettings(PVmoduleSettings)
+        elif (len(PVmoduleSettings) == 23):
+            moduleModelName, moduleName, material, moduleMountType, moduleAreaM, moduleActiveAreaPercent, nameplateDCpowerRating_m, moduleEfficiency, Vmp_ref, Imp_ref, Voc_ref, Isc_ref, alpha_sc_ref, beta_oc_ref, IL_ref, Io_ref, Rs_ref, Rsh_ref, A_ref, n_s, adjust, gamma_r_ref, ws_adjusted_factor, Tnoct_adj = self.deconstruct_PVmoduleSettings(PVmoduleSettings)
+        elif (len(PVmoduleSettings) == 9):
+            moduleModelName, mountTypeName, moduleMaterial, mountType, moduleActiveAreaPercent, moduleEfficiency, gamma, a, b, deltaT = self.deconstruct_PVmoduleSettings(PVmoduleSettings)
+        
+        # Sandia PV Array Performance Module Cover
+        # Module Cover Polynomial Coefficients
+        b0 = 1
+        b1 = -2.438e-3
+        b2 = 3.103e-4
+        b3 = -1.246e-5
+        b4 = 2.112e-7
+        b5 = -1.359e-9
+        
+        f = b0 + b1*AOI_R + b2*(AOI_R**2) + b3*(AOI_R**3) + b4*(AOI_R**4) + b5*(AOI_R**5)
+        Etr = Epoa - (1-f)*Eb*math.cos(AOI_R)
+        
+        if (moduleModelName == "PVFORM") or (moduleModelName == "Sandia"):
+            # module back temperature
+            Tm = Epoa * (math.exp(a+(b*ws10))) + Ta  # in C degrees
+            
+            # cell temperature
+            Tcell = Tm + (Epoa/1000)*deltaT  # in C degrees
+            
+            if ((DNI<=0) and (DHI<=0)):
+                Pdc_ = Pac = 0
+                return Tcell, Pdc_, Pac
+        
+        Pdc0 = nameplateDCpowerRating   # in kWatts
+        if (moduleModelName == "PVFORM"):
+            # a) PVFORM version 3.3 adapted Module Model
+            if Etr > 125:
+                Pdc = (Etr/1000)*Pdc0*(1+gamma*(Tcell-25))  # in KWatts
+            if Etr <= 125:
+                Pdc = ((0.008*(Etr**2))/1000)*Pdc0*(1+gamma*(Tcell-25))  # in KWatts
+        
+        elif (moduleModelName == "CEC"):
+            # b) CEC Module Model
+            # temperature coefficient of short circuit current, corrected using adjust parameter.
+            mu_i_sc = alpha_sc_ref*(1-adjust/100)
+            
+            # temperature coefficient of open circuit voltage, corrected using adjust parameter
+            beta_v_oc = beta_oc_ref*(1+adjust/100)
+            
+            # global effective irradiance
+            G = Eb + Ed_sky + Eground
+            
+            # constants
+            n = 1.526  # refractive index of glass
+            L = 0.002  # thickness of glass cover in meters
+            K = 4  # proportionality constant in meters ^-1
+            
+            # incidence angle for the sky diffuse component of the effective irradiance
+            AOId_D = 59.7 - 0.1388*srfTiltD + 0.001497*(srfTiltD**2)
+            # incidence angle for the ground-reflected component of the effective irradiance
+            AOIg_D = 90 - 0.5788*srfTiltD + 0.002693*(srfTiltD**2)
+            
+            # transmittance
+            theta_i_L = [1*math.pi/180, AOI_R, AOId_D*math.pi/180, AOIg_D*math.pi/180]  # in radians
+            
+            transmittanceL = []
+            for theta_i in theta_i_L:
+                theta_r = math.asin((1/n)*math.sin(theta_i)) # angle of refraction calculated for each incidence angle of interest
+                transmittance = (math.e**(-K*L/math.cos(theta_r))) * (1-0.5*( (((math.sin(theta_r-theta_i))**2)/((math.sin(theta_r+theta_i))**2)) + (((math.tan(theta_r-theta_i))**2)/((math.tan(theta_r+theta_i))**2)) ))
+                transmittanceL.append(transmittance)
+            transmittance_n, transmittance_b, transmittance_d, transmittance_g  =  transmittanceL[0], transmittanceL[1], transmittanceL[2], transmittanceL[3]
+            
+            # incidence angle modifier
+            AOIM_b = transmittance_b/transmittance_n
+            AOIM_d = transmittance_d/transmittance_n
+            AOIM_g = transmittance_g/transmittance_n
+            
+            # irradiance absorbed by the photovoltaic cell
+            G0 = Eb*AOIM_b + Ed_sky*AOIM_d + Eground*AOIM_g
+            
+            # correcting sun zenith angle
+            if sunZenithD < 0:
+                sunZenithD = 0
+                sunZenithR = 0
+            elif sunZenithD > 86:
+                sunZenithD = 86
+                sunZenithR = math.radians(86)
+            else:
+                sunZenithR = math.radians(sunZenithD)
+            
+            # air mass
+            AM = (math.e**(-0.0001184*elevationM))  /  (math.cos(sunZenithR) + ( 0.5057*((96.08 -sunZenithD)**(-1.634)) ))
+            
+            # air mass coefficients for crystalline silicon modules
+            a0 = 0.918093
+            a1 = 0.086257
+            a2 = -0.024459
+            a3 = 0.002816
+            a4 = -0.000126
+            
+            # air mass modifier M
+            M = a0 +a1*AM +a2*(AM**2) +a3*(AM**3) +a4*(AM**4)
+            
+            # air mass adjusted transmittance-absorptance product
+            if G == 0:  # fix when G == 0:
+                transmittance_absorptance = 0
+            else:
+                transmittance_absorptance = 0.9 * (M*G0 / G)
+            
+            # NOCT thermal model, if G > 0
+            nu_ref = Imp_ref * Vmp_ref / (1000 * moduleAreaM)
+            
+            # wind speed adjusted for height above the ground
+            ws_adj = ws_adjusted_factor * ws10                                           
+            
+            # fix when G == 0:
+            if G == 0:
+                Tcell = Ta + (G/800) * (Tnoct_adj - 20) * (1 - 0) * (9.5/(5.7+3.8*ws_adj))
+            else:
+                Tcell = Ta + (G/800) * (Tnoct_adj - 20) * (1 - nu_ref/transmittance_absorptance) * (9.5/(5.7+3.8*ws_adj))
+            
+            if G <= 1:
+                Pdc_m = 0
+            else:
+                # cell temperature in kelvins
+                Tcell_K = Tcell + 273.15
+                
+                # temp and irradiance adjusted light current Il
+                Il = M*G0/1000*(IL_ref + mu_i_sc * (Tcell_K - 298.15)) # Jason fixed
+                
+                # Boltzmann constant
+                k = 8.618 *(10**(-5))
+                
+                # cell material band-gap energy
+                Tcell_ref = 25  # in degrees, Tcell in STC
+                Tcell_ref_K = Tcell_ref + 273.15
+                Ebg = 1.12 * (1 - 0.0002677*(Tcell_K - Tcell_ref_K))
+                
+                # temp adjusted diode reverse saturation current Io
+                Io = Io_ref * ((Tcell_K/Tcell_ref_K)**3) * math.exp((1/k) * ((1.12/Tcell_ref_K) - (Ebg/Tcell_K)))
+                
+                # temp adjusted ideality factor a
+                a = A_ref * Tcell_K/Tcell_ref_K
+                
+                # irradiance adjusted Rsh
+                Rsh = Rsh_ref*1000/(G0*M)
+                # Rs is not adjusted from reference value
+                Rs = Rs_ref
+                
+                # short circuit current
+                Isc = Il / (1+(Rs_ref / Rsh))
+                
+                # equation to solve for Voc
+                # 0 = Il - Io *(math.exp(Voc/a)-1) - Voc/Rsh
+                # solve for Voc using bisection method
+                
+                iterations = 0 
+                solved = 0
+                
+                Voc = Voc_ref
+                bisect_a = Voc_ref * 1.5
+                bisect_b = 0
+                bisect_c = 0
+                
+                f_a = Il - Io *(math.exp(bisect_a/a)-1) - bisect_a/Rsh
+                f_b = Il - Io *(math.exp(bisect_b/a)-1) - bisect_b/Rsh
+                
+                if ((f_a > 0 and f_b < 0) or (f_a < 0 and f_b > 0)):    
+                    while ((iterations <= 50) and (solved == 0)):
+                        bisect_c = (bisect_a+bisect_b)/2
+                        f_c = Il - Io *(math.exp(bisect_c/a)-1) - bisect_c/Rsh
+                        iterations += 1
+                        if ((f_c == 0) or ((abs(bisect_b-bisect_a)/2) < 0.0001)):
+                            solved = 1
+                        elif ((f_c>0 and f_a>0) or (f_c<0 and f_a<0)):
+                            bisect_a = bisect_c
+                            f_a = Il - Io *(math.exp(bisect_a/a)-1) - bisect_a/Rsh
+                        else:
+                            bisect_b = bisect_c
+                            f_b = Il - Io *(math.exp(bisect_b/a)-1) - bisect_b/Rsh
+                
+                Voc = bisect_c
+                
+                # Vmp and Imp are found together, by maximizing Pmp
+                # Pmp = Vmp * Imp. Guess Vmp. Calculate Imp using Lambert W function. Use golden section search to improve guess of Vmp, iterate until Pmp is found.
+                
+                phi = (1 + math.sqrt(5))/2
+                VH = 1.5 * Voc
+                VL = 0
+                
+                err = VH - VL
+                solved = 0
+                iterations = 0
+                
+                while ((iterations <= 50) and (solved == 0)):
+                    V1 = VL + err / phi
+                    V2 = VH - err / phi
+                    # calculate I for V1 Eqn. 4 in Jain and Kapoor, 2004
+                    argW = (Rs*Io*Rsh * math.exp(Rsh*(Rs*(Il+Io)+V1) / (a*(Rs+Rsh))) /(a*(Rs + Rsh)))
+                    lambertwterm = self.w0(argW)     
+                    I_V1 = -V1/(Rs + Rsh) - (a/Rs)*lambertwterm + Rsh*(Il + Io)/(Rs + Rsh)
+                    # calculate P for V1
+                    P_V1 = V1 * I_V1
+                    # calculate I for V2 Eqn. 4 in Jain and Kapoor, 2004
+                    argW = (Rs*Io*Rsh * math.exp(Rsh*(Rs*(Il+Io)+V2) / (a*(Rs+Rsh))) /(a*(Rs + Rsh)))
+                    lambertwterm = self.w0(argW)
+                    I_V2 = -V2/(Rs + Rsh) - (a/Rs)*lambertwterm + Rsh*(Il + Io)/(Rs + Rsh)
+                    # calculate P for V1
+                    P_V2 = V2 * I_V2
+                    # check for convergence on maximum
+                    if (P_V1 < P_V2):
+                        VH = V1
+                    else:
+                        VL = V2
+                    err = abs(VH-VL)
+                    if err < 0.0001:
+                        solved = 1
+                    iterations += 1
+                
+                Vmp = V1
+                Imp = I_V1
+                Pmp = P_V1
+                
+                # module's DC power output at the maximum power point
+                Pdc_m = Vmp * Imp  # in Watts
+            
+            Pdc_array = (Pdc_m/1000) * nameplateDCpowerRating/(nameplateDCpowerRating_m/1000)  # in KWatts
+            if (Pdc_array < 0) or (Pdc_array == -0.0): Pdc_array = 0
+            Pdc = Pdc_array
+        
+        elif (moduleModelName == "Sandia"):
+            # c) Sandia Module Model
+            # air mass
+            sunZenithR = math.radians(sunZenithD)
+            AM = ( (math.e**(-0.0001184*elevationM))  /  math.cos(sunZenithR) )  + ( 0.5057*((96.08-sunZenithD)**(-1.634)) )
+            # F1 polynomial relates the spectral effects on Isc to the variation of air mass over the day
+            F1 = a0 + a1*AM +a2*(AM**2) +a3*(AM**3) +a4*(AM**4)
+            # F2 polynomial relates the optical effects on Isc to the angle of incidence AOI
+            F2 = b0 + b1*AOI_R + b2*(AOI_R**2) + b3*(AOI_R**3) + b4*(AOI_R**4) + b5*(AOI_R**5)
+            
+            # short circuit current
+            Isc = Isc_ref * F1 * ((Eb*F2 + Fd*(Ed_sky+Eground))/1000) * (1 + alpha_sc_ref * (Tcell-25))
+            # effective irradiance on the module surface
+            Ee = Isc / ( Isc_ref * (1+alpha_sc_ref *(Tcell-25)) )
+            # current at the maximum power point
+            Imp = Imp_ref * (C0*Ee+C1*(Ee**2)) * (1+alpha_sc_ref * (Tcell-25))
+            
+            if Ee <= 0:
+                # happens in the early morning and before the night fall
+                Vmp = 0  # voltage at maximum power
+            else:
+                deltaTc = n * (1.38066 *(10**(-23)) * (Tcell +273.15))  /  (1.60218 *(10**(-19)))
+                beta_mp = beta_mp_ref + mu_betamp * (1 - Ee)
+                # open circuit voltage
+                Voc = Voc_ref + s*deltaTc*math.log(Ee) + beta_oc_ref*(Tcell-25)
+                # voltage at maximum power
+                Vmp = Vmp_ref + C2*s*deltaTc*math.log(Ee) + C3*s*((deltaTc*math.log(Ee))**2) + beta_mp*(Tcell-25)
+            
+            # module's DC power output at the maximum power point
+            Pdc_m = Vmp * Imp  # in Watts
+            Pdc_array = (Pdc_m/1000) * nameplateDCpowerRating/(nameplateDCpowerRating_m/1000)  # in KWatts
+            if (Pdc_array < 0) or (Pdc_array == -0.0): Pdc_array = 0
+            Pdc = Pdc_array
+        
+        # System Derates
+        Eta_inv = 0.92  # default
+        Pdc_ = Pdc*(DCtoACderateFactor/Eta_inv)
+        
+        # PVFORM version 3.3 adapted Inverter Model
+        Pac0 = Pdc0
+        Pinv_dc0 = Pac0/Eta_inv
+        f = Pdc_/Pinv_dc0
+        
+        # Pac in kWh
+        if (f >= 0.1) and (f <= 1):
+            Eta_op = 0.774 + 0.663 * f - 0.952 * (f**2) + 0.426 * (f**3)
+            Pac = Pdc_ * Eta_op * (Eta_inv/0.91)
+        elif (f >= 0) and (f < 0.1):
+            Eta_op = -0.015 + 8.46 * f
+            Pac = Pdc_ * Eta_op * (Eta_inv/0.91)
+        elif (f > 1):
+            Pac = Pac0
+        
+        if Pac < 0: Pac = 0
+        
+        return Tcell, Pdc_, Pac
+
+
+    def inletWaterTemperature(self, dryBulbTemperature_C, method=0, minimalTemperature_C=1, depth_m=2, soilThermalDiffusivity_m2_s=2.5):
+        # calculate cold (inlet) water temperature
+        # soilThermalDiffusivity (m2/s) per material (valid for method "0" only):
+        # 0.00000024 - dry sand
+        # 0.00000074 - wet sand
+        # 0.00000025 - dry clay
+        # 0.00000051 - wet clay
+        # 0.00000010 - dry peat
+        # 0.00000012 - wet peat
+        # 0.00000129 - dense rock
+        depth_ft = depth_m * 3.2808399  # to feet
+        soilThermalDiffusivity_m2_s = soilThermalDiffusivity_m2_s * (10**(-7))  # convert from m2/s * 10**(-7) to m2/s
+        soilThermalDiffusivity_ft2_hr = soilThermalDiffusivity_m2_s * 38750.077512  # to ft2/hr
+        minimalTemperature_F = celsiusToFahrenheit(minimalTemperature_C)
+        
+        # Ta in Fahrenheit
+        dryBulbTemperature_F = [celsiusToFahrenheit(TaC) for TaC in dryBulbTemperature_C]
+        hoyForMonths = [0, 744, 1416, 2160, 2880, 3624, 4344, 5088, 5832, 6552, 7296, 8016, 8760, 9000]
+        hoyTaPerMonths_F = [[] for i in range(12)]
+        HOYs = range(1,8761)
+        for i,hoy in enumerate(HOYs):
+            for k,item in enumerate(hoyForMonths):
+                if hoy >= hoyForMonths[k]+1 and hoy <= hoyForMonths[k+1]:
+                    hoyTaPerMonths_F[k].append(dryBulbTemperature_F[i])
+        averageTa_perMonths_F = []
+        numberOfDaysInMonth = [31,28,31,30,31,30,31,31,30,31,30,31]
+        for i in range(len(numberOfDaysInMonth)):
+            averageTa_F = sum(hoyTaPerMonths_F[i])/(numberOfDaysInMonth[i]*24)
+            averageTa_perMonths_F.append(averageTa_F)
+        
+        
+        averageTa_perYear_F = sum(dryBulbTemperature_F)/len(dryBulbTemperature_F)  # annualAverageTa in F
+        minAverageMonthlyTa = min(averageTa_perMonths_F)
+        maxAverageMonthlyTa = max(averageTa_perMonths_F)
+        
+        if method == 0:
+            # Carslaw and Jaeger semi-infinite medium conduction equations.
+            # source: "Residential alternative calculation method reference manual", California energy commission, June 2013:
+            averageTa_dec_JanToDec_perMonths = [averageTa_perMonths_F[-1]] + averageTa_perMonths_F[:-1]
+            
+            janToDecHOYs = dryBulbTemperature_F[:8017]
+            decHOYs = dryBulbTemperature_F[8017:]
+            dec_JanToDecHOYs = decHOYs + janToDecHOYs
+            
+            annualSurfaceTemperatureAmplitude = 0.5*(maxAverageMonthlyTa-minAverageMonthlyTa)
+            pb = 8760 
+            po = 0.6  # phase lag
+            beta = math.sqrt(math.pi/(soilThermalDiffusivity_ft2_hr*pb))*depth_ft
+            xb = math.exp(-beta) 
+            cb = math.cos(beta) 
+            sb = math.sin(beta) 
+            gm = math.sqrt((xb*xb - 2*xb*cb + 1)/(2*beta*beta)) 
+            phi = math.atan((1.-xb*(cb+sb)) / (1.-xb*(cb-sb))) 
+            
+            TinletPerHOY_F = []
+            HOYs = range(1,8761)
+            for i,hoy in enumerate(HOYs):
+                 Tground = averageTa_perYear_F - annualSurfaceTemperatureAmplitude*math.cos((2*math.pi*(hoy/pb))-po-phi)*gm
+                 last31Days = dec_JanToDecHOYs[i:(i+31)]
+                 Tavg31 = sum(last31Days)/len(last31Days)
+                 TinletF = Tground * 0.65 + Tavg31 * 0.35
+                 if TinletF < minimalTemperature_F:  # preventing freezing of inlet water
+                    TinletF = minimalTemperature_F
+                 TinletPerHOY_F.append(TinletF)
+        
+        elif method == 1:
+            # Christensen and Burch.
+            # source: "Development of an Energy Savings Benchmark for All Residential End-Uses", NREL, August 2004
+            montlyAvrMaximalDiff = maxAverageMonthlyTa - minAverageMonthlyTa
+            offset = 6
+            ratio = 0.4 + 0.01 * (averageTa_perYear_F - 44)
+            lag = 35 - 1.0 * (averageTa_perYear_F - 44)
+            TinletPerHOY_F = []
+            for hoy in range(1,8761):
+                julianDay = (hoy - 1) // 24 + 1
+                TinletF = (averageTa_perYear_F + offset) + ( ratio*(montlyAvrMaximalDiff/2) * math.sin(math.radians(0.986*(julianDay-15-lag)-90)) )
+                if TinletF < minimalTemperature_F:  # preventing freezing of inlet water
+                    TinletF = minimalTemperature_F
+                TinletPerHOY_F.append(TinletF)
+        
+        elif method == 2:
+            # RETScreen
+            # source: "Solar water heating project analysis chapter", Minister of Natural Resources Canada, 2004
+            averageTa_dec_JanToDec_perMonths = [averageTa_perMonths_F[-1]] + averageTa_perMonths_F[:-1]
+            TinletPerHOY_F = []
+            for hoy in range(1,8761):
+                month = monthOfHour(hoy)
+                TinletF = averageTa_perYear_F + 0.35*(averageTa_dec_JanToDec_perMonths[month] - averageTa_perYear_F)
+                if TinletF < minimalTemperature_F:  # preventing freezing of inlet water
+                    TinletF = minimalTemperature_F
+                TinletPerHOY_F.append(TinletF)
+        
+        # converting to Celsius
+        TinletPerHOY_C = [fahrenheitToCelsius(Tinlet_F) for Tinlet_F in TinletPerHOY_F]
+        TinletHOYminimal_C = fahrenheitToCelsius(min(TinletPerHOY_F))
+        TinletHOYmaximal_C = fahrenheitToCelsius(max(TinletPerHOY_F))
+        TinletAverageAnnual_C = fahrenheitToCelsius(sum(TinletPerHOY_F)/len(TinletPerHOY_F))
+        
+        return TinletPerHOY_C, TinletAverageAnnual_C, TinletHOYminimal_C, TinletHOYmaximal_C
+
+
+    def swhdesign(self, activeArea, srfTiltD, AOI_R, bo, FavTa, FavUL, Eb_shaded, Ed_shaded, Eg, Qload, Cp, mDot, Ta, Tcold, Tw, TdeliveryW, TmaxW, TdischargeW, TmechRoom, L, Di, insulT, k, pumpPower, pumpEfficiency, tankSize, tankArea, tankLoss, epsilon, minSR=None):
+        
+        # based on:
+        # "Solar Engineering of Thermal Processes", John Wiley and Sons, J. Duffie, W. Beckman, 3rd ed., 2006.
+        # "Technical Manual for the SAM Solar Water Heating Model", NREL, N. DiOrio, C. Christensen, J. Burch, A. Dobos, 2014.
+        # "A simplified method for optimal design of solar water heating systems based on life-cycle energy analysis", Renewable Energy journal, Yan, Wang, Ma, Shi, Vol 74, Feb 2015
+        
+        waterSpecificHeat = 4.18  # kJ/(kg*C)
+        waterDensity = 1000  # kg/m3
+        eta_aux = 1  # auxiliaryHeaterEnergyFactor. equals 1 for electric water heater
+        
+        # convert test results
+        mDotCp = activeArea * mDot * Cp  # W/C
+        FrTau = FavTa / (1 + (activeArea*FavUL)/(2*mDotCp))
+        FrUL = FavUL / (1 + (activeArea*FavUL)/(2*mDotCp))
+        
+        # capacitance rate corrections
+        F_UL = -(mDotCp / activeArea) * math.log(1 - ((FrUL * activeArea) / mDotCp))
+        r = (mDotCp / activeArea * (1 - math.exp(-activeArea * F_UL / mDotCp))) / FavUL
+        FrTa_capacitanceRate = r * FrTau
+        FrUL_capacitanceRate = r * FrUL
+        
+        # pipe losses
+        if insulT == 0: insulT = 0.0001  # fix for math.log(Do / Di)
+        Do = Di + (2*insulT)
+        Uout = (2 * k) / (Do * math.log(Do / Di))
+        A_pipe = math.pi * Do * L
+        UA_pipe = Uout * A_pipe
+        Fr_pipeloss = FrTa_capacitanceRate / (1 + (UA_pipe / mDotCp))
+        FrUL_pipeloss = FrUL_capacitanceRate * (((1 - (UA_pipe / mDotCp)) + (Uout * (A_pipe + A_pipe)) / (activeArea * FrUL_capacitanceRate)) / (1 + (UA_pipe / mDotCp)))
+        
+        # effect of the heat exchanger
+        Fr_ = Fr_pipeloss / (1 + ((activeArea*FrUL_pipeloss)/mDotCp) * ((mDotCp/(epsilon*mDotCp))-1))
+        FrUL_ = FrUL_pipeloss / (1 + ((activeArea*FrUL_pipeloss)/mDotCp) * ((mDotCp/(epsilon*mDotCp))-1))
+        
+        # incidence angle modifiers (IAM) for Flat plate collectors and longitudinal direction of Evacuated tube collectors (for top-bottom direction of tubes optical axis)
+        AOI_D_b = math.degrees(AOI_R)
+        AOI_D_d = 59.7 - 0.1388*srfTiltD + 0.001497*(srfTiltD**2)
+        AOI_D_g = 90 - 0.5788*srfTiltD + 0.002693*(srfTiltD**2)
+        
+        if (AOI_D_b <= 60):
+            Ktau_b = 1-(bo*((1/math.cos( math.radians(AOI_D_b)))- 1))
+            Ktau_d = 1-(bo*((1/math.cos( math.radians(AOI_D_d)))- 1))
+            Ktau_g = 1-(bo*((1/math.cos( math.radians(AOI_D_g)))- 1))
+        else:
+            Ktau_b = (1-bo)*(1-((AOI_D_b-60)/30))
+            Ktau_d = (1-bo)*(1-((AOI_D_d-60)/30))
+            Ktau_g = (1-bo)*(1-((AOI_D_g-60)/30))
+        # incidence angle modifier cannot be negative
+        if Ktau_b < 0: Ktau_b = 0
+        if Ktau_d < 0: Ktau_d = 0
+        if Ktau_g < 0: Ktau_g = 0
+        
+        SR_IAM = Eb_shaded*Ktau_b + Ed_shaded*Ktau_d + Eg*Ktau_g  # Wh/m2
+        
+        
+        if SR_IAM > 0:
+            collectorHeatLoss = FrUL_*((Tw-Ta)/SR_IAM)  # unitless
+        else:
+            collectorHeatLoss = 0
+        
+        if SR_IAM <= 0:
+            collectorEfficiency = Fr_  # unitless
+        else:
+            collectorEfficiency = Fr_-collectorHeatLoss  # unitless
+        if collectorEfficiency < 0:
+            collectorEfficiency = Fr_  # unitless
+        
+        if minSR == None:
+            minSR = (FrUL_*(Tw-Ta))/Fr_  # Wh/m2
+        
+        if SR_IAM > minSR:
+            # absorbed radiation larger than losses
+            Qsolar = collectorEfficiency * SR_IAM * activeArea/1000  # kWh
+            Qpump = (pumpPower * pumpEfficiency)/1000  # kWh, day, regardless of whether there is, or there isn't heating load
+        else:
+            Qsolar = 0
+            Qpump = 0  # day or night
+        
+        if Qload != 0:
+            # day or night, when there is heating load
+            if Tw >= TdeliveryW:
+                Qsupply = Qload - Qpump/eta_aux  # kWh
+                Qaux = 0
+            elif Tw < TdeliveryW:
+                HWC = (Qload/0.000277778)/(0.001 * 1000 * 4.2 * (TdeliveryW-Tcold))  # liters
+                Qsupply = (HWC * 0.001 * 1000 * 4.2 * (Tw-Tcold)* 0.000277778)/eta_aux  # kWh
+                Qaux = (HWC * 0.001 * 1000 * 4.2 * (TdeliveryW-Tw)* 0.000277778)/eta_aux  # kWh, heating up the water with auxiliary heater
+            if Qsupply < 0: Qsupply = 0
+        elif Qload == 0:
+            # day or night, when there is no heating load
+            Qsupply = 0
+            Qaux = 0
+        
+        if Tw >= TmaxW:
+            Qdis = (Tw-TdischargeW)*waterSpecificHeat*tankSize*waterDensity/3600  # kWh
+            Qpump = 0  # swh system stagnate until excess heat is discharged
+        else:
+            Qdis = 0
+        
+        Qloss = tankLoss*tankArea*(Tw-TmechRoom)/1000  # kWh (negative value represents gain instead of loss)
+        dQ = Qsolar - Qloss - Qsupply - Qdis  # kWh
+        dt = dQ*3600/(waterSpecificHeat*tankSize*waterDensity)  # C
+        Tw = Tw + dt  # C
+        
+        return collectorHeatLoss, collectorEfficiency, Qsolar, Qloss, Qsupply, Qaux, Qdis, Qpump, dQ, dt, Tw
+
+
+    def WMMcoefficients(self, COFfilePath=None):
+        """World Magnetic Model of a WMM.COF file or the integrated WMM 2015-2020 model.
+
+        Models are read once (see geomag.WMM) and can be used for lists of sites
+        and dates with their field and declination methods.
+        """
+        from .geomag import WMM
+        if COFfilePath: return WMM.fromCof(COFfilePath)
+        return WMM.default()
+
+
+    def GeoMag(self, dlat, dlon, elevation, time, coefficients):
+        """Magnetic field of a site (elevation in m) and a date.
+
+        Returns:
+            dec, dip, ti, bx, by, bz and the decimal year of the date.
+        """
+        from .geomag import decimalYear
+        dec, dip, ti, bx, by, bz = coefficients.field(dlat, dlon, elevation, time)[0]
+        return dec, dip, ti, bx, by, bz, decimalYear(time)
@@ -0,0 +1,152 @@
+"""
+Psychrometrics.
+
+The functions take lists of hourly values (e.g. the 8760 values of an epw file)
+and calculate every result in a single pass over the inputs. ComfortModels'
+psychrometric methods use these functions.
+
+Temperatures are in C, relative humidity in %, pressure in Pa and humidity
+ratio in kg water / kg air unless noted.
+"""
+from __future__ import division
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+# Magnus coefficients (a, b) for dew point and vapor pressure over water
+MAGNUSBOLTON = (17.67, 243.5)
+MAGNUSMET4 = (17.27, 237.7)
+
+# ITS-90 formulation of the saturation vapor pressure (Hardy 1998)
+ITS90COEFFICIENTS = (-2836.5744, -6028.076559, 19.54263612, -0.02737830188,
+                     0.000016261698, 7.0229056e-10, -1.8680009e-13)
+ITS90LOG = 2.7150305
+
+
+def _saturationPressure(t):
+    # IAPWS saturation pressure above (t >= 273) and below freezing for a
+    # temperature in Kelvin
+    if t >= 273:
+        s = 1 - t / 647.096
+        power = math.exp((647.096 / t) * (s * -7.85951783 + (s ** 1.5) * 1.84408259 +
+                                          (s ** 3) * -11.7866487 + (s ** 3.5) * 22.6807411 +
+                                          (s ** 4) * -15.9618719 + (s ** 7.5) * 1.80122502))
+        return power * 22064000 if power != 1 else 0
+    theta = t / 273.16
+    power = math.exp((1 - theta ** -1.5) * -13.928169 + (1 - theta ** -1.25) * 34.707823)
+    return power * 611.657 if power != 1 else 0
+
+
+def saturationPressure(TKelvin):
+    """Saturation vapor pressure (Pa) for a list of temperatures in Kelvin."""
+    return [_saturationPressure(t) for t in TKelvin]
+
+
+def saturationPressureITS90(TKelvin):
+    """ITS-90 saturation vapor pressure (Pa) for a list of temperatures in Kelvin."""
+    g0, g1, g2, g3, g4, g5, g6 = ITS90COEFFICIENTS
+    return [math.exp(g0 / (t * t) + g1 / t + g2 + g3 * t + g4 * t * t + g5 * t ** 3 + g6 * t ** 4 +
+                     ITS90LOG * math.log(t)) for t in TKelvin]
+
+
+def vaporPressure(airTemp, relHumid):
+    """Water vapor pressure (hPa) with the ITS-90 saturation pressure."""
+    return [es * 0.01 * rh / 100 for es, rh in
+            zip(saturationPressureITS90([t + 273.15 for t in airTemp]), relHumid)]
+
+
+def humidityRatio(airTemp, relHumid, barPress):
+    """Humidity ratio, enthalpy (kJ/kg), partial pressure and saturation pressure (Pa).
+
+    Enthalpy is 0 where it would be negative.
+    """
+    humidRatios, enthalpies, partialPressures, saturationPressures = [], [], [], []
+    for t, rh, p in zip(airTemp, relHumid, barPress):
+        satPress = _saturationPressure(t + 273)
+        partialPress = rh * 0.01 * satPress
+        ratio = (partialPress * 0.621991) / (p - partialPress)
+        enthalpy = (1.01 + 1.89 * ratio) * t + 2500 * ratio
+        humidRatios.append(ratio)
+        enthalpies.append(enthalpy if enthalpy >= 0 else 0)
+        partialPressures.append(partialPress)
+        saturationPressures.append(satPress)
+    return humidRatios, enthalpies, partialPressures, saturationPressures
+
+
+def enthalpy(airTemp, humidRatio):
+    """Enthalpy (kJ/kg) from temperature and humidity ratio."""
+    return [(1.01 + 1.89 * hr) * t + 2500 * hr for t, hr in zip(airTemp, humidRatio)]
+
+
+def tempFromEnthalpy(enthalpy, humidRatio):
+    """Temperature from enthalpy (kJ/kg) and humidity ratio."""
+    return [(h - 2.5 * (hr * 1000)) / (1.01 + 0.00189 * hr * 1000)
+            for h, hr in zip(enthalpy, humidRatio)]
+
+
+def dewPoint(airTemp, relHumid, coefficients=MAGNUSBOLTON):
+    """Magnus dew point temperature."""
+    a, b = coefficients
+    dewPoints = []
+    for t, rh in zip(airTemp, relHumid):
+        gamma = a * t / (b + t) + math.log(rh / 100)
+        dewPoints.append(b * gamma / (a - gamma))
+    return dewPoints
+
+
+def relHumidFromHumidRatio(humidRatio, barPress, airTemp):
+    """Relative humidity from humidity ratio, pressure and temperature."""
+    return [100 * ((hr * 1000 * p) / (621.9907 + hr * 1000)) / _saturationPressure(t + 273)
+            for hr, p, t in zip(humidRatio, barPress, airTemp)]
+
+
+def relHumidFromDewPoint(airTemp, dewPoint):
+    """Relative humidity from temperature and dew point temperature."""
+    relHumids = []
+    for t, td in zip(airTemp, dewPoint):
+        # partial pressure of water in the atmosphere
+        partialPress = (math.pow(10, 7.591386 / ((240.7263 / (td + 273)) + 1)) * 6.11657) / 100
+        relHumids.append(100 * partialPress / _saturationPressure(t + 273))
+    return relHumids
+
+
+def wetBulb(airTemp, relHumid, barPress, tolerance=1e-6, maxIterations=50):
+    """Psychrometer wet bulb temperature.
+
+    Solves e = Ew(Tw) - (P / 100) * (T - Tw) * 0.00066 * (1 + 0.00155 * Tw) for
+    Tw with Newton's method. All the hours take one step at a time and the hours
+    that have converged are dropped from the next steps.
+
+    Args:
+        airTemp: Dry bulb temperatures.
+        relHumid: Relative humidity values.
+        barPress: Barometric pressure values in Pa.
+        tolerance: Largest vapor pressure error (hPa) of the results.
+    """
+    a, b = MAGNUSBOLTON
+    wetBulbs = list(airTemp)
+    vaporPress = []
+    psychro = []
+    for t, rh, p in zip(airTemp, relHumid, barPress):
+        vaporPress.append(6.112 * math.exp(a * t / (t + b)) * rh / 100)
+        psychro.append(p / 100 * 0.00066)
+
+    active = range(len(wetBulbs))
+    for iteration in range(maxIterations):
+        if not active: break
+        stillActive = []
+        for i in active:
+            tw, t, k = wetBulbs[i], airTemp[i], psychro[i]
+            ew = 6.112 * math.exp(a * tw / (tw + b))
+            error = ew - k * (t - tw) * (1 + 0.00155 * tw) - vaporPress[i]
+            if abs(error) <= tolerance: continue
+            slope = ew * a * b / ((tw + b) ** 2) + k * (1 + 0.00155 * tw - 0.00155 * (t - tw))
+            wetBulbs[i] = tw - error / slope
+            stillActive.append(i)
+        active = stillActive
+
+    return wetBulbs
@@ -0,0 +1,263 @@
+"""
+Shadows of planar faces on each other.
+
+For a sun vector every face that faces the sun receives the shadows of the
+faces in front of it. The candidate pairs come from a grid of the bounding
+boxes of the faces seen from the sun, so only faces that overlap in that view
+are tested. A shading face is clipped to the front side of the receiving plane,
+projected along the sun vector onto the plane and clipped with the receiving
+face in 2D. The lit part of each face is kept as disjoint convex pieces and
+every shadow only takes the parts of the pieces that are still lit, so the
+shadows of a face don't overlap and the shadow area is the sum of their areas.
+
+Faces are treated as convex polygons (e.g. mesh triangles and quads).
+
+    polygons: List of faces. Each face is a list of (x, y, z) points in
+        counterclockwise order around the face normal.
+    sunVector: Direction of the sun rays (from the sun to the scene) as in the
+        sun vectors of Ladybug_SunPath.
+"""
+from __future__ import division
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+def _sub(a, b):
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+def _unit(v):
+    length = math.sqrt(_dot(v, v))
+    return (v[0] / length, v[1] / length, v[2] / length) if length else v
+
+
+def polygonNormal(points):
+    """Unit normal (Newell's method) and area of a planar polygon."""
+    x = y = z = 0
+    for (x0, y0, z0), (x1, y1, z1) in zip(points, points[1:] + points[:1]):
+        x += (y0 - y1) * (z0 + z1)
+        y += (z0 - z1) * (x0 + x1)
+        z += (x0 - x1) * (y0 + y1)
+    length = math.sqrt(x * x + y * y + z * z)
+    if not length: return (0, 0, 0), 0
+    return (x / length, y / length, z / length), length / 2
+
+
+def planeAxes(normal):
+    """Two unit vectors that make a right-handed system with the normal."""
+    helper = (0, 0, 1) if abs(normal[2]) < 0.9 else (1, 0, 0)
+    xAxis = _unit(_cross(helper, normal))
+    return xAxis, _cross(normal, xAxis)
+
+
+def polygonArea2D(points):
+    """Signed area of a 2D polygon (positive for counterclockwise)."""
+    return sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])) / 2
+
+
+def clipHalfPlane(points, a, b, keepLeft=True):
+    """Part of a 2D polygon on the left (or right) of the line a -> b."""
+    ax, ay = a
+    dx, dy = b[0] - ax, b[1] - ay
+    sides = [dx * (y - ay) - dy * (x - ax) for x, y in points]
+    if not keepLeft: sides = [-s for s in sides]
+    clipped = []
+    for (p, sp), (q, sq) in zip(zip(points, sides), zip(points[1:] + points[:1], sides[1:] + sides[:1])):
+        if sp >= 0: clipped.append(p)
+        if (sp >= 0) != (sq >= 0):
+            t = sp / (sp - sq)
+            clipped.append((p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1])))
+    return clipped
+
+
+def convexIntersection(subject, clip):
+    """Part of a 2D polygon inside a counterclockwise convex polygon."""
+    for a, b in zip(clip, clip[1:] + clip[:1]):
+        if not subject: break
+        subject = clipHalfPlane(subject, a, b)
+    return subject
+
+
+def convexDifference(subject, clip, minArea=0):
+    """Convex pieces of a convex 2D polygon outside a counterclockwise convex polygon."""
+    pieces = []
+    for a, b in zip(clip, clip[1:] + clip[:1]):
+        if not subject: break
+        outside = clipHalfPlane(subject, a, b, False)
+        if len(outside) > 2 and abs(polygonArea2D(outside)) > minArea: pieces.append(outside)
+        subject = clipHalfPlane(subject, a, b)
+    return pieces
+
+
+def _bounds(points):
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def clipPlane(points, origin, normal, offset=0):
+    """Part of a 3D polygon on the side of a plane that the normal points to."""
+    sides = [_dot(_sub(p, origin), normal) - offset for p in points]
+    clipped = []
+    for (p, sp), (q, sq) in zip(zip(points, sides), zip(points[1:] + points[:1], sides[1:] + sides[:1])):
+        if sp >= 0: clipped.append(p)
+        if (sp >= 0) != (sq >= 0):
+            t = sp / (sp - sq)
+            clipped.append((p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]), p[2] + t * (q[2] - p[2])))
+    return clipped
+
+
+class ShadowStudy(object):
+    """Shadows of a set of faces for one or more sun vectors.
+
+    Args:
+        polygons: List of faces.
+        parents: Index of the geometry of each face. Faces don't shade the
+            faces of their own geometry unless selfShading is True.
+        selfShading: Set to True to include the shadows of a geometry on itself.
+    """
+
+    def __init__(self, polygons, parents=None, selfShading=False):
+        self.polygons = [list(p) for p in polygons]
+        self.parents = parents if parents is not None else range(len(self.polygons))
+        self.selfShading = selfShading
+        self.normals, self.areas = [], []
+        for points in self.polygons:
+            normal, area = polygonNormal(points)
+            self.normals.append(normal)
+            self.areas.append(area)
+        coordinates = [c for points in self.polygons for pt in points for c in pt]
+        size = max(coordinates) - min(coordinates) if coordinates else 1
+        self.tolerance = max(size, 1) * 1e-9
+
+    @classmethod
+    def fromMeshes(cls, meshes, selfShading=False):
+        """Create the study from a (vertices, faces) tuple for each geometry."""
+        polygons, parents = [], []
+        for index, (vertices, faces) in enumerate(meshes):
+            for face in faces:
+                if len(face) == 4 and face[2] == face[3]: face = face[:3]
+                polygons.append([vertices[i] for i in face])
+                parents.append(index)
+        return cls(polygons, parents, selfShading)
+
+    def candidates(self, sunVector):
+        """Faces that may shade each face based on their bounding boxes seen from the sun."""
+        xAxis, yAxis = planeAxes(_unit(sunVector))
+        boxes = []
+        for points in self.polygons:
+            xs = [_dot(p, xAxis) for p in points]
+            ys = [_dot(p, yAxis) for p in points]
+            boxes.append((min(xs), min(ys), max(xs), max(ys)))
+        if not boxes: return []
+
+        # a grid with about one face per cell
+        cellSize = sum(max(b[2] - b[0], b[3] - b[1]) for b in boxes) / len(boxes) or 1
+        grid = {}
+        cellRanges = []
+        for index, (x0, y0, x1, y1) in enumerate(boxes):
+            cells = (int(math.floor(x0 / cellSize)), int(math.floor(y0 / cellSize)),
+                     int(math.floor(x1 / cellSize)), int(math.floor(y1 / cellSize)))
+            cellRanges.append(cells)
+            for i in range(cells[0], cells[2] + 1):
+                for j in range(cells[1], cells[3] + 1):
+                    grid.setdefault((i, j), []).append(index)
+
+        tol = self.tolerance
+        candidates = []
+        for index, (i0, j0, i1, j1) in enumerate(cellRanges):
+            x0, y0, x1, y1 = boxes[index]
+            found = set()
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    found.update(grid.get((i, j), ()))
+            found.discard(index)
+            candidates.append(sorted(
+                other for other in found if boxes[other][0] < x1 + tol and boxes[other][2] > x0 - tol and
+                boxes[other][1] < y1 + tol and boxes[other][3] > y0 - tol))
+        return candidates
+
+    def shadows(self, sunVector):
+        """Shadows on each face for a sun vector.
+
+        Returns:
+            A list for each face with the convex shadow pieces (lists of
+            (x, y, z) points) on the face. Faces that don't face the sun get None.
+        """
+        sun = _unit(sunVector)
+        tol = self.tolerance
+        minArea = tol * tol
+        results = []
+        candidates = self.candidates(sun)
+        for index, points in enumerate(self.polygons):
+            normal = self.normals[index]
+            facing = _dot(normal, sun)
+            if facing >= -tol or not self.areas[index]:
+                results.append(None)
+                continue
+
+            origin = points[0]
+            xAxis, yAxis = planeAxes(normal)
+            to2D = lambda p: (_dot(_sub(p, origin), xAxis), _dot(_sub(p, origin), yAxis))
+            receiver = [to2D(p) for p in points]
+            if polygonArea2D(receiver) < 0: receiver.reverse()
+            lit = [(receiver, _bounds(receiver))]
+            pieces = []
+            for other in candidates[index]:
+                if not self.selfShading and self.parents[other] == self.parents[index]: continue
+                # the part of the shading face in front of the receiving plane
+                front = clipPlane(self.polygons[other], origin, normal, tol)
+                if len(front) < 3: continue
+                projected = []
+                for p in front:
+                    t = -_dot(_sub(p, origin), normal) / facing
+                    projected.append(to2D((p[0] + t * sun[0], p[1] + t * sun[1], p[2] + t * sun[2])))
+                if polygonArea2D(projected) < 0: projected.reverse()
+                box = _bounds(projected)
+                stillLit = []
+                for piece, pieceBox in lit:
+                    if not _overlap(box, pieceBox):
+                        stillLit.append((piece, pieceBox))
+                        continue
+                    shadow = convexIntersection(piece, projected)
+                    if len(shadow) < 3 or polygonArea2D(shadow) <= minArea:
+                        stillLit.append((piece, pieceBox))
+                        continue
+                    pieces.append(shadow)
+                    stillLit.extend((part, _bounds(part))
+                                    for part in convexDifference(piece, projected, minArea))
+                lit = stillLit
+                if not lit: break
+
+            results.append([[(origin[0] + x * xAxis[0] + y * yAxis[0],
+                              origin[1] + x * xAxis[1] + y * yAxis[1],
+                              origin[2] + x * xAxis[2] + y * yAxis[2]) for x, y in piece]
+                            for piece in pieces])
+        return results
+
+    def shadowAreas(self, sunVector):
+        """Shaded area of each face for a sun vector. Faces that don't face the sun are fully shaded."""
+        areas = []
+        for area, pieces in zip(self.areas, self.shadows(sunVector)):
+            if pieces is None: areas.append(area)
+            else: areas.append(sum(polygonNormal(piece)[1] for piece in pieces))
+        return areas
+
+    def ToString(self):
+        return 'ShadowStudy::%d faces' % len(self.polygons)
@@ -0,0 +1,326 @@
+"""
+Preetham sky colors.
+
+Colors of a clear sky from the Perez luminance and chromaticity distributions
+with the coefficients of Preetham, Shirley and Smits (1999). The sun position
+uses the NOAA solar calculator.
+
+The values that only depend on the sun position and the turbidity (the zenith
+luminance and chromaticity, the Perez coefficients and the normalization terms)
+are calculated once for each sky and cached, and all the vertices of a sky dome
+are calculated together: the horizon term of the Perez function is calculated
+once for each ring of the dome and the sun terms once for each vertex.
+
+Dome vertices are in the order of the Colored Sky Visualizer meshes: rings from
+the horizon to the zenith and azimuths from North (clockwise) in each ring.
+"""
+from __future__ import division, print_function
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+_sunPositions = {}
+_skyCoefficients = {}
+_domeDirections = {}
+
+NIGHTCOLOR = (0.2, 0.2, 0.5)
+
+
+class Sun(object):
+    """Sun position. Angles are in radians and the azimuth is clockwise from North."""
+
+    def __init__(self, julianDay, time, declination, zenith, zenithCorr, azimuth):
+        self.julianDay = julianDay
+        self.time = time
+        self.declination = declination
+        self.zenith = zenith
+        self.zenithCorr = zenithCorr
+        self.azimuth = azimuth
+
+
+def julianDay(doy, year, hour, timeZone):
+    y = year + 4800
+    return doy + (hour - timeZone) / 24.0 + 365 * y + math.floor(y / 4) \
+        - math.floor(y / 100) + math.floor(y / 400) - 32045.5 - 59
+
+
+def sunPosition(doy, year, hour, timeZone, latitude, longitude):
+    """Sun position for a 0-based day of the year and an hour. Results are cached."""
+    key = (doy, year, hour, timeZone, latitude, longitude)
+    if key in _sunPositions: return _sunPositions[key]
+
+    jd = julianDay(doy, year, hour, timeZone)
+    julianCentury = (jd - 2451545) / 36525
+    #degrees
+    geomMeanLongSun = (280.46646 + julianCentury * (36000.76983 + julianCentury*0.0003032)) % 360
+    #degrees
+    geomMeanAnomSun = 357.52911 + julianCentury*(35999.05029 - 0.0001537*julianCentury)
+    eccentOrbit = 0.016708634 - julianCentury*(0.000042037 + 0.0000001267*julianCentury)
+    sunEqOfCtr = math.sin(math.radians(geomMeanAnomSun))*(1.914602 - julianCentury*(0.004817+0.000014*julianCentury)) + \
+        math.sin(math.radians(2*geomMeanAnomSun))*(0.019993-0.000101*julianCentury) + \
+        math.sin(math.radians(3*geomMeanAnomSun))*0.000289
+    #degrees
+    sunTrueLong = geomMeanLongSun + sunEqOfCtr
+    #degrees
+    sunAppLong = sunTrueLong - 0.00569 - 0.00478*math.sin(math.radians(125.04-1934.136*julianCentury))
+    #degrees
+    meanObliqEcliptic = 23 + (26 + ((21.448 - julianCentury*(46.815 + \
+        julianCentury*(0.00059 - julianCentury*0.001813))))/60)/60
+    #degrees
+    obliqueCorr = meanObliqEcliptic + 0.00256*math.cos(math.radians(125.04 - 1934.136*julianCentury))
+    #RADIANS
+    declination = math.asin(math.sin(math.radians(obliqueCorr))*math.sin(math.radians(sunAppLong)))
+
+    varY = math.tan(math.radians(obliqueCorr/2))*math.tan(math.radians(obliqueCorr/2))
+    #minutes
+    eqOfTime = 4*math.degrees(varY*math.sin(2*math.radians(geomMeanLongSun)) \
+        - 2*eccentOrbit*math.sin(math.radians(geomMeanAnomSun)) \
+        + 4*eccentOrbit*varY*math.sin(math.radians(geomMeanAnomSun))*math.cos(2*math.radians(geomMeanLongSun)) \
+        - 0.5*(varY**2)*math.sin(4*math.radians(geomMeanLongSun)) \
+        - 1.25*(eccentOrbit**2)*math.sin(2*math.radians(geomMeanAnomSun)))
+    #hours
+    solarTime = ((hour*60 + eqOfTime + 4*longitude - 60*timeZone) % 1440)/60
+    #degrees
+    hourAngle = (solarTime*15 + 180) if (solarTime*15 < 0) else (solarTime*15 - 180)
+    #RADIANS
+    zenith = math.acos(math.sin(math.radians(latitude))*math.sin(declination) \
+        + math.cos(math.radians(latitude))*math.cos(declination)*math.cos(math.radians(hourAngle)))
+    #degrees
+    atmosphRefrac = 0 if (zenith < 0.087) else \
+        (58.1/math.tan(math.pi/2 - zenith) \
+        - 0.07/(math.tan(math.pi/2 - zenith))**3 \
+        + 0.000086/(math.tan(math.pi/2 - zenith))**5)/3600 \
+        if (zenith < 1.484) else \
+            (1735 + (90-math.degrees(zenith)) \
+            *(-518.2 + (90-math.degrees(zenith)) \
+            *(103.4+(90-math.degrees(zenith)) \
+            *(-12.79+(90-math.degrees(zenith))*0.711))))/3600 \
+            if (zenith < -1.581) else \
+                (-20.772/math.tan(math.pi/2 - zenith))/3600
+    #RADIANS cw from N
+    cosAzimuth = ((math.sin(math.radians(latitude))*math.cos(zenith)) - math.sin(declination)) / \
+        (math.cos(math.radians(latitude))*math.sin(zenith))
+    if hourAngle > 0:
+        azimuth = (math.acos(cosAzimuth) + math.pi) % (2*math.pi)
+    else:
+        azimuth = (3*math.pi - math.acos(cosAzimuth)) % (2*math.pi)
+
+    sun = _sunPositions[key] = Sun(jd, solarTime, declination, zenith,
+                                   zenith - math.radians(atmosphRefrac), azimuth)
+    return sun
+
+
+def perez(zenith, gamma, coeffs):
+    """Perez function for a sky direction and its angle to the sun (radians).
+
+    Args:
+        coeffs: (A, B, C, D, E) coefficients.
+    """
+    A, B, C, D, E = coeffs
+    return (1 + A*math.exp(B/math.cos(zenith))) * (1 + C*math.exp(D*gamma) + E*(math.cos(gamma) ** 2))
+
+
+class SkyCoefficients(object):
+    """Zenith values and Perez coefficients of a sky.
+
+    A: darkening or brightening of the horizon
+    B: luminance gradient near the horizon
+    C: relative intensity of the circumsolar region
+    D: width of the circumsolar region
+    E: relative backscattered light
+    """
+
+    def __init__(self, sunZenith, turbidity):
+        T = turbidity
+        Yz = (4.0453*T - 4.9710) * math.tan((4/9 - T/120) * (math.pi - 2*sunZenith)) \
+            - 0.2155*T + 2.4192
+        Y0 = (4.0453*T - 4.9710) * math.tan((4/9 - T/120) * (math.pi)) - 0.2155*T + 2.4192
+        self.Yz = Yz/Y0
+
+        z3, z2, z = sunZenith ** 3, sunZenith ** 2, sunZenith
+        T2 = T ** 2
+        self.xz = T2 * (0.00166 * z3 - 0.00375 * z2 + 0.00209 * z) + \
+            T * (-0.02903 * z3 + 0.06377 * z2 - 0.03202 * z + 0.00394) + \
+            (0.11693 * z3 - 0.21196 * z2 + 0.06052 * z + 0.25886)
+        self.yz = T2 * (0.00275 * z3 - 0.00610 * z2 + 0.00317 * z) + \
+            T * (-0.04214 * z3 + 0.08970 * z2 - 0.04153 * z + 0.00516) + \
+            (0.15346 * z3 - 0.26756 * z2 + 0.06670 * z + 0.26688)
+
+        self.coeffsY = (0.1787 * T - 1.4630, -0.3554 * T + 0.4275, -0.0227 * T + 5.3251,
+                        0.1206 * T - 2.5771, -0.0670 * T + 0.3703)
+        self.coeffsx = (-0.0193 * T - 0.2592, -0.0665 * T + 0.0008, -0.0004 * T + 0.2125,
+                        -0.0641 * T - 0.8989, -0.0033 * T + 0.0452)
+        self.coeffsy = (-0.0167 * T - 0.2608, -0.0950 * T + 0.0092, -0.0079 * T + 0.2102,
+                        -0.0441 * T - 1.6537, -0.0109 * T + 0.0529)
+
+        # zenith value divided by the Perez function at the zenith
+        self.scaleY = self.Yz / perez(0, sunZenith, self.coeffsY)
+        self.scalex = self.xz / perez(0, sunZenith, self.coeffsx)
+        self.scaley = self.yz / perez(0, sunZenith, self.coeffsy)
+
+    @classmethod
+    def fromSun(cls, sunZenith, turbidity):
+        """Cached coefficients for a sun zenith angle and a turbidity."""
+        key = (sunZenith, turbidity)
+        if key not in _skyCoefficients: _skyCoefficients[key] = cls(sunZenith, turbidity)
+        return _skyCoefficients[key]
+
+
+def domeDirections(resolution):
+    """(azimuths, zeniths) of the vertices of a sky dome in radians. Results are cached.
+
+    Each ring has 4 * resolution vertices and there are resolution + 1 rings.
+    """
+    if resolution not in _domeDirections:
+        azimuths, zeniths = [], []
+        ringAzimuths = [j/(4*resolution) * 2*math.pi for j in range(4*resolution)]
+        for i in range(resolution + 1):
+            zenith = (resolution-i)/resolution * math.pi/2
+            azimuths.extend(ringAzimuths)
+            zeniths.extend([zenith] * len(ringAzimuths))
+        _domeDirections[resolution] = (azimuths, zeniths)
+    return _domeDirections[resolution]
+
+
+def YxyToXYZ(Y, x, y):
+    """XYZ color lists from Yxy lists."""
+    X = [xi/yi*Yi for Yi, xi, yi in zip(Y, x, y)]
+    Z = [(1-xi-yi)/yi*Yi for Yi, xi, yi in zip(Y, x, y)]
+    return X, list(Y), Z
+
+
+def XYZToRGB(X, Y, Z):
+    """Linear sRGB color lists from XYZ lists."""
+    R = [3.2406 * Xi - 1.5372 * Yi - 0.4986 * Zi for Xi, Yi, Zi in zip(X, Y, Z)]
+    G = [-0.9689 * Xi + 1.8758 * Yi + 0.0415 * Zi for Xi, Yi, Zi in zip(X, Y, Z)]
+    B = [0.0557 * Xi - 0.2040 * Yi + 1.0570 * Zi for Xi, Yi, Zi in zip(X, Y, Z)]
+    return R, G, B
+
+
+class SkyColor(object):
+    """Preetham sky for a date, a location and a turbidity."""
+
+    def createSky(self, doy, year, hour, timeZone, latitude, longitude, turbidity):
+        """Set the sky.
+
+        Args:
+            doy: 0-based day of the year.
+            hour: Hour of the day.
+        """
+        self.doy = doy
+        self.year = year
+        self.hour = self.time = hour
+        self.timeZone = timeZone
+        self.latitude = latitude
+        self.longitude = longitude
+        self.turbidity = turbidity
+
+        self.sun = sunPosition(doy, year, hour, timeZone, latitude, longitude)
+        self.julianDay = self.sun.julianDay
+        self.coefficients = SkyCoefficients.fromSun(self.sun.zenith, turbidity)
+        return self
+
+    def info(self):
+        print(  "doy: {0}\n"
+                "julian day: {9}\n"
+                "year: {10}\n"
+                "time: {1}\n"
+                "solar time: {2}\n"
+                "latitude: {3}\n"
+                "longitude: {4}\n"
+                "turbidity: {5}\n"
+                "sun azimuth: {6}\n"
+                "sun zenith: {7}\n"
+                "sun declination: {8}\n" \
+                .format(self.doy, self.time, self.sun.time, self.latitude, \
+                self.longitude, self.turbidity, math.degrees(self.sun.azimuth), math.degrees(self.sun.zenith), \
+                math.degrees(self.sun.declination), self.julianDay, self.year))
+
+    def calcSkyColors(self, azimuths, zeniths):
+        """Yxy colors for lists of sky directions (radians).
+
+        Returns:
+            Y, x, y lists.
+        """
+        sunZenith, sunAzimuth = self.sun.zenith, self.sun.azimuth
+        sinSunZenith, cosSunZenith = math.sin(sunZenith), math.cos(sunZenith)
+        co = self.coefficients
+        AY, BY, CY, DY, EY = co.coeffsY
+        Ax, Bx, Cx, Dx, Ex = co.coeffsx
+        Ay, By, Cy, Dy, Ey = co.coeffsy
+        scaleY, scalex, scaley = co.scaleY, co.scalex, co.scaley
+
+        Y, x, y = [], [], []
+        ringZenith = None
+        for azimuth, zenith in zip(azimuths, zeniths):
+            if zenith != ringZenith:
+                # horizon terms of the ring
+                ringZenith = zenith
+                sinZenith, cosZenith = math.sin(zenith), math.cos(zenith)
+                cosPerez = math.cos(min(zenith, math.pi))
+                horizonY = 1 + AY*math.exp(BY/cosPerez)
+                horizonx = 1 + Ax*math.exp(Bx/cosPerez)
+                horizony = 1 + Ay*math.exp(By/cosPerez)
+            gamma = math.acos(sinSunZenith*sinZenith*math.cos(azimuth-sunAzimuth) + cosSunZenith*cosZenith)
+            cosGamma2 = math.cos(gamma) ** 2
+            Y.append(scaleY * (horizonY * (1 + CY*math.exp(DY*gamma) + EY*cosGamma2)))
+            x.append(scalex * (horizonx * (1 + Cx*math.exp(Dx*gamma) + Ex*cosGamma2)))
+            y.append(scaley * (horizony * (1 + Cy*math.exp(Dy*gamma) + Ey*cosGamma2)))
+        return Y, x, y
+
+    def calcSkyColor(self, azimuth, zenith):
+        """Yxy color of a sky direction (radians)."""
+        Y, x, y = self.calcSkyColors([azimuth], [zenith])
+        return Y[0], x[0], y[0]
+
+    def calcDomeXYZ(self, resolution):
+        """XYZ colors of the vertices of a sky dome as X, Y, Z lists."""
+        return YxyToXYZ(*self.calcSkyColors(*domeDirections(resolution)))
+
+    def calcDomeRGB(self, resolution):
+        """Linear sRGB colors of the vertices of a sky dome as R, G, B lists."""
+        return XYZToRGB(*self.calcDomeXYZ(resolution))
+
+    def calcLightColor(self):
+        """Linear sRGB color of the sunlight."""
+        nightColor = XYZToRGB(*YxyToXYZ(*[[v] for v in NIGHTCOLOR]))
+        nightColor = [c[0] for c in nightColor]
+        if (self.sun.zenith > math.pi/2):
+            return nightColor
+
+        co = self.coefficients
+        Ys = co.scaleY * perez(self.sun.zenith, 0, co.coeffsY)
+        xs = co.scalex * perez(self.sun.zenith, 0, co.coeffsx)
+        ys = co.scaley * perez(self.sun.zenith, 0, co.coeffsy)
+        dayColor = [c[0] for c in XYZToRGB(*YxyToXYZ([Ys], [xs], [ys]))]
+
+        interpolation = max(0, min(1, (self.sun.zenith - math.pi/2 + 0.2) / 0.2))
+        return [interpolation * n + (1 - interpolation) * d for n, d in zip(nightColor, dayColor)]
+
+    def calcSkyAvg(self, resolution):
+        """Average Yxy color of the sky dome without the zenith ring."""
+        azimuths, zeniths = domeDirections(resolution)
+        # the last ring is the zenith
+        count = 4 * resolution * resolution
+        Y, x, y = self.calcSkyColors(azimuths[:count], zeniths[:count])
+        fac = 1/(4 * resolution**2)
+        return [sum(v * fac for v in values) for values in (Y, x, y)]
+
+
+def skySequence(doys, year, hours, timeZone, latitude, longitude, turbidity, resolution):
+    """XYZ dome colors for every hour of every day (e.g. an animation of a design day).
+
+    Returns:
+        A list of (X, Y, Z) lists for each sky. Skies are ordered by day and then by hour.
+    """
+    sky = SkyColor()
+    skies = []
+    for doy in doys:
+        for hour in hours:
+            sky.createSky(doy, year, hour, timeZone, latitude, longitude, turbidity)
+            skies.append(sky.calcDomeXYZ(resolution))
+    return skies
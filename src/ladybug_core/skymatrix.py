@@ -0,0 +1,374 @@
+"""
+Native Perez all-weather sky matrix.
+
+This module replaces the gendaymtx run (.bat file + os.system call) of the sky
+components. It follows the method of Radiance's gendaymtx (Ian Ashdown and Greg
+Ward) and produces the same values that Ladybug used to read from gendaymtx -O1
+output: for every sky patch and every hour of the year the diffuse and the direct
+radiation (Wh/m2) that reach a surface facing the patch.
+
+The patches are the Tregenza (density 1, 145 patches) or Reinhart (density 2,
+577 patches) subdivisions. The ground patch is not included. Patch constants
+are calculated once per density and each hour of the year evaluates the Perez
+model for all the patches in a single pass. Night hours are skipped.
+"""
+from __future__ import division
+import math
+
+from .wea import Wea
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+SOLARCONSTANT = 1367.0
+
+# upper bounds of the Perez sky clearness categories
+CLEARNESSBINS = (1.065, 1.230, 1.500, 1.950, 2.800, 4.500, 6.200, 12.01)
+
+# Perez et al. 1993 coefficients [a, b, c, d, e] x [x0, x1, x2, x3] for each
+# clearness category
+PEREZCOEFFICIENTS = (
+    ((1.3525, -0.2576, -0.2690, -1.4366), (-0.7670, 0.0007, 1.2734, -0.1233),
+     (2.8000, 0.6004, 1.2375, 1.0000), (1.8734, 0.6297, 0.9738, 0.2809),
+     (0.0356, -0.1246, -0.5718, 0.9938)),
+    ((-1.2219, -0.7730, 1.4148, 1.1016), (-0.2054, 0.0367, -3.9128, 0.9156),
+     (6.9750, 0.1774, 6.4477, -0.1239), (-1.5798, -0.5081, -1.7812, 0.1080),
+     (0.2624, 0.0672, -0.2190, -0.4285)),
+    ((-1.1000, -0.2515, 0.8952, 0.0156), (0.2782, -0.1812, -4.5000, 1.1766),
+     (24.7219, -13.0812, -37.7000, 34.8438), (-5.0000, 1.5218, 3.9229, -2.6204),
+     (-0.0156, 0.1597, 0.4199, -0.5562)),
+    ((-0.5484, -0.6654, -0.2672, 0.7117), (0.7234, -0.6219, -5.6812, 2.6297),
+     (33.3389, -18.3000, -62.2500, 52.0781), (-3.5000, 0.0016, 1.1477, 0.1062),
+     (0.4659, -0.3296, -0.0876, -0.0329)),
+    ((-0.6000, -0.3566, -2.5000, 2.3250), (0.2937, 0.0496, -5.6812, 1.8415),
+     (21.0000, -4.7656, -21.5906, 7.2492), (-3.5000, -0.1554, 1.4062, 0.3988),
+     (0.0032, 0.0766, -0.0656, -0.1294)),
+    ((-1.0156, -0.3670, 1.0078, 1.4051), (0.2875, -0.5328, -3.8500, 3.3750),
+     (14.0000, -0.9999, -7.1406, 7.5469), (-3.4000, -0.1078, -1.0750, 1.5702),
+     (-0.0672, 0.4016, 0.3017, -0.4844)),
+    ((-1.0000, 0.0211, 0.5025, -0.5119), (-0.3000, 0.1922, 0.7023, -1.6317),
+     (19.0000, -5.0000, 1.2438, -1.9094), (-4.0000, 0.0250, 0.3844, 0.2656),
+     (1.0468, -0.3788, -2.4517, 1.4656)),
+    ((-1.0500, 0.0289, 0.4260, 0.3590), (-0.3250, 0.1156, 0.7781, 0.0025),
+     (31.0625, -14.5000, -46.1148, 55.3750), (-7.2312, 0.4050, 13.3500, 0.6234),
+     (1.5000, -0.6426, 1.8564, 0.5636))
+    )
+
+# number of patches in each row of the Tregenza sky (without the zenith patch)
+TREGENZAROWS = (30, 30, 24, 24, 18, 12, 6)
+
+# number of patches that share the direct radiation
+SUNPATCHCOUNT = 4
+
+_patchCache = {}
+
+
+def skyPatches(density=1):
+    """Sky patches for a Tregenza (density=1) or Reinhart (density=2) sky.
+
+    Returns:
+        vectors: Unit vectors (x, y, z) to the center of each patch. Patches go
+            row by row from the horizon to the zenith and azimuths start from
+            north (+Y) and turn toward east (+X).
+        solidAngles: Solid angle of each patch in steradians.
+        rowCounts: Number of patches in each row.
+    """
+    if density in _patchCache: return _patchCache[density]
+    if density not in (1, 2):
+        raise ValueError('Sky density should be 1 (Tregenza) or 2 (Reinhart). Got %s.' % str(density))
+
+    alpha = (math.pi / 2) / (len(TREGENZAROWS) * density + 0.5)
+    vectors = []
+    solidAngles = []
+    rowCounts = []
+    for row in range(len(TREGENZAROWS) * density):
+        count = TREGENZAROWS[row // density] * density
+        alt = alpha * (row + 0.5)
+        dom = 2 * math.pi * (math.sin(alpha * (row + 1)) - math.sin(alpha * row)) / count
+        for i in range(count):
+            azi = 2 * math.pi * i / count
+            vectors.append((math.sin(azi) * math.cos(alt), math.cos(azi) * math.cos(alt), math.sin(alt)))
+            solidAngles.append(dom)
+        rowCounts.append(count)
+
+    # zenith patch
+    vectors.append((0.0, 0.0, 1.0))
+    solidAngles.append(2 * math.pi * (1 - math.cos(alpha / 2)))
+    rowCounts.append(1)
+
+    _patchCache[density] = vectors, solidAngles, rowCounts
+    return _patchCache[density]
+
+
+def sunPosition(julianDay, time, lat, lngt, timeZone):
+    """Sun altitude and azimuth in radians for a solar position as gendaymtx does.
+
+    Args:
+        julianDay: Day of the year (1-365).
+        time: Standard time in hours (e.g. 12.5).
+        lat, lngt: Location in degrees (north and east are positive).
+        timeZone: Time zone in hours (east is positive).
+    Returns:
+        altitude and azimuth. Azimuth is measured from north toward east.
+    """
+    latRad = math.radians(lat)
+    # radiance uses a west-positive longitude and meridian
+    sLongitude = math.radians(-lngt)
+    sMeridian = math.radians(-timeZone * 15)
+
+    sDec = 0.4093 * math.sin((2 * math.pi / 368) * (julianDay - 81))
+    solarTime = time + 0.170 * math.sin((4 * math.pi / 373) * (julianDay - 80)) \
+                - 0.129 * math.sin((2 * math.pi / 355) * (julianDay - 8)) \
+                + 12 * (sMeridian - sLongitude) / math.pi
+
+    hourAngle = solarTime * math.pi / 12
+    altitude = math.asin(math.sin(latRad) * math.sin(sDec) -
+                         math.cos(latRad) * math.cos(sDec) * math.cos(hourAngle))
+    # radiance measures the azimuth from south (positive toward west)
+    azimuth = -math.atan2(math.cos(sDec) * math.sin(hourAngle),
+                          -math.cos(latRad) * math.sin(sDec) -
+                          math.sin(latRad) * math.cos(sDec) * math.cos(hourAngle))
+    return altitude, azimuth + math.pi
+
+
+def perezParameters(julianDay, sunAltitude, directRad, diffuseRad):
+    """Perez sky model parameters (a, b, c, d, e) for an hour.
+
+    Sky brightness and clearness are calculated from the radiation values the
+    same way gendaymtx does (including its limits for the sun zenith angle).
+    """
+    if sunAltitude <= 0:
+        sunZenith = math.pi / 2
+    elif sunAltitude >= math.radians(87):
+        sunZenith = math.radians(3)
+    else:
+        sunZenith = math.pi / 2 - sunAltitude
+
+    # air mass (Kasten and Young) is calculated for a sun above 5 degrees and the
+    # limited zenith angle is used for the rest of the calculation
+    sunZenith = min(sunZenith, math.radians(85))
+    zenithDeg = math.degrees(sunZenith)
+    airMass = 1 / (math.cos(sunZenith) + 0.15 * math.pow(93.885 - zenithDeg, -1.253))
+
+    dayAngle = 2 * math.pi * (julianDay - 1) / 365
+    eccentricity = 1.00011 + 0.034221 * math.cos(dayAngle) + 0.00128 * math.sin(dayAngle) + \
+                   0.000719 * math.cos(2 * dayAngle) + 0.000077 * math.sin(2 * dayAngle)
+
+    brightness = max(0.01, diffuseRad * airMass / (SOLARCONSTANT * eccentricity))
+    zenith3 = 1.041 * sunZenith ** 3
+    clearness = ((diffuseRad + directRad) / diffuseRad + zenith3) / (1 + zenith3)
+    clearness = min(11.9, max(1.0, clearness))
+
+    for index, upperBound in enumerate(CLEARNESSBINS):
+        if clearness < upperBound: break
+
+    z = sunZenith
+    params = [x0 + x1 * z + brightness * (x2 + x3 * z)
+              for x0, x1, x2, x3 in PEREZCOEFFICIENTS[index]]
+
+    if index == 0:
+        # parameters c and d are calculated differently for overcast skies
+        x0, x1, x2, x3 = PEREZCOEFFICIENTS[0][2]
+        params[2] = math.exp(math.pow(brightness * (x0 + x1 * z), x2)) - x3
+        x0, x1, x2, x3 = PEREZCOEFFICIENTS[0][3]
+        params[3] = -math.exp(brightness * (x0 + x1 * z)) + x2 + brightness * x3
+
+    return params
+
+
+def diffuseValues(sunVector, params, diffuseRad, vectors, solidAngles):
+    """Diffuse radiation (Wh/m2) for each sky patch for a Perez sky."""
+    a, b, c, d, e = params
+    sx, sy, sz = sunVector
+    exp = math.exp
+    acos = math.acos
+
+    relLum = []
+    for (x, y, z) in vectors:
+        cosGamma = sx * x + sy * y + sz * z
+        if cosGamma > 1: cosGamma = 1
+        elif cosGamma < -1: cosGamma = -1
+        lum = (1 + a * exp(b / z)) * (1 + c * exp(d * acos(cosGamma)) + e * cosGamma * cosGamma)
+        relLum.append(lum if lum > 0 else 0)
+
+    # patch values on a horizontal surface should add up to diffuse radiation
+    horizontal = sum(lum * z * dom for lum, (x, y, z), dom in zip(relLum, vectors, solidAngles))
+    if horizontal <= 1e-9:
+        # make it a uniform sky
+        relLum = [1] * len(vectors)
+        horizontal = math.pi
+
+    factor = diffuseRad / horizontal
+    return [lum * factor * dom for lum, dom in zip(relLum, solidAngles)]
+
+
+def directValues(sunVector, directRad, vectors):
+    """Direct radiation (Wh/m2) for each sky patch.
+
+    The sun is spread between the patches closest to the sun position.
+    """
+    sx, sy, sz = sunVector
+    dots = [sx * x + sy * y + sz * z for x, y, z in vectors]
+    closest = sorted(range(len(dots)), key=dots.__getitem__, reverse=True)[:SUNPATCHCOUNT]
+    weights = [1 / (1.002 - dots[p]) for p in closest]
+    totalWeight = sum(weights)
+
+    values = [0] * len(vectors)
+    for p, weight in zip(closest, weights):
+        values[p] = directRad * weight / totalWeight
+    return values
+
+
+def readGendaymtx(daylightMtxDif, daylightMtxDir, density=1):
+    """Read gendaymtx -O1 results in the same structure as SkyMatrix.toDict.
+
+    This is useful to read results from older runs and to compare the native sky
+    against gendaymtx.
+    """
+    vectors, solidAngles, rowCounts = skyPatches(density)
+    patchCount = len(vectors)
+    radValuesDict = dict((patch, {}) for patch in range(patchCount))
+
+    def getValue(line, patch):
+        R, G, B = line.split()
+        return (.265074126 * float(R) + .670114631 * float(G) + .064811243 * float(B)) * \
+            solidAngles[patch]
+
+    with open(daylightMtxDif, 'r') as resFileDif, open(daylightMtxDir, 'r') as resFileDir:
+        lines = zip(resFileDif, resFileDir)
+        # the first block is the ground and blocks are separated by empty lines
+        patch, hour = 0, 0
+        for lineCount, (difLine, dirLine) in enumerate(lines):
+            if lineCount == 0 and difLine.startswith('#?RADIANCE'):
+                # newer versions of gendaymtx write a header
+                for difLine, dirLine in lines:
+                    if not difLine.strip(): break
+                continue
+            if not difLine.strip():
+                patch, hour = patch + 1, 0
+                continue
+            hour += 1
+            if patch == 0 or patch > patchCount: continue
+            try:
+                radValuesDict[patch - 1][hour] = [getValue(difLine, patch - 1),
+                                                  getValue(dirLine, patch - 1)]
+            except ValueError:
+                radValuesDict[patch - 1][hour] = [0, 0]
+
+    return radValuesDict
+
+
+def compareMatrices(matrix, reference, tolerance=0.01):
+    """Compare two sky matrices in SkyMatrix.toDict structure.
+
+    Args:
+        matrix, reference: Sky matrix dictionaries.
+        tolerance: Accepted relative difference for the cumulative radiation of
+            each patch.
+    Returns:
+        isMatching: True if all the patches are within tolerance.
+        maxDifference: Largest relative difference between cumulative patch values.
+    """
+    maxDifference = 0
+    for patch, hourlyValues in reference.items():
+        for i in range(2):
+            refTotal = sum(values[i] for values in hourlyValues.values())
+            total = sum(values[i] for values in matrix[patch].values())
+            difference = abs(total - refTotal) / max(refTotal, 1e-6)
+            maxDifference = max(maxDifference, difference)
+    return maxDifference <= tolerance, maxDifference
+
+
+class SkyMatrix(object):
+    """Hourly Perez sky matrix.
+
+    Args:
+        wea: A Wea.
+        density: 1 for Tregenza (145 patches) and 2 for Reinhart (577 patches).
+    """
+
+    def __init__(self, wea, density=1):
+        self.wea = wea
+        self.density = density
+        self.vectors, self.solidAngles, self.rowCounts = skyPatches(density)
+        # hourly list of patch values. None for hours with no radiation.
+        self.diffuse = [None] * 8760
+        self.direct = [None] * 8760
+        self.compute()
+
+    @classmethod
+    def fromEpwFile(cls, epwFile, density=1):
+        return cls(Wea.fromEpwFile(epwFile), density)
+
+    @classmethod
+    def fromEpwFiles(cls, epwFiles, density=1):
+        """Batch generate sky matrices for a list of epw files."""
+        return [cls.fromEpwFile(epwFile, density) for epwFile in epwFiles]
+
+    readGendaymtx = staticmethod(readGendaymtx)
+    compareMatrices = staticmethod(compareMatrices)
+
+    @property
+    def patchCount(self):
+        return len(self.vectors)
+
+    def compute(self):
+        wea = self.wea
+        vectors = self.vectors
+        solidAngles = self.solidAngles
+        for hour in range(8760):
+            dirRad = wea.directRad[hour]
+            difRad = wea.diffuseRad[hour]
+            if difRad <= 1e-4 and dirRad <= 1e-4: continue
+
+            julianDay = hour // 24 + 1
+            altitude, azimuth = sunPosition(julianDay, hour % 24 + 0.5,
+                                            wea.lat, wea.lngt, wea.timeZone)
+            sunVector = (math.sin(azimuth) * math.cos(altitude),
+                         math.cos(azimuth) * math.cos(altitude),
+                         math.sin(altitude))
+
+            if difRad > 1e-4:
+                params = perezParameters(julianDay, altitude, dirRad, difRad)
+                self.diffuse[hour] = diffuseValues(sunVector, params, difRad,
+                                                   vectors, solidAngles)
+
+            if dirRad > 1e-4 and altitude > 0:
+                self.direct[hour] = directValues(sunVector, dirRad, vectors)
+
+    def patchValues(self, hour):
+        """Diffuse and direct values of all the patches for a 0-based hour."""
+        zeros = [0] * self.patchCount
+        return self.diffuse[hour] or zeros, self.direct[hour] or zeros
+
+    def cumulativeValues(self, hours=None):
+        """Sum of [diffuse, direct] values for each patch for a list of 0-based hours."""
+        if hours is None: hours = range(8760)
+        cumulative = [[0, 0] for p in range(self.patchCount)]
+        for hour in hours:
+            for i, values in enumerate((self.diffuse[hour], self.direct[hour])):
+                if values is None: continue
+                for patchValues, value in zip(cumulative, values):
+                    patchValues[i] += value
+        return cumulative
+
+    def toDict(self):
+        """Sky matrix as {patch: {hour (1-8760): [diffuse, direct]}}.
+
+        This is the structure that the components used to read from gendaymtx
+        results.
+        """
+        zeros = [0] * self.patchCount
+        radValuesDict = dict((patch, {}) for patch in range(self.patchCount))
+        for hour in range(8760):
+            difValues = self.diffuse[hour] or zeros
+            dirValues = self.direct[hour] or zeros
+            for patch, difValue, dirValue in zip(range(self.patchCount), difValues, dirValues):
+                radValuesDict[patch][hour + 1] = [difValue, dirValue]
+        return radValuesDict
+
+    def ToString(self):
+        return 'SkyMatrix::%s' % self.wea.locName
@@ -0,0 +1,310 @@
+"""
+Solar fans of planar boundaries.
+
+A solar fan is the volume above a boundary that has to stay clear so the
+boundary sees the sun for a set of sun positions. The boundary is copied to a
+plane above it (the boundary plane moved up by the height of the fan) along
+each sun vector and the fan is the convex hull of the boundary and all these
+copies, calculated with Quickhull in one pass. Concave boundaries are split
+into a few convex pieces first and each piece gets its own hull.
+
+    boundary: List of (x, y, z) points of a closed planar polygon without the
+        repeated first point.
+    sunVectors: Directions from the boundary to the sun (e.g. sun points
+        minus the center of the sun path).
+"""
+from __future__ import division
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+from .shadows import polygonNormal, planeAxes
+
+
+def _sub(a, b):
+    return a[0] - b[0], a[1] - b[1], a[2] - b[2]
+
+
+def _dot(a, b):
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a, b):
+    return a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0]
+
+
+def _turn(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def convexHull2D(points):
+    """Points of the convex hull of 2D points in counterclockwise order (monotone chain)."""
+    points = sorted(set(points))
+    if len(points) < 3: return points
+    lower, upper = [], []
+    for p in points:
+        while len(lower) > 1 and _turn(lower[-2], lower[-1], p) <= 0: lower.pop()
+        lower.append(p)
+    for p in reversed(points):
+        while len(upper) > 1 and _turn(upper[-2], upper[-1], p) <= 0: upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def _isConvex(points, tol):
+    return all(_turn(a, b, c) >= -tol
+               for a, b, c in zip(points, points[1:] + points[:1], points[2:] + points[:2]))
+
+
+def _pointInTriangle(p, a, b, c):
+    return _turn(a, b, p) >= 0 and _turn(b, c, p) >= 0 and _turn(c, a, p) >= 0
+
+
+def triangulate(points):
+    """Triangles (index tuples) of a simple counterclockwise 2D polygon by ear clipping."""
+    remaining = list(range(len(points)))
+    triangles = []
+    while len(remaining) > 3:
+        count = len(remaining)
+        for k in range(count):
+            i, j, l = remaining[k - 1], remaining[k], remaining[(k + 1) % count]
+            a, b, c = points[i], points[j], points[l]
+            if _turn(a, b, c) <= 0: continue
+            if any(_pointInTriangle(points[m], a, b, c) for m in remaining if m not in (i, j, l)):
+                continue
+            triangles.append((i, j, l))
+            del remaining[k]
+            break
+        else:
+            # no clean ear because of collinear or nearly touching edges
+            triangles.append(tuple(remaining[:3]))
+            del remaining[1]
+    triangles.append(tuple(remaining))
+    return triangles
+
+
+def convexPieces(points, tol=1e-9):
+    """Convex pieces (index lists) of a simple counterclockwise 2D polygon.
+
+    The ear clipping triangles are merged across their diagonals while the
+    merged piece stays convex (Hertel-Mehlhorn), which gives at most four
+    times the minimum number of pieces.
+    """
+    if _isConvex(points, tol): return [list(range(len(points)))]
+    pieces = dict(enumerate(list(t) for t in triangulate(points)))
+    edges = {}
+    for key, piece in pieces.items():
+        for a, b in zip(piece, piece[1:] + piece[:1]): edges[(a, b)] = key
+
+    for (a, b) in sorted(edges):
+        first, second = edges.get((a, b)), edges.get((b, a))
+        if first is None or second is None or first == second: continue
+        p, q = pieces[first], pieces[second]
+        # p goes a -> b and q goes b -> a so the merged piece is p from b to a plus q inside
+        k = p.index(b)
+        p = p[k:] + p[:k]
+        k = q.index(a)
+        q = q[k:] + q[:k]
+        merged = p + q[1:-1]
+        if not _isConvex([points[i] for i in merged], tol): continue
+        pieces[first] = merged
+        del pieces[second]
+        for c, d in zip(merged, merged[1:] + merged[:1]): edges[(c, d)] = first
+        del edges[(a, b)], edges[(b, a)]
+    return [pieces[key] for key in sorted(pieces)]
+
+
+def quickhull(points, tol=None):
+    """Convex hull of 3D points.
+
+    Returns:
+        A list of triangles (index tuples into points) that are counterclockwise
+        seen from outside. Points that are all on a plane raise a ValueError.
+    """
+    count = len(points)
+    if count < 4: raise ValueError('A convex hull needs at least 4 points.')
+    if tol is None:
+        size = max(max(abs(c) for c in p) for p in points)
+        tol = max(size, 1) * 1e-9
+
+    # initial tetrahedron from the extreme points
+    extremes = []
+    for axis in range(3):
+        extremes.append(min(range(count), key=lambda i: points[i][axis]))
+        extremes.append(max(range(count), key=lambda i: points[i][axis]))
+    a, b = max(((i, j) for i in extremes for j in extremes),
+               key=lambda ij: _dot(_sub(points[ij[0]], points[ij[1]]), _sub(points[ij[0]], points[ij[1]])))
+    ab = _sub(points[b], points[a])
+
+    def lineDistance(i):
+        v = _cross(ab, _sub(points[i], points[a]))
+        return _dot(v, v)
+
+    c = max(range(count), key=lineDistance)
+    normal = _cross(ab, _sub(points[c], points[a]))
+    d = max(range(count), key=lambda i: abs(_dot(normal, _sub(points[i], points[a]))))
+    if abs(_dot(normal, _sub(points[d], points[a]))) <= tol * (_dot(normal, normal) ** 0.5):
+        raise ValueError('The points are on a plane.')
+    if _dot(normal, _sub(points[d], points[a])) > 0: b, c = c, b
+
+    faces = {}
+    edges = {}
+    nextKey = [0]
+
+    def addFace(i, j, k):
+        n = _cross(_sub(points[j], points[i]), _sub(points[k], points[i]))
+        length = _dot(n, n) ** 0.5 or 1
+        n = (n[0] / length, n[1] / length, n[2] / length)
+        key = nextKey[0]
+        nextKey[0] += 1
+        faces[key] = [(i, j, k), n, _dot(n, points[i]), []]
+        edges[(i, j)] = edges[(j, k)] = edges[(k, i)] = key
+        return key
+
+    newFaces = [addFace(a, b, c), addFace(a, d, b), addFace(b, d, c), addFace(c, d, a)]
+
+    def assign(candidates, targets):
+        for i in candidates:
+            for key in targets:
+                face = faces[key]
+                if _dot(face[1], points[i]) - face[2] > tol:
+                    face[3].append(i)
+                    break
+
+    assign([i for i in range(count) if i not in (a, b, c, d)], newFaces)
+
+    pending = [key for key in newFaces if faces[key][3]]
+    while pending:
+        key = pending.pop()
+        if key not in faces or not faces[key][3]: continue
+        face = faces[key]
+        apex = max(face[3], key=lambda i: _dot(face[1], points[i]) - face[2])
+        p = points[apex]
+
+        # faces seen from the apex and their horizon edges
+        visible = set([key])
+        stack = [key]
+        horizon = []
+        while stack:
+            current = stack.pop()
+            i, j, k = faces[current][0]
+            for edge in ((i, j), (j, k), (k, i)):
+                neighbor = edges[(edge[1], edge[0])]
+                if neighbor in visible: continue
+                other = faces[neighbor]
+                if _dot(other[1], p) - other[2] > tol:
+                    visible.add(neighbor)
+                    stack.append(neighbor)
+                else:
+                    horizon.append(edge)
+
+        orphans = []
+        for v in visible:
+            i, j, k = faces[v][0]
+            orphans.extend(faces[v][3])
+            for edge in ((i, j), (j, k), (k, i)):
+                if edges.get(edge) == v: del edges[edge]
+            del faces[v]
+        newFaces = [addFace(i, j, apex) for i, j in horizon]
+        assign([i for i in orphans if i != apex], newFaces)
+        pending.extend(k for k in newFaces if faces[k][3])
+
+    return [faces[key][0] for key in sorted(faces)]
+
+
+def fanOffsets(boundary, sunVectors, height):
+    """Vectors from the boundary to its copies on the top plane of the fan.
+
+    The top plane is the plane of the boundary moved up by height. Sun vectors
+    that don't reach the top plane in front of the boundary are skipped.
+    """
+    normal = polygonNormal(boundary)[0]
+    offsets = []
+    for v in sunVectors:
+        facing = _dot(v, normal)
+        if not facing: continue
+        t = height * normal[2] / facing
+        if t <= 0: continue
+        offsets.append((v[0] * t, v[1] * t, v[2] * t))
+    return offsets
+
+
+def solarFan(boundary, sunVectors, height):
+    """Convex hulls of the solar fan of a planar boundary.
+
+    Returns:
+        A (vertices, faces) mesh for each convex piece of the boundary. The
+        faces are triangles that are counterclockwise seen from outside. The
+        list is empty if no sun vector reaches the top plane.
+    """
+    offsets = fanOffsets(boundary, sunVectors, height)
+    if not offsets: return []
+    normal = polygonNormal(boundary)[0]
+    xAxis, yAxis = planeAxes(normal)
+    origin = boundary[0]
+    to2D = lambda p: (_dot(_sub(p, origin), xAxis), _dot(_sub(p, origin), yAxis))
+    # the plane coordinates of the top points are the boundary coordinates plus the offset
+    offsets2D = convexHull2D([to2D((origin[0] + o[0], origin[1] + o[1], origin[2] + o[2])) for o in offsets])
+    flat = [to2D(p) for p in boundary]
+    top = (origin[0] + offsets[0][0], origin[1] + offsets[0][1], origin[2] + offsets[0][2])
+    lift = _dot(_sub(top, origin), normal)
+    size = max(max(abs(c) for c in p) for p in flat)
+    tol = max(size, 1) * 1e-9
+
+    meshes = []
+    for piece in convexPieces(flat, tol):
+        piecePoints = [flat[i] for i in piece]
+        topPoints = convexHull2D([(x + ox, y + oy) for x, y in piecePoints for ox, oy in offsets2D])
+        vertices = [boundary[i] for i in piece] + [
+            (origin[0] + x * xAxis[0] + y * yAxis[0] + lift * normal[0],
+             origin[1] + x * xAxis[1] + y * yAxis[1] + lift * normal[1],
+             origin[2] + x * xAxis[2] + y * yAxis[2] + lift * normal[2]) for x, y in topPoints]
+        triangles = quickhull(vertices)
+        used = sorted(set(i for t in triangles for i in t))
+        index = dict((old, new) for new, old in enumerate(used))
+        meshes.append(([vertices[i] for i in used], [tuple(index[i] for i in t) for t in triangles]))
+    return meshes
+
+
+def meshVolume(vertices, faces):
+    """Volume of a closed triangle mesh with outward faces."""
+    return sum(_dot(vertices[a], _cross(vertices[b], vertices[c])) for a, b, c in faces) / 6
+
+
+class SolarFan(object):
+    """Solar fan of a planar boundary.
+
+    Args:
+        boundary: Points of the boundary. Repeated points are removed.
+        sunVectors: Directions from the boundary to the sun.
+        height: Distance from the boundary plane to the top plane along Z.
+    """
+
+    def __init__(self, boundary, sunVectors, height, tolerance=1e-6):
+        points = []
+        for pt in boundary:
+            pt = tuple(pt)
+            if not points or _dot(_sub(pt, points[-1]), _sub(pt, points[-1])) > tolerance ** 2:
+                points.append(pt)
+        if len(points) > 1 and _dot(_sub(points[0], points[-1]), _sub(points[0], points[-1])) <= tolerance ** 2:
+            points.pop()
+        self.boundary = points
+        self.sunVectors = [tuple(v) for v in sunVectors]
+        self.height = height
+
+    @property
+    def offsets(self):
+        return fanOffsets(self.boundary, self.sunVectors, self.height)
+
+    def meshes(self):
+        """A (vertices, faces) mesh for each convex piece of the boundary."""
+        return solarFan(self.boundary, self.sunVectors, self.height)
+
+    def volume(self):
+        """Volume of the fan if the boundary is convex (the sum of the piece volumes otherwise)."""
+        return sum(meshVolume(vertices, faces) for vertices, faces in self.meshes())
+
+    def ToString(self):
+        return 'SolarFan::%d boundary points, %d sun vectors' % (len(self.boundary), len(self.sunVectors))
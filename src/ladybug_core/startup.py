@@ -0,0 +1,187 @@
+"""
+Fast start of the Ladybug_Ladybug component.
+
+Letting Ladybug fly should never wait for the network or import modules that
+the canvas doesn't use:
+
+    LazyObject: a class or function of a core module that is imported the
+        first time it is called or one of its attributes is used.
+    VersionCache: a local copy of versions.txt with a time to live. The
+        component compares with the local copy and a stale copy is downloaded
+        again in a background thread for the next start.
+    StartupTimer: time of each phase of the start, to keep the start below
+        STARTUPBUDGET seconds without network access.
+"""
+import ast
+import os
+import threading
+import time
+from timeit import default_timer
+
+
+STARTUPBUDGET = 0.2  # seconds
+VERSIONSTTL = 86400  # seconds
+
+
+class LazyObject(object):
+    """A module attribute that is imported on first use.
+
+    Args:
+        path: Module and attribute name as 'module:attribute' (e.g.
+            'ladybug_core.shadows:ShadowStudy').
+    """
+
+    __slots__ = ('path', '_target')
+
+    def __init__(self, path):
+        self.path = path
+        self._target = None
+
+    def resolve(self):
+        """The object itself. The module is imported on the first call."""
+        if self._target is None:
+            moduleName, name = self.path.split(':')
+            self._target = getattr(__import__(moduleName, fromlist=[name]), name)
+        return self._target
+
+    @property
+    def isLoaded(self):
+        return self._target is not None
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return 'LazyObject(%r)' % self.path
+
+    def ToString(self):
+        return 'LazyObject::%s' % self.path
+
+
+def runInBackground(func, *args):
+    """Run a function in a daemon thread and ignore its errors."""
+    def run():
+        try:
+            func(*args)
+        except Exception:
+            pass
+    thread = threading.Thread(target=run)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def urlDownload(url, filePath, timeout=10):
+    try:
+        from urllib.request import urlopen
+    except ImportError:
+        from urllib2 import urlopen
+    response = urlopen(url, timeout=timeout)
+    try:
+        content = response.read()
+    finally:
+        response.close()
+    with open(filePath, 'wb') as outf:
+        outf.write(content)
+
+
+class VersionCache(object):
+    """Local copy of a versions file ({'Ladybug': '2017.07.28.0.0.65', ...}).
+
+    Args:
+        cacheFile: Path to the local copy.
+        url: Address of the versions file.
+        ttl: Seconds before the local copy is downloaded again.
+        fetcher: Optional function (url, filePath) that downloads a url to a file.
+    """
+
+    def __init__(self, cacheFile, url, ttl=VERSIONSTTL, fetcher=None):
+        self.cacheFile = cacheFile
+        self.url = url
+        self.ttl = ttl
+        self.fetcher = fetcher or urlDownload
+        self._thread = None
+
+    @staticmethod
+    def parse(text):
+        """Versions of the text of a versions file. The text is never executed."""
+        versions = ast.literal_eval(text.strip())
+        if not isinstance(versions, dict): raise ValueError('Not a versions file.')
+        return versions
+
+    def versions(self):
+        """Versions of the local copy or None if there isn't a valid copy."""
+        try:
+            with open(self.cacheFile, 'r') as inf:
+                return self.parse(inf.read())
+        except (IOError, OSError, ValueError, SyntaxError):
+            return None
+
+    @property
+    def isStale(self):
+        try:
+            return time.time() - os.path.getmtime(self.cacheFile) > self.ttl
+        except OSError:
+            return True
+
+    def refresh(self):
+        """Download the versions file. The local copy is only replaced by a valid file."""
+        tempFile = '%s.%d.tmp' % (self.cacheFile, os.getpid())
+        try:
+            self.fetcher(self.url, tempFile)
+            with open(tempFile, 'r') as inf:
+                self.parse(inf.read())
+            try:
+                os.rename(tempFile, self.cacheFile)
+            except OSError:
+                # Windows doesn't rename over existing files
+                os.remove(self.cacheFile)
+                os.rename(tempFile, self.cacheFile)
+        finally:
+            if os.path.isfile(tempFile): os.remove(tempFile)
+
+    def refreshInBackground(self):
+        """Download a stale or missing local copy in a background thread.
+
+        Returns:
+            The thread or None if the copy is fresh or a download is running.
+        """
+        if not self.isStale or (self._thread is not None and self._thread.is_alive()):
+            return None
+        self._thread = runInBackground(self.refresh)
+        return self._thread
+
+
+class StartupTimer(object):
+    """Time of the phases of a start.
+
+    Args:
+        startTime: Optional timeit.default_timer() value of the start.
+    """
+
+    def __init__(self, startTime=None):
+        self.startTime = default_timer() if startTime is None else startTime
+        self._last = self.startTime
+        self.phases = []
+
+    def mark(self, phase, endTime=None):
+        """End a phase now or at a default_timer() value."""
+        now = default_timer() if endTime is None else endTime
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self):
+        return self._last - self.startTime
+
+    def isWithinBudget(self, budget=STARTUPBUDGET):
+        return self.total <= budget
+
+    def report(self):
+        return '\n'.join('%s: %.0f ms' % (phase, seconds * 1000) for phase, seconds in self.phases)
+
+    def ToString(self):
+        return 'StartupTimer::%.0f ms' % (self.total * 1000)
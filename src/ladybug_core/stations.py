@@ -0,0 +1,236 @@
+"""
+Catalogue of weather stations with a spatial index.
+
+The stations are kept in parallel lists and their positions are points on
+the unit sphere. A k-d tree of these points answers nearest and radius
+queries without scanning the whole list. The straight distance between two
+points of the sphere grows with the great-circle distance so the order of the
+neighbors is the same and the distances are converted to kilometers at the end.
+
+Catalogues are read from csv files with a header (name, latitude, longitude
+and optional country, source, wmo, elevation, timeZone, climateZone and url
+columns) or from EPWMap style GeoJSON files. The components look for them in
+the Ladybug default folder with one of the CATALOGUENAMES.
+
+    latitude, longitude: WGS84 coordinates in degrees.
+"""
+from __future__ import division
+import csv
+import heapq
+import json
+import math
+import os
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+EARTHRADIUS = 6371.0088  # mean radius in km
+COLUMNS = ('name', 'country', 'source', 'wmo', 'latitude', 'longitude', 'elevation',
+           'timeZone', 'climateZone', 'url')
+CATALOGUENAMES = ('weatherStations.csv', 'weatherStations.geojson')
+
+
+def unitVector(latitude, longitude):
+    """Point of the unit sphere for a latitude and a longitude."""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    cosLat = math.cos(lat)
+    return cosLat * math.cos(lon), cosLat * math.sin(lon), math.sin(lat)
+
+
+def chordToKm(chord):
+    """Great-circle distance in km for a straight distance between points of the unit sphere."""
+    return 2 * EARTHRADIUS * math.asin(min(chord / 2, 1))
+
+
+def kmToChord(distance):
+    """Straight distance between points of the unit sphere for a great-circle distance in km."""
+    return 2 * math.sin(min(distance / EARTHRADIUS, math.pi) / 2)
+
+
+def greatCircleDistance(lat1, lon1, lat2, lon2):
+    """Distance between two points in km (haversine)."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 2 * EARTHRADIUS * math.asin(min(math.sqrt(a), 1))
+
+
+class KDTree(object):
+    """k-d tree of 3D points.
+
+    Args:
+        points: List of (x, y, z) tuples.
+        indices: Optional ids of the points. Default is their position in the list.
+        leafSize: Maximum number of points in a leaf.
+    """
+
+    def __init__(self, points, indices=None, leafSize=8):
+        self.points = points
+        self.leafSize = leafSize
+        if indices is None: indices = range(len(points))
+        self.root = self._build(list(indices))
+
+    def _build(self, indices):
+        if len(indices) <= self.leafSize: return indices
+        points = self.points
+        # split along the longest side of the bounding box
+        spans = []
+        for axis in range(3):
+            values = [points[i][axis] for i in indices]
+            spans.append(max(values) - min(values))
+        axis = spans.index(max(spans))
+        indices.sort(key=lambda i: points[i][axis])
+        middle = len(indices) // 2
+        split = points[indices[middle]][axis]
+        return (axis, split, self._build(indices[:middle]),
+                self._build(indices[middle:]))
+
+    @staticmethod
+    def _distance(a, b):
+        return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+    def nearest(self, point, k=1):
+        """(squared distance, index) of the k nearest points sorted by distance."""
+        points = self.points
+        distance = self._distance
+        heap = []  # max heap of the k best as (-distance, index)
+
+        def search(node):
+            if isinstance(node, list):
+                for i in node:
+                    d = distance(point, points[i])
+                    if len(heap) < k: heapq.heappush(heap, (-d, i))
+                    elif d < -heap[0][0]: heapq.heapreplace(heap, (-d, i))
+                return
+            axis, split, low, high = node
+            difference = point[axis] - split
+            near, far = (low, high) if difference < 0 else (high, low)
+            search(near)
+            if len(heap) < k or difference * difference < -heap[0][0]: search(far)
+
+        if k > 0: search(self.root)
+        return sorted((-d, i) for d, i in heap)
+
+    def within(self, point, radius):
+        """(squared distance, index) of the points closer than radius sorted by distance."""
+        points = self.points
+        distance = self._distance
+        limit = radius * radius
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                for i in node:
+                    d = distance(point, points[i])
+                    if d <= limit: found.append((d, i))
+                continue
+            axis, split, low, high = node
+            difference = point[axis] - split
+            if difference < radius: stack.append(low)
+            if difference > -radius: stack.append(high)
+        found.sort()
+        return found
+
+
+class StationCatalogue(object):
+    """Weather stations with a spatial index.
+
+    Args:
+        stations: List of dictionaries with at least name, latitude and
+            longitude keys. See COLUMNS for the other keys.
+    """
+
+    _loaded = {}
+
+    def __init__(self, stations):
+        self.columns = dict((column, []) for column in COLUMNS)
+        for station in stations:
+            for column in COLUMNS:
+                self.columns[column].append(station.get(column))
+        self.latitudes = [float(v) for v in self.columns['latitude']]
+        self.longitudes = [float(v) for v in self.columns['longitude']]
+        self.columns['latitude'], self.columns['longitude'] = self.latitudes, self.longitudes
+        self.points = [unitVector(lat, lon) for lat, lon in zip(self.latitudes, self.longitudes)]
+        self.tree = KDTree(self.points)
+        self._zoneTrees = {}
+
+    @classmethod
+    def fromCsv(cls, filePath):
+        with open(filePath, 'r') as inf:
+            return cls(list(csv.DictReader(inf)))
+
+    @classmethod
+    def fromGeoJson(cls, filePath):
+        """Catalogue from the point features of a GeoJSON file (e.g. EPWMap's station list)."""
+        with open(filePath, 'r') as inf:
+            data = json.load(inf)
+        stations = []
+        for feature in data.get('features', ()):
+            geometry = feature.get('geometry') or {}
+            if geometry.get('type') != 'Point': continue
+            properties = feature.get('properties') or {}
+            station = dict((column, properties.get(column)) for column in COLUMNS)
+            station['name'] = properties.get('name') or properties.get('title')
+            station['url'] = properties.get('url') or properties.get('epw')
+            station['longitude'], station['latitude'] = geometry['coordinates'][:2]
+            stations.append(station)
+        return cls(stations)
+
+    @classmethod
+    def load(cls, filePath):
+        """Catalogue of a csv or GeoJSON file. Files are read once until they change."""
+        stat = os.stat(filePath)
+        key = os.path.abspath(filePath), stat.st_size, int(stat.st_mtime)
+        catalogue = cls._loaded.get(key)
+        if catalogue is None:
+            if filePath.lower().endswith(('.json', '.geojson')): catalogue = cls.fromGeoJson(filePath)
+            else: catalogue = cls.fromCsv(filePath)
+            cls._loaded[key] = catalogue
+        return catalogue
+
+    @classmethod
+    def fromFolder(cls, folder):
+        """Catalogue of the first of the CATALOGUENAMES in a folder or None."""
+        for fileName in CATALOGUENAMES:
+            filePath = os.path.join(folder, fileName)
+            if os.path.isfile(filePath): return cls.load(filePath)
+
+    def __len__(self):
+        return len(self.points)
+
+    def station(self, index):
+        """Dictionary of the columns of a station."""
+        return dict((column, values[index]) for column, values in self.columns.items())
+
+    def _tree(self, climateZone):
+        if climateZone is None: return self.tree
+        if climateZone not in self._zoneTrees:
+            zones = self.columns['climateZone']
+            indices = [i for i, zone in enumerate(zones) if zone == climateZone]
+            self._zoneTrees[climateZone] = KDTree(self.points, indices)
+        return self._zoneTrees[climateZone]
+
+    def nearest(self, latitude, longitude, k=1, climateZone=None):
+        """(distance in km, index) of the k nearest stations.
+
+        Args:
+            climateZone: Only look at the stations of a climate zone (e.g. '5A').
+        """
+        found = self._tree(climateZone).nearest(unitVector(latitude, longitude), k)
+        return [(chordToKm(math.sqrt(d)), i) for d, i in found]
+
+    def within(self, latitude, longitude, radius, climateZone=None):
+        """(distance in km, index) of the stations closer than radius km."""
+        found = self._tree(climateZone).within(unitVector(latitude, longitude), kmToChord(radius))
+        return [(chordToKm(math.sqrt(d)), i) for d, i in found]
+
+    def nearestMany(self, latitudes, longitudes, k=1, climateZone=None):
+        """nearest for a list of sites."""
+        return [self.nearest(lat, lon, k, climateZone) for lat, lon in zip(latitudes, longitudes)]
+
+    def ToString(self):
+        return 'StationCatalogue::%d stations' % len(self.points)
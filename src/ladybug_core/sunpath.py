@@ -0,0 +1,95 @@
+"""
+Sun position.
+"""
+from __future__ import division, print_function
+import math
+
+
+class Sunpath(object):
+    """
+    The sun-path Class is a Python version of RADIANCE sun-path script by Greg Ward. RADIANCE source code can be accessed at:
+    http://www.radiance-online.org/download-install/CVS%20source%20code
+    The difference of the results with NREL version is less than 1 degree
+    """
+    def __init__(self):
+        pass
+    
+    def initTheClass(self, latitude, northAngle = 0, cenPt = None, scale = 100, longtitude = 0, timeZone = 0):
+        self.solLat = math.radians(float(latitude));
+        self.s_longtitude =  math.radians(longtitude) #2.13; # site longtitude (radians)
+        self.s_meridian = math.radians(timeZone * 15) #2.13 #.0944; # standard meridian (radians)
+        self. angle2North = northAngle
+        self.cenPt = cenPt
+        self.scale = scale
+        self.timeZone = timeZone
+    
+    #This part is written by Trygve Wastvedt (Trygve.Wastvedt@gmail.com).
+    def solInitOutput(self, month, day, hour, solarTime = False):
+        year = 2018
+        self.time = hour
+        
+        a = 1 if (month < 3) else 0
+        y = year + 4800 - a
+        m = month + 12*a - 3
+        self.julianDay = day + math.floor((153*m + 2)/5) + 59
+        
+        self.julianDay += (self.time - self.timeZone)/24.0  + 365*y + math.floor(y/4) \
+            - math.floor(y/100) + math.floor(y/400) - 32045.5 - 59
+        
+        julianCentury = (self.julianDay - 2451545) / 36525
+        #degrees
+        geomMeanLongSun = (280.46646 + julianCentury * (36000.76983 + julianCentury*0.0003032)) % 360
+        #degrees
+        geomMeanAnomSun = 357.52911 + julianCentury*(35999.05029 - 0.0001537*julianCentury)
+        eccentOrbit = 0.016708634 - julianCentury*(0.000042037 + 0.0000001267*julianCentury)
+        sunEqOfCtr = math.sin(math.radians(geomMeanAnomSun))*(1.914602 - julianCentury*(0.004817+0.000014*julianCentury)) + \
+            math.sin(math.radians(2*geomMeanAnomSun))*(0.019993-0.000101*julianCentury) + \
+            math.sin(math.radians(3*geomMeanAnomSun))*0.000289
+        #degrees
+        sunTrueLong = geomMeanLongSun + sunEqOfCtr
+        #AUs
+        sunTrueAnom = geomMeanAnomSun + sunEqOfCtr
+        #AUs
+        sunRadVector = (1.000001018*(1 - eccentOrbit**2))/ \
+            (1 + eccentOrbit*math.cos(math.radians(sunTrueLong)))
+        #degrees
+        sunAppLong = sunTrueLong - 0.00569 - 0.00478*math.sin(math.radians(125.04-1934.136*julianCentury))
+        #degrees
+        meanObliqEcliptic = 23 + (26 + ((21.448 - julianCentury*(46.815 + \
+            julianCentury*(0.00059 - julianCentury*0.001813))))/60)/60
+        #degrees
+        obliqueCorr = meanObliqEcliptic + 0.00256*math.cos(math.radians(125.04 - 1934.136*julianCentury))
+        #degrees
+        sunRightAscen = math.degrees(math.atan2(math.cos(math.radians(obliqueCorr))* \
+            math.sin(math.radians(sunAppLong)), math.cos(math.radians(sunAppLong))))
+        #RADIANS
+        self.solDec = math.asin(math.sin(math.radians(obliqueCorr))*math.sin(math.radians(sunAppLong)))
+        
+        varY = math.tan(math.radians(obliqueCorr/2))*math.tan(math.radians(obliqueCorr/2))
+        #minutes
+        eqOfTime = 4*math.degrees(varY*math.sin(2*math.radians(geomMeanLongSun)) \
+            - 2*eccentOrbit*math.sin(math.radians(geomMeanAnomSun)) \
+            + 4*eccentOrbit*varY*math.sin(math.radians(geomMeanAnomSun))*math.cos(2*math.radians(geomMeanLongSun)) \
+            - 0.5*(varY**2)*math.sin(4*math.radians(geomMeanLongSun)) \
+            - 1.25*(eccentOrbit**2)*math.sin(2*math.radians(geomMeanAnomSun)))
+        #hours
+        if solarTime == False:
+            self.solTime = ((self.time*60 + eqOfTime + 4*math.degrees(self.s_longtitude) - 60*self.timeZone) % 1440)/60
+        else: self.solTime = self.time
+        
+        #degrees
+        hourAngle = (self.solTime*15 + 180) if (self.solTime*15 < 0) else (self.solTime*15 - 180)
+        #RADIANS
+        self.zenith = math.acos(math.sin(self.solLat)*math.sin(self.solDec) \
+            + math.cos(self.solLat)*math.cos(self.solDec)*math.cos(math.radians(hourAngle)))
+        self.solAlt = (math.pi/2) - self.zenith
+        
+        if hourAngle == 0.0 or hourAngle == -180.0 or hourAngle == 180.0:
+            if self.solDec < self.solLat: self.solAz = math.pi
+            else: self.solAz = 0.0
+        else:
+            self.solAz = ((math.acos(((math.sin(self.solLat)*math.cos(self.zenith)) \
+                - math.sin(self.solDec))/(math.cos(self.solLat)*math.sin(self.zenith))) + math.pi) % (2*math.pi)) \
+                if (hourAngle > 0) else \
+                    ((3*math.pi - math.acos(((math.sin(self.solLat)*math.cos(self.zenith)) \
+                    - math.sin(self.solDec))/(math.cos(self.solLat)*math.sin(self.zenith)))) % (2*math.pi))
@@ -0,0 +1,333 @@
+"""
+Elevations from local DEM tiles.
+
+Tiles are 1 x 1 degree rasters named after their south west corner (e.g.
+N40E014 covers latitudes 40 to 41 and longitudes 14 to 15) in SRTM .hgt format
+or as single band GeoTIFF files (.tif). The files are memory-mapped where the
+platform supports it so only the pixels around the sampled points are read.
+Elevations are interpolated bilinearly and all the points of a query that fall
+on the same tile are sampled together.
+
+A DEMCache keeps the tiles of a folder open and can download missing tiles
+with a fetcher, e.g. urlFetcher('https://example.org/srtm/{name}.hgt.gz').
+
+    latitudes, longitudes: Lists of WGS84 coordinates in degrees.
+"""
+from __future__ import division
+import gzip
+import io
+import math
+import os
+import struct
+import zlib
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+HGTVOID = -32768
+TILEEXTENSIONS = ('.hgt', '.tif', '.tiff')
+
+
+def tileName(latitude, longitude):
+    """Name of the 1 x 1 degree tile of a point (e.g. N40E014)."""
+    lat, lon = int(math.floor(latitude)), int(math.floor(longitude))
+    return '%s%02d%s%03d' % ('N' if lat >= 0 else 'S', abs(lat), 'E' if lon >= 0 else 'W', abs(lon))
+
+
+def tileCorner(name):
+    """Latitude and longitude of the south west corner of a tile from its name."""
+    name = os.path.splitext(os.path.basename(name))[0].upper()
+    lat = int(name[1:3]) * (1 if name[0] == 'N' else -1)
+    lon = int(name[4:7]) * (1 if name[3] == 'E' else -1)
+    return lat, lon
+
+
+def _mapFile(filePath):
+    # read-only memory map of a file or its content where mmap isn't available
+    with open(filePath, 'rb') as inf:
+        if mmap is not None:
+            try:
+                return mmap.mmap(inf.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, EnvironmentError, AttributeError):
+                pass
+        return inf.read()
+
+
+class Raster(object):
+    """Elevation raster with the pixel centers on a regular grid.
+
+    Subclasses set width, height, the center of the first pixel (west, north),
+    the pixel size (dx, dy), noData and implement value(row, col).
+    """
+
+    width = height = 0
+    west = north = 0
+    dx = dy = 1
+    noData = None
+
+    def value(self, row, col):
+        raise NotImplementedError
+
+    def sample(self, latitudes, longitudes, default=None):
+        """Bilinear elevations of points. Points outside the raster get default.
+
+        Points within half a pixel from the outer pixel centers get the values
+        of the edge pixels. Pixels without data are left out of the
+        interpolation and points with no valid pixel around them get default.
+        """
+        lastRow, lastCol = self.height - 1, self.width - 1
+        noData = self.noData
+        value = self.value
+        elevations = []
+        for lat, lon in zip(latitudes, longitudes):
+            x = (lon - self.west) / self.dx
+            y = (self.north - lat) / self.dy
+            if x < -0.5 or y < -0.5 or x > lastCol + 0.5 or y > lastRow + 0.5:
+                elevations.append(default)
+                continue
+            x, y = min(max(x, 0), lastCol), min(max(y, 0), lastRow)
+            col = min(max(int(x), 0), max(lastCol - 1, 0))
+            row = min(max(int(y), 0), max(lastRow - 1, 0))
+            fx, fy = min(max(x - col, 0), 1), min(max(y - row, 0), 1)
+            total = weights = 0
+            for r, c, w in ((row, col, (1 - fx) * (1 - fy)), (row, col + 1, fx * (1 - fy)),
+                            (row + 1, col, (1 - fx) * fy), (row + 1, col + 1, fx * fy)):
+                if not w: continue
+                v = value(min(r, lastRow), min(c, lastCol))
+                if v == noData or v != v: continue
+                total += v * w
+                weights += w
+            elevations.append(total / weights if weights else default)
+        return elevations
+
+    def close(self):
+        data = getattr(self, '_data', None)
+        if hasattr(data, 'close'): data.close()
+        self._data = None
+
+
+class HgtTile(Raster):
+    """SRTM .hgt tile (1201 x 1201 or 3601 x 3601 big endian 16 bit integers)."""
+
+    noData = HGTVOID
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+        self._data = _mapFile(filePath)
+        size = int(round(math.sqrt(len(self._data) // 2)))
+        if size * size * 2 != len(self._data):
+            raise ValueError('%s is not a square hgt tile.' % filePath)
+        south, west = tileCorner(filePath)
+        self.width = self.height = size
+        self.west, self.north = west, south + 1
+        self.dx = self.dy = 1 / (size - 1)
+        self._struct = struct.Struct('>h')
+
+    def value(self, row, col):
+        return self._struct.unpack_from(self._data, (row * self.width + col) * 2)[0]
+
+    def ToString(self):
+        return 'HgtTile::%s (%d x %d)' % (os.path.basename(self.filePath), self.width, self.height)
+
+
+class GeoTiffTile(Raster):
+    """Single band GeoTIFF raster.
+
+    Strips or tiles of 16 or 32 bit integers or 32 or 64 bit floats that are
+    uncompressed or deflate compressed, in geographic coordinates.
+    """
+
+    # tiff field types and their struct codes
+    _TYPES = {1: 'B', 2: 'c', 3: 'H', 4: 'I', 5: 'II', 6: 'b', 8: 'h', 9: 'i', 11: 'f', 12: 'd', 16: 'Q'}
+    _SAMPLES = {(1, 8): 'B', (1, 16): 'H', (1, 32): 'I', (2, 8): 'b', (2, 16): 'h', (2, 32): 'i',
+                (3, 32): 'f', (3, 64): 'd'}
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+        self._data = data = _mapFile(filePath)
+        order = {b'II': '<', b'MM': '>'}.get(bytes(data[:2]))
+        if order is None or struct.unpack_from(order + 'H', data, 2)[0] != 42:
+            raise ValueError('%s is not a tiff file.' % filePath)
+        tags = self._readTags(data, order, struct.unpack_from(order + 'I', data, 4)[0])
+
+        self.width, self.height = tags[256][0], tags[257][0]
+        if tags.get(277, (1,))[0] != 1 or tags.get(317, (1,))[0] != 1:
+            raise ValueError('%s needs one band without a predictor.' % filePath)
+        compression = tags.get(259, (1,))[0]
+        if compression not in (1, 8, 32946):
+            raise ValueError('%s uses an unsupported compression.' % filePath)
+        self._compressed = compression != 1
+        sampleFormat = (tags.get(339, (1,))[0], tags.get(258, (8,))[0])
+        self._struct = struct.Struct(order + self._SAMPLES[sampleFormat])
+
+        if 322 in tags:
+            self._blockWidth, self._blockHeight = tags[322][0], tags[323][0]
+            self._offsets, self._counts = tags[324], tags[325]
+        else:
+            self._blockWidth = self.width
+            self._blockHeight = tags.get(278, (self.height,))[0]
+            self._offsets, self._counts = tags[273], tags[279]
+        self._blocksPerRow = -(-self.width // self._blockWidth)
+        self._blocks = {}
+
+        # geographic position of the pixel centers
+        scaleX, scaleY = tags[33550][:2]
+        i, j, k, x, y, z = tags[33922][:6]
+        pixelIsPoint = False
+        keys = tags.get(34735, ())
+        for n in range(4, len(keys), 4):
+            if keys[n] == 1025: pixelIsPoint = keys[n + 3] == 2
+        shift = 0 if pixelIsPoint else 0.5
+        self.dx, self.dy = scaleX, scaleY
+        self.west = x + (shift - i) * scaleX
+        self.north = y - (shift - j) * scaleY
+        noData = tags.get(42113)
+        self.noData = float(noData.strip(b'\x00 ')) if noData else None
+
+    def _readTags(self, data, order, offset):
+        tags = {}
+        count = struct.unpack_from(order + 'H', data, offset)[0]
+        for n in range(count):
+            tag, fieldType, valueCount, valueOffset = struct.unpack_from(
+                order + 'HHII', data, offset + 2 + n * 12)
+            code = self._TYPES.get(fieldType)
+            if code is None: continue
+            size = struct.calcsize(order + code) * valueCount
+            start = offset + 2 + n * 12 + 8 if size <= 4 else valueOffset
+            if fieldType == 2:
+                tags[tag] = bytes(data[start:start + valueCount])
+                continue
+            values = struct.unpack_from(order + code * valueCount, data, start)
+            if fieldType == 5:
+                values = tuple(values[m] / values[m + 1] for m in range(0, len(values), 2))
+            tags[tag] = values
+        return tags
+
+    def _block(self, index):
+        block = self._blocks.get(index)
+        if block is None:
+            start = self._offsets[index]
+            block = zlib.decompress(bytes(self._data[start:start + self._counts[index]]))
+            self._blocks[index] = block
+        return block
+
+    def value(self, row, col):
+        blockRow, r = divmod(row, self._blockHeight)
+        blockCol, c = divmod(col, self._blockWidth)
+        index = blockRow * self._blocksPerRow + blockCol
+        position = (r * self._blockWidth + c) * self._struct.size
+        if self._compressed:
+            return self._struct.unpack_from(self._block(index), position)[0]
+        return self._struct.unpack_from(self._data, self._offsets[index] + position)[0]
+
+    def ToString(self):
+        return 'GeoTiffTile::%s (%d x %d)' % (os.path.basename(self.filePath), self.width, self.height)
+
+
+def openTile(filePath):
+    """HgtTile or GeoTiffTile of a file based on its extension."""
+    if filePath.lower().endswith('.hgt'): return HgtTile(filePath)
+    return GeoTiffTile(filePath)
+
+
+def urlFetcher(urlTemplate):
+    """A fetcher that downloads tiles from a url with a {name} field.
+
+    Gzip compressed downloads (e.g. .hgt.gz) are decompressed.
+    """
+    try:
+        from urllib.request import urlopen
+    except ImportError:
+        from urllib2 import urlopen
+
+    def fetch(name, filePath):
+        response = urlopen(urlTemplate.format(name=name))
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        if content[:2] == b'\x1f\x8b':
+            content = gzip.GzipFile(fileobj=io.BytesIO(content)).read()
+        with open(filePath, 'wb') as outf:
+            outf.write(content)
+        return True
+
+    return fetch
+
+
+class DEMCache(object):
+    """Folder of DEM tiles that samples elevations of points.
+
+    Args:
+        folder: Folder of the tiles.
+        fetcher: Optional function (tileName, filePath) that writes a missing
+            tile to filePath (a .hgt file) and returns True.
+    """
+
+    def __init__(self, folder, fetcher=None):
+        self.folder = folder
+        self.fetcher = fetcher
+        self._tiles = {}
+
+    def tilePath(self, name):
+        """Path of a tile in the folder or None if it isn't there."""
+        for extension in TILEEXTENSIONS:
+            filePath = os.path.join(self.folder, name + extension)
+            if os.path.isfile(filePath): return filePath
+
+    def tile(self, name):
+        """Open tile of a name. Missing tiles are fetched if there is a fetcher."""
+        if name in self._tiles: return self._tiles[name]
+        filePath = self.tilePath(name)
+        if filePath is None and self.fetcher is not None:
+            if not os.path.isdir(self.folder): os.makedirs(self.folder)
+            filePath = os.path.join(self.folder, name + '.hgt')
+            # download to a temporary file so a failed download doesn't leave a broken tile
+            tempFile = '%s.%d.tmp' % (filePath, os.getpid())
+            try:
+                fetched = self.fetcher(name, tempFile)
+            except Exception:
+                fetched = False
+            if fetched and os.path.isfile(tempFile):
+                os.rename(tempFile, filePath)
+            else:
+                if os.path.isfile(tempFile): os.remove(tempFile)
+                filePath = None
+        tile = openTile(filePath) if filePath is not None else None
+        self._tiles[name] = tile
+        return tile
+
+    def sample(self, latitudes, longitudes, default=None):
+        """Elevation of each point. Points on missing tiles get default."""
+        groups = {}
+        for i, (lat, lon) in enumerate(zip(latitudes, longitudes)):
+            groups.setdefault(tileName(lat, lon), []).append(i)
+        elevations = [default] * len(latitudes)
+        for name in sorted(groups):
+            tile = self.tile(name)
+            if tile is None: continue
+            indices = groups[name]
+            values = tile.sample([latitudes[i] for i in indices], [longitudes[i] for i in indices], default)
+            for i, v in zip(indices, values): elevations[i] = v
+        return elevations
+
+    def covers(self, latitudes, longitudes):
+        """True if the tiles of all the points are in the folder."""
+        names = set(tileName(lat, lon) for lat, lon in zip(latitudes, longitudes))
+        return all(self.tilePath(name) is not None for name in names)
+
+    def close(self):
+        for tile in self._tiles.values():
+            if tile is not None: tile.close()
+        self._tiles = {}
+
+    def ToString(self):
+        return 'DEMCache::%s' % self.folder
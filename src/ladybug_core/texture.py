@@ -0,0 +1,124 @@
+"""
+Texture atlases of colored meshes.
+
+Every face gets a 2 x 2 pixel cell of the texture with the colors of its A, B,
+C and D vertices. The texture coordinates of the vertices are the centers of
+these pixels so the renderer blends the vertex colors across the face. The
+cells are placed column by column on a square grid.
+
+The faces must not share vertices (e.g. after Mesh.Unweld(0, False)).
+
+    faces: List of vertex index tuples. Faces have 3 or 4 indices. Rhino
+        triangles have 4 indices with the same third and fourth index.
+    vertexColors: An (R, G, B) tuple for each vertex.
+"""
+from __future__ import division
+import math
+import struct
+import zlib
+
+
+def _chunk(chunkType, data):
+    # length, type, data and crc of a png chunk
+    return (struct.pack('>I', len(data)) + chunkType + data +
+            struct.pack('>I', zlib.crc32(chunkType + data) & 0xffffffff))
+
+
+def encodePng(width, height, rows, alpha=True, level=6):
+    """PNG file content from rows of 8 bit RGBA (or RGB) bytes from the top."""
+    raw = bytearray()
+    previous = None
+    for row in rows:
+        # repeated rows use the Up filter so they compress to zeros
+        if row is previous:
+            raw.append(2)
+            raw.extend(bytearray(len(row)))
+        else:
+            raw.append(0)
+            raw.extend(row)
+        previous = row
+    header = struct.pack('>IIBBBBB', width, height, 8, 6 if alpha else 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _chunk(b'IHDR', header) +
+            _chunk(b'IDAT', zlib.compress(bytes(raw), level)) + _chunk(b'IEND', b''))
+
+
+def writePng(filePath, width, height, rows, alpha=True):
+    """Write rows of RGBA (or RGB) bytes to a png file."""
+    with open(filePath, 'wb') as pngFile:
+        pngFile.write(encodePng(width, height, rows, alpha))
+    return filePath
+
+
+class TextureAtlas(object):
+    """Layout of the face cells of a mesh texture.
+
+    Args:
+        faces: Faces of the mesh.
+        vertexCount: Number of mesh vertices.
+    """
+
+    def __init__(self, faces, vertexCount):
+        self.faces = [tuple(face) if len(face) == 4 else (face[0], face[1], face[2], face[2])
+                      for face in faces]
+        self.vertexCount = vertexCount
+        self.size = int(math.ceil(math.sqrt(len(self.faces))))
+
+    def cell(self, faceIndex):
+        """Column and row (from the bottom) of the cell of a face."""
+        return divmod(faceIndex, self.size)
+
+    def textureCoordinates(self):
+        """(u, v) of each vertex. Vertices that are not on a face get (0, 0)."""
+        coordinates = [(0, 0)] * self.vertexCount
+        sb = self.size * 2
+        for i, (a, b, c, d) in enumerate(self.faces):
+            x, y = self.cell(i)
+            left, right = (x * 2 + 0.5) / sb, (x * 2 + 1.5) / sb
+            bottom, top = (y * 2 + 0.5) / sb, (y * 2 + 1.5) / sb
+            coordinates[a] = (left, bottom)
+            coordinates[b] = (right, bottom)
+            coordinates[c] = (right, top)
+            coordinates[d] = (left, top)
+        return coordinates
+
+    def pixelRows(self, vertexColors, alpha=255, scale=2):
+        """Rows of RGBA bytes of the texture from the top.
+
+        Args:
+            vertexColors: (R, G, B) of each vertex.
+            alpha: Opacity of the pixels from 0 to 255.
+            scale: Each pixel of the atlas is repeated scale x scale times.
+        Returns:
+            width, height and the rows. Repeated rows are the same bytearray.
+        """
+        size = self.size
+        pixels = [bytearray((r, g, b, alpha)) * scale for r, g, b in vertexColors]
+        blank = bytearray(8 * scale)
+        faceCount = len(self.faces)
+        rows = []
+        for y in reversed(range(size)):
+            top, bottom = bytearray(), bytearray()
+            for i in range(y, size * size, size):
+                if i < faceCount:
+                    a, b, c, d = self.faces[i]
+                    top += pixels[d] + pixels[c]
+                    bottom += pixels[a] + pixels[b]
+                else:
+                    top += blank
+                    bottom += blank
+            rows.extend([top] * scale + [bottom] * scale)
+        width = height = size * 2 * scale
+        return width, height, rows
+
+    def png(self, vertexColors, alpha=255, scale=2):
+        """PNG content of the texture with the opacity in the alpha channel."""
+        width, height, rows = self.pixelRows(vertexColors, alpha, scale)
+        return encodePng(width, height, rows)
+
+    def save(self, filePath, vertexColors, alpha=255, scale=2):
+        """Write the texture to a png file."""
+        width, height, rows = self.pixelRows(vertexColors, alpha, scale)
+        return writePng(filePath, width, height, rows)
+
+    def ToString(self):
+        return 'TextureAtlas::%d faces, %d x %d cells' % (len(self.faces), self.size, self.size)
@@ -0,0 +1,159 @@
+"""
+Radiation data for sky generation.
+
+A Wea carries the location and the hourly direct normal and diffuse horizontal
+radiation of a weather file. It replaces the epw > wea text round trip that the
+sky components used to do before calling gendaymtx: the values are read once
+and passed to the sky matrix generator in memory. Writing a Radiance wea file
+is still supported for the components that export to Radiance.
+"""
+from __future__ import division
+import os
+
+
+NUMOFDAYS = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365]
+
+
+def hourToDate(hour):
+    """Return (month, day, time) for a 0-based hour of the year.
+
+    Epw values are hourly averages so each row is stamped at the middle of the
+    hour (row 0 > 1/1 @0.5) which is also what gendaymtx expects.
+    """
+    hour = int(hour)
+    julianDay = hour // 24 + 1
+    for month in range(12):
+        if julianDay <= NUMOFDAYS[month + 1]: break
+    return month + 1, julianDay - NUMOFDAYS[month], hour % 24 + 0.5
+
+
+class Wea(object):
+    """Location and hourly radiation (Wh/m2) for the 8760 hours of a year.
+
+    Args:
+        locName: Location name.
+        lat: Latitude in degrees (north is positive).
+        lngt: Longitude in degrees (east is positive).
+        timeZone: Time zone in hours (east is positive).
+        elev: Elevation in meters.
+        directRad: 8760 direct normal radiation values.
+        diffuseRad: 8760 diffuse horizontal radiation values.
+        year: Optional year of the weather data.
+    """
+
+    def __init__(self, locName, lat, lngt, timeZone, elev, directRad, diffuseRad, year=None):
+        if len(directRad) != 8760 or len(diffuseRad) != 8760:
+            raise ValueError('Wea needs 8760 hourly values. Got %d direct and %d diffuse values.' \
+                             % (len(directRad), len(diffuseRad)))
+        self.locName = locName
+        self.lat = float(lat)
+        self.lngt = float(lngt)
+        self.timeZone = float(timeZone)
+        self.elev = float(elev)
+        self.directRad = [float(v) for v in directRad]
+        self.diffuseRad = [float(v) for v in diffuseRad]
+        self.year = year
+
+    @classmethod
+    def fromEpwFile(cls, epwFile):
+        """Create a Wea from an epw file."""
+        directRad = []
+        diffuseRad = []
+        year = None
+        with open(epwFile, 'r') as epw:
+            headline = epw.readline().strip().split(',')
+            # remove empty cells from the end of the list if any
+            while headline:
+                try: float(headline[-1]); break
+                except ValueError: headline.pop()
+            if len(headline) < 5:
+                raise ValueError('%s is not a valid epw file.' % epwFile)
+            locName = '_'.join(h for h in headline[1:4] if h != '-')
+            lat, lngt, timeZone, elev = headline[-4:]
+            for lineCount, line in enumerate(epw):
+                # the first line is already read
+                if lineCount < 7: continue
+                values = line.split(',')
+                if len(values) < 16: continue
+                year = values[0]
+                directRad.append(values[14])
+                diffuseRad.append(values[15])
+
+        return cls(locName, lat, lngt, timeZone, elev, directRad, diffuseRad, year)
+
+    @classmethod
+    def fromEpwFiles(cls, epwFiles):
+        """Create a list of Weas from a list of epw files."""
+        return [cls.fromEpwFile(epwFile) for epwFile in epwFiles]
+
+    @classmethod
+    def fromWeaFile(cls, weaFile):
+        """Create a Wea from an hourly Radiance wea file."""
+        header = {}
+        directRad = []
+        diffuseRad = []
+        with open(weaFile, 'r') as wea:
+            for line in wea:
+                values = line.split()
+                if not values: continue
+                try:
+                    float(values[0])
+                except ValueError:
+                    header[values[0]] = ' '.join(values[1:])
+                    continue
+                directRad.append(values[3])
+                diffuseRad.append(values[4])
+
+        # wea files use radiance conventions (west is positive)
+        return cls(header.get('place', 'Unknown'), header['latitude'],
+                   -float(header['longitude']), -float(header['time_zone']) / 15,
+                   header.get('site_elevation', 0), directRad, diffuseRad)
+
+    @property
+    def name(self):
+        """Location name and year (if any) without blank characters."""
+        name = self.locName
+        if self.year: name = '%s_%s' % (name, str(self.year).strip())
+        for c in [' ', ',', '.', '-', '\\', '/']:
+            name = name.replace(c, '_')
+        return name
+
+    def header(self):
+        """Radiance wea header."""
+        return 'place %s\n' % self.locName + \
+               'latitude %s\n' % self.lat + \
+               'longitude %s\n' % -self.lngt + \
+               'time_zone %s\n' % (-self.timeZone * 15) + \
+               'site_elevation %s\n' % self.elev + \
+               'weather_data_file_units 1\n'
+
+    def write(self, filePath):
+        """Write the Wea to a Radiance wea file and return the path."""
+        lines = [self.header()]
+        for hour, (dirRad, difRad) in enumerate(zip(self.directRad, self.diffuseRad)):
+            month, day, time = hourToDate(hour)
+            lines.append('%d %d %s %s %s\n' % (month, day, time, dirRad, difRad))
+        with open(filePath, 'w') as wea:
+            wea.write(''.join(lines))
+        return filePath
+
+    def ToString(self):
+        return 'Wea::%s' % self.locName
+
+
+def epw2wea(epwFiles, targetFolder=None):
+    """Convert a list of epw files to wea files.
+
+    Args:
+        epwFiles: List of epw file paths.
+        targetFolder: Optional folder for the wea files. By default each wea is
+            written next to its epw file.
+    Returns:
+        A list of wea file paths.
+    """
+    weaFiles = []
+    for epwFile in epwFiles:
+        fileName = os.path.splitext(os.path.basename(epwFile))[0] + '.wea'
+        folder = targetFolder or os.path.dirname(epwFile)
+        weaFiles.append(Wea.fromEpwFile(epwFile).write(os.path.join(folder, fileName)))
+    return weaFiles
@@ -0,0 +1,328 @@
+"""
+Local store of downloaded weather files.
+
+Downloads are kept by the sha256 of their content so the same archive is only
+stored once no matter which folder a component asks for, and an index maps each
+url to its digest so a stored url is never downloaded again. Archives are
+extracted once into a folder named after the digest and the index keeps the
+sha256 of each extracted file, so copies in other folders are only reused if
+their content is the same.
+
+Files are always written next to their final path first and renamed when they
+are complete, so a failed or interrupted download never leaves a file that
+looks finished. Interrupted downloads keep their partial file and continue from
+there with an HTTP range request on the next try. Several urls are downloaded
+in parallel threads, which works in IronPython as well as in CPython.
+
+    store = WeatherStore('C:/ladybug/weatherStore')
+    epwFile, statFile = store.fetch(url)
+    results = store.fetchMany(urls)
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import zipfile
+
+try:
+    from urllib.request import Request, urlopen
+    from urllib.error import HTTPError
+except ImportError:
+    from urllib2 import Request, urlopen, HTTPError
+
+from .epw import WeatherCache
+
+
+CHUNKSIZE = 1 << 16
+WEATHEREXTENSIONS = ('.epw', '.stat', '.ddy', '.clm', '.wea')
+
+
+def _replace(source, destination):
+    """Rename a file or folder. If the destination is already there the source is removed."""
+    try:
+        os.rename(source, destination)
+    except OSError:
+        if not os.path.exists(destination): raise
+        # another thread or process stored the same content first
+        if os.path.isdir(source): shutil.rmtree(source, True)
+        else: os.remove(source)
+
+
+def _overwrite(source, destination):
+    """Rename a file over an existing file."""
+    try:
+        os.rename(source, destination)
+    except OSError:
+        # Windows doesn't rename over existing files
+        if os.path.isfile(destination): os.remove(destination)
+        _replace(source, destination)
+
+
+def fileDigest(filePath):
+    """sha256 of a file."""
+    digest = hashlib.sha256()
+    with open(filePath, 'rb') as inf:
+        for chunk in iter(lambda: inf.read(CHUNKSIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def urlKey(url):
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def download(url, filePath, timeout=30):
+    """Download a url to a file and continue a partial file if there is one.
+
+    Raises:
+        IOError if the connection breaks or fewer bytes than announced arrive.
+        The partial file is kept so the next call can continue it.
+    """
+    size = os.path.getsize(filePath) if os.path.isfile(filePath) else 0
+    request = Request(url)
+    if size: request.add_header('Range', 'bytes=%d-' % size)
+    try:
+        response = urlopen(request, timeout=timeout)
+    except HTTPError as e:
+        if e.code != 416 or not size: raise
+        # the range doesn't fit the file on the server. start over
+        os.remove(filePath)
+        return download(url, filePath, timeout)
+    try:
+        if response.getcode() != 206: size = 0  # the server sends the whole file
+        length = response.info().get('Content-Length')
+        received = 0
+        with open(filePath, 'ab' if size else 'wb') as outf:
+            for chunk in iter(lambda: response.read(CHUNKSIZE), b''):
+                outf.write(chunk)
+                received += len(chunk)
+    finally:
+        response.close()
+    if length is not None and received != int(length):
+        raise IOError('Download of %s stopped after %d of %s bytes.' % (url, received, length))
+    return filePath
+
+
+def extractWeatherFiles(archive, folder):
+    """Extract the files of a zip archive into a folder without their subfolders.
+
+    The members are streamed to the folder and their CRC is checked while reading.
+    """
+    with zipfile.ZipFile(archive) as zf:
+        for member in zf.infolist():
+            # only keep the file name. this also keeps files inside the folder
+            name = os.path.basename(member.filename.replace('\\', '/'))
+            if not name: continue
+            source = zf.open(member)
+            try:
+                with open(os.path.join(folder, name), 'wb') as outf:
+                    shutil.copyfileobj(source, outf, CHUNKSIZE)
+            finally:
+                source.close()
+
+
+class WeatherStore(object):
+    """Folder of downloaded weather files.
+
+    Args:
+        folder: Folder of the store.
+        workers: Number of parallel downloads in fetchMany.
+        weatherCache: Optional WeatherCache. If set, the epw files are parsed
+            into the cache when they are stored.
+        retries: Number of times a broken download is continued.
+    """
+
+    def __init__(self, folder, workers=8, weatherCache=None, retries=2, timeout=30):
+        self.folder = folder
+        self.workers = workers
+        self.weatherCache = weatherCache
+        self.retries = retries
+        self.timeout = timeout
+        self.errors = {}
+        self._lock = threading.Lock()
+        self._index = None
+
+    @property
+    def indexFile(self):
+        return os.path.join(self.folder, 'index.json')
+
+    def _subfolder(self, name):
+        folder = os.path.join(self.folder, name)
+        if not os.path.isdir(folder):
+            try: os.makedirs(folder)
+            except OSError:
+                if not os.path.isdir(folder): raise
+        return folder
+
+    def _readIndex(self):
+        """{'urls': {url: sha256}, 'files': {digest/fileName: sha256}} of the index file."""
+        try:
+            with open(self.indexFile, 'r') as inf:
+                index = json.load(inf)
+        except (IOError, OSError, ValueError):
+            return {'urls': {}, 'files': {}}
+        if 'urls' not in index: index = {'urls': index, 'files': {}}  # url: sha256 only
+        return index
+
+    def index(self):
+        """Dictionary of url: sha256 of the stored downloads."""
+        with self._lock:
+            if self._index is None: self._index = self._readIndex()
+            return dict(self._index['urls'])
+
+    def _addToIndex(self, url, digest, fileDigests):
+        self.index()
+        with self._lock:
+            # merge the entries that other processes added in the meantime
+            index = self._readIndex()
+            for key in ('urls', 'files'): self._index[key].update(index[key])
+            self._index['urls'][url] = digest
+            self._index['files'].update(fileDigests)
+            tempFile = '%s.%d.%d.tmp' % (self.indexFile, os.getpid(), threading.current_thread().ident)
+            with open(tempFile, 'w') as outf:
+                json.dump(self._index, outf, indent=0, sort_keys=True)
+            _overwrite(tempFile, self.indexFile)
+
+    def extractedFolder(self, digest):
+        return os.path.join(self.folder, 'extracted', digest)
+
+    def storedDigest(self, filePath):
+        """sha256 of an extracted file. Files of older stores are hashed once."""
+        key = '/'.join(filePath.replace('\\', '/').split('/')[-2:])
+        self.index()
+        with self._lock:
+            digest = self._index['files'].get(key)
+        if digest is None:
+            digest = fileDigest(filePath)
+            with self._lock: self._index['files'][key] = digest
+        return digest
+
+    def weatherFiles(self, folder):
+        """(epwFile, statFile) of a folder. Missing files are None."""
+        epwFile = statFile = None
+        for name in sorted(os.listdir(folder)):
+            lower = name.lower()
+            if lower.endswith('.epw') and epwFile is None: epwFile = os.path.join(folder, name)
+            elif lower.endswith('.stat') and statFile is None: statFile = os.path.join(folder, name)
+        return epwFile, statFile
+
+    def stored(self, url):
+        """(epwFile, statFile) of a stored url or None if the url isn't stored."""
+        digest = self.index().get(url)
+        if digest is None: return None
+        folder = self.extractedFolder(digest)
+        if not os.path.isdir(folder): return None
+        return self.weatherFiles(folder)
+
+    def _store(self, url, sha256=None):
+        """Download, verify and extract a url. Returns the digest."""
+        partFile = os.path.join(self._subfolder('partial'), urlKey(url) + '.part')
+        for attempt in range(self.retries + 1):
+            try:
+                download(url, partFile, self.timeout)
+                break
+            except (IOError, OSError):
+                if attempt == self.retries: raise
+
+        digest = fileDigest(partFile)
+        if sha256 is not None and digest != sha256.lower():
+            os.remove(partFile)
+            raise ValueError('The download of %s doesn\'t match its sha256.' % url)
+        name = url.rstrip('/').split('/')[-1].split('?')[0]
+        extension = os.path.splitext(name)[1].lower()
+        archive = os.path.join(self._subfolder('objects'), digest + (extension or '.zip'))
+        _replace(partFile, archive)
+
+        folder = self.extractedFolder(digest)
+        if not os.path.isdir(folder):
+            tempFolder = '%s.%d.%d.tmp' % (folder, os.getpid(), threading.current_thread().ident)
+            self._subfolder(os.path.join('extracted', os.path.basename(tempFolder)))
+            try:
+                if zipfile.is_zipfile(archive):
+                    extractWeatherFiles(archive, tempFolder)
+                elif extension in WEATHEREXTENSIONS:
+                    shutil.copyfile(archive, os.path.join(tempFolder, name))
+                else:
+                    raise ValueError('%s is not a zip archive or a weather file.' % url)
+            except Exception:
+                shutil.rmtree(tempFolder, True)
+                raise
+            _replace(tempFolder, folder)
+
+        if self.weatherCache is not None:
+            epwFile = self.weatherFiles(folder)[0]
+            if epwFile is not None: self.weatherCache.get(epwFile)
+        fileDigests = dict(('%s/%s' % (digest, name), fileDigest(os.path.join(folder, name)))
+                           for name in os.listdir(folder))
+        self._addToIndex(url, digest, fileDigests)
+        return digest
+
+    def fetch(self, url, folder=None, sha256=None):
+        """Weather files of a url. The url is only downloaded if it isn't stored yet.
+
+        Args:
+            folder: Optional folder to copy the files to. Files that are
+                already in the folder with the same sha256 are not copied again.
+            sha256: Optional digest that the download has to match.
+
+        Returns:
+            (epwFile, statFile). Missing files are None.
+        """
+        files = self.stored(url)
+        if files is None:
+            self._store(url, sha256)
+            files = self.stored(url)
+        if folder is None: return files
+
+        if not os.path.isdir(folder): os.makedirs(folder)
+        copies = []
+        for filePath in files:
+            if filePath is None:
+                copies.append(None)
+                continue
+            target = os.path.join(folder, os.path.basename(filePath))
+            if not os.path.isfile(target) or os.path.getsize(target) != os.path.getsize(filePath) \
+                    or fileDigest(target) != self.storedDigest(filePath):
+                tempFile = '%s.%d.tmp' % (target, os.getpid())
+                shutil.copyfile(filePath, tempFile)
+                _overwrite(tempFile, target)
+            copies.append(target)
+        return tuple(copies)
+
+    def fetchMany(self, urls):
+        """Weather files of a list of urls downloaded in parallel.
+
+        Returns:
+            A (epwFile, statFile) tuple for each url. Failed urls get None and
+            their error message in self.errors.
+        """
+        pending = [url for url in sorted(set(urls)) if self.stored(url) is None]
+        lock = threading.Lock()
+
+        def work():
+            while True:
+                with lock:
+                    if not pending: return
+                    url = pending.pop()
+                try:
+                    self._store(url)
+                except Exception as e:
+                    with lock: self.errors[url] = str(e)
+
+        threads = [threading.Thread(target=work) for i in range(min(self.workers, len(pending)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads: thread.join()
+        return [self.stored(url) for url in urls]
+
+    def epw(self, url):
+        """Parsed EPW of a url."""
+        if self.weatherCache is None: self.weatherCache = WeatherCache()
+        epwFile = self.fetch(url)[0]
+        if epwFile is None: raise ValueError('%s has no epw file.' % url)
+        return self.weatherCache.get(epwFile)
+
+    def ToString(self):
+        return 'WeatherStore::%s' % self.folder
@@ -0,0 +1,264 @@
+"""
+Wind speed at a height above the ground based on terrain type.
+
+Power and log laws are linear in the wind speed of the weather file so a wind
+profile is one factor for each height. WindProfile calculates the factors once
+and multiplies them with all the hourly wind speeds (hours x heights), and the
+statistics of each height follow from the statistics of the hourly speeds.
+
+Wind vector arrows share one template mesh. Each arrow is a transform of the
+template (see arrowTemplate and arrowTransforms).
+"""
+from __future__ import division, print_function
+import math
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+
+class WindSpeed(object):
+    def readTerrainType(self, terrainType, powerOrLog = 0):
+        # Function that reads terrain type and returns the following paremeters used to calculate wind speed above the ground:
+        # d = Boundary layer height.  The height above the ground at which wind speeds become stable (or wind is at 95% of the max speed). Used in power-law wind speed calculations.
+        # a = Power-law exponent.
+        # rl = Roughness length. The height above the ground at which wind speed has dropped to 0.  Used in log-law wind speed calculations.
+        validTerrain = True
+        
+        try:
+            if terrainType == None or terrainType == "city" or int(terrainType) == 0:
+                terrainType = "City Terrain"
+                d = 460
+                a = 0.33
+                rl = 1.0
+            elif terrainType == "suburban" or int(terrainType) == 1:
+                terrainType = "Suburban Terrain"
+                d = 370
+                a = 0.22
+                rl = 0.5
+            elif terrainType == "country" or int(terrainType) == 2:
+                terrainType = "Country Terrain"
+                d = 270
+                a = 0.14
+                rl = 0.1
+            elif terrainType == "water" or int(terrainType) == 3:
+                terrainType = "Water Terrain"
+                d = 210
+                a = 0.10
+                rl = 0.03
+            else:
+                terrainType = None
+                d = None
+                a = None
+                rl = None
+                validTerrain = False
+        except:
+            terrainType = None
+            d = None
+            a = None
+            rl = None
+            validTerrain = False
+        
+        #Return the information.
+        if powerOrLog == 0:
+            return validTerrain, terrainType, d, a
+        elif powerOrLog == 1:
+            return validTerrain, terrainType, rl
+        else:
+            return validTerrain, terrainType, d, a, rl
+
+
+    def powerLawWind(self, vMet, height, d, a, metD, metA, refH=10):
+        #Calculate the wind speed using a power law.
+        vHeight = ((height / d) ** a) * (vMet * (metD / refH) ** metA)
+        return vHeight
+
+
+    def logLawWind(self, vMet, height, rl, metrl, refH=10):
+        #Calculate the wind speed using a power law.
+        if height > rl: vHeight = vMet * ((math.log(height/rl)) / (math.log(refH/metrl)))
+        else: vHeight = 0
+        return vHeight
+
+
+def powerLawFactor(height, d, a, metD, metA, refH=10):
+    """Ratio of the power law wind speed at height to the wind speed of the weather file."""
+    return ((height / d) ** a) * (metD / refH) ** metA
+
+
+def logLawFactor(height, rl, metrl, refH=10):
+    """Ratio of the log law wind speed at height to the wind speed of the weather file."""
+    if height > rl: return math.log(height / rl) / math.log(refH / metrl)
+    return 0
+
+
+def percentile(sortedValues, percent):
+    """Percentile of a sorted list with linear interpolation between the values."""
+    if not sortedValues: return 0
+    position = (len(sortedValues) - 1) * percent / 100
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(sortedValues) - 1)
+    return sortedValues[lower] + (sortedValues[upper] - sortedValues[lower]) * (position - lower)
+
+
+def windVectors(speeds, directions, angle=0):
+    """(x, y) wind vectors of the Y axis scaled by the speeds and rotated
+    counterclockwise by the directions (degrees) and an angle (radians)."""
+    vectors = []
+    for speed, direction in zip(speeds, directions):
+        theta = math.radians(direction) + angle
+        vectors.append((-speed * math.sin(theta), speed * math.cos(theta)))
+    return vectors
+
+
+# wind arrow mesh: head base (0-3), tip (4), shaft top (5-8) and shaft bottom (9-12)
+ARROWFACES = ((0, 1, 2, 3), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4),
+              (5, 6, 10, 9), (6, 7, 11, 10), (7, 8, 12, 11), (8, 5, 9, 12), (9, 10, 11, 12))
+
+
+def arrowTemplate(headRadius, shaftTopRadius, shaftBottomRadius):
+    """Vertices and faces of the wind arrow template.
+
+    A template vertex is (x, y, lengthFactor, headFactor). Its position along
+    the arrow is lengthFactor * length + headFactor * headLength so the head
+    keeps its size for arrows of any length.
+    """
+    vertices = []
+    rings = ((headRadius, 1, -1), (None, 1, 0), (shaftTopRadius, 1, -1), (shaftBottomRadius, 0, 0))
+    for radius, lengthFactor, headFactor in rings:
+        if radius is None:
+            vertices.append((0, 0, lengthFactor, headFactor))
+            continue
+        for count in range(4):
+            angle = math.pi / 4 + count * math.pi / 2
+            vertices.append((radius * math.cos(angle), radius * math.sin(angle),
+                             lengthFactor, headFactor))
+    return vertices, ARROWFACES
+
+
+def arrowTransforms(anchors, vectors, headLength, shortHeadRatio=0.3):
+    """Transform of the template for each arrow.
+
+    Arrows that are not longer than headLength get a head of shortHeadRatio of
+    their length.
+
+    Returns:
+        A list of (origin, xAxis, yAxis, zAxis, length, headLength) tuples.
+        Arrows with zero length get None.
+    """
+    transforms = []
+    for origin, vector in zip(anchors, vectors):
+        x, y, z = vector
+        length = math.sqrt(x * x + y * y + z * z)
+        if not length:
+            transforms.append(None)
+            continue
+        zAxis = (x / length, y / length, z / length)
+        # any axis perpendicular to the arrow
+        if abs(zAxis[2]) < 0.9: xAxis = (-zAxis[1], zAxis[0], 0)
+        else: xAxis = (0, -zAxis[2], zAxis[1])
+        xLength = math.sqrt(xAxis[0] ** 2 + xAxis[1] ** 2 + xAxis[2] ** 2)
+        xAxis = (xAxis[0] / xLength, xAxis[1] / xLength, xAxis[2] / xLength)
+        yAxis = (zAxis[1] * xAxis[2] - zAxis[2] * xAxis[1],
+                 zAxis[2] * xAxis[0] - zAxis[0] * xAxis[2],
+                 zAxis[0] * xAxis[1] - zAxis[1] * xAxis[0])
+        head = headLength if length > headLength else shortHeadRatio * length
+        transforms.append((tuple(origin), xAxis, yAxis, zAxis, length, head))
+    return transforms
+
+
+def instanceArrows(template, transforms):
+    """Vertices and faces of all the arrows as one mesh.
+
+    Returns:
+        vertices: List of (x, y, z) tuples.
+        faces: List of vertex index tuples.
+        arrowIndices: Index of the transform of each arrow in the mesh.
+    """
+    templateVertices, templateFaces = template
+    vertices, faces, arrowIndices = [], [], []
+    for count, transform in enumerate(transforms):
+        if transform is None: continue
+        (ox, oy, oz), xAxis, yAxis, zAxis, length, head = transform
+        start = len(vertices)
+        for u, v, lengthFactor, headFactor in templateVertices:
+            w = lengthFactor * length + headFactor * head
+            vertices.append((ox + u * xAxis[0] + v * yAxis[0] + w * zAxis[0],
+                             oy + u * xAxis[1] + v * yAxis[1] + w * zAxis[1],
+                             oz + u * xAxis[2] + v * yAxis[2] + w * zAxis[2]))
+        faces.extend(tuple(start + i for i in face) for face in templateFaces)
+        arrowIndices.append(count)
+    return vertices, faces, arrowIndices
+
+
+class WindProfile(object):
+    """Wind speeds at heights above the ground for a terrain.
+
+    Args:
+        d, a, rl: Boundary layer height, power law exponent and roughness length
+            of the terrain (see WindSpeed.readTerrainType).
+        metD, metA, metrl: The same parameters for the terrain of the weather station.
+        refH: Height of the wind speed of the weather file.
+        powerLaw: Set to False to use the log law.
+    """
+
+    def __init__(self, d, a, rl, metD=270, metA=0.14, metrl=0.1, refH=10, powerLaw=True):
+        self.d, self.a, self.rl = d, a, rl
+        self.metD, self.metA, self.metrl = metD, metA, metrl
+        self.refH = refH
+        self.powerLaw = powerLaw
+
+    @classmethod
+    def fromTerrainTypes(cls, terrainType=None, epwTerrain=2, refH=10, powerLaw=True):
+        """Create a profile from terrain types (e.g. 0 or 'city').
+
+        The default terrain of the weather station is country, which is typical
+        for weather files that are recorded at airports.
+        """
+        windSpeed = WindSpeed()
+        validTerrain, terrain, d, a, rl = windSpeed.readTerrainType(terrainType, 2)
+        validEpwTerrain, epwTerr, metD, metA, metrl = windSpeed.readTerrainType(epwTerrain, 2)
+        if not validTerrain or not validEpwTerrain:
+            raise ValueError('Invalid terrain type: %s' % (terrainType if not validTerrain else epwTerrain))
+        return cls(d, a, rl, metD, metA, metrl, refH, powerLaw)
+
+    def factor(self, height):
+        """Ratio of the wind speed at height to the wind speed of the weather file."""
+        if self.powerLaw:
+            return powerLawFactor(height, self.d, self.a, self.metD, self.metA, self.refH)
+        return logLawFactor(height, self.rl, self.metrl, self.refH)
+
+    def factors(self, heights):
+        return [self.factor(height) for height in heights]
+
+    def speeds(self, windSpeeds, heights):
+        """Hourly wind speeds at each height (heights x hours)."""
+        return [[v * f for v in windSpeeds] for f in self.factors(heights)]
+
+    def statistics(self, windSpeeds, heights, percentiles=(5, 50, 95)):
+        """Average and percentiles of the hourly wind speeds at each height.
+
+        Returns:
+            averages: Average wind speed at each height.
+            percentileValues: A list of the wind speed at each height for each
+                percentile.
+        """
+        factors = self.factors(heights)
+        sortedSpeeds = sorted(windSpeeds)
+        average = sum(sortedSpeeds) / len(sortedSpeeds) if sortedSpeeds else 0
+        percentileValues = []
+        for percent in percentiles:
+            value = percentile(sortedSpeeds, percent)
+            percentileValues.append([value * f for f in factors])
+        return [average * f for f in factors], percentileValues
+
+    # wind vectors and arrows
+    windVectors = staticmethod(windVectors)
+    arrowTemplate = staticmethod(arrowTemplate)
+    arrowTransforms = staticmethod(arrowTransforms)
+    instanceArrows = staticmethod(instanceArrows)
+
+    def ToString(self):
+        return 'WindProfile::%s law, d=%s, a=%s, rl=%s' % ('power' if self.powerLaw else 'log',
+                                                         self.d, self.a, self.rl)
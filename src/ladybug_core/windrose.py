@@ -0,0 +1,249 @@
+"""
+Wind rose statistics.
+
+The hours of a wind rose are assigned to a direction sector once. Any hourly
+data that is shown on the rose (e.g. the wind speed or the dry bulb temperature)
+is then binned into value bands (e.g. the legend ranges) so each rose is a
+(sectors x bands) histogram of hour counts and value sums. Frequencies, average
+values and Beaufort numbers of the wedges are read from the histograms.
+
+Roses for several periods (e.g. the twelve months) or several weather files are
+calculated in one call and share the sector indices of the hours.
+
+    directions: Hourly wind directions in degrees from North (e.g. 8760 values).
+    speeds: Hourly wind speeds for the same hours.
+    hours: 0-based indices of the hours of a rose in these lists.
+"""
+from __future__ import division
+from bisect import bisect_left, bisect_right
+
+try:
+    from itertools import izip as zip
+except ImportError:
+    pass
+
+from .analysisperiod import firstDays
+
+
+# upper limits of Beaufort numbers 0 to 11 for wind speeds rounded to 0.1
+BEAUFORTMPS = (0.3, 1.6, 3.4, 5.5, 8.0, 10.8, 13.9, 17.2, 20.8, 24.5, 28.5, 32.7)
+BEAUFORTMPH = (1, 4, 8, 13, 19, 25, 32, 39, 47, 55, 64, 73)
+
+
+def sectorAngles(numOfDirections):
+    """Angle of the center of each sector from North."""
+    return [360 * i / numOfDirections for i in range(numOfDirections)]
+
+
+def directionSectors(directions, numOfDirections):
+    """Sector of each direction.
+
+    Sector i covers [angle - sectorAngle / 2, angle + sectorAngle / 2) around
+    its center angle and 360 is the same as 0.
+    """
+    sectorAngle = 360 / numOfDirections
+    halfAngle = sectorAngle / 2
+    return [int(((d + halfAngle) % 360) // sectorAngle) % numOfDirections for d in directions]
+
+
+def valueBands(values, bounds):
+    """Band of each value for ascending band bounds (e.g. legend numbers).
+
+    Band k holds bounds[k] <= v <= bounds[k + 1] and values on a bound go to the
+    lower band. Values that are not less than the last bound are in the last
+    band (len(bounds) - 1). Values below the first bound get -1.
+    """
+    first, last = bounds[0], bounds[-1]
+    top = len(bounds) - 1
+    second = bounds[1] if top else last
+    bands = []
+    for v in values:
+        if v < first: bands.append(-1)
+        elif v <= second and top: bands.append(0)
+        elif v >= last: bands.append(top)
+        else: bands.append(bisect_left(bounds, v) - 1)
+    return bands
+
+
+def beaufortNumbers(speeds, units='m/s'):
+    """Beaufort number of each wind speed in m/s or mph."""
+    limits = BEAUFORTMPH if units == 'mph' else BEAUFORTMPS
+    return [bisect_right(limits, round(s, 1)) for s in speeds]
+
+
+class Histogram(object):
+    """Hour counts and value sums of a wind rose in each sector and value band.
+
+    Attributes:
+        counts: Number of hours of each band in each sector (sectors x bands).
+        sums: Sum of the values of each band in each sector (sectors x bands).
+        calmCounts: Number of calm hours in each band.
+        calmSums: Sum of the values of the calm hours in each band.
+        bounds: Band bounds.
+    """
+
+    def __init__(self, counts, sums, calmCounts, calmSums, bounds):
+        self.counts = counts
+        self.sums = sums
+        self.calmCounts = calmCounts
+        self.calmSums = calmSums
+        self.bounds = bounds
+
+    @staticmethod
+    def _averages(counts, sums):
+        return [s / c if c else 0 for c, s in zip(counts, sums)]
+
+    def averages(self):
+        """Average value of each band in each sector. Empty bands get 0."""
+        return [self._averages(c, s) for c, s in zip(self.counts, self.sums)]
+
+    def calmAverages(self):
+        """Average value of the calm hours in each band."""
+        return self._averages(self.calmCounts, self.calmSums)
+
+    def ToString(self):
+        return 'Histogram::%d sectors x %d bands' % (len(self.counts), len(self.bounds))
+
+
+class WindRose(object):
+    """Hours of a wind rose separated into calm hours and direction sectors.
+
+    Args:
+        directions: Hourly wind directions.
+        speeds: Hourly wind speeds.
+        hours: 0-based indices of the hours of the rose. Default is all the hours.
+        numOfDirections: Number of direction sectors.
+        calmSpeed: Hours with a wind speed that is not larger than calmSpeed are calm.
+        pattern: Optional list of booleans for all the hours (e.g. the result of
+            a conditional statement). Hours that are False are not on the rose
+            but frequencies are still percentages of all the hours of the rose.
+        sectors: Sector of every hour from directionSectors to skip the calculation.
+    """
+
+    def __init__(self, directions, speeds, hours=None, numOfDirections=16, calmSpeed=0,
+                 pattern=None, sectors=None):
+        if hours is None: hours = range(len(speeds))
+        if sectors is None: sectors = directionSectors(directions, numOfDirections)
+        self.directions = directions
+        self.speeds = speeds
+        self.numOfDirections = numOfDirections
+        self.hourCount = len(hours)
+
+        self.calmHours = []
+        self.sectorHours = [[] for i in range(numOfDirections)]
+        for h in hours:
+            if pattern is not None and not pattern[h]: continue
+            if speeds[h] <= calmSpeed: self.calmHours.append(h)
+            else: self.sectorHours[sectors[h]].append(h)
+
+    @property
+    def angles(self):
+        return sectorAngles(self.numOfDirections)
+
+    @property
+    def hours(self):
+        """Hours of the sectors followed by the calm hours."""
+        return [h for hours in self.sectorHours for h in hours] + self.calmHours
+
+    def calmFrequency(self):
+        """Percentage of the hours that are calm."""
+        return 100 * len(self.calmHours) / self.hourCount if self.hourCount else 0
+
+    def frequencies(self):
+        """Percentage of the hours that the wind comes from each sector."""
+        if not self.hourCount: return [0] * self.numOfDirections
+        return [100 * len(hours) / self.hourCount for hours in self.sectorHours]
+
+    def averageValues(self, values):
+        """Average value of the hours of each sector (0 for empty sectors)."""
+        return [sum(values[h] for h in hours) / len(hours) if hours else 0
+                for hours in self.sectorHours]
+
+    def averageVelocities(self):
+        """Average wind speed of each sector."""
+        return self.averageValues(self.speeds)
+
+    def beaufortNumbers(self, units='m/s'):
+        """Beaufort number of the average wind speed of each sector."""
+        return beaufortNumbers(self.averageVelocities(), units)
+
+    def histogram(self, bounds, values=None):
+        """Histogram of the hours in value bands (wind speed by default).
+
+        Args:
+            bounds: Ascending band bounds. See valueBands.
+            values: Hourly values. Default is the wind speed.
+        """
+        if values is None: values = self.speeds
+        bandCount = len(bounds)
+
+        def binHours(hours):
+            counts, sums = [0] * bandCount, [0] * bandCount
+            hourValues = [values[h] for h in hours]
+            for band, v in zip(valueBands(hourValues, bounds), hourValues):
+                if band < 0: continue
+                counts[band] += 1
+                sums[band] += v
+            return counts, sums
+
+        counts, sums = [], []
+        for hours in self.sectorHours:
+            c, s = binHours(hours)
+            counts.append(c)
+            sums.append(s)
+        calmCounts, calmSums = binHours(self.calmHours)
+        return Histogram(counts, sums, calmCounts, calmSums, bounds)
+
+    def ToString(self):
+        return 'WindRose::%d directions, %d hours' % (self.numOfDirections, self.hourCount)
+
+
+def monthlyHours(isLeapYear=False):
+    """0-based hour indices of each month of an annual hourly list."""
+    days = firstDays(isLeapYear)
+    return [range(24 * days[m], 24 * days[m + 1]) for m in range(12)]
+
+
+def windRoses(directions, speeds, hourGroups, numOfDirections=16, calmSpeed=0, pattern=None):
+    """A wind rose for each list of hours (e.g. monthlyHours()).
+
+    The sectors of the hours are calculated once for all the roses.
+    """
+    sectors = directionSectors(directions, numOfDirections)
+    return [WindRose(directions, speeds, hours, numOfDirections, calmSpeed, pattern, sectors)
+            for hours in hourGroups]
+
+
+def stationWindRoses(stations, hourGroups=None, numOfDirections=16, calmSpeed=0):
+    """Wind roses of several weather files.
+
+    Args:
+        stations: A (directions, speeds) tuple for each weather file.
+        hourGroups: Lists of hours of the roses of each station. Default is one
+            rose with all the hours.
+    Returns:
+        A list of roses for each station.
+    """
+    roses = []
+    for directions, speeds in stations:
+        groups = hourGroups if hourGroups is not None else [range(len(speeds))]
+        roses.append(windRoses(directions, speeds, groups, numOfDirections, calmSpeed))
+    return roses
+
+
+def stackedHistograms(roses, bounds, values=None):
+    """Hour counts of several roses in the same bands (roses x sectors x bands).
+
+    Args:
+        roses: A list of WindRose objects.
+        bounds: Band bounds shared by the roses (e.g. Beaufort limits).
+        values: Hourly values for all the roses. Default is the wind speed of
+            each rose.
+    Returns:
+        counts: Stacked counts (roses x sectors x bands).
+        calmCounts: Calm hours of each rose in each band (roses x bands).
+        hourCounts: Number of hours of each rose.
+    """
+    histograms = [rose.histogram(bounds, values) for rose in roses]
+    return ([h.counts for h in histograms], [h.calmCounts for h in histograms],
+            [rose.hourCount for rose in roses])